@@ -1,13 +1,21 @@
+import argparse
+import asyncio
 import csv
 import os
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import async_browser, benefit_store, browser, delta, metrics, retry, scheduler
 
 def save_benefits_to_csv(benefits, filename='bancodechile/data/benefits_bancodechile.csv'):
     if not benefits:
@@ -18,31 +26,38 @@ def save_benefits_to_csv(benefits, filename='bancodechile/data/benefits_bancodec
         print(f"Guardando {len(benefits)} beneficios en {filename}...")
         fieldnames = [
             'id', 'title', 'description', 'bank', 'provider',
-            'category', 'is_active', 'created_at', 'updated_at'
+            'category', 'location', 'is_active', 'created_at', 'updated_at'
         ]
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with metrics.span('csv_write'), open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             for i, benefit in enumerate(benefits, 1):
                 row = {
-                    'id': i,
+                    'id': benefit.get('id', i),
                     'title': benefit.get('title', ''),
                     'description': benefit.get('description', ''),
                     'bank': 'bancodechile',
                     'provider': 'Banco de Chile',
                     'category': benefit.get('category', 'Sin categoría'),
+                    'location': benefit.get('location', ''),
                     'is_active': 1,
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat()
+                    'created_at': benefit.get('created_at', datetime.now().isoformat()),
+                    'updated_at': benefit.get('updated_at', datetime.now().isoformat())
                 }
                 writer.writerow(row)
+        metrics.record_file_written(filename)
         print(f"✓ Todos los beneficios han sido guardados en {filename}")
         return True
     except Exception as e:
         print(f"✗ Error al guardar en CSV: {str(e)}")
         return False
 
-def scrape_banco_chile_benefits():
+# Se puede apuntar a otro sitio (ej. benchmarks/standin_server.py) con BANCOCHILE_BENEFITS_URL
+BENEFITS_URL = os.environ.get('BANCOCHILE_BENEFITS_URL', "https://sitiospublicos.bancochile.cl/personas/beneficios")
+DEFAULT_REGION = "Metropolitana de Santiago"
+BREAKER = retry.breaker('bancodechile')
+
+def create_driver():
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -52,91 +67,434 @@ def scrape_banco_chile_benefits():
     options.add_argument("--disable-gpu")
     options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
     service = Service(log_path=os.devnull)
+    with metrics.span('browser_startup'):
+        driver = browser.launch('bancodechile', options, service)
+    return metrics.instrument_driver(driver)
 
-    try:
-        driver = webdriver.Chrome(service=service, options=options)
-        print("Navegador inicializado exitosamente")
-    except Exception as e:
-        print(f"Error al inicializar el navegador: {str(e)}")
-        return []
+def get_region_options(driver):
+    """Lee todas las regiones disponibles en el select #regionSearch"""
+    with metrics.span('page_load'), scheduler.slot(BENEFITS_URL):
+        driver.get(BENEFITS_URL)
+    with metrics.span('wait'):
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.ID, "regionSearch"))
+        )
+    select = Select(driver.find_element(By.ID, "regionSearch"))
+    regions = []
+    for option in select.options:
+        value = (option.get_attribute("value") or '').strip()
+        if value and value not in regions:
+            regions.append(value)
+    return regions
+
+LISTING_TITLES_JS = """
+return Array.from(document.querySelectorAll('a.card p.font-700.text-3.text-gray-dark'),
+                  p => p.textContent.trim()).join('\\n');
+"""
+
+def _listing_titles(driver):
+    """Títulos de las tarjetas visibles en un solo viaje al navegador"""
+    return driver.execute_script(LISTING_TITLES_JS) or None
+
+def extract_card(locate, region, seen_titles, state=None):
+    """Extrae una tarjeta a.card; locate() la entrega (ver retry.relocator)
+
+    Retorna None si el título ya se vio (sin leer la descripción).
+    """
+    element = locate()
+    with metrics.span('card_extraction', scope='benefit'):
+        teaser = delta.teaser_hash(element.text) if state else None
+        known = state.lookup_teaser(teaser) if state else None
+        if known is not None:
+            if known['title'] in seen_titles:
+                return None
+            metrics.incr('cards_unchanged')
+            return dict(known, location=region)
+        title = element.find_element(By.CSS_SELECTOR, "p.font-700.text-3.text-gray-dark").text.strip()
+        if title in seen_titles:
+            return None
+        description = element.find_element(By.CSS_SELECTOR, "p.overflow-ellipsis.mb-2.text-2.text-gray").text.strip()
+        benefit = {
+            'title': title,
+            'description': description,
+            'category': 'Beneficios Bancarios',
+            'location': region
+        }
+        if teaser:
+            benefit['teaser_hash'] = teaser
+    return benefit
+
+def extract_page_benefits(driver, region, seen_titles, state=None):
+    """Extrae las tarjetas a.card de la página actual que aún no se han visto
+
+    Con state (common.delta.DeltaState) una tarjeta cuyo texto no cambió desde
+    la ejecución anterior se reutiliza sin buscar título y descripción. Una
+    tarjeta que falla por un error transitorio (stale) se vuelve a buscar y se
+    reintenta sola.
+    """
+    benefits = []
+    benefit_elements = driver.find_elements(By.CSS_SELECTOR, "a.card")
+    print(f"Encontrados {len(benefit_elements)} beneficios en la página")
+
+    for index, element in enumerate(benefit_elements):
+        try:
+            locate = retry.relocator(driver, "a.card", index, element)
+            benefit = retry.call(extract_card, locate, region, seen_titles, state,
+                                 policy=retry.QUICK_POLICY, label=f"tarjeta {index + 1}")
+            if benefit is None:
+                continue
+            benefits.append(benefit)
+            seen_titles.add(benefit['title'])
+            metrics.incr('cards')
+        except Exception as e:
+            print(f"Error procesando beneficio: {str(e)}")
+            continue
+
+    return benefits
 
-    driver.get("https://sitiospublicos.bancochile.cl/personas/beneficios")
+def open_region(driver, region):
+    """Carga el sitio, selecciona la región y espera las tarjetas (se reintenta completo)"""
+    with metrics.span('page_load'), scheduler.slot(BENEFITS_URL):
+        driver.get(BENEFITS_URL)
 
     # Esperar y seleccionar región
-    try:
+    with metrics.span('wait'):
         WebDriverWait(driver, 20).until(
             EC.presence_of_element_located((By.ID, "regionSearch"))
         )
-        select_element = driver.find_element(By.ID, "regionSearch")
-        select = Select(select_element)
-        select.select_by_value("Metropolitana de Santiago")
-        print("Región Metropolitana seleccionada")
-    except Exception as e:
-        print(f"Error al seleccionar región: {str(e)}")
-        driver.quit()
-        return []
+    select_element = driver.find_element(By.ID, "regionSearch")
+    select = Select(select_element)
+    select.select_by_value(region)
+    print(f"Región {region} seleccionada")
 
     # Esperar que carguen los beneficios
-    try:
+    with metrics.span('wait'):
         WebDriverWait(driver, 20).until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.card"))
         )
-        print("Beneficios cargados")
-    except Exception as e:
-        print(f"Error esperando beneficios: {str(e)}")
-        driver.quit()
-        return []
+    print(f"Beneficios cargados ({region})")
+
+def next_page(driver, boton_siguiente):
+    """Hace clic en la flecha y espera a que cambien las tarjetas
+
+    El clic pasa por el scheduler; si las tarjetas no cambian a tiempo se
+    reintenta (salvo que el cambio haya llegado tarde).
+    """
+    anterior = _listing_titles(driver)
+    locate = retry.relocator(driver, "i.icos-arrow-right-2.cursor-pointer", 0, boton_siguiente)
+
+    def attempt():
+        if _listing_titles(driver) not in (None, anterior):
+            return
+        with scheduler.slot(BENEFITS_URL) as request:
+            locate().click()
+            try:
+                WebDriverWait(driver, 15).until(lambda d: _listing_titles(d) not in (None, anterior))
+            except TimeoutException:
+                request.fail()
+                raise
+
+    retry.call(attempt, breaker=BREAKER, label="siguiente página")
+
+def scrape_region(driver, region=DEFAULT_REGION, state=None, max_paginas=50):
+    """Extrae los beneficios de una región usando un navegador ya iniciado
+
+    Si la carga o la selección de la región fallan por un timeout se vuelve a
+    intentar desde la carga de la página, con backoff (common.retry); si los
+    reintentos se agotan el error se propaga, para que quien llama distinga
+    una región fallida de una región sin beneficios.
+
+    Retorna (beneficios, truncated). truncated indica que el listado se cortó
+    antes de la última página (error al leer una página o al pasar a la
+    siguiente, o tope de max_paginas): lo leído es válido, pero la ejecución
+    es parcial y no se pueden marcar bajas.
+    """
+    retry.call(open_region, driver, region, breaker=BREAKER, label=f"región {region}")
 
     benefits = []
     seen_titles = set()
     pagina_actual = 1
-    max_paginas = 50
+    truncated = False
 
-    while pagina_actual <= max_paginas:
-        print(f"\nProcesando página {pagina_actual}")
+    while True:
+        print(f"\nProcesando página {pagina_actual} ({region})")
 
         try:
-            benefit_elements = driver.find_elements(By.CSS_SELECTOR, "a.card")
-            print(f"Encontrados {len(benefit_elements)} beneficios en la página {pagina_actual}")
+            with metrics.span('page_extraction', scope='page'):
+                benefits.extend(extract_page_benefits(driver, region, seen_titles, state))
         except Exception as e:
-            print(f"Error al buscar beneficios: {str(e)}")
+            print(f"✗ Error al buscar beneficios: {str(e)}")
+            truncated = True
             break
 
-        for element in benefit_elements:
+        # Intentar click en flecha derecha para siguiente página; si la flecha
+        # no está (o no es clickeable) esta es la última página
+        with metrics.span('pagination'):
             try:
-                title = element.find_element(By.CSS_SELECTOR, "p.font-700.text-3.text-gray-dark").text.strip()
-                if title in seen_titles:
-                    continue
-                description = element.find_element(By.CSS_SELECTOR, "p.overflow-ellipsis.mb-2.text-2.text-gray").text.strip()
-                benefits.append({
-                    'title': title,
-                    'description': description,
-                    'category': 'Beneficios Bancarios'
-                })
-                seen_titles.add(title)
+                boton_siguiente = WebDriverWait(driver, 10).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, "i.icos-arrow-right-2.cursor-pointer"))
+                )
+            except TimeoutException:
+                print("No hay botón siguiente: última página")
+                break
+            if pagina_actual >= max_paginas:
+                print(f"✗ Se alcanzó el máximo de {max_paginas} páginas y quedan más en {region}")
+                truncated = True
+                break
+            try:
+                next_page(driver, boton_siguiente)
             except Exception as e:
-                print(f"Error procesando beneficio: {str(e)}")
-                continue
+                print(f"✗ No se pudo hacer click en botón siguiente: {e}")
+                truncated = True
+                break
+        pagina_actual += 1
+        metrics.incr('pages')
+        print("Click en botón siguiente exitoso")
 
-        # Intentar click en flecha derecha para siguiente página
-        try:
-            boton_siguiente = WebDriverWait(driver, 10).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, "i.icos-arrow-right-2.cursor-pointer"))
-            )
-            boton_siguiente.click()
-            pagina_actual += 1
-            print("Click en botón siguiente exitoso")
-        except Exception as e:
-            print(f"No se pudo hacer click en botón siguiente: {e}")
+    print(f"Total beneficios extraídos en {region}: {len(benefits)}")
+    return benefits, truncated
+
+def scrape_banco_chile_benefits(region=DEFAULT_REGION, state=None):
+    """Una región con su propio navegador; retorna (beneficios, regiones fallidas o incompletas)"""
+    try:
+        driver = create_driver()
+        print("Navegador inicializado exitosamente")
+    except Exception as e:
+        print(f"Error al inicializar el navegador: {str(e)}")
+        return [], []
+
+    try:
+        benefits, truncated = scrape_region(driver, region, state)
+        return benefits, [region] if truncated else []
+    except Exception as e:
+        print(f"Error al cargar la región {region}: {str(e)}")
+        return [], []
+    finally:
+        driver.quit()
+
+def merge_region_benefits(benefits_by_region):
+    """Une los beneficios de todas las regiones y elimina los repetidos.
+
+    Un beneficio presente en varias regiones se guarda una sola vez y su
+    columna location acumula las regiones en que aparece.
+    """
+    merged = {}
+    for region, benefits in benefits_by_region:
+        for benefit in benefits:
+            key = (benefit['title'].lower(), benefit['description'].lower())
+            if key not in merged:
+                merged[key] = dict(benefit, location=[region])
+            elif region not in merged[key]['location']:
+                merged[key]['location'].append(region)
+
+    result = []
+    for benefit in merged.values():
+        benefit['location'] = ', '.join(benefit['location'])
+        result.append(benefit)
+    return result
 
-            print(f"Total beneficios extraídos: {len(benefits)}")
-            driver.quit()
-            return benefits
+def scrape_all_regions(max_workers=4, state=None):
+    """Extrae los beneficios de todas las regiones en paralelo.
+
+    Cada hilo del pool mantiene su propio navegador y lo reutiliza para las
+    regiones que le toquen, de modo que el tiempo total queda cerca del de
+    la región más lenta en vez de la suma de todas.
+
+    Retorna (beneficios, regiones que fallaron o quedaron incompletas); con
+    alguna la ejecución es parcial (ver delta.DeltaState.apply).
+    """
+    try:
+        driver = create_driver()
+        print("Navegador inicializado exitosamente")
+    except Exception as e:
+        print(f"Error al inicializar el navegador: {str(e)}")
+        return [], []
+
+    try:
+        regions = get_region_options(driver)
+    except Exception as e:
+        print(f"Error al leer las regiones: {str(e)}")
+        driver.quit()
+        return [], []
+    driver.quit()
+    print(f"Regiones encontradas: {len(regions)}")
+
+    local = threading.local()
+    drivers = []
+    drivers_lock = threading.Lock()
+
+    def worker(region):
+        if getattr(local, 'driver', None) is None:
+            local.driver = create_driver()
+            with drivers_lock:
+                drivers.append(local.driver)
+        return scrape_region(local.driver, region, state)
+
+    results = {}
+    failed = []
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(worker, region): region for region in regions}
+            for future in as_completed(futures):
+                region = futures[future]
+                try:
+                    results[region], truncated = future.result()
+                except Exception as e:
+                    print(f"Error en la región {region}: {str(e)}")
+                    failed.append(region)
+                    continue
+                if truncated:
+                    failed.append(region)
+    finally:
+        for pooled_driver in drivers:
+            try:
+                pooled_driver.quit()
+            except Exception:
+                pass
+
+    # Se respeta el orden del select para que la salida sea estable
+    benefits = merge_region_benefits((region, results.get(region, [])) for region in regions)
+    print(f"Total beneficios únicos en todas las regiones: {len(benefits)}")
+    return benefits, failed
+
+# --- Motor Playwright (common.async_browser): todas las regiones en un solo Chromium ---
+
+NEXT_ARROW_SELECTOR = "i.icos-arrow-right-2.cursor-pointer"
+LISTING_TITLES_FN = "() => {" + LISTING_TITLES_JS + "}"
+CARDS_FN = """
+cards => cards.map(card => {
+    const title = card.querySelector('p.font-700.text-3.text-gray-dark');
+    const description = card.querySelector('p.overflow-ellipsis.mb-2.text-2.text-gray');
+    return {title: title ? title.innerText.trim() : '',
+            description: description ? description.innerText.trim() : ''};
+})
+"""
+REGION_VALUES_FN = "options => options.map(option => (option.value || '').trim())"
+
+async def open_region_async(pw_browser, page, region):
+    """Como open_region: un intento de carga, selección de región y espera de tarjetas"""
+    await pw_browser.load(page, BENEFITS_URL)
+    await page.wait_for_selector("#regionSearch")
+    await page.select_option("#regionSearch", region)
+    await page.wait_for_selector("a.card")
+
+async def scrape_region_async(pw_browser, region, max_paginas=50):
+    """Una región en su propia página del navegador compartido; las tarjetas se leen en un solo evaluate
+
+    Retorna (beneficios, truncated), como scrape_region; un clic fallido en
+    la flecha se propaga como error de la región.
+    """
+    async with pw_browser.page() as page:
+        await retry.call_async(open_region_async, pw_browser, page, region,
+                               breaker=BREAKER, label=f"región {region}")
+        benefits = []
+        seen_titles = set()
+        truncated = False
+        for pagina_actual in range(1, max_paginas + 1):
+            with metrics.span('page_extraction', scope='page'):
+                cards = await page.eval_on_selector_all("a.card", CARDS_FN)
+            for card in cards:
+                if card['title'] and card['title'] not in seen_titles:
+                    seen_titles.add(card['title'])
+                    benefits.append(dict(card, category='Beneficios Bancarios', location=region))
+                    metrics.incr('cards')
+
+            if await page.query_selector(NEXT_ARROW_SELECTOR) is None:
+                break
+            if pagina_actual == max_paginas:
+                print(f"✗ Se alcanzó el máximo de {max_paginas} páginas y quedan más en {region}")
+                truncated = True
+                break
+            with metrics.span('pagination'):
+                await async_browser.click_and_wait_for_change(
+                    page, lambda: page.query_selector(NEXT_ARROW_SELECTOR), LISTING_TITLES_FN, BENEFITS_URL, BREAKER)
+            metrics.incr('pages')
+    print(f"Total beneficios extraídos en {region}: {len(benefits)} ({pagina_actual} páginas)")
+    return benefits, truncated
+
+async def _scrape_regions_async(all_regions, max_pages):
+    async with async_browser.AsyncBrowser(max_pages=max_pages) as pw_browser:
+        if all_regions:
+            async with pw_browser.page() as page:
+                await pw_browser.goto(page, BENEFITS_URL, breaker=BREAKER, wait_for="#regionSearch")
+                regions = list(dict.fromkeys(value for value in await page.eval_on_selector_all(
+                    "#regionSearch option", REGION_VALUES_FN) if value))
+            print(f"Regiones encontradas: {len(regions)}")
+        else:
+            regions = [DEFAULT_REGION]
+
+        outcomes = await asyncio.gather(*(scrape_region_async(pw_browser, region) for region in regions),
+                                        return_exceptions=True)
+    results = {}
+    failed = []
+    for region, outcome in zip(regions, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"Error en la región {region}: {str(outcome)}")
+            failed.append(region)
+            outcome = [], False
+        results[region], truncated = outcome
+        if truncated:
+            failed.append(region)
+    if not all_regions:
+        return results[DEFAULT_REGION], failed
+    return merge_region_benefits((region, results[region]) for region in regions), failed
+
+def scrape_playwright(all_regions=False, max_pages=8):
+    """scrape_banco_chile_benefits / scrape_all_regions con Playwright
+
+    Un solo Chromium con hasta max_pages regiones abiertas a la vez; las
+    imágenes, fuentes y analítica no se descargan. Retorna (beneficios,
+    regiones que fallaron o quedaron incompletas), como scrape_all_regions.
+    """
+    if not async_browser.available():
+        print(async_browser.MISSING_MESSAGE)
+        return [], []
+    try:
+        benefits, failed = asyncio.run(_scrape_regions_async(all_regions, max_pages))
+    except Exception as e:
+        print(f"Error en scraping con Playwright: {str(e)}")
+        return [], []
+    print(f"Total beneficios únicos: {len(benefits)}")
+    return benefits, failed
 
 def main():
-    benefits = scrape_banco_chile_benefits()
+    parser = argparse.ArgumentParser(description="Scraper de beneficios Banco de Chile")
+    parser.add_argument('--todas-regiones', action='store_true',
+                        help="Extrae todas las regiones de #regionSearch en paralelo")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Número de navegadores (o páginas con Playwright) en paralelo (solo con --todas-regiones)")
+    parser.add_argument('--motor', choices=['selenium', 'playwright'], default='selenium',
+                        help="playwright: un solo Chromium asíncrono con muchas páginas (requiere playwright)")
+    parser.add_argument('--delta', action='store_true',
+                        help="Escribe además solo las altas, cambios y bajas respecto de la ejecución anterior")
+    browser.add_arguments(parser)
+    args = parser.parse_args()
+    browser.configure_from_args(args)
+
+    metrics.start_run('bancodechile')
+    # El modo de una región y el de todas tienen catálogos distintos, así que
+    # cada uno lleva su propio estado incremental
+    provider = 'bancodechile_regiones' if args.todas_regiones else 'bancodechile'
+    state = delta.DeltaState(provider)
+    if args.motor == 'playwright':
+        benefits, failed = scrape_playwright(all_regions=args.todas_regiones, max_pages=args.workers)
+    elif args.todas_regiones:
+        benefits, failed = scrape_all_regions(max_workers=args.workers, state=state)
+    else:
+        benefits, failed = scrape_banco_chile_benefits(state=state)
+    if failed:
+        metrics.incr('failed_units', len(failed))
+        print(f"✗ Ejecución parcial, fallaron o quedaron incompletas {len(failed)} regiones ({', '.join(failed)}): "
+              f"no se marcan bajas en esta ejecución")
     if benefits:
+        changes = state.apply(benefits, partial=bool(failed))
         save_benefits_to_csv(benefits)
+        if args.delta:
+            delta.save_changes_csv(changes, 'bancodechile/data/benefits_bancodechile_delta.csv',
+                                   ['id', 'title', 'description', 'category', 'location', 'created_at', 'updated_at'])
+        state.save()
+        benefit_store.append_run(provider, benefits, partial=bool(failed))
+    metrics.finish_run()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Extracción de beneficios del listado BCI desde HTML ya renderizado, sin navegador
+
+Reglas compartidas por bci/scraper_v2.py (tarjetas leídas con Selenium o
+Playwright) y los procesos offline (benchmarks, common/reparse.py, el
+snapshot bci/source/bci.txt), que no necesitan Selenium instalado.
+"""
+
+import os
+import sys
+from datetime import date
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import validity
+
+# Fragmentos de vigencia que vienen como p.card__bajada sueltos
+SCHEDULE_FRAGMENTS = ['Hasta', 'Del', 'Todos los', 'De lunes a viernes']
+
+def split_bajadas(texts, reference=None):
+    """Separa las bajadas de vigencia ("Del 10 al 17 de Junio", "Lunes y viernes") de la descripción
+
+    Retorna (description, campos de vigencia); cuando el texto no trae el año
+    la vigencia se interpreta respecto de reference (por defecto el día del
+    scraping; al re-parsear un snapshot, su fecha).
+    """
+    description = []
+    schedule = []
+    for text in texts:
+        if not text:
+            continue
+        if text in SCHEDULE_FRAGMENTS or validity.is_schedule_text(text):
+            schedule.append(text)
+        else:
+            description.append(text)
+    schedule = ' '.join(schedule)
+    fields = validity.to_fields(validity.parse_validity(schedule, reference or date.today()))
+    fields['schedule'] = schedule
+    return ' '.join(description), fields
+
+def classify_offer(offer_text):
+    """Tipo de oferta a partir del texto del badge"""
+    offer_lower = offer_text.lower()
+    if 'cashback' in offer_lower:
+        return 'cashback'
+    elif 'descuento' in offer_lower:
+        return 'descuento'
+    elif 'cuotas' in offer_lower:
+        return 'cuotas'
+    return 'otro'
+
+def categorize_benefit(title, description):
+    """Categoría por palabras clave (cuando no se conoce la categoría del sitio)"""
+    title_lower = title.lower()
+    desc_lower = description.lower()
+    
+    if any(word in title_lower or word in desc_lower for word in ['burger', 'starbucks', 'coca-cola', 'restaurant']):
+        return 'Restaurantes'
+    elif any(word in title_lower or word in desc_lower for word in ['salcobrand', 'farmacia', 'seguro', 'salud']):
+        return 'Salud y bienestar'
+    elif any(word in title_lower or word in desc_lower for word in ['viaje', 'cuotas sin interés']):
+        return 'Viajes'
+    elif any(word in title_lower or word in desc_lower for word in ['adidas', 'deporte', 'fitness']):
+        return 'Deportes'
+    elif any(word in title_lower or word in desc_lower for word in ['oxxo', 'supermercado', 'tienda']):
+        return 'Supermercados'
+    return 'Beneficios BCI'
+
+def _node_text(node):
+    """Texto de un nodo BeautifulSoup con los espacios colapsados (como WebElement.text)"""
+    return ' '.join(node.get_text(' ').split()) if node else ''
+
+def parse_listing_html(content, category=None, reference=None):
+    """Extrae los beneficios de un HTML ya renderizado del listado (sin navegador)
+
+    Sirve para snapshots como bci/source/bci.txt y aplica las mismas reglas que
+    extract_benefit_from_carrousel_item; reference es la fecha de captura del
+    snapshot (ver split_bajadas).
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    benefits = []
+    
+    for item in soup.select("div.carrousel__item"):
+        link = item.find("a")
+        article = link.find("article") if link else None
+        if not article:
+            continue
+        
+        offer_text = _node_text(article.select_one("p.badge-offer"))
+        description, schedule = split_bajadas((_node_text(desc) for desc in article.select("p.card__bajada")), reference)
+        benefit = {
+            'url': link.get('href', ''),
+            'title': _node_text(article.select_one("p.card__title")),
+            'description': description,
+            'offer_type': classify_offer(offer_text) if offer_text else '',
+            'offer_value': offer_text,
+            'payment_method': _node_text(article.select_one("span.badge")),
+            **schedule,
+        }
+        if not benefit['title']:
+            continue
+        benefit['category'] = category or categorize_benefit(benefit['title'], benefit['description'])
+        benefits.append(benefit)
+    
+    return benefits
@@ -7,17 +7,20 @@ Extrae beneficios de BCI y los guarda en un archivo CSV
 
 import csv
 import os
+import sys
 import time
 import json
 import re
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import browser, metrics, selector_cache
 import requests
 import socket
 
@@ -35,7 +38,7 @@ def save_benefits_to_csv(benefits, filename='data/benefits_bci.csv'):
             'offer_value', 'payment_method'
         ]
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with metrics.span('csv_write'), open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
@@ -57,44 +60,36 @@ def save_benefits_to_csv(benefits, filename='data/benefits_bci.csv'):
                 }
                 writer.writerow(row)
         
+        metrics.record_file_written(filename)
         return True
         
     except Exception as e:
         print(f"Error al guardar CSV: {str(e)}")
         return False
 
+# Cadenas de selectores de respaldo; el ganador de cada una se recuerda entre
+# ejecuciones (common/selector_cache.py)
+CARD_SELECTORS = ["article.card-benefit-v2", "div.carrousel__item", "a[id-comercio]"]
+TITLE_SELECTORS = ["p.card__title", ".card__title", "h3", "h2"]
+DESCRIPTION_SELECTORS = ["p.card__bajada", ".card__bajada", "p"]
+OFFER_SELECTORS = ["p.badge-offer", ".badge-offer", ".badge"]
+PAYMENT_SELECTORS = ["span.badge", ".badge-pill"]
+SELECTORS = selector_cache.for_provider('bci')
+
 def extract_benefit_info(element):
     """Extrae información de un beneficio desde el elemento"""
     try:
         benefit = {}
         
         # Extraer título - múltiples selectores posibles
-        title_selectors = ["p.card__title", ".card__title", "h3", "h2"]
-        for selector in title_selectors:
-            try:
-                title_element = element.find_element(By.CSS_SELECTOR, selector)
-                benefit['title'] = title_element.text.strip()
-                break
-            except:
-                continue
-        
-        if not benefit.get('title'):
-            benefit['title'] = ''
+        benefit['title'] = SELECTORS.find(element, 'title', TITLE_SELECTORS) or ''
         
         # Extraer descripción
-        desc_selectors = ["p.card__bajada", ".card__bajada", "p"]
-        for selector in desc_selectors:
-            try:
-                desc_element = element.find_element(By.CSS_SELECTOR, selector)
-                text = desc_element.text.strip()
-                if text and text != benefit.get('title', ''):
-                    benefit['description'] = text
-                    break
-            except:
-                continue
-        
-        if not benefit.get('description'):
-            benefit['description'] = ''
+        def description_text(desc_element):
+            text = desc_element.text.strip()
+            return text if text != benefit['title'] else None
+        benefit['description'] = SELECTORS.find(element, 'description', DESCRIPTION_SELECTORS,
+                                                description_text) or ''
         
         # Extraer URL
         try:
@@ -107,44 +102,29 @@ def extract_benefit_info(element):
             benefit['url'] = ''
         
         # Extraer oferta
-        offer_selectors = ["p.badge-offer", ".badge-offer", ".badge"]
-        for selector in offer_selectors:
-            try:
-                offer_element = element.find_element(By.CSS_SELECTOR, selector)
-                offer_text = offer_element.text.strip()
-                
-                if 'cashback' in offer_text.lower():
-                    benefit['offer_type'] = 'cashback'
-                elif 'descuento' in offer_text.lower():
-                    benefit['offer_type'] = 'descuento'
-                elif 'cuotas' in offer_text.lower():
-                    benefit['offer_type'] = 'cuotas'
-                else:
-                    benefit['offer_type'] = 'otro'
-                
-                benefit['offer_value'] = offer_text
-                break
-            except:
-                continue
+        offer_text = SELECTORS.find(element, 'offer', OFFER_SELECTORS)
+        if offer_text:
+            if 'cashback' in offer_text.lower():
+                benefit['offer_type'] = 'cashback'
+            elif 'descuento' in offer_text.lower():
+                benefit['offer_type'] = 'descuento'
+            elif 'cuotas' in offer_text.lower():
+                benefit['offer_type'] = 'cuotas'
+            else:
+                benefit['offer_type'] = 'otro'
+            
+            benefit['offer_value'] = offer_text
         
         if not benefit.get('offer_type'):
             benefit['offer_type'] = ''
             benefit['offer_value'] = ''
         
         # Extraer método de pago
-        payment_selectors = ["span.badge", ".badge-pill"]
-        for selector in payment_selectors:
-            try:
-                payment_element = element.find_element(By.CSS_SELECTOR, selector)
-                text = payment_element.text.strip()
-                if text and text not in ['cashback', 'descuento']:
-                    benefit['payment_method'] = text
-                    break
-            except:
-                continue
-        
-        if not benefit.get('payment_method'):
-            benefit['payment_method'] = ''
+        def payment_text(payment_element):
+            text = payment_element.text.strip()
+            return text if text not in ['cashback', 'descuento'] else None
+        benefit['payment_method'] = SELECTORS.find(element, 'payment_method', PAYMENT_SELECTORS,
+                                                   payment_text) or ''
         
         # Categorización
         title_lower = benefit['title'].lower()
@@ -170,6 +150,10 @@ def extract_benefit_info(element):
 
 def wait_for_benefits_to_load(driver, timeout=90):
     """Espera a que los beneficios se carguen dinámicamente via JavaScript/XHR"""
+    with metrics.span('wait'):
+        return _wait_for_benefits_to_load(driver, timeout)
+
+def _wait_for_benefits_to_load(driver, timeout):
     try:
         # Esperar a que la aplicación Vue.js se inicialice
         WebDriverWait(driver, 15).until(
@@ -183,14 +167,8 @@ def wait_for_benefits_to_load(driver, timeout=90):
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
                 time.sleep(2)
                 
-                # Probar múltiples selectores basados en el HTML real
-                selectors_to_try = [
-                    "article.card-benefit-v2",
-                    "div.carrousel__item",
-                    "a[id-comercio]"
-                ]
-                
-                for selector in selectors_to_try:
+                # Probar múltiples selectores basados en el HTML real (el que funcionó antes primero)
+                for selector in SELECTORS.order('cards', CARD_SELECTORS):
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     if len(elements) >= 3:
                         # Verificar que tengan contenido real
@@ -198,22 +176,16 @@ def wait_for_benefits_to_load(driver, timeout=90):
                         for elem in elements[:5]:
                             try:
                                 # Buscar texto en diferentes lugares
-                                text_found = False
-                                for text_selector in ["p.card__title", ".card__title", "h3", "h2", "p"]:
-                                    try:
-                                        text_elem = elem.find_element(By.CSS_SELECTOR, text_selector)
-                                        if text_elem.text.strip() and len(text_elem.text.strip()) > 5:
-                                            text_found = True
-                                            break
-                                    except:
-                                        continue
-                                
-                                if text_found:
+                                # Campo propio: la cadena y la condición no son las de 'title'
+                                text = SELECTORS.find(elem, 'ready_title', TITLE_SELECTORS + ["p"],
+                                                      lambda e: len(e.text.strip()) > 5)
+                                if text:
                                     valid_elements += 1
                             except:
                                 continue
                         
                         if valid_elements >= 3:
+                            SELECTORS.record('cards', selector)
                             return True
                 
                 time.sleep(5)
@@ -232,24 +204,15 @@ def get_current_page_benefits(driver):
     
     try:
         # Intentar múltiples selectores basados en el HTML real
-        selectors = [
-            "article.card-benefit-v2",
-            "div.carrousel__item",
-            "a[id-comercio]"  # Basado en el HTML que viste
-        ]
-        
-        benefit_elements = []
-        for selector in selectors:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                benefit_elements = elements
-                break
+        benefit_elements = SELECTORS.find_all(driver, 'cards', CARD_SELECTORS)
         
         for element in benefit_elements:
             try:
-                benefit = extract_benefit_info(element)
+                with metrics.span('card_extraction', scope='benefit'):
+                    benefit = extract_benefit_info(element)
                 if benefit and benefit.get('title'):
                     benefits.append(benefit)
+                    metrics.incr('cards')
             except:
                 continue
         
@@ -286,8 +249,10 @@ def go_to_next_page(driver):
         if next_button.get_attribute("disabled"):
             return False
         
-        driver.execute_script("arguments[0].click();", next_button)
-        time.sleep(2)  # Esperar a que inicie la navegación
+        with metrics.span('pagination'):
+            driver.execute_script("arguments[0].click();", next_button)
+            time.sleep(2)  # Esperar a que inicie la navegación
+        metrics.incr('pages')
         
         return True
         
@@ -317,14 +282,16 @@ def scrape_bci_benefits():
         # Inicializar navegador
         try:
             service = Service(log_path=os.devnull)
-            driver = webdriver.Chrome(service=service, options=options)
+            with metrics.span('browser_startup'):
+                driver = metrics.instrument_driver(browser.launch('bci', options, service))
         except Exception as e:
             print(f"Error inicializando navegador: {str(e)}")
             return []
 
         # Cargar página
         try:
-            driver.get("https://www.bci.cl/beneficios/beneficios-bci")
+            with metrics.span('page_load'):
+                driver.get("https://www.bci.cl/beneficios/beneficios-bci")
         except Exception as e:
             print(f"Error cargando página: {str(e)}")
             driver.quit()
@@ -348,7 +315,8 @@ def scrape_bci_benefits():
             if not wait_for_benefits_to_load(driver):
                 continue
             
-            page_benefits = get_current_page_benefits(driver)
+            with metrics.span('page_extraction', scope='page'):
+                page_benefits = get_current_page_benefits(driver)
             
             # Filtrar duplicados
             for benefit in page_benefits:
@@ -363,6 +331,7 @@ def scrape_bci_benefits():
                     break
         
         driver.quit()
+        SELECTORS.save()
         print(f"Extraídos {len(all_benefits)} beneficios únicos")
         
         return all_benefits
@@ -377,6 +346,7 @@ def scrape_bci_benefits():
 
 def main():
     """Función principal"""
+    metrics.start_run('bci')
     try:
         benefits = scrape_bci_benefits()
         
@@ -405,6 +375,8 @@ def main():
         print("\nProceso interrumpido")
     except Exception as e:
         print(f"Error: {str(e)}")
+    finally:
+        metrics.finish_run()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
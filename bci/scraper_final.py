@@ -6,10 +6,11 @@ Scraper BCI Final - Estrategia agresiva con múltiples fallbacks
 
 import csv
 import os
+import re
+import sys
 import time
 import requests
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -17,6 +18,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import browser, metrics, selector_cache
+
 def save_benefits_to_csv(benefits, filename='data/benefits_bci.csv'):
     if not benefits:
         return False
@@ -30,7 +34,7 @@ def save_benefits_to_csv(benefits, filename='data/benefits_bci.csv'):
             'offer_value', 'payment_method'
         ]
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with metrics.span('csv_write'), open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
@@ -52,14 +56,47 @@ def save_benefits_to_csv(benefits, filename='data/benefits_bci.csv'):
                 }
                 writer.writerow(row)
         
+        metrics.record_file_written(filename)
         return True
         
     except Exception as e:
         print(f"Error al guardar CSV: {str(e)}")
         return False
 
+# Cadenas de selectores de respaldo; el ganador de cada una se recuerda entre
+# ejecuciones (common/selector_cache.py)
+CONTENT_SELECTORS = [
+    "div.carrousel__item",
+    "article.card-benefit-v2",
+    "a[id-comercio]",
+    ".card__title",
+    "[class*='card']",
+    "[class*='benefit']"
+]
+TITLE_SELECTORS = [
+    "h1", "h2", "h3", "h4", "h5", "h6",
+    ".title", ".card__title", "[class*='title']",
+    "strong", "b", ".font-weight-bold"
+]
+CARD_SELECTORS = [
+    "div.carrousel__item",
+    "article.card-benefit-v2",
+    "a[id-comercio]",
+    "[class*='card']",
+    "[class*='benefit']",
+    "div[class*='item']",
+    "article",
+    "section"
+]
+# Caché propia: las cadenas 'title' y 'cards' no son las de bci/scraper.py
+SELECTORS = selector_cache.for_provider('bci_final')
+
 def wait_and_interact(driver, max_wait=120):
     """Estrategia agresiva de espera e interacción"""
+    with metrics.span('wait'):
+        return _wait_and_interact(driver, max_wait)
+
+def _wait_and_interact(driver, max_wait):
     print("Iniciando estrategia agresiva de espera...")
     
     # Esperar a que la página base cargue
@@ -94,17 +131,8 @@ def wait_and_interact(driver, max_wait=120):
             except:
                 pass
             
-            # Buscar múltiples tipos de elementos
-            selectors_to_check = [
-                "div.carrousel__item",
-                "article.card-benefit-v2", 
-                "a[id-comercio]",
-                ".card__title",
-                "[class*='card']",
-                "[class*='benefit']"
-            ]
-            
-            for selector in selectors_to_check:
+            # Buscar múltiples tipos de elementos (el que funcionó antes primero)
+            for selector in SELECTORS.order('content', CONTENT_SELECTORS):
                 try:
                     elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
@@ -122,6 +150,7 @@ def wait_and_interact(driver, max_wait=120):
                         
                         if elements_with_content >= 3:
                             print(f"✓ {elements_with_content} elementos con contenido válido")
+                            SELECTORS.record('content', selector)
                             return True
                         else:
                             print(f"Solo {elements_with_content} elementos con contenido")
@@ -150,117 +179,177 @@ def wait_and_interact(driver, max_wait=120):
     
     return False
 
+def _first_line_title(text_content):
+    """Primera línea con largo de título (más de 5 y menos de 100 caracteres)"""
+    for line in text_content.split('\n'):
+        line = line.strip()
+        if line and len(line) > 5 and len(line) < 100:
+            return line
+    return None
+
+def benefit_from_text(text_content, title, url=''):
+    """Arma el beneficio a partir del texto ya leído de un bloque y su título"""
+    benefit = {'title': title}
+    
+    # Descripción (resto del texto)
+    description_text = text_content.replace(title, '').strip()
+    benefit['description'] = description_text[:500] if description_text else ''
+    benefit['url'] = url
+    
+    # Buscar ofertas en el texto
+    text_lower = text_content.lower()
+    if 'cashback' in text_lower:
+        benefit['offer_type'] = 'cashback'
+        # Extraer porcentaje
+        match = re.search(r'(\d+%?\s*cashback)', text_content, re.IGNORECASE)
+        if match:
+            benefit['offer_value'] = match.group(1)
+        else:
+            benefit['offer_value'] = 'cashback'
+    elif 'descuento' in text_lower:
+        benefit['offer_type'] = 'descuento'
+        match = re.search(r'(\d+%?\s*descuento)', text_content, re.IGNORECASE)
+        if match:
+            benefit['offer_value'] = match.group(1)
+        else:
+            benefit['offer_value'] = 'descuento'
+    elif 'cuotas' in text_lower:
+        benefit['offer_type'] = 'cuotas'
+        benefit['offer_value'] = 'cuotas sin interés'
+    else:
+        benefit['offer_type'] = ''
+        benefit['offer_value'] = ''
+    
+    # Modalidad
+    if 'online' in text_lower:
+        benefit['payment_method'] = 'Online'
+    elif 'presencial' in text_lower:
+        benefit['payment_method'] = 'Presencial'
+    else:
+        benefit['payment_method'] = ''
+    
+    # Categorización básica
+    title_lower = benefit['title'].lower()
+    desc_lower = benefit['description'].lower()
+    
+    if any(word in title_lower or word in desc_lower for word in ['burger', 'starbucks', 'coca-cola', 'restaurant', 'comida']):
+        benefit['category'] = 'Restaurantes'
+    elif any(word in title_lower or word in desc_lower for word in ['salcobrand', 'farmacia', 'seguro', 'salud']):
+        benefit['category'] = 'Salud y bienestar'
+    elif any(word in title_lower or word in desc_lower for word in ['viaje', 'cuotas sin interés']):
+        benefit['category'] = 'Viajes'
+    elif any(word in title_lower or word in desc_lower for word in ['adidas', 'deporte', 'fitness']):
+        benefit['category'] = 'Deportes'
+    elif any(word in title_lower or word in desc_lower for word in ['oxxo', 'supermercado', 'tienda']):
+        benefit['category'] = 'Supermercados'
+    else:
+        benefit['category'] = 'Beneficios BCI'
+    
+    return benefit
+
 def extract_any_benefit_info(element):
     """Extrae información de cualquier tipo de elemento"""
     try:
-        benefit = {}
-        
         # Buscar texto en cualquier lugar
         text_content = element.text.strip()
         if not text_content or len(text_content) < 10:
             return None
         
         # Intentar extraer título (primera línea o elemento más prominente)
-        title_selectors = [
-            "h1", "h2", "h3", "h4", "h5", "h6",
-            ".title", ".card__title", "[class*='title']",
-            "strong", "b", ".font-weight-bold"
-        ]
-        
-        title_found = False
-        for selector in title_selectors:
-            try:
-                title_elem = element.find_element(By.CSS_SELECTOR, selector)
-                title_text = title_elem.text.strip()
-                if title_text and len(title_text) > 5:
-                    benefit['title'] = title_text
-                    title_found = True
-                    break
-            except:
-                continue
-        
-        if not title_found:
-            # Usar la primera línea del texto como título
-            lines = text_content.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line and len(line) > 5 and len(line) < 100:
-                    benefit['title'] = line
-                    break
-        
-        if not benefit.get('title'):
+        title = SELECTORS.find(element, 'title', TITLE_SELECTORS,
+                               lambda e: e.text.strip() if len(e.text.strip()) > 5 else None)
+        title = title or _first_line_title(text_content)
+        if not title:
             return None
         
-        # Descripción (resto del texto)
-        title = benefit.get('title', '')
-        description_text = text_content.replace(title, '').strip()
-        benefit['description'] = description_text[:500] if description_text else ''
-        
         # URL
         try:
             if element.tag_name == 'a':
-                benefit['url'] = element.get_attribute('href') or ''
+                url = element.get_attribute('href') or ''
             else:
                 link = element.find_element(By.TAG_NAME, "a")
-                benefit['url'] = link.get_attribute('href') or ''
+                url = link.get_attribute('href') or ''
         except:
-            benefit['url'] = ''
+            url = ''
         
-        # Buscar ofertas en el texto
-        text_lower = text_content.lower()
-        if 'cashback' in text_lower:
-            benefit['offer_type'] = 'cashback'
-            # Extraer porcentaje
-            import re
-            match = re.search(r'(\d+%?\s*cashback)', text_content, re.IGNORECASE)
-            if match:
-                benefit['offer_value'] = match.group(1)
-            else:
-                benefit['offer_value'] = 'cashback'
-        elif 'descuento' in text_lower:
-            benefit['offer_type'] = 'descuento'
-            match = re.search(r'(\d+%?\s*descuento)', text_content, re.IGNORECASE)
-            if match:
-                benefit['offer_value'] = match.group(1)
-            else:
-                benefit['offer_value'] = 'descuento'
-        elif 'cuotas' in text_lower:
-            benefit['offer_type'] = 'cuotas'
-            benefit['offer_value'] = 'cuotas sin interés'
-        else:
-            benefit['offer_type'] = ''
-            benefit['offer_value'] = ''
-        
-        # Modalidad
-        if 'online' in text_lower:
-            benefit['payment_method'] = 'Online'
-        elif 'presencial' in text_lower:
-            benefit['payment_method'] = 'Presencial'
-        else:
-            benefit['payment_method'] = ''
-        
-        # Categorización básica
-        title_lower = benefit['title'].lower()
-        desc_lower = benefit['description'].lower()
-        
-        if any(word in title_lower or word in desc_lower for word in ['burger', 'starbucks', 'coca-cola', 'restaurant', 'comida']):
-            benefit['category'] = 'Restaurantes'
-        elif any(word in title_lower or word in desc_lower for word in ['salcobrand', 'farmacia', 'seguro', 'salud']):
-            benefit['category'] = 'Salud y bienestar'
-        elif any(word in title_lower or word in desc_lower for word in ['viaje', 'cuotas sin interés']):
-            benefit['category'] = 'Viajes'
-        elif any(word in title_lower or word in desc_lower for word in ['adidas', 'deporte', 'fitness']):
-            benefit['category'] = 'Deportes'
-        elif any(word in title_lower or word in desc_lower for word in ['oxxo', 'supermercado', 'tienda']):
-            benefit['category'] = 'Supermercados'
-        else:
-            benefit['category'] = 'Beneficios BCI'
-        
-        return benefit
+        return benefit_from_text(text_content, title, url)
         
     except:
         return None
 
+# Último recurso cuando no aparece ningún selector conocido: un solo script
+# recorre el DOM y retorna los mejores bloques candidatos a beneficio, en vez de
+# leer .text de cada elemento de la página con una llamada WebDriver por elemento.
+# Puntaje de cada bloque con 20 a 1000 caracteres de texto:
+# - largo del texto (hasta 300 caracteres)
+# - estructura repetida: hermanos con la misma etiqueta y clase (tarjetas de un listado)
+# - densidad de enlaces: bloques con varios enlaces y casi todo el texto enlazado son menús
+# Los bloques contenidos en otro mejor puntuado se descartan.
+HARVEST_MAX_BLOCKS = 200
+HARVEST_MAX_CHARS = 1000
+HARVEST_JS = """
+const maxBlocks = arguments[0], maxChars = arguments[1];
+const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'SVG', 'TEMPLATE', 'HEAD', 'IFRAME']);
+const TITLE = 'h1, h2, h3, h4, h5, h6, .title, .card__title, [class*="title"], strong, b';
+const signature = el => el.tagName + '.' + (typeof el.className === 'string' ? el.className.trim() : '');
+const candidates = [];
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT, {
+  acceptNode: el => SKIP.has(el.tagName.toUpperCase()) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT
+});
+for (let el = walker.nextNode(); el; el = walker.nextNode()) {
+  const length = el.textContent.replace(/\\s+/g, ' ').trim().length;
+  if (length < 20 || length > maxChars) continue;
+  let siblings = 0;
+  if (el.parentElement) {
+    const sig = signature(el);
+    for (const sibling of el.parentElement.children) if (signature(sibling) === sig) siblings++;
+  }
+  const links = el.tagName === 'A' ? [el] : Array.from(el.querySelectorAll('a'));
+  let linked = 0;
+  for (const a of links) linked += a.textContent.trim().length;
+  const density = el.tagName === 'A' ? 0 : Math.min(1, linked / length);
+  let score = Math.min(length, 300) / 300 + (siblings >= 3 ? Math.log2(siblings) : 0);
+  if (links.length > 1 && density > 0.8) score -= 2;
+  if (score > 0) candidates.push([score, el]);
+}
+candidates.sort((a, b) => b[0] - a[0]);
+const chosen = [];
+for (const [score, el] of candidates) {
+  if (chosen.length >= maxBlocks) break;
+  if (chosen.some(([, other]) => other.contains(el) || el.contains(other))) continue;
+  chosen.push([score, el]);
+}
+return chosen.map(([score, el]) => {
+  const heading = Array.from(el.querySelectorAll(TITLE)).find(h => h.innerText.trim().length > 5);
+  const link = el.closest('a') || el.querySelector('a');
+  return {
+    text: el.innerText.trim().slice(0, maxChars),
+    title: heading ? heading.innerText.trim().slice(0, 200) : '',
+    url: link ? link.href : '',
+    score: Math.round(score * 100) / 100
+  };
+});
+"""
+
+def harvest_text_blocks(driver, max_blocks=HARVEST_MAX_BLOCKS, max_chars=HARVEST_MAX_CHARS):
+    """Bloques candidatos a beneficio de la página en una sola llamada
+
+    Retorna hasta max_blocks dicts con text (máximo max_chars caracteres),
+    title, url y score, de mayor a menor puntaje.
+    """
+    with metrics.span('harvest'):
+        return driver.execute_script(HARVEST_JS, max_blocks, max_chars) or []
+
+def benefit_from_block(block):
+    """Beneficio a partir de un bloque de harvest_text_blocks, o None"""
+    text_content = (block.get('text') or '').strip()
+    if len(text_content) < 10:
+        return None
+    title = block.get('title') if len(block.get('title') or '') > 5 else _first_line_title(text_content)
+    if not title:
+        return None
+    return benefit_from_text(text_content, title, block.get('url') or '')
+
 def scrape_bci_aggressive():
     """Scraping agresivo de BCI"""
     print("=== SCRAPER BCI AGRESIVO ===")
@@ -280,80 +369,75 @@ def scrape_bci_aggressive():
     
     try:
         service = Service()
-        driver = webdriver.Chrome(service=service, options=options)
+        with metrics.span('browser_startup'):
+            driver = metrics.instrument_driver(browser.launch('bci', options, service))
         
         # Ejecutar script para ocultar webdriver
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
         print("Navegando a BCI...")
-        driver.get("https://www.bci.cl/beneficios/beneficios-bci")
+        with metrics.span('page_load'):
+            driver.get("https://www.bci.cl/beneficios/beneficios-bci")
         
         # Esperar e interactuar agresivamente
+        blocks = []
         if not wait_and_interact(driver):
             print("No se pudo cargar contenido dinámico")
             
-            # Último intento: buscar cualquier contenido
+            # Último intento: buscar cualquier contenido (un solo recorrido del DOM en la página)
             print("Buscando cualquier contenido disponible...")
-            all_elements = driver.find_elements(By.CSS_SELECTOR, "*")
-            print(f"Total de elementos en la página: {len(all_elements)}")
+            blocks = harvest_text_blocks(driver)
+            print(f"Bloques con texto candidatos: {len(blocks)}")
             
-            # Buscar elementos con texto
-            text_elements = []
-            for elem in all_elements:
-                try:
-                    text = elem.text.strip()
-                    if text and len(text) > 20 and len(text) < 1000:
-                        text_elements.append(elem)
-                except:
-                    continue
-            
-            print(f"Elementos con texto: {len(text_elements)}")
-            
-            if not text_elements:
+            if not blocks:
                 driver.quit()
                 return []
         
         # Extraer beneficios de cualquier elemento disponible
         print("Extrayendo beneficios...")
         
-        all_selectors = [
-            "div.carrousel__item",
-            "article.card-benefit-v2",
-            "a[id-comercio]",
-            "[class*='card']",
-            "[class*='benefit']",
-            "div[class*='item']",
-            "article",
-            "section"
-        ]
-        
         all_benefits = []
         seen_titles = set()
         
-        for selector in all_selectors:
+        for selector in SELECTORS.order('cards', CARD_SELECTORS):
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 print(f"Procesando {len(elements)} elementos con selector: {selector}")
                 
                 for elem in elements:
                     try:
-                        benefit = extract_any_benefit_info(elem)
+                        with metrics.span('card_extraction', scope='benefit'):
+                            benefit = extract_any_benefit_info(elem)
                         if benefit and benefit.get('title'):
                             title = benefit['title']
                             if title not in seen_titles and len(title) > 10:
                                 seen_titles.add(title)
                                 all_benefits.append(benefit)
+                                metrics.incr('cards')
                                 print(f"  ✓ {title[:50]}...")
                     except:
                         continue
                         
                 if all_benefits:
+                    SELECTORS.record('cards', selector)
                     break  # Si encontramos beneficios, no seguir buscando
                     
             except Exception as e:
                 print(f"Error con selector {selector}: {str(e)}")
                 continue
         
+        # Ningún selector dio beneficios: se usan los bloques del recorrido del DOM
+        if not all_benefits and blocks:
+            print(f"Usando {len(blocks)} bloques del recorrido del DOM")
+            for block in blocks:
+                benefit = benefit_from_block(block)
+                if benefit and len(benefit['title']) > 10 and benefit['title'] not in seen_titles:
+                    seen_titles.add(benefit['title'])
+                    all_benefits.append(benefit)
+                    metrics.incr('cards')
+                    print(f"  ✓ {benefit['title'][:50]}...")
+        
+        SELECTORS.save()
         input("Presiona Enter para cerrar el navegador...")
         driver.quit()
         
@@ -370,6 +454,7 @@ def scrape_bci_aggressive():
 
 def main():
     """Función principal"""
+    metrics.start_run('bci_final')
     try:
         benefits = scrape_bci_aggressive()
         
@@ -397,6 +482,8 @@ def main():
         print("\nProceso interrumpido")
     except Exception as e:
         print(f"Error: {str(e)}")
+    finally:
+        metrics.finish_run()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
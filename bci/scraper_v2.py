@@ -4,17 +4,26 @@
 Scraper BCI v2 - Basado en la estructura HTML real observada
 """
 
+import argparse
+import asyncio
 import csv
 import os
+import sys
+import threading
 import time
 import re
-from datetime import datetime
-from selenium import webdriver
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import async_browser, benefit_store, browser, delta, enrich, metrics, retry, scheduler, validity
+from bci.interpreter_bci import categorize_benefit, classify_offer, parse_listing_html, split_bajadas
 
 def save_benefits_to_csv(benefits, filename='data/benefits_bci.csv'):
     if not benefits:
@@ -26,39 +35,49 @@ def save_benefits_to_csv(benefits, filename='data/benefits_bci.csv'):
         fieldnames = [
             'id', 'title', 'description', 'bank', 'provider', 'category',
             'is_active', 'created_at', 'updated_at', 'url', 'offer_type',
-            'offer_value', 'payment_method'
+            'offer_value', 'payment_method', 'schedule', 'valid_from', 'valid_until', 'weekdays'
         ]
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        today = date.today().isoformat()
+        with metrics.span('csv_write'), open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
             for i, benefit in enumerate(benefits, 1):
                 row = {
-                    'id': i,
+                    'id': benefit.get('id', i),
                     'title': benefit.get('title', ''),
                     'description': benefit.get('description', ''),
                     'bank': 'bci',
                     'provider': 'Banco de Chile',
                     'category': benefit.get('category', 'Beneficios BCI'),
-                    'is_active': 1,
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat(),
+                    'is_active': 0 if benefit.get('valid_until') and benefit['valid_until'] < today else 1,
+                    'created_at': benefit.get('created_at', datetime.now().isoformat()),
+                    'updated_at': benefit.get('updated_at', datetime.now().isoformat()),
                     'url': benefit.get('url', ''),
                     'offer_type': benefit.get('offer_type', ''),
                     'offer_value': benefit.get('offer_value', ''),
-                    'payment_method': benefit.get('payment_method', '')
+                    'payment_method': benefit.get('payment_method', ''),
+                    'schedule': benefit.get('schedule', ''),
+                    'valid_from': benefit.get('valid_from', ''),
+                    'valid_until': benefit.get('valid_until', ''),
+                    'weekdays': benefit.get('weekdays', validity.ALL_DAYS)
                 }
                 writer.writerow(row)
         
+        metrics.record_file_written(filename)
         return True
         
     except Exception as e:
         print(f"Error al guardar CSV: {str(e)}")
         return False
 
-def extract_benefit_from_carrousel_item(item):
-    """Extrae beneficio de un div.carrousel__item"""
+def extract_benefit_from_carrousel_item(item, category=None):
+    """Extrae beneficio de un div.carrousel__item
+
+    Si se entrega category (la categoría del sitio), se usa tal cual y no se
+    aplica la categorización por palabras clave.
+    """
     try:
         benefit = {}
         
@@ -74,18 +93,16 @@ def extract_benefit_from_carrousel_item(item):
             try:
                 title_elem = article.find_element(By.CSS_SELECTOR, "p.card__title")
                 benefit['title'] = title_elem.text.strip()
-            except:
+            except Exception as e:
+                if retry.is_transient(e):
+                    raise
                 benefit['title'] = ''
             
             # Descripción
             try:
                 desc_elems = article.find_elements(By.CSS_SELECTOR, "p.card__bajada")
-                descriptions = []
-                for desc in desc_elems:
-                    text = desc.text.strip()
-                    if text and text not in ['Hasta', 'Del', 'Todos los', 'De lunes a viernes']:
-                        descriptions.append(text)
-                benefit['description'] = ' '.join(descriptions)
+                benefit['description'], schedule = split_bajadas(desc.text.strip() for desc in desc_elems)
+                benefit.update(schedule)
             except:
                 benefit['description'] = ''
             
@@ -93,16 +110,7 @@ def extract_benefit_from_carrousel_item(item):
             try:
                 offer_elem = article.find_element(By.CSS_SELECTOR, "p.badge-offer")
                 offer_text = offer_elem.text.strip()
-                
-                if 'cashback' in offer_text.lower():
-                    benefit['offer_type'] = 'cashback'
-                elif 'descuento' in offer_text.lower():
-                    benefit['offer_type'] = 'descuento'
-                elif 'cuotas' in offer_text.lower():
-                    benefit['offer_type'] = 'cuotas'
-                else:
-                    benefit['offer_type'] = 'otro'
-                
+                benefit['offer_type'] = classify_offer(offer_text)
                 benefit['offer_value'] = offer_text
             except:
                 benefit['offer_type'] = ''
@@ -115,33 +123,36 @@ def extract_benefit_from_carrousel_item(item):
             except:
                 benefit['payment_method'] = ''
             
-        except:
+        except Exception as e:
+            # Una tarjeta que Vue reemplazó mientras se leía se reintenta (ver get_page_benefits)
+            if retry.is_transient(e):
+                raise
             return None
         
+        if category:
+            benefit['category'] = category
+            return benefit if benefit.get('title') else None
+        
         # Categorización
-        title_lower = benefit['title'].lower()
-        desc_lower = benefit['description'].lower()
-        
-        if any(word in title_lower or word in desc_lower for word in ['burger', 'starbucks', 'coca-cola', 'restaurant']):
-            benefit['category'] = 'Restaurantes'
-        elif any(word in title_lower or word in desc_lower for word in ['salcobrand', 'farmacia', 'seguro', 'salud']):
-            benefit['category'] = 'Salud y bienestar'
-        elif any(word in title_lower or word in desc_lower for word in ['viaje', 'cuotas sin interés']):
-            benefit['category'] = 'Viajes'
-        elif any(word in title_lower or word in desc_lower for word in ['adidas', 'deporte', 'fitness']):
-            benefit['category'] = 'Deportes'
-        elif any(word in title_lower or word in desc_lower for word in ['oxxo', 'supermercado', 'tienda']):
-            benefit['category'] = 'Supermercados'
-        else:
-            benefit['category'] = 'Beneficios BCI'
+        benefit['category'] = categorize_benefit(benefit['title'], benefit['description'])
         
         return benefit if benefit.get('title') else None
         
-    except:
+    except Exception as e:
+        if retry.is_transient(e):
+            raise
         return None
 
-def wait_for_dynamic_content(driver, max_attempts=20):
-    """Espera a que se cargue el contenido dinámico"""
+def wait_for_dynamic_content(driver, max_attempts=20, min_items=5):
+    """Espera a que se cargue el contenido dinámico
+
+    min_items es la cantidad de tarjetas con título que se exige; los listados
+    filtrados por categoría pueden tener menos de 5.
+    """
+    with metrics.span('wait'):
+        return _wait_for_dynamic_content(driver, max_attempts, min_items)
+
+def _wait_for_dynamic_content(driver, max_attempts, min_items):
     print("Esperando contenido dinámico...")
     
     for attempt in range(max_attempts):
@@ -153,7 +164,7 @@ def wait_for_dynamic_content(driver, max_attempts=20):
             # Buscar elementos carrousel__item con contenido
             items = driver.find_elements(By.CSS_SELECTOR, "div.carrousel__item")
             
-            if len(items) >= 5:  # Al menos 5 elementos
+            if len(items) >= min_items:
                 # Verificar que tengan contenido real
                 valid_items = 0
                 for item in items[:8]:
@@ -164,7 +175,7 @@ def wait_for_dynamic_content(driver, max_attempts=20):
                     except:
                         continue
                 
-                if valid_items >= 5:
+                if valid_items >= min_items:
                     print(f"✓ Contenido cargado: {len(items)} elementos, {valid_items} válidos")
                     return True
             
@@ -177,8 +188,30 @@ def wait_for_dynamic_content(driver, max_attempts=20):
     
     return False
 
-def get_page_benefits(driver):
-    """Extrae beneficios de la página actual"""
+def extract_card(locate, category=None, state=None):
+    """Extrae una tarjeta; locate() entrega el div.carrousel__item (ver retry.relocator)"""
+    item = locate()
+    with metrics.span('card_extraction', scope='benefit'):
+        teaser = delta.teaser_hash(item.text) if state else None
+        benefit = state.lookup_teaser(teaser) if state else None
+        if benefit is not None:
+            if category:
+                benefit['category'] = category
+            metrics.incr('cards_unchanged')
+        else:
+            benefit = extract_benefit_from_carrousel_item(item, category)
+            if benefit and teaser:
+                benefit['teaser_hash'] = teaser
+    return benefit
+
+def get_page_benefits(driver, category=None, state=None):
+    """Extrae beneficios de la página actual
+
+    Con state (common.delta.DeltaState) las tarjetas cuyo texto no cambió desde
+    la ejecución anterior se reutilizan sin recorrer sus elementos internos.
+    Una tarjeta que falla por un error transitorio (stale) se vuelve a buscar
+    y se reintenta sola, sin repetir la página.
+    """
     benefits = []
     
     try:
@@ -187,9 +220,12 @@ def get_page_benefits(driver):
         
         for i, item in enumerate(items, 1):
             try:
-                benefit = extract_benefit_from_carrousel_item(item)
+                locate = retry.relocator(driver, "div.carrousel__item", i - 1, item)
+                benefit = retry.call(extract_card, locate, category, state,
+                                     policy=retry.QUICK_POLICY, label=f"tarjeta {i}")
                 if benefit:
                     benefits.append(benefit)
+                    metrics.incr('cards')
                     print(f"  {i}. {benefit['title'][:50]}...")
             except Exception as e:
                 print(f"  {i}. Error: {str(e)}")
@@ -219,6 +255,37 @@ def get_total_pages(driver):
     except:
         return 1
 
+LISTING_TITLES_JS = """
+return Array.from(document.querySelectorAll('div.carrousel__item p.card__title'),
+                  p => p.textContent.trim()).join('\\n');
+"""
+
+def _listing_titles(driver):
+    """Títulos de las tarjetas visibles en un solo viaje al navegador"""
+    return driver.execute_script(LISTING_TITLES_JS) or None
+
+def click_and_wait_for_change(driver, locate, timeout=15):
+    """Hace clic en locate() y espera a que cambien las tarjetas del listado
+
+    El clic pasa por common.scheduler, que define el ritmo contra el sitio. Si
+    el listado no cambia a tiempo el scheduler baja la velocidad y el clic se
+    reintenta (common.retry) salvo que el cambio haya llegado tarde.
+    """
+    previous = _listing_titles(driver)
+
+    def attempt():
+        if _listing_titles(driver) not in (None, previous):
+            return
+        with scheduler.slot(BENEFITS_URL) as request:
+            driver.execute_script("arguments[0].click();", locate())
+            try:
+                WebDriverWait(driver, timeout).until(lambda d: _listing_titles(d) not in (None, previous))
+            except TimeoutException:
+                request.fail()
+                raise
+
+    retry.call(attempt, breaker=BREAKER, label="cambio de listado")
+
 def go_to_next_page(driver):
     """Navega a la siguiente página"""
     try:
@@ -227,19 +294,23 @@ def go_to_next_page(driver):
         if next_button.get_attribute("disabled"):
             return False
         
-        # Hacer clic y esperar
-        driver.execute_script("arguments[0].click();", next_button)
-        time.sleep(3)
+        # Hacer clic y esperar a que se reemplacen las tarjetas
+        with metrics.span('pagination'):
+            click_and_wait_for_change(
+                driver, lambda: driver.find_element(By.CSS_SELECTOR, "button.paginator__button--right"))
+        metrics.incr('pages')
         
         return True
     except:
         return False
 
-def scrape_bci_benefits():
-    """Función principal de scraping"""
-    print("=== SCRAPER BCI v2 ===")
-    
-    # Configurar Chrome
+# Se puede apuntar a otro sitio (ej. benchmarks/standin_server.py) con BCI_BENEFITS_URL
+BENEFITS_URL = os.environ.get('BCI_BENEFITS_URL', "https://www.bci.cl/beneficios/beneficios-bci")
+ALL_CATEGORIES = "Todos"
+BREAKER = retry.breaker('bci')
+
+def create_driver():
+    """Crea un navegador Chrome headless configurado para BCI"""
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -250,60 +321,86 @@ def scrape_bci_benefits():
     options.add_argument('--log-level=3')
     options.add_experimental_option("excludeSwitches", ["enable-logging"])
     
-    try:
-        service = Service(log_path=os.devnull)
-        driver = webdriver.Chrome(service=service, options=options)
+    service = Service(log_path=os.devnull)
+    with metrics.span('browser_startup'):
+        driver = browser.launch('bci', options, service)
+    return metrics.instrument_driver(driver)
+
+def scrape_listing(driver, category=None, state=None):
+    """Recorre todas las páginas del listado actualmente cargado
+
+    Retorna (beneficios, truncated). truncated indica que alguna página no se
+    pudo leer o que no se llegó a la última (total_pages): lo leído es
+    válido, pero la ejecución es parcial y no se pueden marcar bajas.
+    """
+    # Obtener total de páginas
+    total_pages = get_total_pages(driver)
+    print(f"Total de páginas: {total_pages}")
+    
+    all_benefits = []
+    seen_titles = set()
+    truncated = False
+    
+    # Procesar todas las páginas
+    for page_num in range(1, total_pages + 1):
+        print(f"\n--- Página {page_num}/{total_pages} ---")
         
-        print("Cargando página BCI...")
-        driver.get("https://www.bci.cl/beneficios/beneficios-bci")
+        # Esperar a que cargue la página
+        if not wait_for_dynamic_content(driver, min_items=1 if category else 5):
+            print(f"✗ Error cargando página {page_num}")
+            truncated = True
+            continue
         
-        # Esperar a que cargue el contenido dinámico
-        if not wait_for_dynamic_content(driver):
-            print("Error: No se cargó el contenido dinámico")
-            driver.quit()
-            return []
+        # Extraer beneficios
+        with metrics.span('page_extraction', scope='page'):
+            page_benefits = get_page_benefits(driver, category, state)
         
-        # Obtener total de páginas
-        total_pages = get_total_pages(driver)
-        print(f"Total de páginas: {total_pages}")
+        # Filtrar duplicados
+        new_benefits = 0
+        for benefit in page_benefits:
+            title = benefit.get('title', '')
+            if title and title not in seen_titles:
+                seen_titles.add(title)
+                all_benefits.append(benefit)
+                new_benefits += 1
         
-        all_benefits = []
-        seen_titles = set()
+        print(f"Nuevos beneficios únicos: {new_benefits}")
+        print(f"Total acumulado: {len(all_benefits)}")
         
-        # Procesar todas las páginas
-        for page_num in range(1, total_pages + 1):
-            print(f"\n--- Página {page_num}/{total_pages} ---")
-            
-            # Esperar a que cargue la página
-            if not wait_for_dynamic_content(driver):
-                print(f"Error cargando página {page_num}")
-                continue
-            
-            # Extraer beneficios
-            page_benefits = get_page_benefits(driver)
-            
-            # Filtrar duplicados
-            new_benefits = 0
-            for benefit in page_benefits:
-                title = benefit.get('title', '')
-                if title and title not in seen_titles:
-                    seen_titles.add(title)
-                    all_benefits.append(benefit)
-                    new_benefits += 1
-            
-            print(f"Nuevos beneficios únicos: {new_benefits}")
-            print(f"Total acumulado: {len(all_benefits)}")
-            
-            # Navegar a siguiente página
-            if page_num < total_pages:
-                if not go_to_next_page(driver):
-                    print("No se pudo navegar a la siguiente página")
-                    break
+        # Navegar a siguiente página
+        if page_num < total_pages:
+            if not go_to_next_page(driver):
+                print(f"✗ No se pudo navegar a la página {page_num + 1} de {total_pages}")
+                truncated = True
+                break
+    
+    return all_benefits, truncated
+
+def scrape_bci_benefits(state=None):
+    """Función principal de scraping
+
+    Retorna (beneficios, listados incompletos), como scrape_bci_by_category;
+    el listado completo se identifica como ALL_CATEGORIES.
+    """
+    print("=== SCRAPER BCI v2 ===")
+    
+    try:
+        driver = create_driver()
+        
+        print("Cargando página BCI...")
+        try:
+            load_listing(driver)
+        except Exception as e:
+            print(f"Error: No se cargó el contenido dinámico ({str(e)})")
+            driver.quit()
+            return [], []
+        
+        all_benefits, truncated = scrape_listing(driver, state=state)
         
         driver.quit()
         print(f"\n✓ Scraping completado: {len(all_benefits)} beneficios únicos")
         
-        return all_benefits
+        return all_benefits, [ALL_CATEGORIES] if truncated else []
         
     except Exception as e:
         print(f"Error en scraping: {str(e)}")
@@ -311,18 +408,278 @@ def scrape_bci_benefits():
             driver.quit()
         except:
             pass
-        return []
+        return [], []
+
+def _load_listing(driver, min_items):
+    with metrics.span('page_load'), scheduler.slot(BENEFITS_URL):
+        driver.get(BENEFITS_URL)
+    if not wait_for_dynamic_content(driver, max_attempts=8, min_items=min_items):
+        raise retry.TransientError("no se cargó el contenido dinámico")
+
+def load_listing(driver, min_items=5):
+    """Carga el listado completo; si no aparece el contenido se recarga la página con backoff"""
+    retry.call(_load_listing, driver, min_items, breaker=BREAKER, label="carga del listado")
+
+def get_categories(driver):
+    """Lee las categorías de la barra categories-bar (li.list-categorie__item)"""
+    items = driver.find_elements(By.CSS_SELECTOR, "li.list-categorie__item")
+    categories = []
+    for index, item in enumerate(items):
+        name = ' '.join((item.get_attribute("name") or '').split())
+        if name and name != ALL_CATEGORIES:
+            categories.append((index, name))
+    return categories
+
+def select_category(driver, index):
+    """Hace clic en la categoría (equivale a setCurrentCategory en la app Vue)"""
+    items = driver.find_elements(By.CSS_SELECTOR, "li.list-categorie__item")
+    if index >= len(items):
+        return False
+    click_and_wait_for_change(driver, retry.relocator(driver, "li.list-categorie__item", index, items[index]))
+    return True
+
+def scrape_category(driver, index, name, state=None):
+    """Carga el listado de una categoría y extrae todas sus páginas
+
+    Si la categoría no se puede cargar el error se propaga: una categoría
+    fallida no es lo mismo que una categoría sin beneficios. Retorna
+    (beneficios, truncated), como scrape_listing.
+    """
+    load_listing(driver)
+    if not select_category(driver, index):
+        raise RuntimeError(f"No se encontró la categoría {name}")
+    return scrape_listing(driver, category=name, state=state)
+
+def scrape_bci_by_category(max_workers=4, state=None):
+    """Extrae los beneficios categoría por categoría en paralelo.
+
+    Cada categoría del sitio se recorre en un navegador del pool y los
+    beneficios quedan etiquetados con la categoría del sitio. Si un
+    beneficio aparece en varias categorías se conserva la primera según el
+    orden de la barra.
+
+    Retorna (beneficios, categorías que fallaron o quedaron incompletas); con
+    alguna la ejecución es parcial (ver delta.DeltaState.apply).
+    """
+    print("=== SCRAPER BCI v2 (por categoría) ===")
+    
+    try:
+        driver = create_driver()
+        load_listing(driver)
+        categories = get_categories(driver)
+        driver.quit()
+    except Exception as e:
+        print(f"Error leyendo categorías: {str(e)}")
+        try:
+            driver.quit()
+        except:
+            pass
+        return [], []
+    
+    print(f"Categorías encontradas: {len(categories)}")
+    
+    local = threading.local()
+    drivers = []
+    drivers_lock = threading.Lock()
+    
+    def worker(index, name):
+        if getattr(local, 'driver', None) is None:
+            local.driver = create_driver()
+            with drivers_lock:
+                drivers.append(local.driver)
+        return scrape_category(local.driver, index, name, state)
+    
+    results = {}
+    failed = []
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(worker, index, name): name for index, name in categories}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name], truncated = future.result()
+                except Exception as e:
+                    print(f"Error en la categoría {name}: {str(e)}")
+                    failed.append(name)
+                    continue
+                if truncated:
+                    failed.append(name)
+    finally:
+        for pooled_driver in drivers:
+            try:
+                pooled_driver.quit()
+            except:
+                pass
+    
+    all_benefits = merge_categories(categories, results)
+    print(f"\n✓ Scraping completado: {len(all_benefits)} beneficios únicos")
+    return all_benefits, failed
+
+def merge_categories(categories, results):
+    """Une los resultados por categoría; un beneficio repetido queda en la primera según la barra"""
+    all_benefits = []
+    seen_titles = set()
+    for _, name in categories:
+        for benefit in results.get(name, []):
+            if benefit['title'] not in seen_titles:
+                seen_titles.add(benefit['title'])
+                all_benefits.append(benefit)
+    return all_benefits
+
+# --- Motor Playwright (common.async_browser): todas las categorías en un solo Chromium ---
+
+CARD_TITLE_SELECTOR = "div.carrousel__item p.card__title"
+NEXT_PAGE_SELECTOR = "button.paginator__button--right"
+LISTING_TITLES_FN = "() => {" + LISTING_TITLES_JS + "}"
+CATEGORY_NAMES_FN = """
+items => items.map(item => (item.getAttribute('name') || '').replace(/\\s+/g, ' ').trim())
+"""
+MAX_LISTING_PAGES = 200
+
+async def scrape_listing_async(page, category=None):
+    """Como scrape_listing, con la página de Playwright; cada página se parsea con parse_listing_html
+
+    Retorna (beneficios, truncated); truncated si se llegó a MAX_LISTING_PAGES
+    con más páginas pendientes. Un clic fallido se propaga como error.
+    """
+    all_benefits = []
+    seen_titles = set()
+    truncated = False
+    
+    for page_num in range(1, MAX_LISTING_PAGES + 1):
+        with metrics.span('page_extraction', scope='page'):
+            page_benefits = parse_listing_html(await page.content(), category)
+        metrics.incr('cards', len(page_benefits))
+        
+        new_benefits = 0
+        for benefit in page_benefits:
+            if benefit['title'] not in seen_titles:
+                seen_titles.add(benefit['title'])
+                all_benefits.append(benefit)
+                new_benefits += 1
+        print(f"{category or 'Listado'} - página {page_num}: {new_benefits} nuevos, {len(all_benefits)} acumulados")
+        
+        next_button = await page.query_selector(NEXT_PAGE_SELECTOR)
+        if next_button is None or await next_button.is_disabled():
+            break
+        if page_num == MAX_LISTING_PAGES:
+            print(f"✗ {category or 'Listado'}: se alcanzó el máximo de {MAX_LISTING_PAGES} páginas y quedan más")
+            truncated = True
+            break
+        with metrics.span('pagination'):
+            await async_browser.click_and_wait_for_change(
+                page, lambda: page.query_selector(NEXT_PAGE_SELECTOR), LISTING_TITLES_FN, BENEFITS_URL, BREAKER)
+        metrics.incr('pages')
+    
+    return all_benefits, truncated
+
+async def scrape_category_async(pw_browser, index, name):
+    """Una categoría en su propia página (y contexto) del navegador compartido"""
+    async with pw_browser.page() as page:
+        await pw_browser.goto(page, BENEFITS_URL, breaker=BREAKER, wait_for=CARD_TITLE_SELECTOR)
+        
+        async def locate():
+            return (await page.query_selector_all("li.list-categorie__item"))[index]
+        
+        await async_browser.click_and_wait_for_change(page, locate, LISTING_TITLES_FN, BENEFITS_URL, BREAKER)
+        return await scrape_listing_async(page, category=name)
+
+async def _scrape_bci_async(by_category, max_pages):
+    async with async_browser.AsyncBrowser(max_pages=max_pages) as pw_browser:
+        async with pw_browser.page() as page:
+            await pw_browser.goto(page, BENEFITS_URL, breaker=BREAKER, wait_for=CARD_TITLE_SELECTOR)
+            if not by_category:
+                all_benefits, truncated = await scrape_listing_async(page)
+                return all_benefits, [ALL_CATEGORIES] if truncated else []
+            names = await page.eval_on_selector_all("li.list-categorie__item", CATEGORY_NAMES_FN)
+        categories = [(index, name) for index, name in enumerate(names) if name and name != ALL_CATEGORIES]
+        print(f"Categorías encontradas: {len(categories)}")
+        
+        outcomes = await asyncio.gather(*(scrape_category_async(pw_browser, index, name)
+                                          for index, name in categories), return_exceptions=True)
+        results = {}
+        failed = []
+        for (_, name), outcome in zip(categories, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"Error en la categoría {name}: {str(outcome)}")
+                failed.append(name)
+                continue
+            results[name], truncated = outcome
+            if truncated:
+                failed.append(name)
+        return merge_categories(categories, results), failed
+
+def scrape_bci_playwright(by_category=False, max_pages=8):
+    """scrape_bci_benefits / scrape_bci_by_category con Playwright
+
+    Un solo Chromium con hasta max_pages páginas abiertas a la vez (una por
+    categoría); las imágenes, fuentes y analítica no se descargan. Retorna
+    (beneficios, categorías que fallaron o quedaron incompletas), como
+    scrape_bci_by_category.
+    """
+    print(f"=== SCRAPER BCI v2 (Playwright{', por categoría' if by_category else ''}) ===")
+    if not async_browser.available():
+        print(async_browser.MISSING_MESSAGE)
+        return [], []
+    try:
+        all_benefits, failed = asyncio.run(_scrape_bci_async(by_category, max_pages))
+    except Exception as e:
+        print(f"Error en scraping: {str(e)}")
+        return [], []
+    print(f"\n✓ Scraping completado: {len(all_benefits)} beneficios únicos")
+    return all_benefits, failed
 
 def main():
     """Función principal"""
+    parser = argparse.ArgumentParser(description="Scraper de beneficios BCI")
+    parser.add_argument('--por-categoria', action='store_true',
+                        help="Recorre cada categoría del sitio en paralelo")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Número de navegadores (o páginas con Playwright) en paralelo (solo con --por-categoria)")
+    parser.add_argument('--motor', choices=['selenium', 'playwright'], default='selenium',
+                        help="playwright: un solo Chromium asíncrono con muchas páginas (requiere playwright)")
+    parser.add_argument('--delta', action='store_true',
+                        help="Escribe además solo las altas, cambios y bajas respecto de la ejecución anterior")
+    parser.add_argument('--enriquecer', action='store_true',
+                        help="Descarga la página de detalle de cada beneficio (data/benefits_bci_detalle.csv)")
+    browser.add_arguments(parser)
+    args = parser.parse_args()
+    browser.configure_from_args(args)
+    
+    metrics.start_run('bci')
+    # Las categorías del sitio y las por palabras clave no son comparables,
+    # así que cada modo lleva su propio estado incremental
+    provider = 'bci_categorias' if args.por_categoria else 'bci'
+    state = delta.DeltaState(provider)
     try:
-        benefits = scrape_bci_benefits()
+        if args.motor == 'playwright':
+            benefits, failed = scrape_bci_playwright(by_category=args.por_categoria, max_pages=args.workers)
+        elif args.por_categoria:
+            benefits, failed = scrape_bci_by_category(max_workers=args.workers, state=state)
+        else:
+            benefits, failed = scrape_bci_benefits(state=state)
         
+        if failed:
+            metrics.incr('failed_units', len(failed))
+            print(f"✗ Ejecución parcial, fallaron o quedaron incompletas {len(failed)} categorías ({', '.join(failed)}): "
+                  f"no se marcan bajas en esta ejecución")
         if benefits:
+            changes = state.apply(benefits, partial=bool(failed))
             success = save_benefits_to_csv(benefits)
+            if success and args.delta:
+                delta.save_changes_csv(changes, 'data/benefits_bci_delta.csv', [
+                    'id', 'title', 'description', 'category', 'url', 'offer_type',
+                    'offer_value', 'payment_method', 'created_at', 'updated_at'
+                ])
+            if success:
+                state.save()
+                benefit_store.append_run(provider, benefits, partial=bool(failed))
             
             if success:
                 print(f"✓ {len(benefits)} beneficios guardados en data/benefits_bci.csv")
+                if args.enriquecer:
+                    with metrics.span('enrich'):
+                        enrich.enrich_csv('data/benefits_bci.csv', base_url=BENEFITS_URL)
                 
                 # Estadísticas
                 categories = {}
@@ -342,6 +699,8 @@ def main():
         print("\nProceso interrumpido")
     except Exception as e:
         print(f"Error: {str(e)}")
+    finally:
+        metrics.finish_run()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
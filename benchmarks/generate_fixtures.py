@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generador de fixtures sintéticos a escala para los benchmarks
+
+Toma la estructura real de umayor/source/umayor.txt, entel/source/entel.txt y
+migrations/benefits.csv y escribe documentos equivalentes N veces más grandes
+(por defecto 10× y 100×; 10000× con --scales 10 100 10000). Cada registro
+generado es:
+
+- un duplicado exacto de uno ya emitido (probabilidad --duplicates),
+- un casi-duplicado: mismo beneficio con cambios menores de mayúsculas,
+  espacios, tildes o porcentajes (probabilidad --near-duplicates),
+- o un registro nuevo basado en una plantilla real con título único.
+
+Los archivos se escriben en streaming, así que 10000× no necesita tener el
+documento completo en memoria. Con --seed la salida es reproducible.
+
+Uso:
+    python benchmarks/generate_fixtures.py --scales 10 100 --output benchmarks/fixtures
+    python benchmarks/run_benchmarks.py --input umayor=benchmarks/fixtures/umayor_x100.txt
+"""
+
+import argparse
+import csv
+import html
+import json
+import os
+import random
+import re
+import shutil
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+UMAYOR_SOURCE = os.path.join(ROOT, 'umayor', 'source', 'umayor.txt')
+ENTEL_SOURCE = os.path.join(ROOT, 'entel', 'source', 'entel.txt')
+CSV_SOURCE = os.path.join(ROOT, 'migrations', 'benefits.csv')
+
+UMAYOR_CARD = re.compile(r'<div class="col-md-6 col-xl-4 ng-scope" ng-repeat="c in Collection".*?<!-- end ngRepeat: c in Collection -->', re.S)
+UMAYOR_MODAL = re.compile(r'<div ng-repeat="c in Collection" id="modalBeneficios\d+".*?<!-- end ngRepeat: c in Collection -->', re.S)
+UMAYOR_ID = re.compile(r'modalBeneficios(\d+)')
+UMAYOR_TITLE = re.compile(r'(<h[45] class="(?:modal-title )?ng-binding">)(.*?)(</h[45]>)', re.S)
+ENTEL_CARD = re.compile(r'<andino-card-general\b[^>]*?\beds-card="([^"]*)"[^>]*>.*?</andino-card-general>', re.S)
+
+ACCENTS = str.maketrans('áéíóúÁÉÍÓÚ', 'aeiouAEIOU')
+
+
+def near_duplicate(text, rng):
+    """Aplica un cambio menor que un humano consideraría el mismo beneficio"""
+    if not text:
+        return text
+    mutation = rng.randrange(5)
+    if mutation == 0:
+        return text.upper() if text != text.upper() else text.title()
+    if mutation == 1:
+        return '  ' + text.replace(' ', '  ', 1) + ' '
+    if mutation == 2:
+        stripped = text.translate(ACCENTS)
+        if stripped != text:
+            return stripped
+        return text + '.'
+    if mutation == 3:
+        match = re.search(r'\d+', text)
+        if match:
+            value = int(match.group()) + rng.choice([-5, 5])
+            return text[:match.start()] + str(max(value, 1)) + text[match.end():]
+        return text + ' '
+    words = text.split(' ')
+    if len(words) > 2:
+        i = rng.randrange(len(words) - 1)
+        words[i], words[i + 1] = words[i + 1], words[i]
+        return ' '.join(words)
+    return text.lower()
+
+
+class RecordMixer:
+    """Decide para cada registro si es nuevo, duplicado o casi-duplicado"""
+
+    def __init__(self, rng, duplicates, near_duplicates, memory=1000):
+        self.rng = rng
+        self.duplicates = duplicates
+        self.near_duplicates = near_duplicates
+        self.memory = memory
+        self.emitted = []
+
+    def next(self, fresh, mutate):
+        """fresh() crea un registro nuevo; mutate(record) uno casi duplicado"""
+        roll = self.rng.random()
+        if self.emitted and roll < self.duplicates:
+            record = self.rng.choice(self.emitted)
+        elif self.emitted and roll < self.duplicates + self.near_duplicates:
+            record = mutate(self.rng.choice(self.emitted))
+        else:
+            record = fresh()
+        # Se guarda una ventana acotada para no crecer en memoria a 10000×
+        if len(self.emitted) < self.memory:
+            self.emitted.append(record)
+        else:
+            self.emitted[self.rng.randrange(self.memory)] = record
+        return record
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def generate_umayor(scale, output_path, mixer):
+    content = _read(UMAYOR_SOURCE)
+    cards = [m for m in UMAYOR_CARD.finditer(content)]
+    modals = {UMAYOR_ID.search(m.group()).group(1): m.group() for m in UMAYOR_MODAL.finditer(content)}
+    prefix = content[:cards[0].start()]
+    middle_start = cards[-1].end()
+    first_modal = UMAYOR_MODAL.search(content)
+    middle = content[middle_start:first_modal.start()]
+    suffix = content[max(m.end() for m in UMAYOR_MODAL.finditer(content)):]
+
+    templates = []
+    for card in cards:
+        modal_id = UMAYOR_ID.search(card.group()).group(1)
+        templates.append((card.group(), modals.get(modal_id, '')))
+
+    counter = [0]
+
+    def fresh():
+        card, modal = mixer.rng.choice(templates)
+        counter[0] += 1
+        title_suffix = f' {counter[0]}'
+        return (UMAYOR_TITLE.sub(lambda m: m.group(1) + m.group(2) + title_suffix + m.group(3), card),
+                UMAYOR_TITLE.sub(lambda m: m.group(1) + m.group(2) + title_suffix + m.group(3), modal))
+
+    def mutate(record):
+        card, modal = record
+        title = UMAYOR_TITLE.search(card).group(2)
+        new_title = near_duplicate(title, mixer.rng)
+        return (UMAYOR_TITLE.sub(lambda m: m.group(1) + new_title + m.group(3), card),
+                UMAYOR_TITLE.sub(lambda m: m.group(1) + new_title + m.group(3), modal))
+
+    total = len(templates) * scale
+    # Las tarjetas y los modales van en secciones separadas, igual que en el
+    # HTML real; los modales se escriben a un temporal y se anexan al final
+    modals_path = output_path + '.modals'
+    with open(output_path, 'w', encoding='utf-8') as f, open(modals_path, 'w', encoding='utf-8') as modals_file:
+        f.write(prefix)
+        for n in range(1, total + 1):
+            card, modal = mixer.next(fresh, mutate)
+            f.write(UMAYOR_ID.sub(f'modalBeneficios{n}', card))
+            modals_file.write(UMAYOR_ID.sub(f'modalBeneficios{n}', modal))
+        f.write(middle)
+    with open(output_path, 'a', encoding='utf-8') as f, open(modals_path, 'r', encoding='utf-8') as modals_file:
+        shutil.copyfileobj(modals_file, f)
+        f.write(suffix)
+    os.remove(modals_path)
+    return total
+
+
+def generate_entel(scale, output_path, mixer):
+    content = _read(ENTEL_SOURCE)
+    cards = list(ENTEL_CARD.finditer(content))
+    prefix = content[:cards[0].start()]
+    suffix = content[cards[-1].end():]
+    templates = [json.loads(html.unescape(card.group(1))) for card in cards]
+    counter = [0]
+
+    def fresh():
+        data = json.loads(json.dumps(mixer.rng.choice(templates)))
+        counter[0] += 1
+        item = data[0]
+        item['title'] = f"{item.get('title', '')} {counter[0]}"
+        if item.get('href'):
+            item['href'] = f"{item['href'].rstrip('/')}-{counter[0]}"
+        return data
+
+    def mutate(record):
+        data = json.loads(json.dumps(record))
+        item = data[0]
+        item['title'] = near_duplicate(item.get('title', ''), mixer.rng)
+        item['text'] = near_duplicate(item.get('text', ''), mixer.rng)
+        return data
+
+    total = len(templates) * scale
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(prefix)
+        for _ in range(total):
+            data = mixer.next(fresh, mutate)
+            attr = html.escape(json.dumps(data, ensure_ascii=False), quote=True)
+            f.write(f'<andino-card-general eds-card="{attr}"></andino-card-general>\n')
+        f.write(suffix)
+    return total
+
+
+def generate_csv(scale, output_path, mixer):
+    with open(CSV_SOURCE, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        templates = list(reader)
+    counter = [0]
+
+    def fresh():
+        row = dict(mixer.rng.choice(templates))
+        counter[0] += 1
+        row['name'] = f"{row['name']} {counter[0]}"
+        return row
+
+    def mutate(record):
+        row = dict(record)
+        row['name'] = near_duplicate(row['name'], mixer.rng)
+        row['description'] = near_duplicate(row['description'], mixer.rng)
+        return row
+
+    total = len(templates) * scale
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for _ in range(total):
+            writer.writerow(mixer.next(fresh, mutate))
+    return total
+
+
+GENERATORS = {
+    'umayor': (generate_umayor, 'umayor_x{scale}.txt'),
+    'entel': (generate_entel, 'entel_x{scale}.txt'),
+    'builder': (generate_csv, 'benefits_x{scale}.csv'),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera fixtures sintéticos a escala desde los snapshots reales")
+    parser.add_argument('--scales', type=int, nargs='+', default=[10, 100],
+                        help="Factores de escala (ej. 10 100 10000)")
+    parser.add_argument('--only', action='append', choices=sorted(GENERATORS),
+                        help="Genera solo este tipo de fixture (se puede repetir)")
+    parser.add_argument('--duplicates', type=float, default=0.05,
+                        help="Proporción de duplicados exactos")
+    parser.add_argument('--near-duplicates', type=float, default=0.05,
+                        help="Proporción de casi-duplicados")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=os.path.join(ROOT, 'benchmarks', 'fixtures'))
+    args = parser.parse_args(argv)
+
+    if args.duplicates + args.near_duplicates > 1:
+        parser.error("--duplicates + --near-duplicates no puede superar 1")
+
+    os.makedirs(args.output, exist_ok=True)
+    for name in args.only or list(GENERATORS):
+        generate, filename = GENERATORS[name]
+        for scale in args.scales:
+            mixer = RecordMixer(random.Random(f'{args.seed}-{name}-{scale}'),
+                                args.duplicates, args.near_duplicates)
+            output_path = os.path.join(args.output, filename.format(scale=scale))
+            total = generate(scale, output_path, mixer)
+            size_mb = os.path.getsize(output_path) / (1024 * 1024)
+            print(f"✓ {output_path}: {total} registros, {size_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks offline de los parsers sobre los snapshots del repositorio
+
+Mide las rutas que no necesitan navegador ni red:
+
+- umayor:  umayor/interpreter_umayor.py sobre umayor/source/umayor.txt
+- entel:   entel/interpreter_entel.py sobre entel/source/entel.txt
+- bci:     bci/interpreter_bci.py sobre bci/source/bci.txt
+- builder: migrations/builder.py sobre migrations/benefits.csv
+
+Cada caso hace rondas de calentamiento y luego repite la medición. Se reporta
+registros/s, MB/s, la memoria máxima del proceso (RSS) y el pico de memoria
+asignada por Python en una ronda. La salida es JSON (--output) además de la
+tabla por consola, y cada resultado se agrega al historial por commit
+(common/history.py) salvo que se use --no-history.
+
+Uso:
+    python benchmarks/run_benchmarks.py --repeat 10 --output bench.json
+    python benchmarks/run_benchmarks.py --only umayor --input umayor=fixtures/umayor_x100.txt
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from common import history
+from common.metrics import peak_rss_mb
+
+
+def load_module(name, relative_path):
+    """Carga un script del repo por ruta (varios se llaman scraper.py)"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_text(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def setup_umayor(path):
+    interpreter = load_module('interpreter_umayor', 'umayor/interpreter_umayor.py')
+    content = read_text(path)
+    return (lambda: len(interpreter.parse_benefits(content))), len(content.encode('utf-8'))
+
+
+def setup_entel(path):
+    interpreter = load_module('interpreter_entel', 'entel/interpreter_entel.py')
+    content = read_text(path)
+    return (lambda: len(interpreter.extract_benefits_from_html(content))), len(content.encode('utf-8'))
+
+
+def setup_bci(path):
+    interpreter = load_module('interpreter_bci', 'bci/interpreter_bci.py')
+    content = read_text(path)
+    return (lambda: len(interpreter.parse_listing_html(content))), len(content.encode('utf-8'))
+
+
+def setup_builder(path):
+    builder = load_module('builder', 'migrations/builder.py')
+    output_dir = tempfile.mkdtemp(prefix='bench_builder_')
+    sql_path = os.path.join(output_dir, 'create_and_insert.sql')
+    csv_path = os.path.abspath(path)
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        rows = sum(1 for _ in f) - 1
+
+    def run():
+        builder.generar_sql_desde_csv(csv_path, sql_path)
+        return rows
+
+    return run, os.path.getsize(csv_path)
+
+
+BENCHMARKS = {
+    'umayor': (setup_umayor, 'umayor/source/umayor.txt'),
+    'entel': (setup_entel, 'entel/source/entel.txt'),
+    'bci': (setup_bci, 'bci/source/bci.txt'),
+    'builder': (setup_builder, 'migrations/benefits.csv'),
+}
+
+
+def run_benchmark(name, fn, size_bytes, warmup, repeat):
+    # Los scripts imprimen progreso; se descarta para no medir la consola
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        return _run_benchmark(name, fn, size_bytes, warmup, repeat)
+
+
+def _run_benchmark(name, fn, size_bytes, warmup, repeat):
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    records = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = fn()
+        timings.append(time.perf_counter() - start)
+
+    # La memoria se mide en una ronda aparte para no contaminar los tiempos
+    tracemalloc.start()
+    fn()
+    _, peak_alloc = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        'name': name,
+        'records': records,
+        'input_bytes': size_bytes,
+        'warmup': warmup,
+        'repeat': repeat,
+        'seconds_min': round(min(timings), 6),
+        'seconds_median': round(median, 6),
+        'seconds_stdev': round(statistics.stdev(timings), 6) if len(timings) > 1 else 0.0,
+        'records_per_second': round(records / median, 2) if median > 0 else 0.0,
+        'mb_per_second': round(size_bytes / (1024 * 1024) / median, 3) if median > 0 else 0.0,
+        'peak_alloc_mb': round(peak_alloc / (1024 * 1024), 2),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def parse_inputs(values):
+    inputs = {}
+    for value in values or []:
+        name, _, path = value.partition('=')
+        if name not in BENCHMARKS or not path:
+            raise SystemExit(f"--input inválido: {value} (formato NOMBRE=RUTA, nombres: {', '.join(BENCHMARKS)})")
+        inputs[name] = path
+    return inputs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks offline de los parsers de beneficios")
+    parser.add_argument('--only', action='append', choices=sorted(BENCHMARKS),
+                        help="Ejecuta solo este benchmark (se puede repetir)")
+    parser.add_argument('--input', action='append', metavar='NOMBRE=RUTA',
+                        help="Usa otro archivo de entrada para un benchmark")
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--output', help="Archivo JSON de salida")
+    parser.add_argument('--no-history', action='store_true',
+                        help="No agrega los resultados al historial de métricas")
+    args = parser.parse_args(argv)
+
+    inputs = parse_inputs(args.input)
+    results = []
+    for name in args.only or list(BENCHMARKS):
+        setup, default_path = BENCHMARKS[name]
+        path = inputs.get(name, os.path.join(ROOT, default_path))
+        try:
+            fn, size_bytes = setup(path)
+            result = run_benchmark(name, fn, size_bytes, args.warmup, args.repeat)
+        except ImportError as e:
+            print(f"✗ {name}: falta una dependencia ({str(e)})")
+            continue
+        result['input'] = os.path.relpath(path, ROOT)
+        results.append(result)
+        if not args.no_history:
+            # Con otra entrada se registra como serie aparte para no mezclar escalas
+            series = name if name not in inputs else f"{name}@{os.path.basename(path)}"
+            history.record('benchmark', series, {
+                key: result[key] for key in
+                ('records_per_second', 'mb_per_second', 'seconds_median', 'peak_rss_mb', 'peak_alloc_mb')
+            })
+        print(f"{name:8} {result['records']:>8} registros  "
+              f"{result['records_per_second']:>12.1f} reg/s  "
+              f"{result['mb_per_second']:>8.2f} MB/s  "
+              f"mediana {result['seconds_median'] * 1000:.2f} ms  "
+              f"RSS {result['peak_rss_mb']} MB")
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Resultados guardados en {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
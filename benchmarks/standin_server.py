@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sitio local que replica las páginas de beneficios para probar los scrapers
+
+Sirve réplicas de las tres páginas que recorren los scrapers con Selenium,
+armadas desde los datos guardados en el repo y sin ningún recurso externo:
+
+- /bancodechile/personas/beneficios: select #regionSearch, tarjetas a.card y
+  flecha i.icos-arrow-right-2 (datos de bancodechile/data/benefits_bancodechile.csv)
+- /bci/beneficios/beneficios-bci: barra de categorías, div.carrousel__item y
+  div.paginator (tarjetas de bci/source/bci.txt)
+- /entel/beneficios/: elementos andino-card-general con eds-card
+  (tarjetas de entel/source/entel.txt)
+- páginas de detalle de cada tarjeta BCI (/beneficios/beneficios-bci/detalle/…)
+  y Entel (/entel/detalle/…, los href de los eds-card se reescriben), con
+  condiciones, locales y términos para probar common/enrich.py
+- /images/<nombre>: un PNG de un color que depende solo del nombre (la query
+  no cambia el contenido), para probar migrations/assets.py
+
+--pages y --page-size controlan cuántas páginas tiene cada listado (las
+tarjetas se repiten con títulos únicos si hace falta), --latency-ms agrega
+demora a cada respuesta HTTP y --render-delay-ms a cada cambio de página o de
+filtro hecho en el navegador (emula las llamadas XHR del sitio real).
+--rate-limit responde 429 (Retry-After: 1) a las peticiones que pasen de ese
+número por segundo, para probar common/scheduler.py.
+
+Uso:
+    python benchmarks/standin_server.py --port 8765 --pages 5 --latency-ms 150
+    BCI_BENEFITS_URL=http://127.0.0.1:8765/bci/beneficios/beneficios-bci python bci/scraper_v2.py
+"""
+
+import argparse
+import base64
+import csv
+import functools
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+REGIONS = [
+    "Arica y Parinacota", "Tarapacá", "Antofagasta", "Atacama", "Coquimbo",
+    "Valparaíso", "Metropolitana de Santiago", "Libertador General Bernardo O'Higgins",
+    "Maule", "Ñuble", "Biobío", "La Araucanía", "Los Ríos", "Los Lagos",
+    "Aysén del General Carlos Ibáñez del Campo", "Magallanes y de la Antártica Chilena",
+]
+
+BCI_ITEM = re.compile(r'<div class="carrousel__item.*?</article></a></div>', re.S)
+BCI_CATEGORY = re.compile(r'<li name="([^"]+)" class="list-categorie__item')
+BCI_TITLE = re.compile(r'(<p class="card__title[^"]*">)\s*(.*?)\s*(</p>)', re.S)
+ENTEL_CARD = re.compile(r'<andino-card-general\b[^>]*?\beds-card="([^"]*)"')
+EXTERNAL_SRC = re.compile(r'src="https?://[^"]*"')
+
+# GIF transparente de 1x1 para reemplazar imágenes externas
+PIXEL_GIF = base64.b64decode('R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7')
+
+DETAIL_PREFIXES = ('/beneficios/beneficios-bci/detalle/', '/entel/detalle/')
+
+DETAIL_PAGE = '''<!DOCTYPE html>
+<html lang="es"><head><meta charset="utf-8"><title>{title}</title>
+<meta name="description" content="{title}: beneficio exclusivo para clientes pagando con tarjetas adheridas.">
+</head><body><header><nav>Inicio / Beneficios</nav></header>
+<main><h1>{title}</h1>
+<p>Disfruta de {title} con descuentos exclusivos durante toda la temporada.</p>
+<section><h2>Condiciones</h2><ul>
+<li>Válido pagando con tarjetas de crédito adheridas.</li>
+<li>No acumulable con otras promociones.</li>
+<li>Tope de descuento de $20.000 por transacción.</li>
+</ul></section>
+<section><h2>Locales adheridos</h2><ul>
+<li>Av. Providencia 1234, Providencia</li>
+<li>Av. Apoquindo {number}, Las Condes</li>
+</ul></section>
+<section><h2>Términos y condiciones</h2>
+<p>Beneficio sujeto a disponibilidad. Bases legales protocolizadas en notaría.</p>
+</section></main><footer>Todos los derechos reservados</footer></body></html>'''
+
+PAGE = '''<!DOCTYPE html>
+<html lang="es"><head><meta charset="utf-8"><title>{title}</title>
+<style>a.card, .carrousel__item {{ display: block; margin: 8px; }}
+i.icos-arrow-right-2 {{ display: inline-block; width: 24px; height: 24px; background: #ccc; }}</style>
+</head><body>
+{body}
+<script>var DATA = {data}; var RENDER_DELAY = {render_delay};</script>
+<script>{script}</script>
+</body></html>'''
+
+BANCOCHILE_SCRIPT = '''
+var current = {region: null, page: 0};
+var select = document.getElementById('regionSearch');
+function render() {
+  var list = document.getElementById('benefits');
+  var cards = DATA.regions[current.region] || [];
+  var start = current.page * DATA.pageSize;
+  var html = '';
+  cards.slice(start, start + DATA.pageSize).forEach(function (c) {
+    html += '<a class="card" href="#"><p class="font-700 text-3 text-gray-dark">' + c.title +
+            '</p><p class="overflow-ellipsis mb-2 text-2 text-gray">' + c.description + '</p></a>';
+  });
+  list.innerHTML = html;
+  var arrow = document.getElementById('next');
+  arrow.className = start + DATA.pageSize < cards.length ? 'icos-arrow-right-2 cursor-pointer' : 'icos-arrow-right-2';
+}
+select.addEventListener('change', function () {
+  current = {region: select.value, page: 0};
+  document.getElementById('benefits').innerHTML = '';
+  setTimeout(render, RENDER_DELAY);
+});
+document.getElementById('next').addEventListener('click', function () {
+  if (this.className.indexOf('cursor-pointer') < 0) return;
+  current.page += 1;
+  setTimeout(render, RENDER_DELAY);
+});
+'''
+
+BCI_SCRIPT = '''
+var current = {category: null, page: 1};
+function items() {
+  return DATA.items.filter(function (i) { return !current.category || i.category === current.category; });
+}
+function render() {
+  var all = items();
+  var pages = Math.max(1, Math.ceil(all.length / DATA.pageSize));
+  var start = (current.page - 1) * DATA.pageSize;
+  document.getElementById('carrousel').innerHTML = all.slice(start, start + DATA.pageSize)
+    .map(function (i) { return i.html; }).join(' ');
+  var html = '<ul class="paginator__wrap"><li><button class="paginator__button paginator__button--left"' +
+             (current.page === 1 ? ' disabled="disabled"' : '') + '>&lt;</button></li>';
+  for (var p = 1; p <= pages; p++) {
+    html += '<li><button class="paginator__button' + (p === current.page ? ' paginator__button--active' : '') +
+            '">' + p + '</button></li>';
+  }
+  html += '<li><button class="paginator__button paginator__button--right"' +
+          (current.page === pages ? ' disabled="disabled"' : '') + '>&gt;</button></li></ul>';
+  var paginator = document.getElementById('paginator');
+  paginator.innerHTML = html;
+  paginator.querySelector('.paginator__button--right').addEventListener('click', function () {
+    current.page += 1;
+    setTimeout(render, RENDER_DELAY);
+  });
+}
+document.querySelectorAll('li.list-categorie__item').forEach(function (li) {
+  li.addEventListener('click', function () {
+    current = {category: li.getAttribute('name') === 'Todos' ? null : li.getAttribute('name'), page: 1};
+    document.getElementById('carrousel').innerHTML = '';
+    setTimeout(render, RENDER_DELAY);
+  });
+});
+setTimeout(render, RENDER_DELAY);
+'''
+
+
+def _read(relative_path):
+    with open(os.path.join(ROOT, relative_path), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _json_for_script(data):
+    # Evita que un '</script>' dentro de los datos cierre el bloque
+    return json.dumps(data, ensure_ascii=False).replace('</', '<\\/')
+
+
+def _repeat_with_unique_titles(records, total, set_title):
+    """Repite records hasta total, agregando ' #n' al título en cada vuelta extra"""
+    result = []
+    for i in range(total):
+        record = records[i % len(records)]
+        cycle = i // len(records)
+        result.append(set_title(record, f' #{cycle + 1}') if cycle else record)
+    return result
+
+
+def build_bancochile_page(pages, page_size, render_delay):
+    with open(os.path.join(ROOT, 'bancodechile', 'data', 'benefits_bancodechile.csv'), newline='', encoding='utf-8') as f:
+        rows = [{'title': html.escape(r['title']), 'description': html.escape(r['description'])} for r in csv.DictReader(f)]
+
+    # Cada región recibe un subconjunto determinista; la Metropolitana las tiene todas,
+    # así los beneficios compartidos entre regiones ejercitan la deduplicación
+    rng = random.Random(7)
+    total = pages * page_size
+    regions = {}
+    for region in REGIONS:
+        if region == "Metropolitana de Santiago":
+            subset = rows
+        else:
+            subset = [row for row in rows if rng.random() < 0.4] or rows[:1]
+        regions[region] = _repeat_with_unique_titles(subset, total, lambda r, s: dict(r, title=r['title'] + s))
+
+    options = ''.join(f'<option value="{html.escape(region, quote=True)}">{html.escape(region)}</option>' for region in REGIONS)
+    body = (f'<select id="regionSearch"><option value="">Selecciona una región</option>{options}</select>'
+            '<div id="benefits"></div><i id="next" class="icos-arrow-right-2"></i>')
+    data = {'regions': regions, 'pageSize': page_size}
+    return PAGE.format(title='Beneficios Banco de Chile', body=body, data=_json_for_script(data),
+                       render_delay=render_delay, script=BANCOCHILE_SCRIPT)
+
+
+def build_bci_page(pages, page_size, render_delay):
+    content = _read('bci/source/bci.txt')
+    snippets = [EXTERNAL_SRC.sub('src="/pixel.gif"', m.group()) for m in BCI_ITEM.finditer(content)]
+    categories = [' '.join(name.split()) for name in BCI_CATEGORY.findall(content)]
+    filters = [name for name in categories if name != 'Todos']
+
+    def set_title(snippet, suffix):
+        return BCI_TITLE.sub(lambda m: m.group(1) + m.group(2) + suffix + m.group(3), snippet, count=1)
+
+    total = pages * page_size
+    items = [{'html': snippet, 'category': filters[i % len(filters)] if filters else ''}
+             for i, snippet in enumerate(_repeat_with_unique_titles(snippets, total, set_title))]
+
+    category_bar = ''.join(
+        f'<li name="{html.escape(name, quote=True)}" class="list-categorie__item">'
+        f'<p class="list-categorie__title">{html.escape(name)}</p></li>'
+        for name in categories
+    )
+    body = (f'<section id="app"><aside class="list-categorie"><ul class="list-categorie__list">{category_bar}</ul></aside>'
+            '<div class="benefits__wrap"><div id="carrousel"></div>'
+            '<div id="paginator" class="paginator"></div></div></section>')
+    data = {'items': items, 'pageSize': page_size}
+    return PAGE.format(title='Beneficios Bci', body=body, data=_json_for_script(data),
+                       render_delay=render_delay, script=BCI_SCRIPT)
+
+
+def build_entel_page(pages, page_size):
+    content = _read('entel/source/entel.txt')
+    cards = [json.loads(html.unescape(raw)) for raw in ENTEL_CARD.findall(content)]
+
+    def set_title(card, suffix):
+        card = json.loads(json.dumps(card))
+        card[0]['title'] = card[0].get('title', '') + suffix
+        return card
+
+    # Los detalles se sirven desde este mismo sitio
+    for card in cards:
+        for item in card:
+            if item.get('href'):
+                item['href'] = '/entel/detalle/' + item['href'].rstrip('/').rsplit('/', 1)[-1]
+
+    # Entel no pagina: --pages multiplica la cantidad de tarjetas en la página
+    total = max(len(cards), pages * page_size)
+    body = '\n'.join(
+        f'<andino-card-general eds-card="{html.escape(json.dumps(card, ensure_ascii=False), quote=True)}"></andino-card-general>'
+        for card in _repeat_with_unique_titles(cards, total, set_title)
+    )
+    return f'<!DOCTYPE html><html lang="es"><head><meta charset="utf-8"><title>Beneficios Entel</title></head><body>{body}</body></html>'
+
+
+@functools.lru_cache(maxsize=256)
+def solid_png(name, size=256):
+    color = hashlib.md5(name.encode('utf-8')).digest()[:3]
+    raw = b''.join(b'\x00' + color * size for _ in range(size))
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw)) + chunk(b'IEND', b''))
+
+
+def build_detail_page(path):
+    slug = path.rstrip('/').rsplit('/', 1)[-1]
+    title = html.escape(' '.join(re.sub(r'-[a-z0-9]*\d[a-z0-9]*$', '', slug).replace('-', ' ').split()).capitalize())
+    return DETAIL_PAGE.format(title=title, number=1000 + sum(map(ord, slug)) % 9000)
+
+
+class RateLimit:
+    """Ventana fija de un segundo; None o 0 es sin límite"""
+
+    def __init__(self, per_second):
+        self.per_second = per_second
+        self.window = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        if not self.per_second:
+            return True
+        with self.lock:
+            window = int(time.time())
+            if window != self.window:
+                self.window, self.count = window, 0
+            self.count += 1
+            return self.count <= self.per_second
+
+
+def make_handler(pages_by_path, latency_ms, jitter_ms, rate_limit=None):
+    limiter = RateLimit(rate_limit)
+
+    class StandInHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if not limiter.allow():
+                self.send_response(429)
+                self.send_header('Retry-After', '1')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            if latency_ms or jitter_ms:
+                time.sleep((latency_ms + random.uniform(0, jitter_ms)) / 1000)
+
+            path = self.path.split('?', 1)[0]
+            if path == '/pixel.gif':
+                body, content_type = PIXEL_GIF, 'image/gif'
+            elif path in pages_by_path:
+                body, content_type = pages_by_path[path].encode('utf-8'), 'text/html; charset=utf-8'
+            elif path.startswith('/images/'):
+                body, content_type = solid_png(path[len('/images/'):]), 'image/png'
+            elif path.startswith(DETAIL_PREFIXES):
+                body, content_type = build_detail_page(path).encode('utf-8'), 'text/html; charset=utf-8'
+            else:
+                self.send_error(404)
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StandInHandler
+
+
+def build_pages(pages, page_size, render_delay):
+    return {
+        '/bancodechile/personas/beneficios': build_bancochile_page(pages, page_size, render_delay),
+        '/bci/beneficios/beneficios-bci': build_bci_page(pages, page_size, render_delay),
+        '/entel/beneficios/': build_entel_page(pages, page_size),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sitio local de beneficios para probar los scrapers")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--pages', type=int, default=3, help="Páginas por listado")
+    parser.add_argument('--page-size', type=int, default=12, help="Tarjetas por página")
+    parser.add_argument('--latency-ms', type=float, default=0, help="Demora fija por respuesta HTTP")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Demora aleatoria adicional por respuesta")
+    parser.add_argument('--render-delay-ms', type=int, default=300,
+                        help="Demora de cada cambio de página o filtro en el navegador")
+    parser.add_argument('--rate-limit', type=int, default=0,
+                        help="Peticiones por segundo antes de responder 429 (0 = sin límite)")
+    args = parser.parse_args(argv)
+
+    pages_by_path = build_pages(args.pages, args.page_size, args.render_delay_ms)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(pages_by_path, args.latency_ms, args.jitter_ms, args.rate_limit))
+    base = f'http://{args.host}:{args.port}'
+    print(f"Sitio local escuchando en {base}")
+    print(f"  BANCOCHILE_BENEFITS_URL={base}/bancodechile/personas/beneficios")
+    print(f"  BCI_BENEFITS_URL={base}/bci/beneficios/beneficios-bci")
+    print(f"  ENTEL_BENEFITS_URL={base}/entel/beneficios/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor detenido")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de navegador asíncrono con Playwright: muchas páginas en un solo Chromium
+
+Con Selenium cada página concurrente es un navegador (y un hilo) aparte. Aquí
+un solo proceso Chromium y un solo event loop manejan decenas de páginas, cada
+una en su propio contexto (cookies y almacenamiento aislados, como una
+ventana de incógnito), con mucha menos memoria por página:
+
+    from common import async_browser
+
+    async def main():
+        async with async_browser.AsyncBrowser(max_pages=16) as browser:
+            async with browser.page() as page:
+                await browser.goto(page, url)
+                html = await page.content()
+
+- Bloqueo por rutas: imágenes, fuentes, media y los dominios de analítica
+  (BLOCKED_RESOURCE_TYPES, BLOCKED_HOSTS) se abortan antes de salir a la red;
+  los scrapers solo necesitan el DOM.
+- Intercepción de respuestas: cada respuesta suma a los contadores de
+  common.metrics; las 429/503 de subrecursos también le avisan al scheduler
+  del host. page(capture=...) guarda además el JSON de las respuestas cuya
+  URL coincide con la expresión regular, para leer datos que la app carga por
+  XHR sin tener que buscarlos en el DOM.
+- goto() pasa por common.scheduler (async_slot) y common.retry (call_async),
+  igual que las cargas de página de los scrapers con Selenium;
+  click_and_wait_for_change() hace lo mismo con la paginación.
+
+Playwright es opcional (pip install playwright && playwright install
+chromium); sin él available() es False y los scrapers lo avisan.
+"""
+
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+from common import metrics, retry, scheduler
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # Playwright es opcional: los scrapers usan Selenium por defecto
+    async_playwright = None
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+BLOCKED_HOSTS = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'facebook.net',
+                 'facebook.com', 'hotjar.com', 'clarity.ms', 'newrelic.com', 'nr-data.net')
+MISSING_MESSAGE = "✗ Playwright no está instalado (pip install playwright && playwright install chromium)"
+
+
+def available():
+    return async_playwright is not None
+
+
+def is_blocked(resource_type, url, block_types=BLOCKED_RESOURCE_TYPES):
+    if resource_type in block_types:
+        return True
+    host = urlparse(url).hostname or ''
+    return any(host == blocked or host.endswith('.' + blocked) for blocked in BLOCKED_HOSTS)
+
+
+class AsyncBrowser:
+    def __init__(self, max_pages=16, headless=True, block_types=BLOCKED_RESOURCE_TYPES, timeout=30):
+        """max_pages: páginas abiertas a la vez; timeout en segundos para cargas y esperas"""
+        if async_playwright is None:
+            raise RuntimeError(MISSING_MESSAGE)
+        self.max_pages = max_pages
+        self.headless = headless
+        self.block_types = block_types
+        self.timeout_ms = timeout * 1000
+        self._playwright = None
+        self.browser = None
+        self._pages = None
+
+    async def __aenter__(self):
+        self._pages = asyncio.Semaphore(self.max_pages)
+        self._playwright = await async_playwright().start()
+        with metrics.span('browser_startup'):
+            self.browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=['--no-sandbox', '--disable-dev-shm-usage'])
+        return self
+
+    async def __aexit__(self, *exc):
+        if self.browser is not None:
+            await self.browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    async def _route(self, route):
+        request = route.request
+        if is_blocked(request.resource_type, request.url, self.block_types):
+            metrics.incr('requests_blocked')
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @staticmethod
+    def _on_response(response, capture, captured):
+        metrics.incr('browser_responses')
+        if response.status in scheduler.THROTTLE_STATUS and response.request.resource_type != 'document':
+            # Un subrecurso limitado también cuenta para el ritmo del host (el documento ya pasó por goto)
+            metrics.incr('browser_throttled')
+            scheduler.host(response.url).throttle(response.headers.get('retry-after'))
+        if capture is not None and capture.search(response.url):
+            captured.append(response)
+
+    @asynccontextmanager
+    async def page(self, capture=None):
+        """Página en un contexto propio; se cierra al salir del bloque
+
+        capture: expresión regular de URL; las respuestas que coinciden quedan
+        en page.captured (ver captured_json).
+        """
+        async with self._pages:
+            context = await self.browser.new_context(user_agent=USER_AGENT,
+                                                     viewport={'width': 1920, 'height': 1080})
+            context.set_default_timeout(self.timeout_ms)
+            await context.route('**/*', self._route)
+            page = await context.new_page()
+            page.captured = []
+            pattern = re.compile(capture) if isinstance(capture, str) else capture
+            page.on('response', lambda response: self._on_response(response, pattern, page.captured))
+            try:
+                yield page
+            finally:
+                await context.close()
+
+    async def load(self, page, url):
+        """Un solo intento de page.goto bajo el scheduler del host
+
+        Los 429/5xx se levantan como retry.HttpStatusError para que el
+        reintento lo decida quien llama (goto o la unidad de reintento del scraper).
+        """
+        async with scheduler.async_slot(url) as request:
+            with metrics.span('page_load'):
+                response = await page.goto(url, wait_until='domcontentloaded')
+            if response is not None:
+                request.status = response.status
+                request.retry_after = response.headers.get('retry-after')
+        if response is not None and response.status in retry.TRANSIENT_STATUS:
+            raise retry.HttpStatusError(url, response.status, response.headers.get('retry-after'))
+        return response
+
+    async def goto(self, page, url, breaker=None, wait_for=None):
+        """load() con reintentos (ver common.retry); wait_for: selector que debe aparecer
+
+        La espera del selector es parte del intento, así una página que cargó
+        sin el contenido dinámico también se reintenta.
+        """
+        async def attempt():
+            response = await self.load(page, url)
+            if wait_for:
+                await page.wait_for_selector(wait_for)
+            return response
+
+        return await retry.call_async(attempt, breaker=breaker, label=url)
+
+
+async def click_and_wait_for_change(page, locate, titles_js, url, breaker=None, timeout=15):
+    """Click en locate() y espera a que cambie el listado (titles_js: función JS que retorna un string)
+
+    Igual que bci.scraper_v2.click_and_wait_for_change con Selenium: se
+    reintenta si el cambio no llega, y si el cambio llegó tarde después de un
+    intento fallido no se vuelve a hacer click.
+    """
+    previous = await page.evaluate(titles_js)
+    changed = f"previous => {{ const now = ({titles_js})(); return Boolean(now) && now !== previous; }}"
+
+    async def attempt():
+        if await page.evaluate(changed, previous):
+            return
+        async with scheduler.async_slot(url) as request:
+            element = await locate()
+            await element.evaluate('element => element.click()')
+            try:
+                await page.wait_for_function(changed, arg=previous, timeout=timeout * 1000)
+            except Exception:
+                request.fail()
+                raise
+
+    await retry.call_async(attempt, breaker=breaker, label='cambio de listado')
+
+
+async def captured_json(page):
+    """JSON de las respuestas capturadas por page(capture=...) (las que no son JSON se omiten)"""
+    payloads = []
+    for response in page.captured:
+        try:
+            payloads.append(await response.json())
+        except Exception:
+            continue
+    return payloads
+
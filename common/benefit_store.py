@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Almacén histórico de beneficios con intervalos de vigencia
+
+Cada ejecución de un scraper agrega sus beneficios a store/benefits.sqlite
+(cambiable con BENEFITS_STORE_FILE; se desactiva con BENEFITS_STORE=0). Una
+versión de un beneficio vale desde la ejecución en que apareció con ese
+contenido (valid_from) hasta la primera ejecución en que cambió o dejó de
+aparecer (valid_to). Las ejecuciones que no cambian nada no agregan filas.
+
+El contenido se guarda comprimido (JSON + zlib) y direccionado por su hash,
+así que dos versiones iguales ocupan un solo registro. Los índices por
+(provider, valid_from) y (provider, benefit_key) permiten responder sin
+recorrer todas las ejecuciones:
+
+    python common/benefit_store.py agregar bci data/benefits_bci.csv
+    python common/benefit_store.py vigentes bci 2025-03-01
+    python common/benefit_store.py historial umayor modalBeneficios12
+"""
+
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import zlib
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import delta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STORE_FILE = os.path.join(ROOT, 'store', 'benefits.sqlite')
+
+# Proveedores cuya llave estable es un id de origen y no la URL o el título
+ID_FIELDS = {'umayor': 'id'}
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS contents (
+    content_hash TEXT PRIMARY KEY,
+    record BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    provider TEXT NOT NULL,
+    benefit_key TEXT NOT NULL,
+    content_hash TEXT NOT NULL REFERENCES contents (content_hash),
+    valid_from TEXT NOT NULL,
+    valid_to TEXT
+);
+CREATE INDEX IF NOT EXISTS versions_by_time ON versions (provider, valid_from, valid_to);
+CREATE INDEX IF NOT EXISTS versions_by_key ON versions (provider, benefit_key, valid_from);
+CREATE TABLE IF NOT EXISTS runs (
+    provider TEXT NOT NULL,
+    run_at TEXT NOT NULL,
+    benefits INTEGER,
+    changes INTEGER
+);
+'''
+
+
+def store_file():
+    return os.environ.get('BENEFITS_STORE_FILE', DEFAULT_STORE_FILE)
+
+
+def enabled():
+    return os.environ.get('BENEFITS_STORE', '1') != '0'
+
+
+def connect(path=None):
+    path = path or store_file()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _pack(record):
+    return zlib.compress(json.dumps(record, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+
+
+def _unpack(blob):
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+
+def _as_timestamp(when):
+    """Una fecha sola (YYYY-MM-DD) se interpreta como el final de ese día"""
+    return when + 'T23:59:59.999999' if len(when) == 10 else when
+
+
+def append_run(provider, benefits, run_at=None, path=None, partial=False):
+    """Agrega los beneficios de una ejecución y cierra las versiones que cambiaron
+
+    Con partial=True (ver delta.DeltaState.apply) las versiones de los
+    beneficios que no aparecieron quedan abiertas. Retorna la cantidad de
+    cambios (versiones abiertas más versiones cerradas).
+    """
+    if not enabled():
+        return None
+    run_at = run_at or datetime.now().isoformat()
+    id_field = ID_FIELDS.get(provider)
+    conn = connect(path)
+    changes = 0
+    try:
+        with conn:
+            current = dict(conn.execute(
+                'SELECT benefit_key, content_hash FROM versions WHERE provider = ? AND valid_to IS NULL',
+                (provider,)))
+            seen = set()
+            for key, benefit in delta.unique_keys(provider, benefits, id_field):
+                seen.add(key)
+                record = {k: v for k, v in benefit.items()
+                          if k not in delta.BOOKKEEPING_FIELDS or k == id_field}
+                digest = delta.content_hash(record)
+                if current.get(key) == digest:
+                    continue
+                conn.execute('INSERT OR IGNORE INTO contents (content_hash, record) VALUES (?, ?)',
+                             (digest, _pack(record)))
+                if key in current:
+                    conn.execute('UPDATE versions SET valid_to = ? WHERE provider = ? AND benefit_key = ? AND valid_to IS NULL',
+                                 (run_at, provider, key))
+                conn.execute('INSERT INTO versions (provider, benefit_key, content_hash, valid_from) VALUES (?, ?, ?, ?)',
+                             (provider, key, digest, run_at))
+                changes += 1
+
+            for key in (set() if partial else current.keys() - seen):
+                conn.execute('UPDATE versions SET valid_to = ? WHERE provider = ? AND benefit_key = ? AND valid_to IS NULL',
+                             (run_at, provider, key))
+                changes += 1
+
+            conn.execute('INSERT INTO runs (provider, run_at, benefits, changes) VALUES (?, ?, ?, ?)',
+                         (provider, run_at, len(seen), changes))
+    except sqlite3.Error as e:
+        print(f"✗ Error al guardar en el almacén histórico: {str(e)}")
+        return None
+    finally:
+        conn.close()
+    return changes
+
+
+def as_of(provider, when, path=None):
+    """Beneficios vigentes de un proveedor en una fecha (YYYY-MM-DD o ISO)"""
+    when = _as_timestamp(when)
+    conn = connect(path)
+    try:
+        rows = conn.execute('''
+            SELECT v.benefit_key, c.record FROM versions v JOIN contents c USING (content_hash)
+            WHERE v.provider = ? AND v.valid_from <= ? AND (v.valid_to IS NULL OR v.valid_to > ?)
+            ORDER BY v.benefit_key
+        ''', (provider, when, when)).fetchall()
+    finally:
+        conn.close()
+    return [dict(_unpack(record), benefit_key=key) for key, record in rows]
+
+
+def versions_of(provider, key, path=None):
+    """Versiones de un beneficio ordenadas en el tiempo
+
+    key puede ser la llave completa (proveedor:...), el id de origen, la URL o
+    el título; se normaliza igual que delta.benefit_key.
+    """
+    if not key.startswith(f'{provider}:'):
+        key = f'{provider}:{key}' if ID_FIELDS.get(provider) or '://' in key else f'{provider}:{delta.normalize_title(key)}'
+    conn = connect(path)
+    try:
+        rows = conn.execute('''
+            SELECT v.valid_from, v.valid_to, v.content_hash, c.record
+            FROM versions v JOIN contents c USING (content_hash)
+            WHERE v.provider = ? AND (v.benefit_key = ? OR v.benefit_key LIKE ? ESCAPE '\\')
+            ORDER BY v.valid_from
+        ''', (provider, key, key.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '#%')).fetchall()
+    finally:
+        conn.close()
+    return [{'valid_from': valid_from, 'valid_to': valid_to, 'content_hash': digest, 'record': _unpack(record)}
+            for valid_from, valid_to, digest, record in rows]
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Almacén histórico de beneficios")
+    parser.add_argument('--file', help="Base SQLite (por defecto store/benefits.sqlite)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = subparsers.add_parser('agregar', help="Agrega un CSV como una ejecución")
+    add_parser.add_argument('proveedor')
+    add_parser.add_argument('csv')
+    add_parser.add_argument('--fecha', help="Fecha de la ejecución (por defecto la de modificación del CSV)")
+
+    as_of_parser = subparsers.add_parser('vigentes', help="Beneficios vigentes en una fecha")
+    as_of_parser.add_argument('proveedor')
+    as_of_parser.add_argument('fecha')
+
+    history_parser = subparsers.add_parser('historial', help="Versiones de un beneficio")
+    history_parser.add_argument('proveedor')
+    history_parser.add_argument('llave', help="Id de origen, URL o título")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'agregar':
+        run_at = args.fecha or datetime.fromtimestamp(os.path.getmtime(args.csv)).isoformat()
+        changes = append_run(args.proveedor, _read_csv(args.csv), run_at, args.file)
+        print(f"✓ {args.csv} agregado a {args.file or store_file()} ({changes} cambios)")
+    elif args.command == 'vigentes':
+        benefits = as_of(args.proveedor, args.fecha, args.file)
+        for benefit in benefits:
+            print(f"{benefit['benefit_key']}: {benefit.get('title') or benefit.get('name', '')}")
+        print(f"\n{len(benefits)} beneficios vigentes de {args.proveedor} al {args.fecha}")
+    else:
+        versions = versions_of(args.proveedor, args.llave, args.file)
+        for version in versions:
+            until = version['valid_to'] or 'vigente'
+            print(f"{version['valid_from'][:19]} → {until[:19]}  {version['content_hash'][:10]}  "
+                  f"{json.dumps(version['record'], ensure_ascii=False)[:120]}")
+        if not versions:
+            print("No hay versiones para esa llave")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
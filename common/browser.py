@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Chrome con perfil persistente por proveedor y conexión a un Chrome ya abierto
+
+Por defecto cada scraper abre Chrome con un perfil vacío y vuelve a bajar los
+bundles JS, las fuentes y la app Vue de BCI en cada ejecución. Hay dos modos
+para evitarlo, que se activan con flags de los scrapers o con variables de
+entorno (para los scripts sin argparse):
+
+- perfil persistente (--perfil-persistente o BENEFITS_CHROME_PROFILE=1): cada
+  navegador usa --user-data-dir=cache/chrome/<proveedor>/<n> (n es el primer
+  perfil libre, así los pools de varios navegadores no comparten perfil) con
+  la caché HTTP de disco limitada a BENEFITS_CHROME_CACHE_MB (256 por
+  defecto). Antes de abrirlo, si el perfil pasa de BENEFITS_CHROME_PROFILE_MB
+  (512) se borran los archivos de caché más antiguos.
+- conexión a un Chrome vivo (--conectar 127.0.0.1:9222 o
+  BENEFITS_CHROME_DEBUGGER): el driver se conecta por debuggerAddress a un
+  Chrome headless que sigue abierto entre ejecuciones programadas, así que no
+  hay arranque de navegador y la caché ya está caliente. Cada driver trabaja
+  en una pestaña propia, que se cierra en quit(); el navegador sigue abierto.
+  Ese Chrome se levanta con:
+
+      python common/browser.py --proveedor bci --puerto 9222
+
+Uso desde un scraper:
+
+    driver = browser.launch('bci', options, service)
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PROFILE_DIR = os.path.join(ROOT, 'cache', 'chrome')
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+# Subdirectorios del perfil que son solo caché y se pueden borrar sin romperlo
+CACHE_SUBDIRS = ('Cache', 'Code Cache', 'GPUCache', 'DawnCache', 'GrShaderCache', 'ShaderCache',
+                 os.path.join('Service Worker', 'CacheStorage'), os.path.join('Service Worker', 'ScriptCache'))
+
+_settings = {
+    'profile': os.environ.get('BENEFITS_CHROME_PROFILE', '0') == '1',
+    'debugger': os.environ.get('BENEFITS_CHROME_DEBUGGER') or None,
+}
+_in_use = set()
+_in_use_lock = threading.Lock()
+
+
+def profile_root():
+    return os.environ.get('BENEFITS_CHROME_PROFILE_DIR', DEFAULT_PROFILE_DIR)
+
+
+def cache_mb():
+    return int(os.environ.get('BENEFITS_CHROME_CACHE_MB', 256))
+
+
+def profile_mb():
+    return int(os.environ.get('BENEFITS_CHROME_PROFILE_MB', 512))
+
+
+def configure(profile=None, debugger=None):
+    """Activa los modos para los navegadores que se abran después (None deja el valor actual)"""
+    if profile is not None:
+        _settings['profile'] = profile
+    if debugger is not None:
+        _settings['debugger'] = debugger or None
+
+
+def add_arguments(parser):
+    parser.add_argument('--perfil-persistente', action='store_true',
+                        help="Usa un perfil de Chrome persistente por proveedor (caché HTTP entre ejecuciones)")
+    parser.add_argument('--conectar', metavar='HOST:PUERTO',
+                        help="Se conecta a un Chrome ya abierto con --remote-debugging-port")
+
+
+def configure_from_args(args):
+    configure(profile=args.perfil_persistente or None, debugger=args.conectar)
+
+
+def _acquire_profile(provider):
+    """Primer perfil del proveedor que no esté en uso en este proceso ni por otro Chrome"""
+    base = os.path.join(profile_root(), provider)
+    with _in_use_lock:
+        n = 0
+        while True:
+            path = os.path.join(base, str(n))
+            # Chrome deja el symlink SingletonLock mientras el perfil está abierto
+            if path not in _in_use and not os.path.lexists(os.path.join(path, 'SingletonLock')):
+                _in_use.add(path)
+                os.makedirs(path, exist_ok=True)
+                return path
+            n += 1
+
+
+def _release_profile(path):
+    with _in_use_lock:
+        _in_use.discard(path)
+
+
+def _dir_size(path):
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def prune_profile(path, max_mb=None):
+    """Si el perfil pasa de max_mb borra archivos de caché, los más antiguos primero, hasta el 80%
+
+    Retorna los bytes liberados.
+    """
+    limit = (max_mb or profile_mb()) * 1024 * 1024
+    size = _dir_size(path)
+    if size <= limit:
+        return 0
+    files = []
+    for dirpath, _, filenames in os.walk(path):
+        relative = os.sep + os.path.relpath(dirpath, path) + os.sep
+        if not any(os.sep + subdir + os.sep in relative for subdir in CACHE_SUBDIRS):
+            continue
+        for name in filenames:
+            file_path = os.path.join(dirpath, name)
+            try:
+                stat = os.lstat(file_path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file_path))
+    freed = 0
+    for _, file_size, file_path in sorted(files):
+        if size - freed <= limit * 0.8:
+            break
+        try:
+            os.remove(file_path)
+            freed += file_size
+        except OSError:
+            pass
+    print(f"✓ Perfil {path} recortado: {freed / 1024 / 1024:.1f} MB de caché liberados")
+    return freed
+
+
+def _wrap_quit(driver, on_quit):
+    """Agrega on_quit a driver.quit en la instancia (como webdriver_stats.instrument con execute)"""
+    original_quit = driver.quit
+
+    def quit():
+        try:
+            on_quit()
+        finally:
+            original_quit()
+
+    driver.quit = quit
+    return driver
+
+
+def launch(provider, options, service=None):
+    """Abre un webdriver.Chrome según el modo configurado (ver el docstring del módulo)
+
+    options son las opciones normales del scraper; al conectarse a un Chrome
+    vivo se ignoran porque ese navegador ya está configurado.
+    """
+    from selenium import webdriver
+
+    if _settings['debugger']:
+        attach_options = type(options)()
+        attach_options.debugger_address = _settings['debugger']
+        driver = webdriver.Chrome(service=service, options=attach_options)
+        original_handles = set(driver.window_handles)
+        driver.switch_to.new_window('tab')
+        tab = driver.current_window_handle
+
+        def close_tab():
+            # El driver no cierra un Chrome al que solo se conectó: se cierra la pestaña propia
+            if tab not in original_handles and tab in driver.window_handles:
+                driver.switch_to.window(tab)
+                driver.close()
+
+        return _wrap_quit(driver, close_tab)
+
+    if _settings['profile']:
+        path = _acquire_profile(provider)
+        try:
+            prune_profile(path)
+            options.add_argument(f'--user-data-dir={path}')
+            options.add_argument(f'--disk-cache-size={cache_mb() * 1024 * 1024}')
+            driver = webdriver.Chrome(service=service, options=options)
+        except Exception:
+            _release_profile(path)
+            raise
+        return _wrap_quit(driver, lambda: _release_profile(path))
+
+    return webdriver.Chrome(service=service, options=options)
+
+
+def find_chrome():
+    binary = os.environ.get('CHROME_BINARY')
+    if binary:
+        return binary
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mantiene abierto un Chrome headless para conectar los scrapers")
+    parser.add_argument('--proveedor', default='compartido', help="Perfil a usar (cache/chrome/<proveedor>/servidor)")
+    parser.add_argument('--puerto', type=int, default=9222, help="Puerto de --remote-debugging-port")
+    parser.add_argument('--chrome', help="Ejecutable de Chrome (por defecto CHROME_BINARY o el del PATH)")
+    args = parser.parse_args(argv)
+
+    binary = args.chrome or find_chrome()
+    if not binary:
+        print("✗ No se encontró Chrome; usa --chrome o CHROME_BINARY")
+        return 1
+    path = os.path.join(profile_root(), args.proveedor, 'servidor')
+    os.makedirs(path, exist_ok=True)
+    prune_profile(path)
+    command = [binary, '--headless=new', '--no-sandbox', '--disable-gpu', '--window-size=1920,1080',
+               f'--remote-debugging-port={args.puerto}', '--remote-debugging-address=127.0.0.1',
+               f'--user-data-dir={path}', f'--disk-cache-size={cache_mb() * 1024 * 1024}', 'about:blank']
+    print(f"✓ Chrome en 127.0.0.1:{args.puerto} con perfil {path}; conectar con --conectar 127.0.0.1:{args.puerto}")
+    try:
+        return subprocess.call(command)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
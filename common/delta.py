@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Scraping incremental: llave estable y huella de contenido por beneficio
+
+Cada proveedor guarda entre ejecuciones un estado en state/<proveedor>.json
+(cambiable con BENEFITS_STATE_DIR) con, por beneficio:
+
+- la llave estable: id de origen (ej. modalBeneficiosN de umayor), la URL del
+  detalle o, si no hay, proveedor + título normalizado
+- el hash del contenido y el hash del texto de la tarjeta (teaser)
+- id, created_at y updated_at persistentes
+
+Con eso:
+
+- DeltaState.lookup_teaser() permite saltarse la extracción campo a campo de
+  una tarjeta cuyo texto no cambió y reutilizar el registro guardado
+- DeltaState.apply() asigna ids y timestamps estables y devuelve solo las
+  altas, cambios y bajas de la ejecución
+- save_changes_csv() escribe esos cambios con una columna change
+  (insert / update / delete)
+"""
+
+import csv
+import hashlib
+import json
+import os
+import unicodedata
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STATE_DIR = os.path.join(ROOT, 'state')
+
+# Campos que describen la ejecución y no el beneficio; no entran en la huella
+BOOKKEEPING_FIELDS = ('id', 'created_at', 'updated_at', 'is_active', 'teaser_hash', 'change')
+
+
+def normalize_title(title):
+    """Minúsculas, sin tildes ni espacios de ancho cero y con los espacios colapsados"""
+    text = unicodedata.normalize('NFKD', (title or '').replace('\u200b', ' '))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return ' '.join(text.lower().split())
+
+
+def benefit_key(provider, benefit, id_field=None):
+    if id_field and benefit.get(id_field):
+        return f"{provider}:{benefit[id_field]}"
+    if benefit.get('url'):
+        return f"{provider}:{benefit['url']}"
+    # El CSV consolidado (migrations/benefits.csv) usa name en vez de title
+    return f"{provider}:{normalize_title(benefit.get('title') or benefit.get('name', ''))}"
+
+
+def unique_keys(provider, benefits, id_field=None):
+    """Llave de cada beneficio; dos beneficios distintos con la misma llave se desambiguan por orden"""
+    seen = set()
+    for benefit in benefits:
+        key = base_key = benefit_key(provider, benefit, id_field)
+        n = 2
+        while key in seen:
+            key, n = f'{base_key}#{n}', n + 1
+        seen.add(key)
+        yield key, benefit
+
+
+def content_hash(benefit):
+    content = {k: v for k, v in benefit.items() if k not in BOOKKEEPING_FIELDS}
+    payload = json.dumps(content, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def teaser_hash(text):
+    """Huella barata del texto completo de una tarjeta (una sola llamada WebDriver)"""
+    return hashlib.sha1(' '.join((text or '').split()).encode('utf-8')).hexdigest()
+
+
+class DeltaState:
+    """Estado persistente de un proveedor entre ejecuciones"""
+
+    def __init__(self, provider, id_field=None, state_dir=None):
+        self.provider = provider
+        self.id_field = id_field
+        state_dir = state_dir or os.environ.get('BENEFITS_STATE_DIR', DEFAULT_STATE_DIR)
+        self.path = os.path.join(state_dir, f'{provider}.json')
+        self.entries = {}
+        self.next_id = 1
+        self.load()
+        self.teasers = {entry['teaser_hash']: key for key, entry in self.entries.items()
+                        if entry.get('teaser_hash') and entry.get('active')}
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get('entries', {})
+            self.next_id = data.get('next_id', 1)
+        except (OSError, ValueError) as e:
+            print(f"✗ Estado incremental ilegible en {self.path}, se parte de cero: {str(e)}")
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'provider': self.provider, 'next_id': self.next_id, 'entries': self.entries},
+                      f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def lookup_teaser(self, teaser):
+        """Registro guardado de una tarjeta con el mismo texto, o None"""
+        key = self.teasers.get(teaser)
+        if key is None:
+            return None
+        record = dict(self.entries[key]['record'])
+        record['teaser_hash'] = teaser
+        return record
+
+    def apply(self, benefits, partial=False):
+        """Compara los beneficios de esta ejecución con el estado guardado
+
+        Completa id, created_at y updated_at en cada beneficio (estables entre
+        ejecuciones) y retorna la lista de cambios: dicts del beneficio con una
+        llave change en 'insert', 'update' o 'delete'.
+
+        partial=True es una ejecución en que falló alguna región o categoría:
+        los beneficios que no aparecieron pueden estar en la parte que falló,
+        así que no se emiten bajas y siguen activos.
+        """
+        now = datetime.now().isoformat()
+        changes = []
+        seen = set()
+
+        for key, benefit in unique_keys(self.provider, benefits, self.id_field):
+            seen.add(key)
+
+            digest = content_hash(benefit)
+            entry = self.entries.get(key)
+            record = {k: v for k, v in benefit.items()
+                      if k not in BOOKKEEPING_FIELDS or k == self.id_field}
+
+            if entry is None:
+                entry = {'id': self.next_id, 'created_at': now, 'updated_at': now}
+                self.next_id += 1
+                self.entries[key] = entry
+                change = 'insert'
+            elif not entry.get('active'):
+                entry['updated_at'] = now
+                change = 'insert'
+            elif entry['hash'] != digest:
+                entry['updated_at'] = now
+                change = 'update'
+            else:
+                change = None
+
+            entry.update({'hash': digest, 'record': record, 'active': True, 'last_seen': now})
+            if benefit.get('teaser_hash'):
+                entry['teaser_hash'] = benefit['teaser_hash']
+
+            if self.id_field is None:
+                benefit['id'] = entry['id']
+            benefit['created_at'] = entry['created_at']
+            benefit['updated_at'] = entry['updated_at']
+            if change:
+                changes.append(dict(benefit, change=change))
+
+        if not partial:
+            for key, entry in self.entries.items():
+                if key not in seen and entry.get('active'):
+                    entry['active'] = False
+                    entry['updated_at'] = now
+                    removed = dict(entry['record'], created_at=entry['created_at'], updated_at=now, change='delete')
+                    if self.id_field is None:
+                        removed['id'] = entry['id']
+                    changes.append(removed)
+
+        return changes
+
+
+def save_changes_csv(changes, filename, fieldnames):
+    """Escribe solo los cambios de la ejecución, con la columna change al inicio"""
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=['change'] + list(fieldnames), extrasaction='ignore')
+        writer.writeheader()
+        for change in changes:
+            writer.writerow(change)
+
+    counts = {}
+    for change in changes:
+        counts[change['change']] = counts.get(change['change'], 0) + 1
+    summary = ', '.join(f'{kind}: {count}' for kind, count in sorted(counts.items())) or 'sin cambios'
+    print(f"✓ Cambios guardados en {filename} ({summary})")
+    return counts
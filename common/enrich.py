@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Enriquecimiento de beneficios con su página de detalle
+
+Los listados solo traen el texto corto de la tarjeta. Esta etapa descarga en
+paralelo la página de detalle de cada beneficio (la columna url: href de las
+tarjetas BCI o de los eds-card de Entel) con common.http_client, que limita
+las conexiones por host y guarda las páginas en caché, y extrae:
+
+- detail_description: la descripción completa (meta description o primer párrafo)
+- conditions: condiciones y requisitos de uso
+- locations: locales o sucursales adheridas
+- terms: términos y condiciones / bases legales
+
+Los ítems de cada campo (párrafos o elementos de lista) van separados por " | ".
+
+Las secciones se reconocen por el texto de sus títulos (h2-h5, strong), así
+que la misma lógica sirve para los dos sitios. Uso:
+
+    python common/enrich.py data/benefits_bci.csv --base-url https://www.bci.cl
+    python common/enrich.py entel/data/benefits_entel.csv --salida /tmp/entel_detalle.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import metrics
+from common.delta import normalize_title
+from common.http_client import HttpClient
+
+ENRICH_FIELDS = ['detail_description', 'conditions', 'locations', 'terms']
+
+# Títulos de sección → campo; se revisan en orden ("Términos y condiciones" es terms)
+SECTION_TITLES = [
+    ('terms', ('terminos', 'bases legales', 'bases del', 'letra chica', 'legal')),
+    ('locations', ('locales', 'sucursales', 'direccion', 'donde', 'ubicacion', 'tiendas adheridas')),
+    ('conditions', ('condiciones', 'requisitos', 'como acceder', 'como usar', 'restricciones', 'vigencia')),
+]
+HEADINGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'strong', 'b']
+
+
+def _text(node):
+    return ' '.join(node.get_text(' ').replace('\u200b', ' ').split())
+
+
+def _section_field(heading):
+    title = normalize_title(_text(heading))
+    if not title or len(title) > 60:
+        return None
+    for field, words in SECTION_TITLES:
+        if any(word in title for word in words):
+            return field
+    return None
+
+
+def _section_content(heading):
+    """Textos que siguen a un título hasta el siguiente título (ítems de lista por separado)"""
+    node = heading
+    # Un <strong> dentro de un <p> es el título de ese párrafo: el contenido va después del párrafo
+    if heading.name in ('strong', 'b') and heading.parent is not None and heading.parent.name == 'p':
+        node = heading.parent
+    items = []
+    for sibling in node.find_next_siblings():
+        if sibling.name in HEADINGS or sibling.find(['h1', 'h2', 'h3', 'h4', 'h5']):
+            break
+        if sibling.name == 'p' and sibling.find(['strong', 'b']) and _section_field(sibling.find(['strong', 'b'])):
+            break
+        lis = sibling.find_all('li')
+        if lis:
+            items.extend(_text(li) for li in lis)
+        else:
+            items.append(_text(sibling))
+    return [item for item in items if item]
+
+
+def parse_detail(content):
+    """Extrae los campos de ENRICH_FIELDS del HTML de una página de detalle"""
+    soup = BeautifulSoup(content, 'html.parser')
+    # Los datos estructurados se leen antes de quitar los script, así su JSON no queda en el texto de las secciones
+    structured = [script.string or '' for script in soup.find_all('script', type='application/ld+json')]
+    for tag in soup(['script', 'style', 'noscript', 'nav', 'header', 'footer']):
+        tag.decompose()
+
+    sections = {field: [] for field in ENRICH_FIELDS}
+    for heading in soup.find_all(HEADINGS):
+        field = _section_field(heading)
+        if field:
+            sections[field].extend(item for item in _section_content(heading) if item not in sections[field])
+
+    # Direcciones publicadas como datos estructurados (schema.org)
+    for raw in structured:
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            address = item.get('address') if isinstance(item, dict) else None
+            if isinstance(address, dict):
+                address = ', '.join(str(address[k]) for k in ('streetAddress', 'addressLocality') if address.get(k))
+            if isinstance(address, str) and address not in sections['locations']:
+                sections['locations'].append(address)
+
+    meta = soup.find('meta', attrs={'name': 'description'}) or soup.find('meta', attrs={'property': 'og:description'})
+    description = (meta.get('content') or '').strip() if meta else ''
+    if not description:
+        main = soup.find('main') or soup.body or soup
+        paragraph = main.find('p')
+        description = _text(paragraph) if paragraph else ''
+
+    return {
+        'detail_description': description,
+        'conditions': ' | '.join(sections['conditions']),
+        'locations': ' | '.join(sections['locations']),
+        'terms': ' | '.join(sections['terms']),
+    }
+
+
+def enrich_benefits(benefits, base_url=None, per_host=4, workers=16, client=None):
+    """Agrega ENRICH_FIELDS a cada beneficio (en el mismo dict); retorna (enriquecidos, fallidos)
+
+    Las URL relativas (los href de BCI) se resuelven contra base_url. Varios
+    beneficios con la misma URL comparten una sola descarga.
+    """
+    by_url = {}
+    for benefit in benefits:
+        for field in ENRICH_FIELDS:
+            benefit.setdefault(field, '')
+        url = urljoin(base_url, benefit['url']) if base_url and benefit.get('url') else benefit.get('url', '')
+        if url.startswith(('http://', 'https://')):
+            by_url.setdefault(url, []).append(benefit)
+
+    def handle(response):
+        if not response.ok:
+            raise ValueError(f"HTTP {response.status_code}")
+        with metrics.span('detail_parse'):
+            return parse_detail(response.text)
+
+    own_client = client is None
+    client = client or HttpClient(per_host=per_host)
+    enriched = failed = 0
+    try:
+        for url, result in client.map(by_url, workers=workers, handler=handle):
+            if isinstance(result, Exception):
+                failed += len(by_url[url])
+                print(f"✗ Error al enriquecer {url}: {str(result)}")
+                continue
+            for benefit in by_url[url]:
+                benefit.update(result)
+                enriched += 1
+    finally:
+        if own_client:
+            client.close()
+    metrics.incr('benefits_enriched', enriched)
+    metrics.incr('benefits_enrich_failed', failed)
+    return enriched, failed
+
+
+def enrich_csv(csv_filename, output_filename=None, base_url=None, per_host=4, workers=16):
+    """Lee un CSV de un scraper y escribe el mismo CSV con las columnas de detalle agregadas"""
+    output_filename = output_filename or os.path.splitext(csv_filename)[0] + '_detalle.csv'
+    with open(csv_filename, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames or [])
+        benefits = list(reader)
+
+    start = time.perf_counter()
+    enriched, failed = enrich_benefits(benefits, base_url, per_host, workers)
+    elapsed = time.perf_counter() - start
+
+    fieldnames += [field for field in ENRICH_FIELDS if field not in fieldnames]
+    with metrics.span('csv_write'), open(output_filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(benefits)
+    metrics.record_file_written(output_filename)
+    print(f"✓ {enriched} beneficios enriquecidos en {elapsed:.2f}s ({failed} fallidos) → {output_filename}")
+    return output_filename
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enriquece beneficios con su página de detalle")
+    parser.add_argument('csv', help="CSV de un scraper con columna url")
+    parser.add_argument('--salida', help="CSV de salida (por defecto <csv>_detalle.csv)")
+    parser.add_argument('--base-url', help="Base para resolver URLs relativas (ej. https://www.bci.cl)")
+    parser.add_argument('--por-host', type=int, default=4, help="Conexiones simultáneas por host")
+    parser.add_argument('--workers', type=int, default=16, help="Descargas en paralelo en total")
+    args = parser.parse_args(argv)
+
+    metrics.start_run('enrich')
+    enrich_csv(args.csv, args.salida, args.base_url, args.por_host, args.workers)
+    metrics.finish_run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Historial de métricas por commit y detección de regresiones
+
+Cada benchmark (benchmarks/run_benchmarks.py) y cada ejecución instrumentada
+(common.metrics.finish_run) agrega una línea JSON a metrics/history.jsonl con
+el commit de git, la fecha y sus métricas. El archivo se puede cambiar con
+BENEFITS_HISTORY_FILE y el registro se desactiva con BENEFITS_HISTORY=0.
+
+El comando compare toma las muestras del commit actual y las contrasta con
+una ventana móvil de commits anteriores. Una métrica se marca como regresión
+cuando empeora más que --min-change (relativo) y además queda a más de
+--sigma desviaciones estándar de la media de la ventana. Con menos de
+--min-samples muestras en la ventana (o todas iguales) no hay desviación
+confiable y el cambio no se marca:
+
+    python common/history.py compare --window 10 --sigma 3
+    python common/history.py show --name builder
+
+Sale con código 1 si hay regresiones, así que puede usarse como gate.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HISTORY_FILE = os.path.join(ROOT, 'metrics', 'history.jsonl')
+
+# Dirección de cada métrica: True si un valor más alto es mejor
+HIGHER_IS_BETTER = {
+    'records_per_second': True,
+    'mb_per_second': True,
+    'cards_per_second': True,
+    'seconds_median': False,
+    'wall_seconds': False,
+    'webdriver_commands_per_benefit': False,
+    'peak_rss_mb': False,
+    'peak_alloc_mb': False,
+}
+
+
+def history_file():
+    return os.environ.get('BENEFITS_HISTORY_FILE', DEFAULT_HISTORY_FILE)
+
+
+def enabled():
+    return os.environ.get('BENEFITS_HISTORY', '1') != '0'
+
+
+def current_commit():
+    """Commit actual de git (con sufijo -dirty si hay cambios sin commitear)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        return f'{commit}-dirty' if status else commit
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def record(kind, name, metrics, commit=None, path=None):
+    """Agrega una muestra al historial. kind es 'benchmark' o 'run'"""
+    if not enabled():
+        return None
+    entry = {
+        'commit': commit or current_commit(),
+        'recorded_at': datetime.now().isoformat(),
+        'kind': kind,
+        'name': name,
+        'metrics': {key: value for key, value in metrics.items() if value is not None},
+    }
+    path = path or history_file()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    except OSError as e:
+        print(f"✗ Error al guardar historial: {str(e)}")
+        return None
+    return entry
+
+
+def load(path=None):
+    path = path or history_file()
+    entries = []
+    if not os.path.exists(path):
+        return entries
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
+
+
+def compare(entries, commit=None, window=10, sigma=3.0, min_change=0.05, min_samples=3):
+    """Compara las muestras de commit contra la ventana de commits anteriores
+
+    Retorna una lista de dicts con kind, name, metric, baseline, current,
+    change, significant y regression. Un cambio solo es significativo con al
+    menos min_samples muestras de línea base y desviación estándar mayor que 0.
+    """
+    if not entries:
+        return []
+    commit = commit or entries[-1]['commit']
+
+    series = {}
+    for entry in entries:
+        series.setdefault((entry['kind'], entry['name']), []).append(entry)
+
+    results = []
+    for (kind, name), samples in sorted(series.items()):
+        current = [s for s in samples if s['commit'] == commit]
+        if not current:
+            continue
+        first_current = samples.index(current[0])
+        previous = [s for s in samples[:first_current] if s['commit'] != commit]
+
+        # La ventana es por commit: se toman los últimos `window` commits distintos
+        baseline_commits = []
+        for sample in reversed(previous):
+            if sample['commit'] not in baseline_commits:
+                baseline_commits.append(sample['commit'])
+            if len(baseline_commits) == window:
+                break
+        baseline = [s for s in previous if s['commit'] in baseline_commits]
+        if not baseline:
+            continue
+
+        for metric, higher_is_better in HIGHER_IS_BETTER.items():
+            current_values = [s['metrics'][metric] for s in current if metric in s['metrics']]
+            baseline_values = [s['metrics'][metric] for s in baseline if metric in s['metrics']]
+            if not current_values or not baseline_values:
+                continue
+
+            base_mean = statistics.fmean(baseline_values)
+            base_stdev = statistics.stdev(baseline_values) if len(baseline_values) > 1 else 0.0
+            value = statistics.fmean(current_values)
+            change = (value - base_mean) / base_mean if base_mean else 0.0
+            worse = change < 0 if higher_is_better else change > 0
+            z_score = abs(value - base_mean) / base_stdev if base_stdev else None
+            # Con una sola muestra (o todas iguales) la desviación es 0 y cualquier ruido pasaría por regresión
+            significant = len(baseline_values) >= min_samples and z_score is not None and z_score >= sigma
+
+            results.append({
+                'kind': kind,
+                'name': name,
+                'metric': metric,
+                'baseline': round(base_mean, 6),
+                'baseline_stdev': round(base_stdev, 6),
+                'baseline_samples': len(baseline_values),
+                'current': round(value, 6),
+                'change': round(change, 4),
+                'z_score': round(z_score, 2) if z_score is not None else None,
+                'significant': significant,
+                'regression': worse and abs(change) >= min_change and significant,
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Historial de métricas y detección de regresiones")
+    parser.add_argument('--file', help="Archivo de historial (por defecto metrics/history.jsonl)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    compare_parser = subparsers.add_parser('compare', help="Compara el commit actual contra la ventana anterior")
+    compare_parser.add_argument('--commit', help="Commit a evaluar (por defecto el de la última muestra)")
+    compare_parser.add_argument('--window', type=int, default=10, help="Commits anteriores en la línea base")
+    compare_parser.add_argument('--sigma', type=float, default=3.0, help="Desviaciones estándar para considerar significativo")
+    compare_parser.add_argument('--min-change', type=float, default=0.05, help="Cambio relativo mínimo (0.05 = 5%%)")
+    compare_parser.add_argument('--min-samples', type=int, default=3,
+                                help="Muestras mínimas en la línea base para marcar una regresión")
+    compare_parser.add_argument('--json', action='store_true', help="Imprime el resultado como JSON")
+
+    show_parser = subparsers.add_parser('show', help="Muestra las muestras registradas")
+    show_parser.add_argument('--name', help="Filtra por nombre de benchmark o ejecución")
+
+    args = parser.parse_args(argv)
+    entries = load(args.file)
+
+    if args.command == 'show':
+        for entry in entries:
+            if args.name and entry['name'] != args.name:
+                continue
+            values = ', '.join(f'{key}={value}' for key, value in sorted(entry['metrics'].items()))
+            print(f"{entry['recorded_at'][:19]} {entry['commit']:>14} {entry['kind']:9} {entry['name']}: {values}")
+        return 0
+
+    results = compare(entries, args.commit, args.window, args.sigma, args.min_change, args.min_samples)
+    regressions = [r for r in results if r['regression']]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        if not results:
+            print("No hay muestras suficientes para comparar")
+        for r in results:
+            mark = '✗ REGRESIÓN' if r['regression'] else '✓'
+            few = ', línea base insuficiente' if r['baseline_samples'] < args.min_samples else ''
+            print(f"{mark:12} {r['kind']}/{r['name']} {r['metric']}: {r['baseline']} → {r['current']} "
+                  f"({r['change']:+.1%}, n={r['baseline_samples']}{few})")
+        print(f"\n{len(regressions)} regresiones en {len(results)} métricas comparadas")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Cliente HTTP compartido para las etapas que no necesitan navegador
+
+- una sola requests.Session con pool de conexiones keep-alive por host
+- cada petición pasa por common.scheduler (token bucket y concurrencia
+  adaptativa por host, tope global); per_host es el máximo de descargas
+  simultáneas contra un mismo host, aunque el pool de hilos sea más grande
+- los timeouts, conexiones cortadas y respuestas 429/5xx se reintentan con
+  backoff (common.retry), con un circuit breaker por host
+- caché en disco en cache/http (cambiable con BENEFITS_HTTP_CACHE_DIR; se
+  desactiva con BENEFITS_HTTP_CACHE=0): dentro de max_age la respuesta sale
+  del disco y después se revalida con If-None-Match / If-Modified-Since
+
+    from common.http_client import HttpClient
+
+    with HttpClient(per_host=4) as client:
+        for url, response in client.map(urls, workers=16):
+            ...
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from common import metrics, retry, scheduler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(ROOT, 'cache', 'http')
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+
+def cache_dir():
+    if os.environ.get('BENEFITS_HTTP_CACHE', '1') == '0':
+        return None
+    return os.environ.get('BENEFITS_HTTP_CACHE_DIR', DEFAULT_CACHE_DIR)
+
+
+class Response:
+    """Respuesta ya leída completa (viene de la red o de la caché)"""
+
+    def __init__(self, url, status_code, headers, content, from_cache=False):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.from_cache = from_cache
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 400
+
+    @property
+    def text(self):
+        content_type = self.headers.get('Content-Type', '')
+        charset = content_type.split('charset=', 1)[1].split(';')[0].strip() if 'charset=' in content_type else 'utf-8'
+        return self.content.decode(charset, errors='replace')
+
+
+class HttpClient:
+    def __init__(self, per_host=4, timeout=20, max_age=24 * 3600, cache=None):
+        """cache: directorio de la caché; None usa cache_dir() y False la desactiva"""
+        self.per_host = per_host
+        self.timeout = timeout
+        self.max_age = max_age
+        self.cache = cache_dir() if cache is None else (cache or None)
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=per_host)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.policy = scheduler.HostPolicy(max_concurrency=per_host)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _cache_paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache, key[:2], key)
+        return base + '.json', base + '.body'
+
+    def _read_cache(self, url):
+        if not self.cache:
+            return None, None
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        return meta, Response(url, meta['status'], meta['headers'], body, from_cache=True)
+
+    def _write_cache(self, url, response, fetched_at):
+        meta_path, body_path = self._cache_paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {'url': url, 'status': response.status_code, 'fetched_at': fetched_at,
+                'headers': {k: v for k, v in response.headers.items()
+                            if k in ('Content-Type', 'ETag', 'Last-Modified')}}
+        for path, data, mode in ((body_path, response.content, 'wb'), (meta_path, json.dumps(meta), 'w')):
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp_path, mode) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+    def _fetch(self, url, headers):
+        with scheduler.slot(url) as request, metrics.span('http_get'):
+            r = self.session.get(url, headers=headers, timeout=self.timeout)
+            content = r.content
+            request.status = r.status_code
+            request.retry_after = r.headers.get('Retry-After')
+        metrics.incr('http_requests')
+        metrics.incr('http_bytes', len(content))
+        if r.status_code in retry.TRANSIENT_STATUS:
+            raise retry.HttpStatusError(url, r.status_code, r.headers.get('Retry-After'))
+        return r, content
+
+    def get(self, url):
+        """GET con caché
+
+        Los errores de red se propagan como requests.RequestException y los
+        429/5xx que persisten después de los reintentos como
+        retry.HttpStatusError.
+        """
+        meta, cached = self._read_cache(url)
+        if cached is not None and time.time() - meta['fetched_at'] < self.max_age:
+            metrics.incr('http_cache_hits')
+            return cached
+
+        headers = {}
+        if meta:
+            if meta['headers'].get('ETag'):
+                headers['If-None-Match'] = meta['headers']['ETag']
+            if meta['headers'].get('Last-Modified'):
+                headers['If-Modified-Since'] = meta['headers']['Last-Modified']
+
+        state = scheduler.host(url, self.policy)
+        r, content = retry.call(self._fetch, url, headers, breaker=retry.breaker(state.host), label=url)
+
+        if r.status_code == 304 and cached is not None:
+            metrics.incr('http_not_modified')
+            self._write_cache(url, cached, time.time())
+            return cached
+
+        response = Response(r.url, r.status_code, dict(r.headers), content)
+        if self.cache and r.status_code == 200:
+            self._write_cache(url, response, time.time())
+        return response
+
+    def map(self, urls, workers=16, handler=None):
+        """Descarga urls en paralelo; genera (url, resultado) a medida que terminan
+
+        resultado es handler(response) (o la respuesta si no hay handler), o la
+        excepción si la descarga o el handler fallaron.
+        """
+        def fetch(url):
+            response = self.get(url)
+            return handler(response) if handler else response
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(fetch, url): url for url in dict.fromkeys(urls)}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as e:
+                    metrics.incr('http_errors')
+                    yield futures[future], e
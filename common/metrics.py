@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Trazas livianas para los scrapers: spans por fase, contadores y reporte final
+
+Uso típico:
+
+    from common import metrics
+
+    metrics.start_run('bci')
+    driver = metrics.instrument_driver(driver)
+    with metrics.span('page_load'):
+        driver.get(url)
+    with metrics.span('card_extraction', scope='benefit'):
+        ...
+    metrics.incr('cards')
+    metrics.finish_run()
+
+El detalle de cada comando WebDriver (selector, latencia, NoSuchElement y
+histogramas por beneficio/página) lo lleva common.webdriver_stats y se
+incluye en el reporte bajo la llave 'webdriver'.
+
+Al terminar se escriben metrics/<run>.json y metrics/<run>.prom (formato
+OpenMetrics, apto para el textfile collector de node_exporter). El directorio
+se puede cambiar con la variable de entorno BENEFITS_METRICS_DIR. Además
+cada ejecución agrega sus métricas principales al historial de
+common.history para detectar regresiones entre commits.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from common import history, webdriver_stats
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_OUTPUT_DIR = 'metrics'
+
+
+def peak_rss_mb():
+    """Memoria máxima del proceso en MB (None si la plataforma no lo expone)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss viene en KB en Linux y en bytes en macOS
+    if sys.platform == 'darwin':
+        return round(peak / (1024 * 1024), 2)
+    return round(peak / 1024, 2)
+
+
+class Run:
+    """Acumula los tiempos por fase y los contadores de una ejecución"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = datetime.now().isoformat()
+        self.start = time.perf_counter()
+        self.phases = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def add_phase(self, phase, seconds):
+        with self.lock:
+            stats = self.phases.setdefault(phase, {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            stats['count'] += 1
+            stats['seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+
+    def incr(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        wall = time.perf_counter() - self.start
+        with self.lock:
+            phases = {phase: dict(stats) for phase, stats in self.phases.items()}
+            counters = dict(self.counters)
+
+        cards = counters.get('cards', 0)
+        extraction = phases.get('card_extraction', {}).get('seconds', 0.0)
+        return {
+            'run': self.name,
+            'started_at': self.started_at,
+            'wall_seconds': round(wall, 6),
+            'phases': phases,
+            'counters': counters,
+            'cards_per_second': round(cards / wall, 3) if wall > 0 else 0.0,
+            'cards_per_extraction_second': round(cards / extraction, 3) if extraction > 0 else 0.0,
+            'peak_rss_mb': peak_rss_mb(),
+            'webdriver': webdriver_stats.recorder.summary(),
+        }
+
+
+_current = Run('default')
+
+
+def start_run(name):
+    """Inicia una nueva ejecución y la deja como la actual"""
+    global _current
+    _current = Run(name)
+    webdriver_stats.reset()
+    return _current
+
+
+def current_run():
+    return _current
+
+
+@contextmanager
+def span(phase, scope=None):
+    """Mide el tiempo de pared de un bloque y lo suma a la fase indicada
+
+    Con scope ('benefit' o 'page') los comandos WebDriver emitidos dentro del
+    bloque se agrupan además en ese ámbito de webdriver_stats.
+    """
+    run = _current
+    start = time.perf_counter()
+    try:
+        if scope:
+            with webdriver_stats.scope(scope):
+                yield
+        else:
+            yield
+    finally:
+        run.add_phase(phase, time.perf_counter() - start)
+
+
+def incr(name, value=1):
+    _current.incr(name, value)
+
+
+def record_file_written(path):
+    """Suma el tamaño de un archivo recién escrito al contador bytes_written"""
+    try:
+        _current.incr('bytes_written', os.path.getsize(path))
+    except OSError:
+        pass
+
+
+def instrument_driver(driver):
+    """Cuenta y cronometra cada comando WebDriver que emite el driver (y sus elementos)"""
+    return webdriver_stats.instrument(driver, on_command=lambda: _current.incr('webdriver_commands'))
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def to_openmetrics(summary):
+    """Convierte el resumen de una ejecución al formato de texto OpenMetrics"""
+    run = _label(summary['run'])
+    lines = [
+        '# TYPE benefits_run_wall_seconds gauge',
+        '# UNIT benefits_run_wall_seconds seconds',
+        f'benefits_run_wall_seconds{{run="{run}"}} {summary["wall_seconds"]}',
+        '# TYPE benefits_cards_per_second gauge',
+        f'benefits_cards_per_second{{run="{run}"}} {summary["cards_per_second"]}',
+        '# TYPE benefits_phase_seconds counter',
+        '# UNIT benefits_phase_seconds seconds',
+    ]
+    for phase, stats in sorted(summary['phases'].items()):
+        lines.append(f'benefits_phase_seconds_total{{run="{run}",phase="{_label(phase)}"}} {round(stats["seconds"], 6)}')
+    lines.append('# TYPE benefits_phase_calls counter')
+    for phase, stats in sorted(summary['phases'].items()):
+        lines.append(f'benefits_phase_calls_total{{run="{run}",phase="{_label(phase)}"}} {stats["count"]}')
+    lines.append('# TYPE benefits_events counter')
+    for name, value in sorted(summary['counters'].items()):
+        lines.append(f'benefits_events_total{{run="{run}",name="{_label(name)}"}} {value}')
+    webdriver = summary.get('webdriver', {})
+    for kind, stats in sorted(webdriver.get('scopes', {}).items()):
+        name = f'benefits_webdriver_commands_per_{_label(kind)}'
+        lines.append(f'# TYPE {name} histogram')
+        for upper, count in stats['commands_histogram']:
+            lines.append(f'{name}_bucket{{run="{run}",le="{upper}"}} {count}')
+        lines.append(f'{name}_count{{run="{run}"}} {stats["count"]}')
+        lines.append(f'{name}_sum{{run="{run}"}} {stats["commands"]}')
+    if webdriver.get('commands'):
+        lines.append('# TYPE benefits_webdriver_command_seconds counter')
+        lines.append('# UNIT benefits_webdriver_command_seconds seconds')
+        for item in webdriver['commands']:
+            labels = f'run="{run}",command="{_label(item["command"])}",selector="{_label(item["selector"])}"'
+            lines.append(f'benefits_webdriver_command_seconds_total{{{labels}}} {item["seconds"]}')
+        lines.append('# TYPE benefits_webdriver_not_found counter')
+        for item in webdriver['commands']:
+            if item['not_found']:
+                labels = f'run="{run}",command="{_label(item["command"])}",selector="{_label(item["selector"])}"'
+                lines.append(f'benefits_webdriver_not_found_total{{{labels}}} {item["not_found"]}')
+    lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
+
+
+def finish_run(output_dir=None):
+    """Escribe el reporte JSON y OpenMetrics de la ejecución actual
+
+    Retorna el resumen como diccionario.
+    """
+    output_dir = output_dir or os.environ.get('BENEFITS_METRICS_DIR', DEFAULT_OUTPUT_DIR)
+    summary = _current.summary()
+    history.record('run', summary['run'], {
+        'wall_seconds': summary['wall_seconds'],
+        'cards_per_second': summary['cards_per_second'] or None,
+        'webdriver_commands_per_benefit': summary['webdriver']['scopes'].get('benefit', {}).get('commands_per_scope'),
+        'peak_rss_mb': summary['peak_rss_mb'],
+    })
+
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        json_path = os.path.join(output_dir, f"{summary['run']}.json")
+        prom_path = os.path.join(output_dir, f"{summary['run']}.prom")
+
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        # Se escribe a un temporal y se renombra para que el collector nunca lea un archivo a medias
+        with open(prom_path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(to_openmetrics(summary))
+        os.replace(prom_path + '.tmp', prom_path)
+    except OSError as e:
+        print(f"✗ Error al guardar métricas: {str(e)}")
+        return summary
+
+    print(f"\n=== MÉTRICAS ({summary['run']}) ===")
+    print(f"Tiempo total: {summary['wall_seconds']:.2f}s")
+    for phase, stats in sorted(summary['phases'].items(), key=lambda item: -item[1]['seconds']):
+        print(f"  {phase}: {stats['seconds']:.2f}s en {stats['count']} llamadas")
+    for name, value in sorted(summary['counters'].items()):
+        print(f"  {name}: {value}")
+    for kind, stats in sorted(summary['webdriver']['scopes'].items()):
+        print(f"  comandos WebDriver por {kind}: {stats['commands_per_scope']} "
+              f"({stats['not_found_time_share']:.0%} del tiempo en NoSuchElement)")
+    for item in summary['webdriver']['commands'][:5]:
+        print(f"  {item['command']} {item['selector']}: {item['count']} llamadas, "
+              f"{item['seconds']:.2f}s, {item['not_found']} sin resultado")
+    print(f"Métricas guardadas en {json_path} y {prom_path}")
+    return summary
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+"""
+Re-parseo en lote de un archivo de snapshots históricos con un pool de procesos
+
+Cuando se corrige un extractor (el modal de umayor, la limpieza del JSON de
+Entel, ...) hay que volver a derivar los datos de todos los snapshots
+guardados. Parsear con BeautifulSoup es trabajo de CPU, así que los archivos
+se reparten en lotes (--lote) entre procesos (--workers, por defecto uno por
+núcleo) y los resultados se escriben a medida que terminan:
+
+    python common/reparse.py capturas/ --jsonl rederivado.jsonl
+    python common/reparse.py capturas-2025.tar.gz --almacen store/rederivado.sqlite
+    python common/reparse.py capturas.zip --proveedor entel --errores fallidos.csv
+
+La entrada es un directorio (recursivo), un .zip o un .tar(.gz/.bz2/.xz) con
+archivos .txt/.html/.htm, opcionalmente comprimidos con gzip. El proveedor se
+deduce de la ruta (umayor/source/umayor.txt, 2025-03-01/entel.html,
+bci_20250301.txt) y la fecha del snapshot del primer YYYY-MM-DD o YYYYMMDD de
+la ruta (si no hay, la fecha de modificación del archivo). Las fechas sin
+año del snapshot ("hasta el 30 de abril" en BCI) se resuelven respecto de
+esa fecha y no del día en que se re-parsea.
+
+Salidas (sinks), que se pueden combinar:
+
+- --jsonl: una línea por beneficio, con el snapshot, su fecha y el proveedor.
+- --almacen: agrega cada snapshot como una ejecución de common.benefit_store
+  con su fecha. Los resultados llegan desordenados, así que se agregan en
+  orden cronológico a medida que se completa el prefijo.
+
+Un archivo que falla (ilegible, proveedor desconocido, excepción del parser)
+se informa y el lote sigue; --errores guarda la lista en un CSV y el comando
+sale con código 1 si hubo fallas.
+"""
+
+import argparse
+import csv
+import gzip
+import importlib.util
+import json
+import os
+import re
+import sys
+import tarfile
+import time
+import zipfile
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from common import benefit_store, metrics
+
+# Proveedor -> (script del repo, función que recibe el HTML y retorna la lista de beneficios,
+#              si la función recibe reference= con la fecha del snapshot para fechas sin año)
+PARSERS = {
+    'umayor': ('umayor/interpreter_umayor.py', 'parse_benefits', False),
+    'entel': ('entel/interpreter_entel.py', 'extract_benefits_from_html', False),
+    'bci': ('bci/interpreter_bci.py', 'parse_listing_html', True),
+}
+SNAPSHOT_SUFFIXES = ('.txt', '.html', '.htm')
+DATE_PATTERN = re.compile(r'(20\d\d)-?(0[1-9]|1[0-2])-?(0[1-9]|[12]\d|3[01])')
+
+Snapshot = namedtuple('Snapshot', 'seq name provider date location')
+
+_parsers = {}
+
+
+def load_parser(provider):
+    """Función de parseo del proveedor (el script se carga una vez por proceso)"""
+    if provider not in _parsers:
+        relative_path, function, _ = PARSERS[provider]
+        spec = importlib.util.spec_from_file_location(f'reparse_{provider}', os.path.join(ROOT, relative_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _parsers[provider] = getattr(module, function)
+    return _parsers[provider]
+
+
+def provider_from_path(name):
+    for token in re.split(r'[^a-z0-9]+', name.lower()):
+        if token in PARSERS:
+            return token
+    return None
+
+
+def date_from_path(name, mtime):
+    match = DATE_PATTERN.search(name)
+    if match:
+        return '-'.join(match.groups())
+    return datetime.fromtimestamp(mtime).date().isoformat()
+
+
+def is_snapshot(name):
+    name = name.lower()
+    if name.endswith('.gz') and not name.endswith(('.tar.gz', '.tgz')):
+        name = name[:-3]
+    return name.endswith(SNAPSHOT_SUFFIXES)
+
+
+def _entries(source):
+    """(nombre, fecha de modificación, ubicación) de cada archivo de snapshot de source
+
+    La ubicación es lo que necesita un proceso del pool para leerlo: una ruta,
+    un miembro de un zip (acceso directo) o el contenido ya leído de un tar,
+    que solo se puede recorrer en orden.
+    """
+    if not os.path.exists(source):
+        raise ValueError(f"No existe {source}")
+    if os.path.isdir(source):
+        for dirpath, _, filenames in os.walk(source):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if is_snapshot(filename):
+                    yield os.path.relpath(path, source), os.path.getmtime(path), ('file', path)
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and is_snapshot(info.filename):
+                    yield info.filename, time.mktime(info.date_time + (0, 0, -1)), ('zip', source, info.filename)
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            for member in archive:
+                if member.isfile() and is_snapshot(member.name):
+                    yield member.name, member.mtime, ('bytes', archive.extractfile(member).read())
+    else:
+        raise ValueError(f"{source} no es un directorio, .zip ni .tar")
+
+
+def iter_snapshots(source, provider=None):
+    """Snapshots de source en orden cronológico (fecha, nombre)
+
+    Con un tar el contenido se lee acá; como el orden cronológico obliga a
+    leer el índice completo, conviene que los tar grandes se recorran con
+    --sin-orden (ver run_batch).
+    """
+    entries = [(date_from_path(name, mtime), name, location) for name, mtime, location in _entries(source)]
+    entries.sort(key=lambda entry: entry[:2])
+    for seq, (snapshot_date, name, location) in enumerate(entries):
+        yield Snapshot(seq, name, provider or provider_from_path(name), snapshot_date, location)
+
+
+def iter_snapshots_unordered(source, provider=None):
+    """Como iter_snapshots pero en el orden del archivo, sin leer todo antes de empezar"""
+    for seq, (name, mtime, location) in enumerate(_entries(source)):
+        yield Snapshot(seq, name, provider or provider_from_path(name), date_from_path(name, mtime), location)
+
+
+def read_snapshot(location):
+    kind = location[0]
+    if kind == 'file':
+        with open(location[1], 'rb') as f:
+            data = f.read()
+    elif kind == 'zip':
+        with zipfile.ZipFile(location[1]) as archive:
+            data = archive.read(location[2])
+    else:
+        data = location[1]
+    if data[:2] == b'\x1f\x8b':
+        data = gzip.decompress(data)
+    return data
+
+
+def parse_snapshot(snapshot):
+    """Parsea un snapshot; nunca levanta: el error queda en el resultado"""
+    result = {'seq': snapshot.seq, 'name': snapshot.name, 'provider': snapshot.provider,
+              'date': snapshot.date, 'benefits': None, 'error': None, 'bytes': 0, 'seconds': 0.0}
+    start = time.perf_counter()
+    try:
+        if snapshot.provider not in PARSERS:
+            raise ValueError("proveedor desconocido (usa --proveedor)")
+        data = read_snapshot(snapshot.location)
+        result['bytes'] = len(data)
+        parse = load_parser(snapshot.provider)
+        content = data.decode('utf-8', errors='replace')
+        if PARSERS[snapshot.provider][2]:
+            result['benefits'] = parse(content, reference=date.fromisoformat(snapshot.date))
+        else:
+            result['benefits'] = parse(content)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {str(e)}"
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def parse_chunk(chunk):
+    return [parse_snapshot(snapshot) for snapshot in chunk]
+
+
+def _chunks(snapshots, size):
+    chunk = []
+    for snapshot in snapshots:
+        chunk.append(snapshot)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class JsonlSink:
+    """Una línea JSON por beneficio, en el orden en que terminan los snapshots"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def write(self, result):
+        if result['benefits'] is None:
+            return
+        for benefit in result['benefits']:
+            record = dict(benefit, snapshot=result['name'], snapshot_date=result['date'], provider=result['provider'])
+            self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def close(self):
+        self.file.close()
+        metrics.record_file_written(self.path)
+
+
+class StoreSink:
+    """Agrega cada snapshot a common.benefit_store como una ejecución, en orden de seq
+
+    Los resultados que llegan adelantados esperan en memoria hasta que
+    terminan los anteriores; un snapshot fallido solo avanza el orden (no es
+    una ejecución vacía, que cerraría todas las versiones abiertas).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.pending = {}
+        self.next_seq = 0
+        self.runs = 0
+
+    def write(self, result):
+        self.pending[result['seq']] = result
+        while self.next_seq in self.pending:
+            ready = self.pending.pop(self.next_seq)
+            self.next_seq += 1
+            if ready['benefits'] is not None:
+                benefit_store.append_run(ready['provider'], ready['benefits'], ready['date'], self.path)
+                self.runs += 1
+
+    def close(self):
+        if self.pending:
+            print(f"✗ {len(self.pending)} snapshots no se agregaron al almacén porque faltó uno anterior")
+
+
+def _failed(snapshot, error):
+    return {'seq': snapshot.seq, 'name': snapshot.name, 'provider': snapshot.provider, 'date': snapshot.date,
+            'benefits': None, 'bytes': 0, 'seconds': 0.0, 'error': error}
+
+
+def parse_isolated(snapshot):
+    """Parsea un snapshot solo, en un proceso propio, para saber si es él el que mata al proceso"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(parse_snapshot, snapshot).result()
+        except BrokenProcessPool:
+            return _failed(snapshot, "BrokenProcessPool: el proceso terminó de forma inesperada con este archivo")
+
+
+def run_batch(snapshots, sinks, workers=None, chunk_size=4, on_result=None):
+    """Reparte snapshots en lotes de chunk_size entre workers procesos y pasa cada resultado a los sinks
+
+    Hay a lo sumo dos lotes por proceso en vuelo, así que con
+    iter_snapshots_unordered los contenidos de un tar no se acumulan en
+    memoria.
+
+    Si un proceso del pool muere (por ejemplo por memoria) el pool completo
+    queda roto y todos los lotes en vuelo fallan juntos, sin que se sepa cuál
+    lo causó. Se crea un pool nuevo para los lotes pendientes y cada archivo
+    de los lotes rotos se vuelve a parsear solo en un proceso propio
+    (parse_isolated): únicamente el que vuelve a matarlo queda como fallido.
+    Retorna la lista de resultados fallidos.
+    """
+    workers = workers or os.cpu_count() or 1
+    failures = []
+    chunks = _chunks(snapshots, chunk_size)
+
+    def deliver(result):
+        if result['error']:
+            failures.append(result)
+            metrics.incr('snapshot_failures')
+        else:
+            metrics.incr('snapshots')
+            metrics.incr('cards', len(result['benefits']))
+            metrics.incr('bytes_read', result['bytes'])
+        for sink in sinks:
+            sink.write(result)
+        if on_result:
+            on_result(result)
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    in_flight = {}
+    # Lotes que hay que (re)enviar antes de tomar nuevos: los en vuelo de un pool roto
+    resubmit = []
+    try:
+        while True:
+            while len(in_flight) < workers * 2:
+                chunk = resubmit.pop(0) if resubmit else next(chunks, None)
+                if chunk is None:
+                    break
+                try:
+                    in_flight[executor.submit(parse_chunk, chunk)] = chunk
+                except BrokenProcessPool:
+                    # El pool se rompió después del último wait: los lotes en vuelo lo
+                    # informan en el siguiente y este se reenvía al pool nuevo
+                    resubmit.insert(0, chunk)
+                    break
+            if not in_flight:
+                if not resubmit:
+                    break
+                # Roto sin lotes en vuelo que lo informen: no hay a quién aislar
+                metrics.incr('pool_restarts')
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=workers)
+                continue
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            broken = []
+            for future in done:
+                chunk = in_flight.pop(future, None)
+                if chunk is None:
+                    continue
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    broken.append(chunk)
+                    continue
+                except Exception as e:
+                    results = [_failed(snapshot, f"{type(e).__name__}: {str(e)}") for snapshot in chunk]
+                for result in results:
+                    deliver(result)
+            if not broken:
+                continue
+
+            # Los lotes que seguían en vuelo también se perdieron con el pool: se reenvían a uno nuevo
+            metrics.incr('pool_restarts')
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor = ProcessPoolExecutor(max_workers=workers)
+            resubmit = list(in_flight.values()) + resubmit
+            in_flight = {}
+            for chunk in broken:
+                for snapshot in chunk:
+                    deliver(parse_isolated(snapshot))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return failures
+
+
+def save_failures_csv(failures, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['snapshot', 'provider', 'date', 'error'])
+        writer.writeheader()
+        for failure in sorted(failures, key=lambda result: result['seq']):
+            writer.writerow({'snapshot': failure['name'], 'provider': failure['provider'] or '',
+                             'date': failure['date'], 'error': failure['error']})
+    metrics.record_file_written(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vuelve a parsear en paralelo un archivo de snapshots históricos")
+    parser.add_argument('origen', help="Directorio, .zip o .tar(.gz) con los snapshots")
+    parser.add_argument('--proveedor', choices=sorted(PARSERS),
+                        help="Parser a usar para todos los archivos (por defecto se deduce de la ruta)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Procesos del pool (por defecto uno por núcleo)")
+    parser.add_argument('--lote', type=int, default=4, help="Archivos por tarea enviada a un proceso")
+    parser.add_argument('--jsonl', help="Escribe los beneficios en este archivo JSONL")
+    parser.add_argument('--almacen', help="Agrega cada snapshot como ejecución en esta base de benefit_store")
+    parser.add_argument('--errores', help="Escribe la lista de archivos fallidos en este CSV")
+    parser.add_argument('--sin-orden', action='store_true',
+                        help="Procesa en el orden del archivo sin indexarlo antes (no se puede con --almacen)")
+    args = parser.parse_args(argv)
+
+    if args.sin_orden and args.almacen:
+        parser.error("--almacen necesita los snapshots en orden cronológico; quita --sin-orden")
+    if args.almacen and not benefit_store.enabled():
+        parser.error("--almacen no tiene efecto con BENEFITS_STORE=0")
+
+    metrics.start_run('reparse')
+    sinks = []
+    if args.jsonl:
+        sinks.append(JsonlSink(args.jsonl))
+    if args.almacen:
+        sinks.append(StoreSink(args.almacen))
+
+    def report(result):
+        if result['error']:
+            print(f"✗ {result['name']}: {result['error']}")
+        else:
+            print(f"✓ {result['name']} ({result['provider']}, {result['date']}): "
+                  f"{len(result['benefits'])} beneficios en {result['seconds']:.2f}s")
+
+    iterate = iter_snapshots_unordered if args.sin_orden else iter_snapshots
+    start = time.perf_counter()
+    try:
+        with metrics.span('reparse'):
+            failures = run_batch(iterate(args.origen, args.proveedor), sinks, args.workers, args.lote, report)
+    except ValueError as e:
+        print(f"✗ {str(e)}")
+        return 2
+    finally:
+        for sink in sinks:
+            sink.close()
+    elapsed = time.perf_counter() - start
+
+    counters = metrics.current_run().summary()['counters']
+    print(f"\n{counters.get('snapshots', 0)} snapshots ({counters.get('cards', 0)} beneficios) en {elapsed:.1f}s, "
+          f"{len(failures)} con error")
+    if failures and args.errores:
+        save_failures_csv(failures, args.errores)
+        print(f"✓ Archivos fallidos en {args.errores}")
+    metrics.finish_run()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Reintentos con backoff exponencial y jitter, y circuit breakers por proveedor
+
+Los errores se clasifican en transitorios (timeouts, conexiones cortadas,
+elementos que el sitio reemplazó mientras se leían, HTTP 408/429/5xx) y
+permanentes (un selector que no existe, un 404). Solo los transitorios se
+reintentan, y se reintenta la unidad más chica que falló (una tarjeta, una
+página, una petición) en vez de descartar la ejecución completa:
+
+    from common import retry
+
+    benefit = retry.call(lambda: extract(card), label='tarjeta', breaker=retry.breaker('bci'))
+
+(call_async hace lo mismo para corutinas, ver common/async_browser.py.)
+
+La espera entre intentos es aleatoria entre 0 y base_delay * 2^intento (con
+tope max_delay, "full jitter"), así los hilos que fallaron juntos no vuelven
+a pedir juntos; si el error trae Retry-After se espera al menos eso.
+
+Cada proveedor tiene un circuit breaker: después de failure_threshold errores
+transitorios seguidos el circuito se abre y las llamadas fallan al instante
+con CircuitOpenError durante reset_timeout segundos; luego se deja pasar una
+llamada de prueba que lo cierra si resulta bien. Cuando un sitio está caído
+la ejecución termina rápido en vez de esperar todos los timeouts.
+
+Los valores por defecto se pueden cambiar con BENEFITS_RETRY_ATTEMPTS,
+BENEFITS_BREAKER_THRESHOLD y BENEFITS_BREAKER_RESET.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+
+from common import metrics
+
+# Nombres de excepciones transitorias; se comparan por nombre para no tener
+# que importar selenium ni requests aquí
+TRANSIENT_NAMES = {
+    'TimeoutError', 'ConnectionError', 'ConnectionResetError', 'ConnectionAbortedError',
+    'Timeout', 'ReadTimeout', 'ConnectTimeout', 'ChunkedEncodingError',  # requests
+    'TimeoutException', 'StaleElementReferenceException',  # selenium
+    'ElementClickInterceptedException', 'ElementNotInteractableException',
+}
+TRANSIENT_STATUS = (408, 425, 429, 500, 502, 503, 504)
+# Un 429 se reintenta pero no abre el circuito: el sitio responde y common.scheduler ya baja el ritmo
+THROTTLE_STATUS = (429,)
+
+
+class TransientError(Exception):
+    """Error que vale la pena reintentar (ej. el listado no cambió después de un clic)"""
+
+
+class PermanentError(Exception):
+    """Error que no se arregla reintentando"""
+
+
+class HttpStatusError(Exception):
+    def __init__(self, url, status_code, retry_after=None):
+        super().__init__(f"HTTP {status_code} en {url}")
+        self.url = url
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name, remaining):
+        super().__init__(f"circuito abierto para {name} (reintento en {remaining:.0f}s)")
+        self.name = name
+
+
+def is_transient(error):
+    if isinstance(error, HttpStatusError):
+        return error.status_code in TRANSIENT_STATUS
+    if isinstance(error, TransientError):
+        return True
+    if isinstance(error, (PermanentError, CircuitOpenError)):
+        return False
+    return any(cls.__name__ in TRANSIENT_NAMES for cls in type(error).__mro__)
+
+
+def _retry_after(error):
+    value = getattr(error, 'retry_after', None)
+    try:
+        return float(value) if value else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class RetryPolicy:
+    def __init__(self, attempts=None, base_delay=0.5, max_delay=10.0):
+        self.attempts = attempts or int(os.environ.get('BENEFITS_RETRY_ATTEMPTS', 3))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt, error=None):
+        """Espera antes del intento attempt + 1 (attempt empieza en 0)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        return max(delay, min(self.max_delay, _retry_after(error)))
+
+
+DEFAULT_POLICY = RetryPolicy()
+# Para unidades baratas que fallan por carreras con el render (una tarjeta)
+QUICK_POLICY = RetryPolicy(attempts=2, base_delay=0.2, max_delay=1.0)
+
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=None, reset_timeout=None):
+        self.name = name
+        self.failure_threshold = failure_threshold or int(os.environ.get('BENEFITS_BREAKER_THRESHOLD', 5))
+        self.reset_timeout = reset_timeout or float(os.environ.get('BENEFITS_BREAKER_RESET', 30))
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return 'closed'
+            return 'half-open' if time.monotonic() - self.opened_at >= self.reset_timeout else 'open'
+
+    def before_call(self):
+        """Lanza CircuitOpenError si el circuito está abierto (deja pasar una sola prueba)"""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+            if remaining > 0 or self._probing:
+                metrics.incr('circuit_rejected')
+                raise CircuitOpenError(self.name, max(remaining, 0))
+            self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                print(f"✓ Circuito de {self.name} cerrado")
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self, error):
+        """Solo los errores transitorios cuentan: un 404 o un 429 dicen que el sitio responde"""
+        if not is_transient(error) or getattr(error, 'status_code', None) in THROTTLE_STATUS:
+            self.record_success()
+            return
+        with self._lock:
+            self.failures += 1
+            reopen = self._probing
+            self._probing = False
+            if reopen or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                metrics.incr('circuit_opened')
+                print(f"✗ Circuito de {self.name} abierto tras {self.failures} errores seguidos: {str(error)}")
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker(name):
+    """Circuit breaker compartido de un proveedor (o host)"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name)
+        return _breakers[name]
+
+
+def relocator(driver, css_selector, index, element=None):
+    """Función que retorna el elemento index de css_selector
+
+    La primera vez entrega element (ya encontrado) si se da; en los reintentos
+    lo vuelve a buscar, porque el anterior puede haber quedado stale.
+    """
+    pending = [element] if element is not None else []
+
+    def locate():
+        if pending:
+            return pending.pop()
+        elements = driver.find_elements('css selector', css_selector)
+        if index >= len(elements):
+            raise TransientError(f"no está el elemento {index} de {css_selector}")
+        return elements[index]
+    return locate
+
+
+def call(fn, *args, policy=None, breaker=None, label=None, **kwargs):
+    """Llama fn(*args, **kwargs) reintentando los errores transitorios
+
+    Relanza el último error si se agotan los intentos, o de inmediato si es
+    permanente o el circuito está abierto.
+    """
+    policy = policy or DEFAULT_POLICY
+    for attempt in range(policy.attempts):
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure(e)
+            if not is_transient(e):
+                raise
+            if attempt + 1 >= policy.attempts:
+                metrics.incr('retry_exhausted')
+                raise
+            delay = policy.delay(attempt, e)
+            metrics.incr('retries')
+            print(f"  Reintentando {label or getattr(fn, '__name__', 'operación')} en {delay:.1f}s "
+                  f"({attempt + 2}/{policy.attempts}): {type(e).__name__}")
+            time.sleep(delay)
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+
+async def call_async(fn, *args, policy=None, breaker=None, label=None, **kwargs):
+    """Como call() para corutinas: espera con asyncio.sleep en vez de bloquear el event loop"""
+    policy = policy or DEFAULT_POLICY
+    for attempt in range(policy.attempts):
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure(e)
+            if not is_transient(e):
+                raise
+            if attempt + 1 >= policy.attempts:
+                metrics.incr('retry_exhausted')
+                raise
+            delay = policy.delay(attempt, e)
+            metrics.incr('retries')
+            print(f"  Reintentando {label or getattr(fn, '__name__', 'operación')} en {delay:.1f}s "
+                  f"({attempt + 2}/{policy.attempts}): {type(e).__name__}")
+            await asyncio.sleep(delay)
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result
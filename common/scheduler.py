@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+Ritmo de las peticiones a cada sitio: token bucket por host, concurrencia
+adaptativa (AIMD) y un tope global
+
+Todo lo que pide algo a un sitio (descargas HTTP de common.http_client,
+cambios de página y de filtro en el navegador) pasa por un slot:
+
+    from common import scheduler
+
+    with scheduler.slot(url) as request:
+        response = session.get(url)
+        request.status = response.status_code
+
+Por host se lleva:
+
+- un token bucket de rate peticiones por segundo (ráfagas de hasta burst)
+- un límite de peticiones simultáneas
+- la latencia observada (promedio móvil) y la mejor vista hasta ahora
+
+Cada respuesta correcta sube el límite en 1/límite y el rate en RATE_STEP
+(aumento aditivo); un 429/503, un 5xx o una excepción (timeout) los reduce a
+la mitad y respeta Retry-After (disminución multiplicativa). Si la latencia
+sube a más de LATENCY_FACTOR veces la mejor vista se reduce un 20%: el sitio
+se está cargando antes de empezar a rechazar. Sobre todo eso, nunca hay más
+de max_total peticiones en curso entre todos los hosts.
+
+Con asyncio (common.async_browser) se usa async_slot(url), que espera con
+asyncio.sleep en vez de bloquear el event loop.
+
+Los valores por defecto se pueden cambiar con BENEFITS_MAX_CONCURRENCY
+(global), BENEFITS_HOST_RATE y BENEFITS_HOST_CONCURRENCY (máximos por host).
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from common import metrics
+
+RATE_STEP = 1.0
+LATENCY_FACTOR = 3.0
+LATENCY_ALPHA = 0.2
+THROTTLE_STATUS = (429, 503)
+# Cada cuánto revisa async_slot si se liberó un lugar
+ASYNC_POLL = 0.05
+
+
+class HostPolicy:
+    def __init__(self, rate=5.0, burst=4, concurrency=2, min_rate=0.5, max_rate=None,
+                 min_concurrency=1, max_concurrency=None):
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.min_rate = min_rate
+        self.max_rate = max_rate or float(os.environ.get('BENEFITS_HOST_RATE', 50))
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency or int(os.environ.get('BENEFITS_HOST_CONCURRENCY', 8))
+
+
+def _retry_after_seconds(value):
+    """Retry-After viene en segundos o como fecha HTTP"""
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class HostState:
+    """Estado de un host; todos los cambios se hacen con self.cond tomado"""
+
+    def __init__(self, host, policy):
+        self.host = host
+        self.policy = policy
+        self.rate = policy.rate
+        self.tokens = float(policy.burst)
+        self.refilled_at = time.monotonic()
+        self.limit = float(min(policy.concurrency, policy.max_concurrency))
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.latency = None
+        self.best_latency = None
+        self.requests = 0
+        self.throttled = 0
+        self.cond = threading.Condition()
+
+    def _try_acquire(self):
+        """Toma un lugar si se puede y retorna 0; si no, cuánto esperar (None: hasta que se libere uno)"""
+        now = time.monotonic()
+        self.tokens = min(self.policy.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= int(self.limit):
+            return None
+        if self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        self.tokens -= 1
+        self.in_flight += 1
+        self.requests += 1
+        return 0
+
+    def acquire(self):
+        with self.cond:
+            while True:
+                timeout = self._try_acquire()
+                if timeout == 0:
+                    return
+                self.cond.wait(timeout)
+
+    async def acquire_async(self):
+        while True:
+            with self.cond:
+                timeout = self._try_acquire()
+            if timeout == 0:
+                return
+            await asyncio.sleep(ASYNC_POLL if timeout is None else min(timeout, 1.0))
+
+    def release(self, latency, outcome, retry_after=0.0):
+        with self.cond:
+            self.in_flight -= 1
+            if outcome == 'ok':
+                self.latency = latency if self.latency is None else \
+                    (1 - LATENCY_ALPHA) * self.latency + LATENCY_ALPHA * latency
+                self.best_latency = self.latency if self.best_latency is None else min(self.best_latency, self.latency)
+                if self.latency > LATENCY_FACTOR * self.best_latency:
+                    self._decrease(0.8)
+                else:
+                    self.limit = min(self.policy.max_concurrency, self.limit + 1 / self.limit)
+                    self.rate = min(self.policy.max_rate, self.rate + RATE_STEP)
+            elif outcome in ('throttled', 'error'):
+                self._throttle(retry_after)
+            self.cond.notify_all()
+
+    def throttle(self, retry_after=None):
+        """Baja el ritmo por una respuesta limitada que no pasó por un slot (ej. un subrecurso)
+
+        retry_after es el valor del encabezado Retry-After, si vino.
+        """
+        with self.cond:
+            self._throttle(_retry_after_seconds(retry_after))
+
+    def _throttle(self, retry_after):
+        self.throttled += 1
+        self._decrease(0.5)
+        if retry_after:
+            self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+    def _decrease(self, factor):
+        self.limit = max(self.policy.min_concurrency, self.limit * factor)
+        self.rate = max(self.policy.min_rate, self.rate * factor)
+
+    def snapshot(self):
+        with self.cond:
+            return {
+                'rate': round(self.rate, 2),
+                'concurrency': round(self.limit, 2),
+                'latency_ms': round(self.latency * 1000, 1) if self.latency is not None else None,
+                'requests': self.requests,
+                'throttled': self.throttled,
+            }
+
+
+class Request:
+    """Lo que devuelve slot(); quien hace la petición anota el status HTTP si lo tiene"""
+
+    def __init__(self):
+        self.status = None
+        self.retry_after = None
+        self.failed = False
+
+    def fail(self):
+        """Marca la petición como fallida sin lanzar excepción (ej. la página no cambió a tiempo)"""
+        self.failed = True
+
+    def outcome(self):
+        if self.failed:
+            return 'error'
+        if self.status in THROTTLE_STATUS:
+            return 'throttled'
+        if self.status is not None and self.status >= 500:
+            return 'error'
+        return 'ok'
+
+
+class Scheduler:
+    def __init__(self, max_total=None, policy=None):
+        self.max_total = max_total or int(os.environ.get('BENEFITS_MAX_CONCURRENCY', 16))
+        self.policy = policy or HostPolicy()
+        self._global = threading.BoundedSemaphore(self.max_total)
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def host(self, url_or_host, policy=None):
+        """Estado de un host; policy solo se usa la primera vez que aparece"""
+        host = urlparse(url_or_host).netloc or url_or_host
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostState(host, policy or self.policy)
+            return self._hosts[host]
+
+    @contextmanager
+    def slot(self, url):
+        state = self.host(url)
+        with metrics.span('scheduler_wait'):
+            state.acquire()
+            self._global.acquire()
+        request = Request()
+        start = time.monotonic()
+        outcome = 'error'
+        try:
+            yield request
+            outcome = request.outcome()
+        finally:
+            self._global.release()
+            state.release(time.monotonic() - start, outcome, _retry_after_seconds(request.retry_after))
+            if outcome != 'ok':
+                metrics.incr('scheduler_backoffs')
+
+    @asynccontextmanager
+    async def async_slot(self, url):
+        """Como slot(), para corutinas: las esperas no bloquean el event loop"""
+        state = self.host(url)
+        with metrics.span('scheduler_wait'):
+            await state.acquire_async()
+            while not self._global.acquire(blocking=False):
+                await asyncio.sleep(ASYNC_POLL)
+        request = Request()
+        start = time.monotonic()
+        outcome = 'error'
+        try:
+            yield request
+            outcome = request.outcome()
+        finally:
+            self._global.release()
+            state.release(time.monotonic() - start, outcome, _retry_after_seconds(request.retry_after))
+            if outcome != 'ok':
+                metrics.incr('scheduler_backoffs')
+
+    def stats(self):
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: state.snapshot() for host, state in hosts.items()}
+
+
+_default = Scheduler()
+
+
+def configure(max_total=None, policy=None):
+    """Reemplaza el scheduler compartido (antes de empezar a pedir)"""
+    global _default
+    _default = Scheduler(max_total, policy)
+    return _default
+
+
+def current():
+    return _default
+
+
+def slot(url):
+    return _default.slot(url)
+
+
+def async_slot(url):
+    return _default.async_slot(url)
+
+
+def host(url_or_host, policy=None):
+    return _default.host(url_or_host, policy)
+
+
+def stats():
+    return _default.stats()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Selector ganador de cada cadena de selectores de respaldo, persistido por proveedor
+
+Los scrapers prueban listas de selectores en orden (["p.card__title",
+".card__title", "h3", "h2"], ...) y cada selector que no encuentra nada es un
+viaje al navegador. SelectorCache recuerda, por proveedor y campo, qué
+selector funcionó, lo prueba primero en la siguiente tarjeta y en la
+siguiente ejecución (state/selectors/<proveedor>.json, dentro de
+BENEFITS_STATE_DIR), y solo vuelve a recorrer la cadena cuando deja de
+encontrar algo. En régimen estable hay una sola búsqueda por campo.
+
+    cache = selector_cache.for_provider('bci')
+    title = cache.find(card, 'title', ["p.card__title", ".card__title", "h3", "h2"])
+    ...
+    cache.save()
+
+Los ganadores se guardan por nombre de campo, así que dos scripts cuyas
+cadenas para un mismo campo son distintas usan cachés distintas
+(for_provider('bci') y for_provider('bci_final')), y dentro de un script cada
+cadena lleva su propio campo.
+
+El ganador se reemplaza recién cuando falla MISS_LIMIT tarjetas seguidas en
+que otro selector de la cadena sí encontró algo: una tarjeta a la que le
+falta el campo no cambia el orden para las demás.
+"""
+
+import json
+import os
+import threading
+
+from common import metrics
+from common.delta import DEFAULT_STATE_DIR
+
+MISS_LIMIT = 3
+
+
+def element_text(element):
+    return element.text.strip()
+
+
+class SelectorCache:
+    def __init__(self, provider, state_dir=None):
+        self.provider = provider
+        state_dir = state_dir or os.environ.get('BENEFITS_STATE_DIR', DEFAULT_STATE_DIR)
+        self.path = os.path.join(state_dir, 'selectors', f'{provider}.json')
+        self.winners = {}
+        self.misses = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.winners = json.load(f).get('winners', {})
+        except (OSError, ValueError) as e:
+            print(f"✗ Caché de selectores ilegible en {self.path}, se vuelve a probar: {str(e)}")
+
+    def save(self):
+        with self._lock:
+            if not self.dirty:
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'provider': self.provider, 'winners': self.winners}, f, ensure_ascii=False, indent=1)
+            os.replace(self.path + '.tmp', self.path)
+            self.dirty = False
+
+    def order(self, field, selectors):
+        """La cadena con el ganador de field primero (si es parte de la cadena)"""
+        winner = self.winners.get(field)
+        if winner not in selectors:
+            return list(selectors)
+        return [winner] + [selector for selector in selectors if selector != winner]
+
+    def record(self, field, selector):
+        """Anota que selector encontró field (para cadenas que se recorren a mano con order())"""
+        with self._lock:
+            winner = self.winners.get(field)
+            if selector == winner:
+                self.misses[field] = 0
+                return
+            self.misses[field] = self.misses.get(field, 0) + 1
+            if winner is None or self.misses[field] >= MISS_LIMIT:
+                self.winners[field] = selector
+                self.misses[field] = 0
+                self.dirty = True
+                metrics.incr('selector_switches')
+
+    def find(self, root, field, selectors, extract=element_text):
+        """Primer valor no vacío de extract(primer elemento de cada selector bajo root)
+
+        Retorna None si ningún selector de la cadena da un valor.
+        """
+        for probes, selector in enumerate(self.order(field, selectors), 1):
+            elements = root.find_elements('css selector', selector)
+            value = extract(elements[0]) if elements else None
+            if value:
+                metrics.incr('selector_lookups', probes)
+                self.record(field, selector)
+                return value
+        metrics.incr('selector_lookups', len(selectors))
+        return None
+
+    def find_all(self, root, field, selectors, accept=bool):
+        """Elementos del primer selector de la cadena cuyo resultado cumple accept (o [])"""
+        for probes, selector in enumerate(self.order(field, selectors), 1):
+            elements = root.find_elements('css selector', selector)
+            if accept(elements):
+                metrics.incr('selector_lookups', probes)
+                self.record(field, selector)
+                return elements
+        metrics.incr('selector_lookups', len(selectors))
+        return []
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def for_provider(provider):
+    """Caché compartida de un proveedor (una sola instancia por proceso)"""
+    with _caches_lock:
+        if provider not in _caches:
+            _caches[provider] = SelectorCache(provider)
+        return _caches[provider]
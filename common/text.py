@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Normalización de texto en español para los índices de búsqueda y similitud
+
+- minúsculas y sin tildes (café = cafe, FOTOGRAFÍA = fotografia)
+- separa palabras pegadas por el scraping (descuentoMICLUBMAYOR, cursos.Pago)
+- quita palabras vacías del español (de, la, los, para...)
+- reduce plurales simples (descuentos → descuento, promociones → promocion)
+"""
+
+import re
+import unicodedata
+
+STOPWORDS = {
+    'a', 'al', 'con', 'de', 'del', 'el', 'en', 'es', 'la', 'las', 'lo', 'los', 'o', 'para',
+    'por', 'que', 'se', 'su', 'sus', 'u', 'un', 'una', 'unos', 'unas', 'y', 'e', 'tu', 'tus',
+}
+
+GLUED_WORDS = re.compile(r'(?<=[a-záéíóúñü])(?=[A-ZÁÉÍÓÚÑÜ])|(?<=[a-záéíóúñü])\.(?=[A-Za-zÁÉÍÓÚÑÜ])')
+TOKEN = re.compile(r'\w+')
+
+
+def stem(word):
+    """Reduce plurales simples del español"""
+    if len(word) <= 4 or word.isdigit():
+        return word
+    if word.endswith('ces'):
+        return word[:-3] + 'z'
+    if word.endswith('es') and word[-3] in 'lrndj':
+        return word[:-2]
+    if word.endswith('s') and word[-2] in 'aeiou':
+        return word[:-1]
+    return word
+
+
+def tokenize(text):
+    text = GLUED_WORDS.sub(' ', (text or '').replace('\u200b', ' '))
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return [stem(token) for token in TOKEN.findall(text) if token not in STOPWORDS]
+
+
+def normalize(text):
+    return ' '.join(tokenize(text))
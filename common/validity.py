@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Vigencia de los beneficios: fechas de inicio y término y días de la semana
+
+Interpreta los textos de vigencia de las tarjetas ("Del 10 al 17 de Junio",
+"Lunes y viernes", "De lunes a viernes", "todos los sábados de junio") y las
+fechas de las fichas ("hasta el 1º de marzo de 2026", "08/06/2025").
+
+La vigencia se representa como un dict con:
+
+- valid_from / valid_until: datetime.date o None si no hay límite
+- weekdays: máscara de bits con lunes = 1 << 0 ... domingo = 1 << 6
+  (ALL_DAYS si no hay restricción de días)
+
+Si una fecha no trae año se usa una sola regla respecto de reference (la
+fecha del scraping): el término de la vigencia es su próxima ocurrencia desde
+reference ("hasta el 30 de abril" leído en junio es el abril siguiente, igual
+que "del 1 al 30 de abril" o "en abril") y el inicio queda en el año que lo
+deja antes de ese término. Un inicio sin término ("desde el 1 de junio") toma
+el año más cercano a reference. Sin reference esas fechas se ignoran en vez
+de adivinar, y un intervalo que termina antes de empezar se descarta.
+"""
+
+import re
+import unicodedata
+from datetime import date, timedelta
+
+ALL_DAYS = 0x7F
+
+MONTHS = {
+    'enero': 1, 'ene': 1, 'febrero': 2, 'feb': 2, 'marzo': 3, 'mar': 3, 'abril': 4, 'abr': 4,
+    'mayo': 5, 'may': 5, 'junio': 6, 'jun': 6, 'julio': 7, 'jul': 7, 'agosto': 8, 'ago': 8,
+    'septiembre': 9, 'setiembre': 9, 'sep': 9, 'sept': 9, 'octubre': 10, 'oct': 10,
+    'noviembre': 11, 'nov': 11, 'diciembre': 12, 'dic': 12,
+}
+MONTH_NAMES = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio', 'julio', 'agosto',
+               'septiembre', 'octubre', 'noviembre', 'diciembre']
+WEEKDAYS = ['lunes', 'martes', 'miercoles', 'jueves', 'viernes', 'sabado', 'domingo']
+WEEKDAY_ABBREVIATIONS = ['lu', 'ma', 'mi', 'ju', 'vi', 'sa', 'do']
+
+_MONTH = '(' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\b'
+# Sin día al lado solo se aceptan nombres completos: "sal de mar" no es marzo
+_FULL_MONTH = '(' + '|'.join(sorted(MONTH_NAMES + ['setiembre'], key=len, reverse=True)) + r')\b'
+_YEAR = r'(?:\s+(?:de|del)?\s*(\d{4}))?'
+_DAY = '(' + '|'.join(WEEKDAYS) + ')s?'
+
+NUMERIC_DATE = re.compile(r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{4})\b')
+RANGE = re.compile(r'\b(?:del|desde el|desde)\s+(\d{1,2})(?:\s+de\s+' + _MONTH + ')?' + _YEAR
+                   + r'\s+(?:al|hasta el|hasta|a)\s+(\d{1,2})\s+de\s+' + _MONTH + _YEAR)
+UNTIL = re.compile(r'\b(?:hasta|al)(?:\s+el)?\s+(\d{1,2})\s+de\s+' + _MONTH + _YEAR)
+SINCE = re.compile(r'\b(?:desde|a partir del?)(?:\s+el)?\s+(\d{1,2})\s+de\s+' + _MONTH + _YEAR)
+# Un mes sin día ("los viernes de junio", "durante julio"), que no sea parte de "17 de junio"
+WHOLE_MONTH = re.compile(r'(?<!\d\s)\b(?:de|durante|todo|en)\s+' + _FULL_MONTH + _YEAR)
+DAY_RANGE = re.compile(r'\b' + _DAY + r'\s+a\s+' + _DAY)
+DAY = re.compile(r'\b' + _DAY + r'\b')
+EVERY_DAY = re.compile(r'\btodos los dias\b')
+WEEKEND = re.compile(r'\bfines? de semana\b')
+
+# Lo que queda de un texto de vigencia al quitarle fechas y días
+SCHEDULE_FILLER = re.compile(r'\b(?:del?|al?|el|los|las|y|e|todos|todas|hasta|desde|a partir|solo|cada|'
+                             r'mes|dias|vigencia|valido|durante|todo)\b|[\d,.:;/-]')
+
+
+def _normalize(text):
+    text = unicodedata.normalize('NFKD', (text or '').replace('\u200b', ' ').lower())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    text = re.sub(r'(\d)\s*[º°o]\b', r'\1', text)
+    text = NUMERIC_DATE.sub(lambda m: f'{int(m.group(1))} de {MONTH_NAMES[int(m.group(2)) - 1]} de {m.group(3)}'
+                            if 1 <= int(m.group(2)) <= 12 else m.group(0), text)
+    return ' '.join(text.split())
+
+
+def _make_date(year, month, day):
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _resolve(day, month, year, reference, upcoming=False):
+    """Fecha con el año explícito o, si falta, el más cercano a reference
+
+    upcoming=True (fechas de término) toma la primera ocurrencia desde reference.
+    """
+    if year:
+        return _make_date(int(year), month, day)
+    if reference is None:
+        return None
+    if upcoming:
+        # Hasta 4 años por el 29 de febrero
+        candidates = [_make_date(reference.year + delta, month, day) for delta in range(5)]
+        return next((c for c in candidates if c and c >= reference), None)
+    candidates = [_make_date(reference.year + delta, month, day) for delta in (-1, 0, 1)]
+    candidates = [c for c in candidates if c]
+    return min(candidates, key=lambda c: abs((c - reference).days)) if candidates else None
+
+
+def _resolve_start(day, month, year, end, reference):
+    """Inicio de un intervalo: sin año, el que lo deja antes de su término"""
+    if end and not year:
+        year = end.year - (1 if month > end.month else 0)
+    return _resolve(day, month, year, reference)
+
+
+def _interval(start, end):
+    """Un intervalo que termina antes de empezar es una mala lectura: se descarta completo"""
+    if start and end and end < start:
+        return None, None
+    return start, end
+
+
+def _month_end(year, month):
+    return date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+
+
+def parse_dates(text, reference=None):
+    """Retorna (valid_from, valid_until) desde un texto ya normalizado"""
+    match = RANGE.search(text)
+    if match:
+        start_day, start_month, start_year, end_day, end_month, end_year = match.groups()
+        end_month = MONTHS[end_month]
+        start_month = MONTHS[start_month] if start_month else end_month
+        end = _resolve(int(end_day), end_month, end_year, reference, upcoming=True)
+        start = _resolve_start(int(start_day), start_month, start_year, end, reference)
+        return _interval(start, end)
+
+    start = end = None
+    match = UNTIL.search(text)
+    if match:
+        end = _resolve(int(match.group(1)), MONTHS[match.group(2)], match.group(3), reference, upcoming=True)
+    match = SINCE.search(text)
+    if match:
+        start = _resolve_start(int(match.group(1)), MONTHS[match.group(2)], match.group(3), end, reference)
+    if start or end:
+        return _interval(start, end)
+
+    match = WHOLE_MONTH.search(text)
+    if match:
+        # El mes completo sigue la regla de los términos: su próxima ocurrencia
+        month, year = MONTHS[match.group(1)], match.group(2)
+        if year:
+            year = int(year)
+        elif reference is not None:
+            year = reference.year + (1 if _month_end(reference.year, month) < reference else 0)
+        else:
+            return None, None
+        return date(year, month, 1), _month_end(year, month)
+    return None, None
+
+
+def parse_weekdays(text):
+    """Máscara de días desde un texto ya normalizado; ALL_DAYS si no menciona días"""
+    if EVERY_DAY.search(text):
+        return ALL_DAYS
+    mask = 0
+    if WEEKEND.search(text):
+        mask |= 1 << 5 | 1 << 6
+    for match in DAY_RANGE.finditer(text):
+        first, last = WEEKDAYS.index(match.group(1)), WEEKDAYS.index(match.group(2))
+        day = first
+        while True:
+            mask |= 1 << day
+            if day == last:
+                break
+            day = (day + 1) % 7
+    text = DAY_RANGE.sub(' ', text)
+    for match in DAY.finditer(text):
+        mask |= 1 << WEEKDAYS.index(match.group(1))
+    return mask or ALL_DAYS
+
+
+def parse_validity(text, reference=None, weekdays=True):
+    """Vigencia de un texto; weekdays=False ignora los días (fichas con horarios de atención)"""
+    text = _normalize(text)
+    valid_from, valid_until = parse_dates(text, reference)
+    return {
+        'valid_from': valid_from,
+        'valid_until': valid_until,
+        'weekdays': parse_weekdays(text) if weekdays else ALL_DAYS,
+    }
+
+
+def is_schedule_text(text):
+    """True si el texto solo habla de vigencia ("Del 10 al 17 de Junio", "Lunes y viernes")"""
+    text = _normalize(text)
+    if not text:
+        return False
+    rest = RANGE.sub(' ', text)
+    rest = DAY_RANGE.sub(' ', rest)
+    rest = DAY.sub(' ', rest)
+    rest = WEEKEND.sub(' ', rest)
+    rest = re.sub(r'\b' + _MONTH, ' ', rest)
+    return not SCHEDULE_FILLER.sub(' ', rest).strip()
+
+
+def is_valid_on(validity, day):
+    """True si la vigencia cubre la fecha day (rango de fechas y día de la semana)"""
+    if validity['valid_from'] and day < validity['valid_from']:
+        return False
+    if validity['valid_until'] and day > validity['valid_until']:
+        return False
+    return bool(validity['weekdays'] & (1 << day.weekday()))
+
+
+def is_expired(validity, today=None):
+    return bool(validity['valid_until'] and validity['valid_until'] < (today or date.today()))
+
+
+def parse_date(value):
+    """Fecha de un filtro: 'hoy', YYYY-MM-DD o DD/MM/YYYY"""
+    value = str(value).strip().lower()
+    if value in ('hoy', 'today'):
+        return date.today()
+    match = re.fullmatch(r'(\d{1,2})/(\d{1,2})/(\d{4})', value)
+    if match:
+        return date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+    return date.fromisoformat(value)
+
+
+def parse_weekday(value):
+    """Día de un filtro: 0-6 (lunes = 0), 'hoy', nombre o abreviatura en español"""
+    value = _normalize(str(value)).rstrip('s')
+    if value in ('hoy', 'today'):
+        return date.today().weekday()
+    if value.isdigit() and int(value) < 7:
+        return int(value)
+    for i, name in enumerate(WEEKDAYS):
+        if value in (name.rstrip('s'), WEEKDAY_ABBREVIATIONS[i]):
+            return i
+    raise ValueError(f"Día de la semana no reconocido: {value}")
+
+
+def to_fields(validity):
+    """Columnas CSV: fechas ISO (vacías si no hay límite) y la máscara de días"""
+    return {
+        'valid_from': validity['valid_from'].isoformat() if validity['valid_from'] else '',
+        'valid_until': validity['valid_until'].isoformat() if validity['valid_until'] else '',
+        'weekdays': validity['weekdays'],
+    }
+
+
+def from_fields(row):
+    """Inverso de to_fields; None si la fila no trae columnas de vigencia"""
+    if not any(row.get(field) not in (None, '') for field in ('valid_from', 'valid_until', 'weekdays')):
+        return None
+    return {
+        'valid_from': date.fromisoformat(row['valid_from']) if row.get('valid_from') else None,
+        'valid_until': date.fromisoformat(row['valid_until']) if row.get('valid_until') else None,
+        'weekdays': int(row['weekdays']) if row.get('weekdays') not in (None, '') else ALL_DAYS,
+    }
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Registro de cada comando WebDriver: tipo, selector, latencia y NoSuchElement
+
+Todos los comandos (también los de WebElement, que delegan en el driver)
+pasan por driver.execute, así que instrument() envuelve ese método en la
+instancia. Cada comando queda asociado a los ámbitos abiertos con scope()
+('benefit', 'page'), lo que permite armar histogramas por beneficio y por
+página y ver, por ejemplo, cuánto tiempo se va en selectores de respaldo que
+no encuentran nada.
+
+No importa selenium: NoSuchElementException se reconoce por nombre para que
+este módulo (y common.metrics, que lo usa) sirva también en los scripts
+offline que no tienen selenium instalado.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+FIND_COMMANDS = ('findElement', 'findElements', 'findChildElement', 'findChildElements')
+
+
+def _bucket_counts(buckets):
+    return [0] * (len(buckets) + 1)
+
+
+def _observe(counts, buckets, value):
+    for i, upper in enumerate(buckets):
+        if value <= upper:
+            counts[i] += 1
+            return
+    counts[-1] += 1
+
+
+def _histogram(counts, buckets):
+    """Convierte conteos por bucket en pares acumulados (le, count) al estilo Prometheus"""
+    result = []
+    total = 0
+    for upper, count in zip(list(buckets) + ['+Inf'], counts):
+        total += count
+        result.append([upper, total])
+    return result
+
+
+class CommandRecorder:
+    """Acumula estadísticas de comandos WebDriver por comando/selector y por ámbito"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.commands = {}
+        self.scopes = {}
+
+    def _open_scopes(self):
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    def record(self, command, selector, seconds, not_found=False, error=False):
+        with self.lock:
+            stats = self.commands.setdefault((command, selector), {
+                'count': 0, 'seconds': 0.0, 'not_found': 0, 'errors': 0,
+                'latency_buckets': _bucket_counts(LATENCY_BUCKETS),
+            })
+            stats['count'] += 1
+            stats['seconds'] += seconds
+            stats['not_found'] += 1 if not_found else 0
+            stats['errors'] += 1 if error else 0
+            _observe(stats['latency_buckets'], LATENCY_BUCKETS, seconds)
+
+        for current in self._open_scopes():
+            current['commands'] += 1
+            current['seconds'] += seconds
+            if not_found:
+                current['not_found'] += 1
+                current['not_found_seconds'] += seconds
+
+    @contextmanager
+    def scope(self, kind):
+        """Agrupa los comandos emitidos dentro del bloque bajo un ámbito (ej. 'benefit')"""
+        current = {'commands': 0, 'seconds': 0.0, 'not_found': 0, 'not_found_seconds': 0.0}
+        stack = self._open_scopes()
+        stack.append(current)
+        try:
+            yield current
+        finally:
+            # Por identidad y no por valor: un ámbito externo y uno anidado
+            # pueden tener los mismos conteos (ej. ambos aún en cero)
+            for index in range(len(stack) - 1, -1, -1):
+                if stack[index] is current:
+                    del stack[index]
+                    break
+            with self.lock:
+                stats = self.scopes.setdefault(kind, {
+                    'count': 0, 'commands': 0, 'seconds': 0.0,
+                    'not_found': 0, 'not_found_seconds': 0.0,
+                    'commands_buckets': _bucket_counts(COUNT_BUCKETS),
+                    'latency_buckets': _bucket_counts(LATENCY_BUCKETS),
+                })
+                stats['count'] += 1
+                for key in ('commands', 'seconds', 'not_found', 'not_found_seconds'):
+                    stats[key] += current[key]
+                _observe(stats['commands_buckets'], COUNT_BUCKETS, current['commands'])
+                _observe(stats['latency_buckets'], LATENCY_BUCKETS, current['seconds'])
+
+    def summary(self):
+        with self.lock:
+            commands = []
+            for (command, selector), stats in sorted(self.commands.items(), key=lambda item: -item[1]['seconds']):
+                commands.append({
+                    'command': command,
+                    'selector': selector,
+                    'count': stats['count'],
+                    'seconds': round(stats['seconds'], 6),
+                    'not_found': stats['not_found'],
+                    'errors': stats['errors'],
+                    'latency_histogram': _histogram(stats['latency_buckets'], LATENCY_BUCKETS),
+                })
+
+            scopes = {}
+            for kind, stats in self.scopes.items():
+                scopes[kind] = {
+                    'count': stats['count'],
+                    'commands': stats['commands'],
+                    'seconds': round(stats['seconds'], 6),
+                    'commands_per_scope': round(stats['commands'] / stats['count'], 3) if stats['count'] else 0.0,
+                    'not_found': stats['not_found'],
+                    'not_found_time_share': round(stats['not_found_seconds'] / stats['seconds'], 4) if stats['seconds'] else 0.0,
+                    'commands_histogram': _histogram(stats['commands_buckets'], COUNT_BUCKETS),
+                    'latency_histogram': _histogram(stats['latency_buckets'], LATENCY_BUCKETS),
+                }
+
+        return {
+            'total_commands': sum(item['count'] for item in commands),
+            'total_seconds': round(sum(item['seconds'] for item in commands), 6),
+            'not_found': sum(item['not_found'] for item in commands),
+            'commands': commands,
+            'scopes': scopes,
+        }
+
+
+recorder = CommandRecorder()
+
+
+def reset():
+    global recorder
+    recorder = CommandRecorder()
+    return recorder
+
+
+def scope(kind):
+    return recorder.scope(kind)
+
+
+def _selector(driver_command, params):
+    if driver_command in FIND_COMMANDS and params:
+        return f"{params.get('using', '')}={params.get('value', '')}"
+    if driver_command in ('getElementAttribute', 'getElementProperty') and params:
+        return params.get('name', '')
+    return ''
+
+
+def instrument(driver, on_command=None):
+    """Envuelve driver.execute para registrar cada comando en el recorder actual
+
+    on_command, si se entrega, se llama sin argumentos por cada comando (lo usa
+    common.metrics para su contador).
+    """
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        start = time.perf_counter()
+        not_found = False
+        error = False
+        try:
+            return original_execute(driver_command, params)
+        except Exception as e:
+            if type(e).__name__ == 'NoSuchElementException':
+                not_found = True
+            else:
+                error = True
+            raise
+        finally:
+            recorder.record(driver_command, _selector(driver_command, params),
+                            time.perf_counter() - start, not_found, error)
+            if on_command:
+                on_command()
+
+    driver.execute = execute
+    return driver
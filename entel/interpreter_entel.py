@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Extracción de beneficios de Entel Club desde el HTML de la página, sin navegador
+
+Los eds-card de andino-card-general (tarjetas) y eds-card-general (banner)
+traen el JSON de cada beneficio. Lo usan entel/scraper.py (con Selenium o
+Playwright) y los procesos offline (benchmarks, common/reparse.py), que no
+necesitan Selenium instalado.
+"""
+
+import html
+import json
+import re
+
+def extract_benefit_from_json(json_data):
+    """Extrae información del beneficio desde el JSON embebido en el HTML"""
+    try:
+        # El JSON está en formato de string escapado, necesitamos parsearlo
+        if isinstance(json_data, str):
+            # Decodificar entidades HTML
+            json_data = json_data.replace('&quot;', '"')
+            data = json.loads(json_data)
+        else:
+            data = json_data
+        
+        if isinstance(data, list) and len(data) > 0:
+            benefit_data = data[0]
+            
+            title = benefit_data.get('title', '')
+            description = benefit_data.get('text', '')
+            url = benefit_data.get('href', '')
+            
+            # Limpiar la descripción de markdown
+            if description:
+                description = re.sub(r'\*\*(.*?)\*\*', r'\1', description)  # Remover **texto**
+                description = description.strip()
+            
+            return {
+                'title': title,
+                'description': description,
+                'url': url
+            }
+    except Exception as e:
+        print(f"Error al parsear JSON: {str(e)}")
+        return None
+    
+    return None
+
+def extract_banner_benefits(json_data):
+    """Extrae todos los beneficios del eds-card de un banner (puede traer varios)"""
+    json_data = json_data.replace('&quot;', '"')
+    data = json.loads(json_data)
+    
+    benefits = []
+    if isinstance(data, list):
+        for item in data:
+            title = item.get('title', '')
+            if not title:
+                continue
+            description = item.get('text', '')
+            # Limpiar markdown
+            if description:
+                description = re.sub(r'\*\*(.*?)\*\*', r'\1', description)
+            
+            benefits.append({
+                'title': title,
+                'description': description,
+                'url': item.get('href', ''),
+                'category': 'Club Entel - Destacados'
+            })
+    return benefits
+
+CARD_ATTR_PATTERN = re.compile(r'<andino-card-general\b[^>]*?\beds-card="([^"]*)"')
+BANNER_ATTR_PATTERN = re.compile(r'<eds-card-general\b[^>]*?\beds-card="([^"]*)"')
+
+def extract_benefits_from_html(content):
+    """Extrae los beneficios desde el HTML guardado de la página (sin navegador)
+
+    Replica lo que hace scrape_entel_benefits sobre los atributos eds-card de
+    andino-card-general y eds-card-general, por ejemplo con entel/source/entel.txt.
+    """
+    benefits = []
+    seen_titles = set()
+    
+    for raw in CARD_ATTR_PATTERN.findall(content):
+        benefit_data = extract_benefit_from_json(html.unescape(raw))
+        if benefit_data and benefit_data['title'] and benefit_data['title'] not in seen_titles:
+            benefit_data['category'] = 'Club Entel'
+            benefits.append(benefit_data)
+            seen_titles.add(benefit_data['title'])
+    
+    for raw in BANNER_ATTR_PATTERN.findall(content):
+        try:
+            items = extract_banner_benefits(html.unescape(raw))
+        except Exception as e:
+            print(f"Error al procesar banner: {str(e)}")
+            continue
+        for item in items:
+            if item['title'] not in seen_titles:
+                benefits.append(item)
+                seen_titles.add(item['title'])
+    
+    return benefits
@@ -5,13 +5,13 @@ Scraper offline para Entel Club
 Extrae beneficios del Club Entel y los guarda en un archivo CSV
 """
 
+import argparse
+import asyncio
 import csv
 import os
+import sys
 import time
-import json
-import re
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -20,6 +20,15 @@ from selenium.webdriver.support import expected_conditions as EC
 import requests
 import socket
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import async_browser, benefit_store, browser, delta, enrich, metrics, retry, scheduler
+from entel.interpreter_entel import extract_banner_benefits, extract_benefit_from_json, extract_benefits_from_html
+
+DEFAULT_BENEFITS_URL = "https://www.entel.cl/beneficios/"
+# Se puede apuntar a otro sitio (ej. benchmarks/standin_server.py) con ENTEL_BENEFITS_URL
+BENEFITS_URL = os.environ.get('ENTEL_BENEFITS_URL', DEFAULT_BENEFITS_URL)
+BREAKER = retry.breaker('entel')
+
 def test_internet_connection():
     """Prueba la conexión a internet"""
     try:
@@ -60,7 +69,7 @@ def save_benefits_to_csv(benefits, filename='benefits_entel.csv'):
             'url'  # Campo adicional para la URL del beneficio
         ]
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with metrics.span('csv_write'), open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             
             # Escribir headers
@@ -69,20 +78,21 @@ def save_benefits_to_csv(benefits, filename='benefits_entel.csv'):
             # Escribir beneficios
             for i, benefit in enumerate(benefits, 1):
                 row = {
-                    'id': i,
+                    'id': benefit.get('id', i),
                     'title': benefit.get('title', ''),
                     'description': benefit.get('description', ''),
                     'bank': 'entel',
                     'provider': 'Entel',
                     'category': benefit.get('category', 'Club Entel'),
                     'is_active': 1,
-                    'created_at': datetime.now().isoformat(),
-                    'updated_at': datetime.now().isoformat(),
+                    'created_at': benefit.get('created_at', datetime.now().isoformat()),
+                    'updated_at': benefit.get('updated_at', datetime.now().isoformat()),
                     'url': benefit.get('url', '')
                 }
                 writer.writerow(row)
                 print(f"Beneficio {i}/{len(benefits)} guardado: {benefit.get('title', '')[:50]}...")
         
+        metrics.record_file_written(filename)
         print(f"✓ Todos los beneficios han sido guardados en {filename}")
         return True
         
@@ -90,39 +100,15 @@ def save_benefits_to_csv(benefits, filename='benefits_entel.csv'):
         print(f"✗ Error al guardar en CSV: {str(e)}")
         return False
 
-def extract_benefit_from_json(json_data):
-    """Extrae información del beneficio desde el JSON embebido en el HTML"""
-    try:
-        # El JSON está en formato de string escapado, necesitamos parsearlo
-        if isinstance(json_data, str):
-            # Decodificar entidades HTML
-            json_data = json_data.replace('&quot;', '"')
-            data = json.loads(json_data)
-        else:
-            data = json_data
-        
-        if isinstance(data, list) and len(data) > 0:
-            benefit_data = data[0]
-            
-            title = benefit_data.get('title', '')
-            description = benefit_data.get('text', '')
-            url = benefit_data.get('href', '')
-            
-            # Limpiar la descripción de markdown
-            if description:
-                description = re.sub(r'\*\*(.*?)\*\*', r'\1', description)  # Remover **texto**
-                description = description.strip()
-            
-            return {
-                'title': title,
-                'description': description,
-                'url': url
-            }
-    except Exception as e:
-        print(f"Error al parsear JSON: {str(e)}")
-        return None
-    
-    return None
+def open_benefits_page(driver):
+    """Carga la página y espera las tarjetas; se reintenta completo si hay un timeout"""
+    with metrics.span('page_load'), scheduler.slot(BENEFITS_URL):
+        driver.get(BENEFITS_URL)
+    print("✓ Página cargada exitosamente")
+    with metrics.span('wait'):
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.TAG_NAME, "andino-card-general"))
+        )
 
 def scrape_entel_benefits():
     """Función principal para hacer scraping de beneficios de Entel"""
@@ -130,8 +116,8 @@ def scrape_entel_benefits():
         print("=== SCRAPER OFFLINE ENTEL CLUB ===")
         print("Iniciando proceso de scraping...")
         
-        # Verificar conexión a internet
-        if not test_internet_connection():
+        # Verificar conexión a internet (no aplica contra un sitio local)
+        if BENEFITS_URL == DEFAULT_BENEFITS_URL and not test_internet_connection():
             print("Error: No hay conexión a internet")
             return []
         
@@ -155,29 +141,18 @@ def scrape_entel_benefits():
         print("\nInicializando navegador...")
         try:
             service = Service(log_path=os.devnull)
-            driver = webdriver.Chrome(service=service, options=options)
+            with metrics.span('browser_startup'):
+                driver = metrics.instrument_driver(browser.launch('entel', options, service))
             print("✓ Navegador inicializado exitosamente")
         except Exception as e:
             print(f"✗ Error al inicializar el navegador: {str(e)}")
             print("Asegúrate de tener ChromeDriver instalado y en el PATH")
             return []
 
-        # Abrir la página de beneficios de Entel
+        # Abrir la página de beneficios de Entel y esperar a que carguen los beneficios
         print("\nAccediendo a la página de beneficios de Entel...")
         try:
-            driver.get("https://www.entel.cl/beneficios/")
-            print("✓ Página cargada exitosamente")
-        except Exception as e:
-            print(f"✗ Error al cargar la página: {str(e)}")
-            driver.quit()
-            return []
-        
-        # Esperar a que carguen los beneficios
-        print("\nEsperando a que carguen los beneficios...")
-        try:
-            WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.TAG_NAME, "andino-card-general"))
-            )
+            retry.call(open_benefits_page, driver, breaker=BREAKER, label="carga de la página")
             print("✓ Beneficios cargados exitosamente")
         except Exception as e:
             print(f"✗ Error al esperar los beneficios: {str(e)}")
@@ -187,7 +162,8 @@ def scrape_entel_benefits():
         
         # Dar tiempo para que carguen todos los elementos
         print("\nEsperando 5 segundos para asegurar que todos los elementos estén cargados...")
-        time.sleep(5)
+        with metrics.span('wait'):
+            time.sleep(5)
         
         # Encontrar todos los beneficios
         benefits = []
@@ -203,10 +179,11 @@ def scrape_entel_benefits():
             for i, element in enumerate(benefit_elements, 1):
                 try:
                     # Obtener el atributo eds-card que contiene el JSON con la información
-                    eds_card_attr = element.get_attribute("eds-card")
+                    with metrics.span('card_extraction', scope='benefit'):
+                        eds_card_attr = element.get_attribute("eds-card")
+                        benefit_data = extract_benefit_from_json(eds_card_attr) if eds_card_attr else None
                     
                     if eds_card_attr:
-                        benefit_data = extract_benefit_from_json(eds_card_attr)
                         
                         if benefit_data and benefit_data['title']:
                             title = benefit_data['title']
@@ -220,6 +197,7 @@ def scrape_entel_benefits():
                                     'category': 'Club Entel'
                                 })
                                 seen_titles.add(title)
+                                metrics.incr('cards')
                                 print(f"Beneficio {len(benefits)} extraído: {title[:50]}...")
                             else:
                                 print(f"Beneficio duplicado omitido: {title[:50]}...")
@@ -238,26 +216,13 @@ def scrape_entel_benefits():
                         eds_card_attr = element.get_attribute("eds-card")
                         if eds_card_attr:
                             # El banner puede tener múltiples beneficios en un array
-                            json_data = eds_card_attr.replace('&quot;', '"')
-                            data = json.loads(json_data)
-                            
-                            if isinstance(data, list):
-                                for item in data:
-                                    title = item.get('title', '')
-                                    if title and title not in seen_titles:
-                                        description = item.get('text', '')
-                                        # Limpiar markdown
-                                        if description:
-                                            description = re.sub(r'\*\*(.*?)\*\*', r'\1', description)
-                                        
-                                        benefits.append({
-                                            'title': title,
-                                            'description': description,
-                                            'url': item.get('href', ''),
-                                            'category': 'Club Entel - Destacados'
-                                        })
-                                        seen_titles.add(title)
-                                        print(f"Beneficio destacado extraído: {title[:50]}...")
+                            for item in extract_banner_benefits(eds_card_attr):
+                                title = item['title']
+                                if title not in seen_titles:
+                                    benefits.append(item)
+                                    seen_titles.add(title)
+                                    metrics.incr('cards')
+                                    print(f"Beneficio destacado extraído: {title[:50]}...")
                     except Exception as e:
                         print(f"Error al procesar banner: {str(e)}")
                         continue
@@ -285,24 +250,76 @@ def scrape_entel_benefits():
         print(f"\nError general en el proceso: {str(e)}")
         return []
 
+async def _scrape_entel_async():
+    async with async_browser.AsyncBrowser(max_pages=1) as pw_browser:
+        async with pw_browser.page() as page:
+            await pw_browser.goto(page, BENEFITS_URL, breaker=BREAKER, wait_for="andino-card-general")
+            # En vez de la espera fija de 5 s: hasta que la red quede quieta
+            with metrics.span('wait'):
+                await page.wait_for_load_state('networkidle')
+            content = await page.content()
+    with metrics.span('page_extraction', scope='page'):
+        return extract_benefits_from_html(content)
+
+def scrape_entel_playwright():
+    """scrape_entel_benefits con Playwright: sin imágenes ni analítica, y las tarjetas se leen del HTML"""
+    print("=== SCRAPER OFFLINE ENTEL CLUB (Playwright) ===")
+    if not async_browser.available():
+        print(async_browser.MISSING_MESSAGE)
+        return []
+    try:
+        benefits = asyncio.run(_scrape_entel_async())
+    except Exception as e:
+        print(f"✗ Error en scraping con Playwright: {str(e)}")
+        return []
+    metrics.incr('cards', len(benefits))
+    print(f"Total de beneficios extraídos: {len(benefits)}")
+    return benefits
+
 def main():
     """Función principal"""
+    parser = argparse.ArgumentParser(description="Scraper de beneficios Entel Club")
+    parser.add_argument('--delta', action='store_true',
+                        help="Escribe además solo las altas, cambios y bajas respecto de la ejecución anterior")
+    parser.add_argument('--enriquecer', action='store_true',
+                        help="Descarga la página de detalle de cada beneficio (entel/data/benefits_entel_detalle.csv)")
+    parser.add_argument('--motor', choices=['selenium', 'playwright'], default='selenium',
+                        help="playwright: Chromium asíncrono sin imágenes ni analítica (requiere playwright)")
+    browser.add_arguments(parser)
+    args = parser.parse_args()
+    browser.configure_from_args(args)
+    
     print("Iniciando scraper offline de Entel Club...")
+    metrics.start_run('entel')
+    state = delta.DeltaState('entel')
     
     # Hacer scraping
-    benefits = scrape_entel_benefits()
+    benefits = scrape_entel_playwright() if args.motor == 'playwright' else scrape_entel_benefits()
     
     if benefits:
+        # ids y fechas estables entre ejecuciones (llave: URL o título)
+        changes = state.apply(benefits)
+        
         # Guardar en CSV
         success = save_benefits_to_csv(benefits, 'entel/data/benefits_entel.csv')
         
         if success:
+            if args.delta:
+                delta.save_changes_csv(changes, 'entel/data/benefits_entel_delta.csv',
+                                       ['id', 'title', 'description', 'category', 'url', 'created_at', 'updated_at'])
+            state.save()
+            benefit_store.append_run('entel', benefits)
+            if args.enriquecer:
+                with metrics.span('enrich'):
+                    enrich.enrich_csv('entel/data/benefits_entel.csv', base_url=BENEFITS_URL)
             print(f"\n✓ Proceso completado exitosamente!")
             print(f"✓ Total de beneficios: {len(benefits)}")
         else:
             print(f"\n✗ Error al guardar el archivo CSV")
     else:
         print(f"\n✗ No se pudieron extraer beneficios")
+    
+    metrics.finish_run()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,267 @@
+"""
+Copia local de las imágenes de los beneficios (logos e íconos)
+
+Descarga en paralelo las image_url de los CSV (catálogo consolidado y
+Universidad Mayor, cuyas rutas son relativas a www.umayor.cl) y los íconos de
+categorías del listado BCI, con el cliente HTTP compartido (pool por host y
+caché, ver common/http_client.py). Cada imagen se guarda direccionada por su
+contenido en migrations/assets/objects/<aa>/<sha256><ext>, así que un logo
+repetido en muchos beneficios o servido desde varias URL ocupa un solo
+archivo. Las miniaturas se generan en un pool de procesos con Pillow (si no
+está instalado se omiten; los SVG se usan tal cual) en
+migrations/assets/thumbs/<aa>/<sha256>_<tamaño><ext>.
+
+migrations/assets/manifest.json relaciona:
+
+    urls:     URL de origen → hash
+    benefits: llave del beneficio (proveedor:nombre) o bci:categoria:<nombre> → hash
+    objects:  hash → [extensión, tipo, bytes, ancho, alto, extensión de las miniaturas]
+
+Las rutas no se guardan porque salen del hash (ver asset_path).
+
+Las URL que ya están en el manifiesto no se vuelven a descargar (salvo con
+--refrescar). Uso:
+
+    python migrations/assets.py
+    python migrations/assets.py --csv otro.csv --base-url https://www.umayor.cl --workers 32
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import metrics
+from common.delta import normalize_title
+from common.http_client import HttpClient
+
+try:
+    from PIL import Image
+except ImportError:  # Sin Pillow no hay miniaturas
+    Image = None
+
+DIR_SCRIPT = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(DIR_SCRIPT)
+DEFAULT_ASSETS_DIR = os.path.join(DIR_SCRIPT, 'assets')
+
+# (CSV, proveedor si el CSV no trae columna provider, base de las URL relativas)
+DEFAULT_SOURCES = [
+    (os.path.join(DIR_SCRIPT, 'benefits.csv'), None, None),
+    (os.path.join(ROOT, 'umayor', 'data', 'benefits_umayor.csv'), 'Universidad Mayor', 'https://www.umayor.cl'),
+]
+DEFAULT_ICONS_HTML = os.path.join(ROOT, 'bci', 'source', 'bci.txt')
+BCI_CATEGORY_ICON = re.compile(r'<li name="([^"]+)" class="list-categorie__item.*?<img src="([^"]+)"', re.S)
+
+THUMB_SIZES = (128, 384)
+# Posiciones de cada objeto en el manifiesto
+EXT, TYPE, BYTES, WIDTH, HEIGHT, THUMB_EXT = range(6)
+EXTENSIONS = {'image/png': '.png', 'image/jpeg': '.jpg', 'image/gif': '.gif', 'image/webp': '.webp',
+              'image/svg+xml': '.svg'}
+
+
+def benefit_key(provider, name):
+    return f"{normalize_title(provider)}:{normalize_title(name)}"
+
+
+def collect_images(sources, icons_html=None):
+    """Retorna {llave de beneficio: URL absoluta de la imagen}"""
+    images = {}
+    for path, default_provider, base_url in sources:
+        if not os.path.exists(path):
+            continue
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                url = (row.get('image_url') or '').strip()
+                if not url:
+                    continue
+                if base_url:
+                    url = urljoin(base_url, url)
+                if not url.startswith(('http://', 'https://')):
+                    continue
+                provider = row.get('provider') or default_provider or ''
+                images.setdefault(benefit_key(provider, row.get('name') or row.get('title')), url)
+    if icons_html and os.path.exists(icons_html):
+        with open(icons_html, 'r', encoding='utf-8') as f:
+            for name, url in BCI_CATEGORY_ICON.findall(f.read()):
+                images.setdefault('bci:categoria:' + normalize_title(name), url)
+    return images
+
+
+def _extension(response):
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    return EXTENSIONS.get(content_type) or mimetypes.guess_extension(content_type) or \
+        os.path.splitext(urlparse(response.url).path)[1].lower()
+
+
+class ObjectStore:
+    """Archivos direccionados por contenido; seguro para escribir desde varios hilos"""
+
+    def __init__(self, assets_dir):
+        self.assets_dir = assets_dir
+        self._known = set()
+        self._lock = threading.Lock()
+
+    def put(self, response):
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if not response.ok:
+            raise ValueError(f"HTTP {response.status_code}")
+        if not content_type.startswith('image/'):
+            raise ValueError(f"no es una imagen ({content_type or 'sin Content-Type'})")
+        digest = hashlib.sha256(response.content).hexdigest()
+        extension = _extension(response)
+        path = os.path.join(self.assets_dir, object_path(digest, extension))
+        with self._lock:
+            exists = digest in self._known or os.path.exists(path)
+            self._known.add(digest)
+        if exists:
+            metrics.incr('assets_deduplicated')
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(response.content)
+            os.replace(tmp_path, path)
+            metrics.incr('assets_stored')
+            metrics.record_file_written(path)
+        return digest, [extension, content_type, len(response.content), None, None, None]
+
+
+def object_path(digest, extension):
+    return os.path.join('objects', digest[:2], digest + extension)
+
+
+def thumb_path(digest, size, extension):
+    return os.path.join('thumbs', digest[:2], f'{digest}_{size}{extension}')
+
+
+def asset_path(manifest, key, size=None):
+    """Ruta relativa (a migrations/assets) de la imagen de un beneficio o de su miniatura"""
+    digest = manifest['benefits'].get(key)
+    if digest is None:
+        return None
+    entry = manifest['objects'][digest]
+    if size is not None and entry[THUMB_EXT]:
+        return thumb_path(digest, size, entry[THUMB_EXT])
+    return object_path(digest, entry[EXT])
+
+
+def make_thumbnails(assets_dir, digest, extension, sizes=THUMB_SIZES):
+    """Genera las miniaturas de un objeto (se ejecuta en otro proceso)
+
+    Retorna (digest, ancho, alto, extensión de las miniaturas). Las
+    miniaturas que ya existen no se regeneran.
+    """
+    with Image.open(os.path.join(assets_dir, object_path(digest, extension))) as image:
+        image.load()
+        width, height = image.size
+        alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+        thumb_extension = '.png' if alpha else '.jpg'
+        for size in sizes:
+            path = os.path.join(assets_dir, thumb_path(digest, size, thumb_extension))
+            if os.path.exists(path):
+                continue
+            thumb = image.convert('RGBA' if alpha else 'RGB')
+            thumb.thumbnail((size, size))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            thumb.save(path + '.tmp', format='PNG' if alpha else 'JPEG', **({} if alpha else {'quality': 85}))
+            os.replace(path + '.tmp', path)
+    return digest, width, height, thumb_extension
+
+
+def load_manifest(assets_dir):
+    path = os.path.join(assets_dir, 'manifest.json')
+    if not os.path.exists(path):
+        return {'version': 1, 'thumb_sizes': list(THUMB_SIZES), 'objects': {}, 'urls': {}, 'benefits': {}}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def mirror(images, assets_dir=DEFAULT_ASSETS_DIR, per_host=6, workers=16, processes=None, refresh=False):
+    """Descarga las imágenes, genera miniaturas y escribe el manifiesto; retorna el manifiesto"""
+    manifest = load_manifest(assets_dir)
+    objects, urls = manifest['objects'], manifest['urls']
+    pending = [url for url in dict.fromkeys(images.values())
+               if refresh or urls.get(url) not in objects
+               or not os.path.exists(os.path.join(assets_dir, object_path(urls[url], objects[urls[url]][EXT])))]
+
+    store = ObjectStore(assets_dir)
+    failed = 0
+    start = time.perf_counter()
+    with HttpClient(per_host=per_host) as client, metrics.span('download'):
+        for url, result in client.map(pending, workers=workers, handler=store.put):
+            if isinstance(result, Exception):
+                failed += 1
+                print(f"✗ No se pudo copiar {url}: {str(result)}")
+                continue
+            digest, entry = result
+            urls[url] = digest
+            if digest not in objects or refresh:
+                objects[digest] = entry
+    download_seconds = time.perf_counter() - start
+
+    # Miniaturas en procesos aparte: redimensionar es CPU y no avanza en paralelo con hilos
+    todo = [(digest, entry[EXT]) for digest, entry in objects.items()
+            if entry[TYPE] != 'image/svg+xml' and not entry[THUMB_EXT]]
+    if todo and Image is None:
+        print("✗ Pillow no está instalado; se omiten las miniaturas (pip install Pillow)")
+    elif todo:
+        with metrics.span('thumbnails'), ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(make_thumbnails, assets_dir, digest, extension) for digest, extension in todo]
+            for future in futures:
+                try:
+                    digest, width, height, thumb_extension = future.result()
+                except Exception as e:
+                    print(f"✗ No se pudo generar la miniatura: {str(e)}")
+                    continue
+                objects[digest][WIDTH:] = [width, height, thumb_extension]
+                metrics.incr('thumbnails', len(THUMB_SIZES))
+
+    manifest['benefits'] = {key: urls[url] for key, url in sorted(images.items()) if url in urls}
+    path = os.path.join(assets_dir, 'manifest.json')
+    os.makedirs(assets_dir, exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    os.replace(path + '.tmp', path)
+    metrics.record_file_written(path)
+
+    metrics.incr('assets_downloaded', len(pending) - failed)
+    metrics.incr('assets_failed', failed)
+    print(f"✓ {len(pending) - failed} imágenes descargadas en {download_seconds:.2f}s ({failed} fallidas); "
+          f"{len(manifest['benefits'])} beneficios → {len(objects)} archivos únicos en {assets_dir}")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Copia local de las imágenes de los beneficios")
+    parser.add_argument('--destino', default=DEFAULT_ASSETS_DIR, help="Directorio de los archivos y el manifiesto")
+    parser.add_argument('--csv', action='append',
+                        help="CSV con columna image_url (se puede repetir; por defecto el catálogo y Universidad Mayor)")
+    parser.add_argument('--base-url', help="Base para resolver las image_url relativas de --csv")
+    parser.add_argument('--iconos', default=DEFAULT_ICONS_HTML,
+                        help="HTML del listado BCI del que se toman los íconos de categorías ('' para omitir)")
+    parser.add_argument('--por-host', type=int, default=6, help="Descargas simultáneas por host")
+    parser.add_argument('--workers', type=int, default=16, help="Descargas en paralelo en total")
+    parser.add_argument('--procesos', type=int, help="Procesos para las miniaturas (por defecto uno por CPU)")
+    parser.add_argument('--refrescar', action='store_true', help="Vuelve a descargar las URL ya copiadas")
+    args = parser.parse_args(argv)
+
+    sources = [(path, None, args.base_url) for path in args.csv] if args.csv else DEFAULT_SOURCES
+    metrics.start_run('assets')
+    with metrics.span('collect'):
+        images = collect_images(sources, args.iconos or None)
+    mirror(images, args.destino, args.por_host, args.workers, args.procesos, args.refrescar)
+    metrics.finish_run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,405 @@
+"""
+Índice binario precalculado para servir listados de beneficios sin base de datos
+
+construir lee migrations/benefits.csv y escribe migrations/benefits.idx:
+
+    'BIDX' | largo del encabezado | encabezado JSON
+    filas:     una estructura fija por beneficio (proveedor, categoría, tipo de
+               oferta, activo, posición y largo del registro, vigencia)
+    postings:  por cada valor de cada filtro, los números de fila (uint32)
+    registros: cada beneficio como JSON UTF-8
+
+La vigencia (ver common/validity.py) sale de las columnas valid_from,
+valid_until y weekdays si el CSV las trae, o si no del texto de la
+descripción. Los beneficios ya vencidos no entran al índice. Para los filtros
+de vigencia hay una posting por día de la semana y un índice de intervalos:
+las filas sin fechas (siempre vigentes) y las filas con fechas ordenadas por
+inicio, así que "vigente el 2025-06-12" es una búsqueda binaria más revisar el
+término de las filas que ya empezaron.
+
+El encabezado trae los diccionarios de valores, dónde empieza cada posting y
+los conteos por faceta ya calculados, así que abrir el índice es un mmap más
+un json.loads de unos pocos KB. Un filtro recorre la posting más corta y
+revisa los demás campos en la fila fija; nada se copia a memoria hasta leer
+los registros de la página pedida.
+
+    python migrations/benefits_index.py construir
+    python migrations/benefits_index.py servir --puerto 8090
+    curl 'http://127.0.0.1:8090/benefits?provider=Entel&limit=5'
+    curl 'http://127.0.0.1:8090/facets?category=Cursos'
+    curl 'http://127.0.0.1:8090/benefits?valid_on=hoy&provider=Entel'
+    curl 'http://127.0.0.1:8090/benefits?weekday=martes'
+"""
+
+import argparse
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import metrics, validity
+
+DIR_SCRIPT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INDEX = os.path.join(DIR_SCRIPT, 'benefits.idx')
+
+MAGIC = b'BIDX'
+VERSION = 2
+# provider, category, offer_type, active, offset del registro, largo del registro,
+# día de inicio, día de término, máscara de días de la semana
+ROW = struct.Struct('<HHBBIIHHB')
+FILTERS = ('provider', 'category', 'offer_type', 'active')
+QUERY_FILTERS = FILTERS + ('valid_on', 'weekday')
+
+# Las fechas se guardan como días desde DAY_EPOCH; sin inicio es 0 y sin término OPEN_END
+DAY_EPOCH = date(2000, 1, 1)
+OPEN_END = 0xFFFF
+# Descripciones más largas son fichas con horarios de atención: de ellas solo se toman fechas
+MAX_SCHEDULE_TEXT = 160
+
+
+def day_number(day):
+    return (day - DAY_EPOCH).days
+
+
+def stored_day(day):
+    """day_number acotado a lo que cabe en la fila (0 .. OPEN_END - 1)
+
+    Un inicio anterior a DAY_EPOCH ("desde el 1 de enero de 1999") queda como
+    sin inicio y un término más allá del rango como el último día guardable,
+    en vez de que struct.pack aborte la construcción.
+    """
+    return min(max(day_number(day), 0), OPEN_END - 1)
+
+
+def _reference_date(row):
+    """Fecha del scraping de la fila, para completar el año de fechas que no lo traen"""
+    for field in ('updated_at', 'created_at'):
+        try:
+            return datetime.fromisoformat(row[field]).date()
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def row_validity(row):
+    parsed = validity.from_fields(row)
+    if parsed is None:
+        description = row.get('description') or ''
+        parsed = validity.parse_validity(description, _reference_date(row),
+                                         weekdays=len(description) <= MAX_SCHEDULE_TEXT)
+    return parsed
+
+
+def offer_type(text):
+    """Tipo de oferta desde el texto (reglas de classify_offer del scraper BCI más dcto, dto y %)"""
+    text = (text or '').lower()
+    if 'cashback' in text:
+        return 'cashback'
+    if 'descuento' in text or 'dcto' in text or 'dto' in text or '%' in text:
+        return 'descuento'
+    if 'cuotas' in text:
+        return 'cuotas'
+    return 'otro'
+
+
+def build_index(csv_filename='benefits.csv', index_filename=DEFAULT_INDEX, today=None):
+    """Construye el índice; los beneficios vencidos antes de today (por defecto hoy) se omiten"""
+    ruta_csv = os.path.join(DIR_SCRIPT, csv_filename)
+    with open(ruta_csv, newline='', encoding='utf-8') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+
+    today = today or date.today()
+    validities = []
+    current = []
+    for row in rows:
+        parsed = row_validity(row)
+        if not validity.is_expired(parsed, today):
+            current.append(row)
+            validities.append(parsed)
+    expired = len(rows) - len(current)
+    rows = current
+
+    values = {name: [] for name in FILTERS}
+    lookup = {name: {} for name in FILTERS}
+    postings = {name: [] for name in FILTERS}
+
+    def code(name, value):
+        if value not in lookup[name]:
+            lookup[name][value] = len(values[name])
+            values[name].append(value)
+            postings[name].append(array('I'))
+        return lookup[name][value]
+
+    weekday_postings = [array('I') for _ in range(7)]
+    always = array('I')
+    bounded = []
+    fixed = bytearray()
+    payload = bytearray()
+    with metrics.span('index_build'):
+        for n, (row, parsed) in enumerate(zip(rows, validities)):
+            record = json.dumps(row, ensure_ascii=False).encode('utf-8')
+            fields = {
+                'provider': row.get('provider', ''),
+                'category': row.get('category', ''),
+                'offer_type': row.get('offer_type') or offer_type(row.get('description')),
+                'active': str(row.get('is_active') or '1'),
+            }
+            codes = {name: code(name, fields[name]) for name in FILTERS}
+            for name in FILTERS:
+                postings[name][codes[name]].append(n)
+            start = stored_day(parsed['valid_from']) if parsed['valid_from'] else 0
+            end = stored_day(parsed['valid_until']) if parsed['valid_until'] else OPEN_END
+            for day in range(7):
+                if parsed['weekdays'] & (1 << day):
+                    weekday_postings[day].append(n)
+            if start == 0 and end == OPEN_END:
+                always.append(n)
+            else:
+                bounded.append((start, n))
+            fixed += ROW.pack(codes['provider'], codes['category'], codes['offer_type'], codes['active'],
+                              len(payload), len(record), start, end, parsed['weekdays'])
+            payload += record
+        bounded.sort()
+
+    # Las secciones van alineadas a 4 bytes para poder leer las postings como uint32
+    posting_bytes = bytearray()
+    posting_meta = {}
+    postings['weekday'] = weekday_postings
+    postings['always'] = [always]
+    postings['bounded_starts'] = [array('I', (start for start, _ in bounded))]
+    postings['bounded_rows'] = [array('I', (n for _, n in bounded))]
+    for name, lists in postings.items():
+        posting_meta[name] = []
+        for ids in lists:
+            posting_meta[name].append([len(posting_bytes), len(ids)])
+            posting_bytes += ids.tobytes()
+
+    header = {
+        'version': VERSION,
+        'byteorder': sys.byteorder,
+        'count': len(rows),
+        'values': values,
+        'postings': posting_meta,
+        'facets': {name: {value: len(postings[name][i]) for i, value in enumerate(values[name])} for name in FILTERS},
+    }
+    # Primero se calcula el tamaño del encabezado y luego las posiciones de cada sección
+    header_size = 0
+    while True:
+        rows_at = _align(8 + header_size)
+        postings_at = _align(rows_at + len(fixed))
+        records_at = _align(postings_at + len(posting_bytes))
+        header.update(rows_at=rows_at, postings_at=postings_at, records_at=records_at)
+        encoded = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        if len(encoded) == header_size:
+            break
+        header_size = len(encoded)
+
+    tmp_path = index_filename + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(encoded)) + encoded)
+        for position, section in ((rows_at, fixed), (postings_at, posting_bytes), (records_at, payload)):
+            f.write(b'\0' * (position - f.tell()))
+            f.write(section)
+    os.replace(tmp_path, index_filename)
+
+    metrics.incr('rows', len(rows))
+    metrics.incr('expired', expired)
+    metrics.record_file_written(index_filename)
+    print(f"✓ Índice creado en {index_filename} ({len(rows)} beneficios, {expired} vencidos omitidos)")
+    return len(rows)
+
+
+def _align(position):
+    return (position + 3) & ~3
+
+
+class BenefitIndex:
+    """Lectura del índice vía mmap; seguro para usar desde varios hilos"""
+
+    def __init__(self, path=DEFAULT_INDEX):
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:4] != MAGIC:
+            raise ValueError(f"{path} no es un índice de beneficios")
+        (header_size,) = struct.unpack_from('<I', self._mm, 4)
+        self.header = json.loads(self._mm[8:8 + header_size].decode('utf-8'))
+        if self.header['version'] != VERSION or self.header['byteorder'] != sys.byteorder:
+            raise ValueError(f"{path} fue construido con otra versión o arquitectura; vuelve a construirlo")
+        self.count = self.header['count']
+        self._codes = {name: {value: i for i, value in enumerate(self.header['values'][name])} for name in FILTERS}
+        self._view = memoryview(self._mm)
+
+    def close(self):
+        try:
+            self._view.release()
+            self._mm.close()
+        except BufferError:
+            # Queda alguna posting en uso; el mmap se libera al terminar el proceso
+            pass
+        self._file.close()
+
+    def _posting(self, name, code):
+        offset, length = self.header['postings'][name][code]
+        start = self.header['postings_at'] + offset
+        return self._view[start:start + 4 * length].cast('I')
+
+    def _row(self, n):
+        return ROW.unpack_from(self._mm, self.header['rows_at'] + n * ROW.size)
+
+    def valid_on(self, day):
+        """Filas vigentes en la fecha day (rango de fechas y día de la semana), en orden"""
+        number = day_number(day)
+        bit = 1 << day.weekday()
+        started = bisect_right(self._posting('bounded_starts', 0), number)
+        rows = [n for n in self._posting('bounded_rows', 0)[:started] if number <= self._row(n)[7]]
+        rows.extend(self._posting('always', 0))
+        return sorted(n for n in rows if self._row(n)[8] & bit)
+
+    def _matches(self, filters):
+        """Números de fila que cumplen todos los filtros, en orden
+
+        Se recorre la lista de candidatos más corta y el resto de los filtros
+        se revisa en la fila fija.
+        """
+        sources = []
+        checks = []
+        for position, name in enumerate(FILTERS):
+            value = filters.get(name)
+            if value is None:
+                continue
+            code = self._codes[name].get(str(value))
+            if code is None:
+                return ()
+            sources.append(self._posting(name, code))
+            checks.append(lambda row, p=position, c=code: row[p] == c)
+        if filters.get('weekday') is not None:
+            weekday = validity.parse_weekday(filters['weekday'])
+            sources.append(self._posting('weekday', weekday))
+            checks.append(lambda row, bit=1 << weekday: row[8] & bit)
+        if filters.get('valid_on') is not None:
+            day = validity.parse_date(filters['valid_on'])
+            number, bit = day_number(day), 1 << day.weekday()
+            sources.append(self.valid_on(day))
+            checks.append(lambda row: row[6] <= number <= row[7] and row[8] & bit)
+        if not sources:
+            return range(self.count)
+
+        driver = min(range(len(sources)), key=lambda i: len(sources[i]))
+        rest = checks[:driver] + checks[driver + 1:]
+        if not rest:
+            return sources[driver]
+        return (n for n in sources[driver] if all(check(self._row(n)) for check in rest))
+
+    def record(self, n):
+        row = self._row(n)
+        start = self.header['records_at'] + row[4]
+        return json.loads(self._mm[start:start + row[5]].decode('utf-8'))
+
+    def query(self, limit=50, offset=0, **filters):
+        """Retorna (total, registros de la página) para los filtros dados"""
+        matches = self._matches(filters)
+        if not hasattr(matches, '__next__'):
+            # Sin filtros o con uno solo el total es el largo de la posting
+            return len(matches), [self.record(n) for n in matches[offset:offset + limit]]
+        total = 0
+        page = []
+        for n in matches:
+            if offset <= total < offset + limit:
+                page.append(n)
+            total += 1
+        return total, [self.record(n) for n in page]
+
+    def facets(self, **filters):
+        """Conteos por valor de cada filtro; sin filtros vienen precalculados"""
+        if not any(filters.get(name) is not None for name in QUERY_FILTERS):
+            return self.header['facets']
+        counts = [dict.fromkeys(range(len(self.header['values'][name])), 0) for name in FILTERS]
+        for n in self._matches(filters):
+            row = self._row(n)
+            for position in range(len(FILTERS)):
+                counts[position][row[position]] += 1
+        return {name: {self.header['values'][name][code]: count for code, count in counts[position].items() if count}
+                for position, name in enumerate(FILTERS)}
+
+
+def make_handler(index):
+    class IndexHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            filters = {name: params[name] for name in QUERY_FILTERS if name in params}
+            start = time.perf_counter()
+            try:
+                if url.path == '/benefits':
+                    total, records = index.query(limit=int(params.get('limit', 50)),
+                                                 offset=int(params.get('offset', 0)), **filters)
+                    body = {'total': total, 'results': records}
+                elif url.path == '/facets':
+                    body = {'facets': index.facets(**filters)}
+                else:
+                    self.send_error(404)
+                    return
+            except ValueError as e:
+                self.send_error(400, str(e))
+                return
+            body['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return IndexHandler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Índice binario de beneficios y servicio de lectura")
+    parser.add_argument('--indice', default=DEFAULT_INDEX, help="Archivo del índice")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('construir', help="Construye el índice desde el CSV")
+    build_parser.add_argument('--csv', default='benefits.csv')
+    build_parser.add_argument('--fecha', help="Omite los beneficios vencidos antes de esta fecha (por defecto hoy)")
+
+    serve_parser = subparsers.add_parser('servir', help="Sirve /benefits y /facets por HTTP")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--puerto', type=int, default=8090)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'construir':
+        metrics.start_run('benefits_index')
+        build_index(args.csv, args.indice, validity.parse_date(args.fecha) if args.fecha else None)
+        metrics.finish_run()
+        return 0
+
+    start = time.perf_counter()
+    index = BenefitIndex(args.indice)
+    print(f"✓ Índice {args.indice} abierto en {(time.perf_counter() - start) * 1000:.2f} ms ({index.count} beneficios)")
+    server = ThreadingHTTPServer((args.host, args.puerto), make_handler(index))
+    print(f"Sirviendo en http://{args.host}:{args.puerto}/benefits y /facets")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor detenido")
+    finally:
+        server.server_close()
+        index.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,40 +1,196 @@
+import argparse
 import csv
 import os
+import shutil
+import sys
 
-def generar_sql_desde_csv(csv_filename):
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import metrics
+from common.delta import normalize_title
+
+COLUMNS = ['name', 'description', 'category', 'provider', 'location', 'image_url']
+
+# Último CSV cuya migración se confirmó como aplicada; es la base del diff de la siguiente ejecución
+SNAPSHOT_FILE = os.path.join('snapshots', 'benefits.csv')
+
+def benefit_key(row):
+    """Llave estable: proveedor + nombre normalizado"""
+    return f"{normalize_title(row.get('provider', ''))}:{normalize_title(row.get('name', ''))}"
+
+def _sql(value):
+    return "'" + (value or '').replace("'", "''") + "'"
+
+def unique_benefit_keys(rows):
+    """Llave de cada fila; dos beneficios distintos con la misma llave se desambiguan por orden
+
+    "Verde Sazón" y "VERDE SAZÓN" con descuentos distintos quedan como
+    proveedor:verde sazon y proveedor:verde sazon#2, igual que delta.unique_keys.
+    """
+    seen = set()
+    for row in rows:
+        key = base_key = benefit_key(row)
+        n = 2
+        while key in seen:
+            key, n = f'{base_key}#{n}', n + 1
+        seen.add(key)
+        yield key, row
+
+def load_snapshot(ruta_csv):
+    """Lee un CSV canónico y lo retorna ordenado por llave
+
+    Las filas con la misma llave base no se descartan: se desambiguan con
+    unique_benefit_keys en el orden del CSV.
+    """
+    if not ruta_csv or not os.path.exists(ruta_csv):
+        return []
+    with open(ruta_csv, newline='', encoding='utf-8') as csvfile:
+        rows = list(unique_benefit_keys(csv.DictReader(csvfile)))
+    return sorted(rows, key=lambda item: item[0])
+
+def diff_snapshots(previous, current):
+    """Recorre en paralelo dos snapshots ordenados por llave (sort-merge)
+
+    Genera tuplas (cambio, llave, fila) con cambio en 'insert', 'update' o
+    'delete'. Las filas iguales en ambos snapshots no se emiten.
+    """
+    i = j = 0
+    while i < len(previous) or j < len(current):
+        if j >= len(current) or (i < len(previous) and previous[i][0] < current[j][0]):
+            yield 'delete', previous[i][0], previous[i][1]
+            i += 1
+        elif i >= len(previous) or current[j][0] < previous[i][0]:
+            yield 'insert', current[j][0], current[j][1]
+            j += 1
+        else:
+            old, new = previous[i][1], current[j][1]
+            if any((old.get(c) or '') != (new.get(c) or '') for c in COLUMNS):
+                yield 'update', current[j][0], new
+            i += 1
+            j += 1
+
+def _deactivate_missing_sql(keys):
+    """UPDATE de la carga completa: desactiva lo que no está en el snapshot actual"""
+    keys = [_sql(key) for key in keys]
+    if not keys:
+        return 'UPDATE benefits SET is_active = 0;\n'
+    return ('UPDATE benefits SET is_active = 0 WHERE benefit_key IS NULL OR benefit_key NOT IN (\n    '
+            + ',\n    '.join(keys) + '\n);\n')
+
+def generar_sql_desde_csv(csv_filename, sql_filename='create_and_insert.sql', previous_csv=None):
+    """Genera una migración incremental desde previous_csv hasta csv_filename
+
+    Los beneficios nuevos o modificados se escriben como INSERT ... ON CONFLICT
+    DO UPDATE sobre benefit_key y los que desaparecieron como is_active = 0.
+    Sin previous_csv la migración incluye todas las filas (carga inicial) y
+    desactiva toda fila de la tabla cuya llave no está en csv_filename, sea
+    sin llave (recarga completa antigua) o de una carga incremental anterior.
+    """
     dir_script = os.path.dirname(os.path.abspath(__file__))
     ruta_csv = os.path.join(dir_script, csv_filename)
-    ruta_sql = os.path.join(dir_script, 'create_and_insert.sql')
-
-    with open(ruta_csv, newline='', encoding='utf-8') as csvfile, open(ruta_sql, 'w', encoding='utf-8') as sqlfile:
-        reader = csv.DictReader(csvfile)
+    ruta_sql = os.path.join(dir_script, sql_filename)
+    ruta_anterior = os.path.join(dir_script, previous_csv) if previous_csv else None
 
-        sqlfile.write('DROP TABLE IF EXISTS benefits;\n\n')
+    with metrics.span('snapshot_load'):
+        previous = load_snapshot(ruta_anterior)
+        current = load_snapshot(ruta_csv)
 
+    counts = {'insert': 0, 'update': 0, 'delete': 0}
+    with metrics.span('sql_write'), open(ruta_sql, 'w', encoding='utf-8') as sqlfile:
         sqlfile.write('''
-CREATE TABLE benefits (
+CREATE TABLE IF NOT EXISTS benefits (
     id SERIAL PRIMARY KEY,
+    benefit_key TEXT UNIQUE,
     name TEXT,
     description TEXT,
     category TEXT,
     provider TEXT,
     location TEXT,
-    image_url TEXT
+    image_url TEXT,
+    is_active INTEGER DEFAULT 1
 );
 '''.strip() + '\n\n')
+        # Tablas creadas por versiones anteriores del builder
+        sqlfile.write('ALTER TABLE benefits ADD COLUMN IF NOT EXISTS benefit_key TEXT UNIQUE;\n')
+        sqlfile.write('ALTER TABLE benefits ADD COLUMN IF NOT EXISTS is_active INTEGER DEFAULT 1;\n\n')
+
+        sqlfile.write('BEGIN;\n\n')
+        if ruta_anterior is None:
+            sqlfile.write(_deactivate_missing_sql(key for key, _ in current))
 
-        for row in reader:
-            name = row.get('name', '').replace("'", "''")
-            description = row.get('description', '').replace("'", "''")
-            category = row.get('category', '').replace("'", "''")
-            provider = row.get('provider', '').replace("'", "''")
-            location = row.get('location', '').replace("'", "''")
-            image_url = row.get('image_url', '').replace("'", "''")
+        columns = ', '.join(COLUMNS)
+        updates = ', '.join(f'{c} = EXCLUDED.{c}' for c in COLUMNS)
+        for change, key, row in diff_snapshots(previous, current):
+            if change == 'delete':
+                sqlfile.write(f"UPDATE benefits SET is_active = 0 WHERE benefit_key = {_sql(key)};\n")
+            else:
+                values = ', '.join(_sql(row.get(c, '')) for c in COLUMNS)
+                sqlfile.write(f"INSERT INTO benefits (benefit_key, {columns}, is_active) VALUES ({_sql(key)}, {values}, 1) "
+                              f"ON CONFLICT (benefit_key) DO UPDATE SET {updates}, is_active = 1;\n")
+            counts[change] += 1
+            metrics.incr('rows')
 
-            insert = f"INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('{name}', '{description}', '{category}', '{provider}', '{location}', '{image_url}');\n"
-            sqlfile.write(insert)
+        sqlfile.write('\nCOMMIT;\n')
 
-    print(f"Archivo SQL creado en {ruta_sql}")
+    metrics.record_file_written(ruta_sql)
+    print(f"Archivo SQL creado en {ruta_sql} ({counts['insert']} nuevos, "
+          f"{counts['update']} modificados, {counts['delete']} desactivados)")
+    return counts
+
+def snapshot_pendiente(sql_filename):
+    """Snapshot de la migración sql_filename mientras no se confirme como aplicada"""
+    nombre = os.path.splitext(os.path.basename(sql_filename))[0]
+    return os.path.join(os.path.dirname(SNAPSHOT_FILE), f'{nombre}.pendiente.csv')
+
+def guardar_snapshot(csv_filename, snapshot_filename=SNAPSHOT_FILE):
+    dir_script = os.path.dirname(os.path.abspath(__file__))
+    ruta_snapshot = os.path.join(dir_script, snapshot_filename)
+    os.makedirs(os.path.dirname(ruta_snapshot), exist_ok=True)
+    shutil.copyfile(os.path.join(dir_script, csv_filename), ruta_snapshot)
+
+def confirmar_snapshot(sql_filename, snapshot_filename=SNAPSHOT_FILE):
+    """Promueve el snapshot pendiente de sql_filename a base del siguiente diff
+
+    Retorna False si esa migración no tiene snapshot pendiente (no se generó
+    o ya se confirmó).
+    """
+    dir_script = os.path.dirname(os.path.abspath(__file__))
+    ruta_pendiente = os.path.join(dir_script, snapshot_pendiente(sql_filename))
+    if not os.path.exists(ruta_pendiente):
+        return False
+    os.replace(ruta_pendiente, os.path.join(dir_script, snapshot_filename))
+    return True
 
 if __name__ == '__main__':
-    generar_sql_desde_csv('benefits.csv')
+    parser = argparse.ArgumentParser(
+        description="Genera la migración SQL de beneficios",
+        epilog=f"El diff se calcula contra {SNAPSHOT_FILE}, que solo cambia al confirmar: generar la "
+               f"migración deja el CSV en snapshots/<salida>.pendiente.csv, y una vez aplicada en la base "
+               f"se ejecuta de nuevo con --confirmar (y la misma --salida). Si la migración no se aplica "
+               f"o falla, la siguiente se vuelve a calcular desde la última confirmada y no se pierden cambios.")
+    parser.add_argument('--csv', default='benefits.csv')
+    parser.add_argument('--salida', default='create_and_insert.sql')
+    parser.add_argument('--anterior', default=SNAPSHOT_FILE,
+                        help="CSV de la carga anterior (por defecto el snapshot de la última migración confirmada)")
+    parser.add_argument('--completo', action='store_true',
+                        help="Ignora el snapshot anterior y escribe todas las filas")
+    parser.add_argument('--confirmar', action='store_true',
+                        help="Marca como aplicada la migración --salida: su snapshot pasa a ser la base del siguiente diff")
+    args = parser.parse_args()
+
+    if args.confirmar:
+        if not confirmar_snapshot(args.salida):
+            print(f"✗ No hay snapshot pendiente para {args.salida} (¿no se generó o ya se confirmó?)")
+            sys.exit(1)
+        print(f"✓ {args.salida} confirmada: {SNAPSHOT_FILE} es la base del siguiente diff")
+        sys.exit(0)
+
+    metrics.start_run('builder')
+    previous_csv = None if args.completo else args.anterior
+    if previous_csv and not os.path.exists(os.path.join(os.path.dirname(os.path.abspath(__file__)), previous_csv)):
+        print(f"No existe {previous_csv}, se genera la carga completa")
+        previous_csv = None
+    generar_sql_desde_csv(args.csv, args.salida, previous_csv)
+    guardar_snapshot(args.csv, snapshot_pendiente(args.salida))
+    print(f"Snapshot pendiente en {snapshot_pendiente(args.salida)}; una vez aplicada la migración: "
+          f"python migrations/builder.py --salida {args.salida} --confirmar")
+    metrics.finish_run()
@@ -1,530 +1,1057 @@
-DROP TABLE IF EXISTS benefits;
-
-CREATE TABLE benefits (
+CREATE TABLE IF NOT EXISTS benefits (
     id SERIAL PRIMARY KEY,
+    benefit_key TEXT UNIQUE,
     name TEXT,
     description TEXT,
     category TEXT,
     provider TEXT,
     location TEXT,
-    image_url TEXT
+    image_url TEXT,
+    is_active INTEGER DEFAULT 1
+);
+
+ALTER TABLE benefits ADD COLUMN IF NOT EXISTS benefit_key TEXT UNIQUE;
+ALTER TABLE benefits ADD COLUMN IF NOT EXISTS is_active INTEGER DEFAULT 1;
+
+BEGIN;
+
+UPDATE benefits SET is_active = 0 WHERE benefit_key IS NULL OR benefit_key NOT IN (
+    'banco de chile:3ina',
+    'banco de chile:511 the hemingway room',
+    'banco de chile:7veinte',
+    'banco de chile:abastible',
+    'banco de chile:ac odontologia',
+    'banco de chile:aesthetic place dr. roy sothers',
+    'banco de chile:akali',
+    'banco de chile:al pesto',
+    'banco de chile:all play kids zone',
+    'banco de chile:alma salud',
+    'banco de chile:almapiel',
+    'banco de chile:amandine bistro dolares premio',
+    'banco de chile:ambar deco',
+    'banco de chile:ancares cafe',
+    'banco de chile:aqua force',
+    'banco de chile:aquachile',
+    'banco de chile:ari nikkei',
+    'banco de chile:ash',
+    'banco de chile:asia skincare',
+    'banco de chile:aufbau',
+    'banco de chile:aurea dolares premio',
+    'banco de chile:autoexpertos',
+    'banco de chile:av odontologia',
+    'banco de chile:azaleia',
+    'banco de chile:b bar',
+    'banco de chile:bangkok thai',
+    'banco de chile:bao bar',
+    'banco de chile:bar enigma',
+    'banco de chile:bar imperial',
+    'banco de chile:bar medanoso',
+    'banco de chile:bar plaza',
+    'banco de chile:barrica 94',
+    'banco de chile:bazhars alfombras',
+    'banco de chile:be electric',
+    'banco de chile:bellapiel',
+    'banco de chile:benetton',
+    'banco de chile:bigos',
+    'banco de chile:bigu',
+    'banco de chile:billabong',
+    'banco de chile:biobrush',
+    'banco de chile:bo concept',
+    'banco de chile:bodega parma',
+    'banco de chile:boga',
+    'banco de chile:bondup',
+    'banco de chile:bouden',
+    'banco de chile:brando',
+    'banco de chile:brookman',
+    'banco de chile:bsoul',
+    'banco de chile:bsoul#2',
+    'banco de chile:buffet express',
+    'banco de chile:bug me',
+    'banco de chile:burano',
+    'banco de chile:burger vs pizza',
+    'banco de chile:burgerbeef',
+    'banco de chile:burton',
+    'banco de chile:cafeteria espresso dolares premio',
+    'banco de chile:cafeteria le grand de la fete dolares premio',
+    'banco de chile:caffarena',
+    'banco de chile:calcetines bacanes',
+    'banco de chile:caleta la reina',
+    'banco de chile:california cantina',
+    'banco de chile:calpany',
+    'banco de chile:canasta raices sanas',
+    'banco de chile:capogrossi',
+    'banco de chile:capogrossi dolares premio',
+    'banco de chile:caprese',
+    'banco de chile:car broker chile',
+    'banco de chile:carbel coffee & pastry',
+    'banco de chile:carl’s jr.',
+    'banco de chile:carolina varela',
+    'banco de chile:casa morera',
+    'banco de chile:casa morera dolares premio',
+    'banco de chile:casagiardino',
+    'banco de chile:casona del virrey',
+    'banco de chile:cassis',
+    'banco de chile:castillo hamburgo',
+    'banco de chile:cat',
+    'banco de chile:ceiba',
+    'banco de chile:celiv',
+    'banco de chile:centro odontologico dr. alvaro pena paez',
+    'banco de chile:cevichazo 102',
+    'banco de chile:chiaroscuro panoramico',
+    'banco de chile:chilelentes',
+    'banco de chile:china wok',
+    'banco de chile:cine star',
+    'banco de chile:cinque pizza restaurant',
+    'banco de chile:circus barber shop',
+    'banco de chile:citadelle',
+    'banco de chile:ciudad vieja',
+    'banco de chile:ciudadano dolares premio',
+    'banco de chile:claro',
+    'banco de chile:clickepp',
+    'banco de chile:clinica abedules',
+    'banco de chile:clinica agua',
+    'banco de chile:clinica bast',
+    'banco de chile:clinica crl',
+    'banco de chile:clinica dental santorini',
+    'banco de chile:clinica estetica bien etre',
+    'banco de chile:clinica estetica mi mantra',
+    'banco de chile:clinica everest',
+    'banco de chile:clinica nace',
+    'banco de chile:clinica ortodoncia antonella sivori',
+    'banco de chile:clinica versalles',
+    'banco de chile:clinicas odontologicas everest',
+    'banco de chile:club de padel de la florida',
+    'banco de chile:club de san miguel',
+    'banco de chile:cno',
+    'banco de chile:cocoa dolares premio',
+    'banco de chile:columbia',
+    'banco de chile:coney jump + yukids',
+    'banco de chile:confiteria larbos',
+    'banco de chile:conserbar',
+    'banco de chile:copas y cervezas',
+    'banco de chile:crocs',
+    'banco de chile:danubio azul',
+    'banco de chile:dbs',
+    'banco de chile:de flores y floreros',
+    'banco de chile:deltamotors',
+    'banco de chile:deysa care',
+    'banco de chile:dhouse',
+    'banco de chile:dily',
+    'banco de chile:do sushi',
+    'banco de chile:doggis',
+    'banco de chile:doite',
+    'banco de chile:dominga dolares premio',
+    'banco de chile:don teo santiago',
+    'banco de chile:dr smile',
+    'banco de chile:dunkin’',
+    'banco de chile:el aji seco maipu',
+    'banco de chile:el naturalista',
+    'banco de chile:el nuevo arriero',
+    'banco de chile:element',
+    'banco de chile:empirico',
+    'banco de chile:emporio san marco',
+    'banco de chile:enelx',
+    'banco de chile:engintel',
+    'banco de chile:entel',
+    'banco de chile:eshopex',
+    'banco de chile:espacio caju – stay and play cafe',
+    'banco de chile:estacionamiento autopark',
+    'banco de chile:europa secreta',
+    'banco de chile:everlast',
+    'banco de chile:exclusivo clientes plan cordillera',
+    'banco de chile:exclusivo clientes plan oceano',
+    'banco de chile:expendio',
+    'banco de chile:fabrics',
+    'banco de chile:farmex',
+    'banco de chile:fashion''s park',
+    'banco de chile:favara',
+    'banco de chile:fco motor services',
+    'banco de chile:first security',
+    'banco de chile:flixbus',
+    'banco de chile:flux solar',
+    'banco de chile:fondo de cultura economica',
+    'banco de chile:funsport',
+    'banco de chile:gaes',
+    'banco de chile:galpon alonso',
+    'banco de chile:geomar',
+    'banco de chile:glam & co',
+    'banco de chile:goota',
+    'banco de chile:gorilas',
+    'banco de chile:gravat',
+    'banco de chile:green glass',
+    'banco de chile:green lab',
+    'banco de chile:green poke',
+    'banco de chile:hacienda el llano',
+    'banco de chile:hands & company',
+    'banco de chile:heladeria larrs',
+    'banco de chile:hifi',
+    'banco de chile:horwin',
+    'banco de chile:hush puppies',
+    'banco de chile:hush puppies kids',
+    'banco de chile:ica restaurante',
+    'banco de chile:icarcheck',
+    'banco de chile:imared',
+    'banco de chile:infiltrados',
+    'banco de chile:io',
+    'banco de chile:istanwool',
+    'banco de chile:jansport',
+    'banco de chile:japon ya',
+    'banco de chile:juan maestro',
+    'banco de chile:kaya unite',
+    'banco de chile:kechua',
+    'banco de chile:keds',
+    'banco de chile:keypa',
+    'banco de chile:kfc',
+    'banco de chile:kiara',
+    'banco de chile:koychi korean street food',
+    'banco de chile:l occitane',
+    'banco de chile:la barra',
+    'banco de chile:la biferia',
+    'banco de chile:la bodeguita miguel torres',
+    'banco de chile:la bonaerense',
+    'banco de chile:la casona del aji',
+    'banco de chile:la cocina de javier',
+    'banco de chile:la cocina de javier dolares premio',
+    'banco de chile:la divina comida',
+    'banco de chile:la fete chocolat',
+    'banco de chile:la murta',
+    'banco de chile:la pesca de los mekis',
+    'banco de chile:la pizzarra',
+    'banco de chile:la tabla dolares premio',
+    'banco de chile:laqu',
+    'banco de chile:lineatre',
+    'banco de chile:local burger',
+    'banco de chile:lola lash',
+    'banco de chile:lomo de la fuente',
+    'banco de chile:lounge',
+    'banco de chile:ma griffe',
+    'banco de chile:maconline apple',
+    'banco de chile:maison niche',
+    'banco de chile:majestic',
+    'banco de chile:majestic dolares premio',
+    'banco de chile:make make',
+    'banco de chile:maldito arroz',
+    'banco de chile:malevolo pizza',
+    'banco de chile:mandala food & bar',
+    'banco de chile:mantraa unisex salon & spa',
+    'banco de chile:marathon',
+    'banco de chile:mardeli',
+    'banco de chile:maria la biyux',
+    'banco de chile:maria pompon',
+    'banco de chile:mariabooth',
+    'banco de chile:marley coffee',
+    'banco de chile:mattarello',
+    'banco de chile:mdf',
+    'banco de chile:mercado carozzi',
+    'banco de chile:merrell',
+    'banco de chile:minata clean beauty',
+    'banco de chile:mota',
+    'banco de chile:mountain hardwear',
+    'banco de chile:movistar',
+    'banco de chile:muebles el cipres',
+    'banco de chile:my family pets',
+    'banco de chile:nectar deco',
+    'banco de chile:nevada novias',
+    'banco de chile:nikola',
+    'banco de chile:nolia',
+    'banco de chile:nosu',
+    'banco de chile:novu',
+    'banco de chile:nuna restaurante',
+    'banco de chile:oasi di bellezza',
+    'banco de chile:ocarrol rent a car',
+    'banco de chile:olivia trattoria',
+    'banco de chile:onedent',
+    'banco de chile:orquidea',
+    'banco de chile:pad thai',
+    'banco de chile:padel mundo sport',
+    'banco de chile:paladar restobar',
+    'banco de chile:pawer',
+    'banco de chile:peces de ciudad',
+    'banco de chile:peluqueria francesa',
+    'banco de chile:pet family',
+    'banco de chile:petrizzio',
+    'banco de chile:pf changs',
+    'banco de chile:pisco bou legado',
+    'banco de chile:pitisimas',
+    'banco de chile:pizzeria capri dolares premio',
+    'banco de chile:plant me',
+    'banco de chile:poliglota',
+    'banco de chile:pollo rey',
+    'banco de chile:porfirio',
+    'banco de chile:preu filadd',
+    'banco de chile:preuniversitario pedro de valdivia',
+    'banco de chile:prima bar',
+    'banco de chile:prowashgo',
+    'banco de chile:qb restaurant bar',
+    'banco de chile:quercus',
+    'banco de chile:quiero mi masaje',
+    'banco de chile:rally kart',
+    'banco de chile:ramblas',
+    'banco de chile:rappi',
+    'banco de chile:restaurant urbano 136',
+    'banco de chile:restaurante ana maria',
+    'banco de chile:restaurante hotel magnolia dolares premio',
+    'banco de chile:restaurante isabella',
+    'banco de chile:revesderecho',
+    'banco de chile:rockford',
+    'banco de chile:rotter y krauss',
+    'banco de chile:ruca bar',
+    'banco de chile:rugendas',
+    'banco de chile:sabor x2',
+    'banco de chile:sabor y aroma',
+    'banco de chile:sabores del aji seco',
+    'banco de chile:sabores del peru',
+    'banco de chile:saint patrick s day',
+    'banco de chile:saki',
+    'banco de chile:samsung',
+    'banco de chile:sanasalud',
+    'banco de chile:selvado',
+    'banco de chile:senior suites',
+    'banco de chile:smartdent',
+    'banco de chile:smellwell',
+    'banco de chile:snow force',
+    'banco de chile:sociedad o306',
+    'banco de chile:solar fotovoltaica',
+    'banco de chile:specialized',
+    'banco de chile:surista',
+    'banco de chile:sushi thai',
+    'banco de chile:sushiban',
+    'banco de chile:taco bell',
+    'banco de chile:tanaka la dehesa dolares premio',
+    'banco de chile:tanaka vitacura dolares premio',
+    'banco de chile:taproom tubinger',
+    'banco de chile:taringa',
+    'banco de chile:taringuita mall sport',
+    'banco de chile:teatro mori',
+    'banco de chile:tendencias gourmet',
+    'banco de chile:terra force',
+    'banco de chile:tessa',
+    'banco de chile:thai express',
+    'banco de chile:tienda friosur',
+    'banco de chile:tigre bravo',
+    'banco de chile:tika',
+    'banco de chile:tirua bar restoran',
+    'banco de chile:togo',
+    'banco de chile:toke',
+    'banco de chile:tommy beans',
+    'banco de chile:tortas amelia',
+    'banco de chile:transvip',
+    'banco de chile:trattoria santtino',
+    'banco de chile:tratur',
+    'banco de chile:trauko',
+    'banco de chile:trayecto bookstore',
+    'banco de chile:tropicalia',
+    'banco de chile:tua',
+    'banco de chile:uber eats: mcdonald’s',
+    'banco de chile:ultimate clothing',
+    'banco de chile:ultimate fitness',
+    'banco de chile:under armour',
+    'banco de chile:unu',
+    'banco de chile:varvacoa',
+    'banco de chile:velvet bakery',
+    'banco de chile:verde sazon',
+    'banco de chile:verde sazon#2',
+    'banco de chile:vicenzo',
+    'banco de chile:vietnam dicovery',
+    'banco de chile:vina clos de luz',
+    'banco de chile:vina espaldares del maipo',
+    'banco de chile:violeta restaurant',
+    'banco de chile:vistandes',
+    'banco de chile:vtr',
+    'banco de chile:wendys',
+    'banco de chile:wom',
+    'banco de chile:yale',
+    'banco de chile:yma dolares premio',
+    'banco de chile:yokono sushi',
+    'banco de chile:yoyo tea',
+    'banco de chile:zaika comida india',
+    'banco de chile:zanzibar dolares premio',
+    'banco de chile:zapatos.cl',
+    'banco de chile:zenclinic',
+    'banco de chile:zenclinic dental',
+    'banco de chile:zona verde',
+    'banco de chile:zoo york',
+    'entel:akikb',
+    'entel:assist card',
+    'entel:aventura kids',
+    'entel:bamers',
+    'entel:bar el callejon',
+    'entel:beauty plus',
+    'entel:belsport',
+    'entel:blue express copec',
+    'entel:cabify',
+    'entel:castano',
+    'entel:chayanne',
+    'entel:chiletur copec',
+    'entel:cinemark',
+    'entel:condor bus',
+    'entel:copec voltex',
+    'entel:corrales del sur',
+    'entel:do sushi',
+    'entel:doggis',
+    'entel:easycancha',
+    'entel:eclass',
+    'entel:ecocitex',
+    'entel:entrelagos',
+    'entel:escuela de surf maintencillo',
+    'entel:euro rent a car',
+    'entel:farmacia ahumada',
+    'entel:farmacia fraccion',
+    'entel:flixbus',
+    'entel:franchute',
+    'entel:freemet',
+    'entel:glam & co',
+    'entel:green day',
+    'entel:green lab',
+    'entel:hola ola',
+    'entel:hozier',
+    'entel:ibis',
+    'entel:juan maestro',
+    'entel:just burger',
+    'entel:karun',
+    'entel:katy perry',
+    'entel:kidzania',
+    'entel:klean kanteen',
+    'entel:kylie minogue',
+    'entel:late',
+    'entel:linkin park',
+    'entel:local burger',
+    'entel:mamut',
+    'entel:marathon',
+    'entel:micoca-cola.cl',
+    'entel:mut',
+    'entel:natura',
+    'entel:oakley',
+    'entel:opticas schilling',
+    'entel:papa johns',
+    'entel:parque aventura',
+    'entel:parques outlife',
+    'entel:rappi',
+    'entel:rauw alejandro',
+    'entel:restaurante olivia',
+    'entel:ripley',
+    'entel:roda',
+    'entel:starbucks',
+    'entel:sundeck - bob moses',
+    'entel:sundeck - the grid',
+    'entel:super zoo',
+    'entel:taller f',
+    'entel:the body shop',
+    'entel:tommy beans',
+    'entel:turbus',
+    'entel:wild foods',
+    'universidad mayor:aamaal fit',
+    'universidad mayor:achs',
+    'universidad mayor:aradeli sabores',
+    'universidad mayor:artemisa salud mental',
+    'universidad mayor:bci',
+    'universidad mayor:beauty june',
+    'universidad mayor:bhanga climing',
+    'universidad mayor:bikefix',
+    'universidad mayor:cabanas las ananuca',
+    'universidad mayor:calper',
+    'universidad mayor:camp fit girls',
+    'universidad mayor:centro de bienestar kohler',
+    'universidad mayor:centro integral plaza de armas',
+    'universidad mayor:ceoi',
+    'universidad mayor:cetep',
+    'universidad mayor:chilescalando',
+    'universidad mayor:cleta sos',
+    'universidad mayor:clinica dental alba',
+    'universidad mayor:clinica odontologica everest',
+    'universidad mayor:clinica tomas moro',
+    'universidad mayor:club fotografia',
+    'universidad mayor:color astral',
+    'universidad mayor:cute stuff spa',
+    'universidad mayor:diario financiero',
+    'universidad mayor:el colorado',
+    'universidad mayor:ems providencia',
+    'universidad mayor:escuela de conductores san luis',
+    'universidad mayor:espacio vuela',
+    'universidad mayor:estacionamiento zenit',
+    'universidad mayor:eyoukine',
+    'universidad mayor:garmin',
+    'universidad mayor:georuston',
+    'universidad mayor:gimnasio el muro',
+    'universidad mayor:gimnasio upgrade',
+    'universidad mayor:goolfy',
+    'universidad mayor:henk-co',
+    'universidad mayor:inaltum fitness',
+    'universidad mayor:juntos al volante',
+    'universidad mayor:koe',
+    'universidad mayor:la holandesa cafe',
+    'universidad mayor:la quadrada pizza',
+    'universidad mayor:labysalud',
+    'universidad mayor:levimed',
+    'universidad mayor:libreria nacional',
+    'universidad mayor:libreria san borja',
+    'universidad mayor:libroos',
+    'universidad mayor:live, love, rock on!',
+    'universidad mayor:logo_1211-gotech.jpg',
+    'universidad mayor:lovely mantequillas',
+    'universidad mayor:m3storage',
+    'universidad mayor:made in marruecos',
+    'universidad mayor:maithai',
+    'universidad mayor:marina temuco',
+    'universidad mayor:megafitness',
+    'universidad mayor:mundo roms',
+    'universidad mayor:naturista',
+    'universidad mayor:norden',
+    'universidad mayor:optica switch',
+    'universidad mayor:otium',
+    'universidad mayor:parque farellones',
+    'universidad mayor:peregrino coffee',
+    'universidad mayor:pie monte',
+    'universidad mayor:quiero mi examen',
+    'universidad mayor:rami',
+    'universidad mayor:red hotelera',
+    'universidad mayor:restaurante frutal temuco',
+    'universidad mayor:saba',
+    'universidad mayor:sala k',
+    'universidad mayor:sala teatro u.mayor',
+    'universidad mayor:samsumg',
+    'universidad mayor:scorpi',
+    'universidad mayor:sello.pink',
+    'universidad mayor:serviteca de luca',
+    'universidad mayor:sexshop toy hot',
+    'universidad mayor:smartfit',
+    'universidad mayor:smartfix',
+    'universidad mayor:sportlife',
+    'universidad mayor:stile isabella',
+    'universidad mayor:sublicraft studio',
+    'universidad mayor:teatro azares',
+    'universidad mayor:teatro municipal',
+    'universidad mayor:terrapadel y crossfit',
+    'universidad mayor:turbus',
+    'universidad mayor:un rincon del encuentro',
+    'universidad mayor:up fit temuco',
+    'universidad mayor:valentinna',
+    'universidad mayor:valle nevado',
+    'universidad mayor:vera napoli',
+    'universidad mayor:vina casa donoso',
+    'universidad mayor:vina sutil',
+    'universidad mayor:volta roasters',
+    'universidad mayor:w1 temuco',
+    'universidad mayor:yasser azar',
+    'universidad mayor:zanaholiva'
 );
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:3ina', '3INA', '20% dto. martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:511 the hemingway room', '511 The Hemingway Room', '20% dto. lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:7veinte', '7Veinte', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:abastible', 'Abastible', 'Paga en 13 a 24 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ac odontologia', 'AC Odontología', '50% de descuento.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:aesthetic place dr. roy sothers', 'Aesthetic Place Dr. Roy Sothers', '15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:akali', 'AKALI', 'Hasta 40% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:al pesto', 'Al Pesto', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:all play kids zone', 'All Play Kids Zone', '20% dto. lunes a viernes de manera presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:alma salud', 'Alma Salud', 'Hasta 30% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:almapiel', 'ALMAPIEL', '20% dto. adicional todos los días en compra online y presencial.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:amandine bistro dolares premio', 'Amandine Bistró Dólares Premio', 'Consumo por $80.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ambar deco', 'Ambar Deco', '20% dto. En compras presenciales de lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ancares cafe', 'Ancares Café', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:aqua force', 'AQUA FORCE', '20% dto adicional. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:aquachile', 'AquaChile', '20% dto los jueves online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ari nikkei', 'Ari Nikkei', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ash', 'ASH', '20% dto. todos los días presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:asia skincare', 'Asia Skincare', '20% dto. los miércoles presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:aufbau', 'AUFBAU', 'Paga en 13 a 24 cuotas sin interés con tus Tarjetas de Crédito del Chile', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:aurea dolares premio', 'Áurea Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:autoexpertos', 'AutoExpertos', '25% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:av odontologia', 'AV ODONTOLOGÍA', 'Hasta un 60% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:azaleia', 'Azaleia', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:b bar', 'B BAR', '20% dto. Viernes y sábado.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bangkok thai', 'BANGKOK THAI', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bao bar', 'Bao Bar', '40% dto. todos los sábados de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bar enigma', 'BAR ENIGMA', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bar imperial', 'Bar Imperial', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bar medanoso', 'Bar Medanoso', '20% dto. Lunes a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bar plaza', 'BAR PLAZA', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:barrica 94', 'Barrica 94', '50% dto. todos los jueves de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bazhars alfombras', 'Bazhars Alfombras', '10% dto. adicional en compra online y presencial todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:be electric', 'Be electric', 'Paga en 6 a 24 cuotas sin interés todos los días en productos.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bellapiel', 'Bellapiel', '20% dto. lunes a jueves en servicios', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:benetton', 'BENETTON', '20% dto. lunes a jueves en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bigos', 'Bigos', 'Todos los viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bigu', 'BIGU', '20% dto. Todos los días en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:billabong', 'Billabong', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:biobrush', 'Biobrush', '25% dto online todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bo concept', 'BO Concept', '15% dto. en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bodega parma', 'Bodega Parma', '40% dto. todos los lunes de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:boga', 'Boga', '20% dto. Lunes a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bondup', 'BondUP', '6 meses gratis de psicología, telemedicina y entretenimiento.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bouden', 'Bouden', '20% dto. martes online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:brando', 'Brando', '25% dto. lunes presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:brookman', 'Brookman', '20% dto. de lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bsoul', 'Bsoul', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bsoul#2', 'BSoul', '20% dcto. miércoles, jueves y viernes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:buffet express', 'Buffet Express', '20% dto. Lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:bug me', 'BUG ME', 'Todos los días en compra online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:burano', 'Burano', '15% dto adicional. todos los días online y presencial.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:burger vs pizza', 'Burger vs Pizza', '20% dto. viernes, sábado y domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:burgerbeef', 'BurgerBeef', '20% dcto. en delivery de lunes a jueves.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:burton', 'BURTON', '20% dto. miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cafeteria espresso dolares premio', 'Cafetería Espresso Dólares Premio', 'Consumo por $10.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cafeteria le grand de la fete dolares premio', 'Cafetería Le Grand de La Fete Dólares Premio', 'Consumo por $30.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:caffarena', 'CAFFARENA', '30% dto. en compras online todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:calcetines bacanes', 'Calcetines Bacanes', '20% dto. en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:caleta la reina', 'Caleta la Reina', '25% dto. miércoles y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:california cantina', 'California Cantina', '20% dto. Lunes, martes y domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:calpany', 'Calpany', '20% dcto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:canasta raices sanas', 'Canasta Raíces Sanas', '20% dto. en compras online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:capogrossi', 'Capogrossi', '50% dto. los martes de junio con tu Tarjeta Visa Infinite', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:capogrossi dolares premio', 'Capogrossi Dólares Premio', 'Consumo por $80.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:caprese', 'Caprese', '20% dto. Lunes a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:car broker chile', 'Car Broker Chile', 'Hasta 25% dto. en servicios presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:carbel coffee & pastry', 'CARBEL COFFEE & PASTRY', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:carl’s jr.', 'Carl’s Jr.', '20% dto. todos los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:carolina varela', 'Carolina Varela', 'Paga en 4 a 12 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:casa morera', 'Casa Morera', '40% dto. todos los jueves de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:casa morera dolares premio', 'Casa Morera Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:casagiardino', 'CASAGIARDINO', '20% dto. martes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:casona del virrey', 'Casona Del Virrey', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cassis', 'Cassis', '20% dto. los lunes en "Cafetería" de la carta "Para Tomar"', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:castillo hamburgo', 'Castillo Hamburgo', '20% dto. Martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cat', 'CAT', '40% dto. jueves 12 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ceiba', 'Ceiba', '20% dto. todos los jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:celiv', 'CELIV', '20% dcto los días martes.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:centro odontologico dr. alvaro pena paez', 'Centro Odontológico Dr. Alvaro Peña Páez', 'Hasta 35% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cevichazo 102', 'CEVICHAZO 102', '20% dto. lunes, viernes y sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:chiaroscuro panoramico', 'CHIAROSCURO PANORAMICO', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:chilelentes', 'ChileLentes', 'Hasta un 25% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:china wok', 'China Wok', 'Viernes 30% dto. en compras presenciales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cine star', 'Cine Star', 'Canjea hasta el 100% con tus Dólares-Premio.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cinque pizza restaurant', 'Cinque Pizza Restaurant', '25% dto. martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:circus barber shop', 'CIRCUS BARBER SHOP', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:citadelle', 'Citadelle', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ciudad vieja', 'Ciudad Vieja', '20% dto. martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ciudadano dolares premio', 'Ciudadano Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:claro', 'CLARO', 'Paga en 13 a 18 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clickepp', 'CLICKEPP', '20% dto. todos los días online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica abedules', 'Clínica Abedules', 'Paga en 4 a 12 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica agua', 'Clínica Agua', 'Hasta 40% dto. En tratamientos presenciales todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica bast', 'Clínica Bast', '20% dto. martes y miércoles presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica crl', 'Clínica CRL', 'Hasta 50% dcto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica dental santorini', 'Clínica Dental Santorini', '50% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica estetica bien etre', 'CLÍNICA ESTÉTICA BIEN ÊTRE', 'Hasta 20% dto en limpiezas faciales, masajes y tratamientos corporales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica estetica mi mantra', 'CLINICA ESTÉTICA MI MANTRA', '20% dto todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica everest', 'Clinica Everest', 'Paga en 7 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica nace', 'CLINICA NACE', '15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica ortodoncia antonella sivori', 'Clínica Ortodoncia Antonella Sivori', 'Hasta 35% dto. En prestaciones seleccionadas', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinica versalles', 'Clínica Versalles', 'Hasta 50% dto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:clinicas odontologicas everest', 'Clínicas Odontologicas Everest', 'Hasta 64% dcto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:club de padel de la florida', 'CLUB DE PADEL DE LA FLORIDA', 'Hasta 25% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:club de san miguel', 'Club de San Miguel', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cno', 'CNO', 'Paga en 7 a 12 cuotas sin interés tus tratamientos odontológicos en clínicas pertenecientes a CNO', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:cocoa dolares premio', 'Cocoa Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:columbia', 'Columbia', '40% dto. jueves 12 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:coney jump + yukids', 'CONEY JUMP + YUKIDS', '35% dto. En los 40 minutos de juego todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:confiteria larbos', 'CONFITERIA LARBOS', '20% dto. lunes, martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:conserbar', 'CONSERBAR', '20% dto. miércoles y sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:copas y cervezas', 'Copas y Cervezas', '25% dto. en planes semestrales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:crocs', 'Crocs', '40% dto. martes 10 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:danubio azul', 'Danubio Azul', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:dbs', 'DBS', '20% dto. todos los miércoles en compra online con tus Tarjetas del Chile.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:de flores y floreros', 'De Flores y Floreros', '10% dto. miércoles presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:deltamotors', 'DELTAMOTORS', '20% dto. todos los días presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:deysa care', 'Deysa Care', '20% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:dhouse', 'DHouse', '20% dcto. miércoles, jueves y viernes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:dily', 'Dily', 'Hasta 30% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:do sushi', 'DO SUSHI', '20% dto. jueves y viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:doggis', 'Doggis', '40% dto pidiendo por la App y 30% dto presencial los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:doite', 'Doite', '20% dto. en compras presenciales y online todos los martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:dominga dolares premio', 'Dominga Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:don teo santiago', 'Don Teo Santiago', '20% dto. viernes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:dr smile', 'DR SMILE', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:dunkin’', 'Dunkin’', '30% dto. lunes y miércoles en compra presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:el aji seco maipu', 'El Ají Seco Maipú', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:el naturalista', 'El Naturalista', 'Hasta 20% dto. en compra presencial lunes y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:el nuevo arriero', 'El Nuevo Arriero', '20% dto. lunes a viernes horario almuerzo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:element', 'Element', '20% dcto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:empirico', 'EMPIRICO', '20% dto. los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:emporio san marco', 'Emporio San Marco', '20% dto. los lunes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:enelx', 'EnelX', 'Paga en 13 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:engintel', 'ENGINTEL', '20% dto en programas Let´s learn together', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:entel', 'Entel', 'Paga en 13 a 18 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:eshopex', 'Eshopex', '20% dto. en flete internacional.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:espacio caju – stay and play cafe', 'Espacio Caju – Stay and play café', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:estacionamiento autopark', 'ESTACIONAMIENTO AUTOPARK', '20% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:europa secreta', 'Europa Secreta', '20% dto. Todos los días en compra online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:everlast', 'EVERLAST', '30% dto. todos los lunes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:exclusivo clientes plan cordillera', 'Exclusivo Clientes Plan Cordillera', '30% dto. en grandes marcas de vestuario y calzado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:exclusivo clientes plan oceano', 'Exclusivo Clientes Plan Océano', '40% dto. en grandes marcas de vestuario y calzado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:expendio', 'Expendio', 'Hasta 30% dto. sábados y domingos', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:fabrics', 'Fabrics', 'Hasta 40% dto. en ropa de cama y baño', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:farmex', 'Farmex', 'Hasta 20% dto. en compra online todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:fashion''s park', 'Fashion''s Park', 'Hasta 25% dto. adicional en compra online y presencial.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:favara', 'Favara', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:fco motor services', 'FCO Motor Services', '25% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:first security', 'First Security', '60% dcto. todos los dias', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:flixbus', 'FLIXBUS', '25% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:flux solar', 'Flux Solar', 'Compra tu planta solar de 6 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:fondo de cultura economica', 'Fondo de Cultura Económica', '25% dto en compra presencial y online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:funsport', 'Funsport', '20% dcto. miércoles, jueves y viernes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:gaes', 'Gaes', 'Paga en 13 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:galpon alonso', 'GALPÓN ALONSO', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:geomar', 'Geomar', '20% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:glam & co', 'Glam & Co', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:goota', 'GOOTA', '20% dto. en alimentos probióticos', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:gorilas', 'Gorilas', '20% dto. jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:gravat', 'GRAVAT', '30% dto. todos los días online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:green glass', 'Green Glass', '15% dto. en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:green lab', 'Green Lab', '20% dto. jueves a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:green poke', 'Green Poke', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:hacienda el llano', 'Hacienda el Llano', '20% dto. Martes y Miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:hands & company', 'Hands & Company', '30% dto. en servicios presenciales los días lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:heladeria larrs', 'HELADERIA LARRS', '30% dto. los días lunes pagando con tus Tarjetas del Chile', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:hifi', 'HIFI', '4 a 24 cuotas sin interes.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:horwin', 'Horwin', 'Paga en 13 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:hush puppies', 'Hush Puppies', '40% dto. viernes 13 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:hush puppies kids', 'Hush Puppies Kids', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ica restaurante', 'ICA RESTAURANTE', '20% dto. sábado y domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:icarcheck', 'icarcheck', '20% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:imared', 'Imared', '20% dto. todos los días en pagos presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:infiltrados', 'Infiltrados', '20% dto. martes, miércoles y sábados', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:io', 'iO', '20% dto. todos los días en compra presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:istanwool', 'ISTANWOOL', '10% dto. adicional en compra presencial todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:jansport', 'Jansport', '20% dcto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:japon ya', 'Japón Ya', '20% dto. miércoles y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:juan maestro', 'Juan Maestro', '40% dto pidiendo por la App y 30% dto presencial los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:kaya unite', 'Kaya Unite', '40% dto. presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:kechua', 'Kechua', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:keds', 'Keds', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:keypa', 'KEYPA', '40% dcto. Todos los días en compra online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:kfc', 'KFC', 'Jueves 30% dto. en compras presenciales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:kiara', 'Kiara', '50% dto. todos los lunes de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:koychi korean street food', 'Koychi Korean Street Food', '25% dto. todos los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:l occitane', 'L´Occitane', '20% dto. los miércoles, jueves y viernes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la barra', 'La Barra', 'Beneficios exclusivos todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la biferia', 'La Biferia', '20% dto. lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la bodeguita miguel torres', 'La Bodeguita Miguel Torres', '50% dto. los viernes de junio con tu Tarjeta Visa Infinite', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la bonaerense', 'La Bonaerense', '20% dcto. de lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la casona del aji', 'La Casona del Ají', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la cocina de javier', 'La Cocina de Javier', '30% dto. los martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la cocina de javier dolares premio', 'La Cocina de Javier Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la divina comida', 'La Divina Comida', '20% dto. miércoles a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la fete chocolat', 'La Fête Chocolat', '20% dto. los lunes presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la murta', 'LA MURTA', '20% dto. viernes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la pesca de los mekis', 'La Pesca De Los Mekis', '30% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la pizzarra', 'LA PIZZARRA', 'lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:la tabla dolares premio', 'La Tabla Dólares Premio', 'Consumo por $40.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:laqu', 'Laqu', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:lineatre', 'Lineatre', '20% dto. los lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:local burger', 'Local Burger', '20% de dto. viernes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:lola lash', 'Lola Lash', 'Hasta 25% dto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:lomo de la fuente', 'Lomo de la Fuente', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:lounge', 'Lounge', '20% dto. adicional sobre el precio vigente, todos los domingos.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ma griffe', 'Ma Griffe', '20% dto. todos los días en compras online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:maconline apple', 'MacOnline Apple', 'Lo mejor de Apple en 4 a 24 cuotas sin interés con tus Tarjetas de Crédito del Chile', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:maison niche', 'Maison Niche', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:majestic', 'Majestic', '30% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:majestic dolares premio', 'Majestic Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:make make', 'Make Make', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:maldito arroz', 'MALDITO ARROZ', '20% dto. lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:malevolo pizza', 'MALEVOLO PIZZA', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mandala food & bar', 'Mandala Food & Bar', '20% dto. lunes a sábado de 17:00 a 22:00 Hrs', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mantraa unisex salon & spa', 'Mantraa Unisex Salon & Spa', '20% dcto. Lunes y Martes en todos los servicios', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:marathon', 'Marathon', '20% dto. adicional presencial y online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mardeli', 'MARDELI', '20% dto martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:maria la biyux', 'Maria La Biyux', '20% dto online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:maria pompon', 'María Pompón', '15% dto. adicional lunes y miércoles presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mariabooth', 'Maríabooth', '15% dto. todos los días en compra online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:marley coffee', 'MARLEY COFFEE', '35% dto los miércoles online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mattarello', 'Mattarello', '20% dto. lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mdf', 'MDF', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mercado carozzi', 'Mercado Carozzi', 'Desde 20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:merrell', 'Merrell', '40% dto. martes 10 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:minata clean beauty', 'Minata Clean Beauty', '20% dto los martes online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mota', 'MOTA', '25% dto. en compras online todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:mountain hardwear', 'Mountain Hardwear', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:movistar', 'Movistar', 'Paga en 13 hasta 24 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:muebles el cipres', 'MUEBLES EL CIPRÉS', 'Hasta 20% dcto Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:my family pets', 'MY FAMILY PETS', 'Hasta 15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:nectar deco', 'Néctar Deco', '20% dcto. Todos los días en compras presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:nevada novias', 'Nevada Novias', '15% dto. todos los días presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:nikola', 'Nikola', 'Paga en 4 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:nolia', 'NOLIA', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:nosu', 'Nosu', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:novu', 'Novu', '20% dto. los días lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:nuna restaurante', 'Nuna Restaurante', '15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:oasi di bellezza', 'Oasi di Bellezza', '40% de descuento en depilación Láser Soprano Ice', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ocarrol rent a car', 'Ocarrol Rent a Car', '30% dto. En arriendos de vehículos', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:olivia trattoria', 'Olivia Trattoria', '20% dto. lunes y viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:onedent', 'ONEDENT', 'sobre el arancel de ONEDENT', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:orquidea', 'Orquídea', '25% dto. los días lunes en compras presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:pad thai', 'PAD THAI', '40% dto. todos los miércoles de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:padel mundo sport', 'Padel Mundo Sport', '20% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:paladar restobar', 'Paladar Restobar', '20% dto. martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:pawer', 'PAWER', 'Hasta 18% dto. en contratación de planes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:peces de ciudad', 'PECES DE CIUDAD', '20% dto. miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:peluqueria francesa', 'Peluquería Francesa', '20% dto. lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:pet family', 'PET FAMILY', 'Hasta 15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:petrizzio', 'Petrizzio', '30% dto. jueves y viernes en petrizzio.cl', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:pf changs', 'PF CHANGS', '20% dto. de lunes a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:pisco bou legado', 'Pisco Bou Legado', 'Hasta 15% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:pitisimas', 'Pitísimas', '20% dto. todos los días en pitisimas.cl', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:pizzeria capri dolares premio', 'Pizzeria Capri Dólares Premio', 'Consumo por $30.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:plant me', 'PLANT ME', '20% dto. presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:poliglota', 'Poliglota', 'Hasta 76% dto. para estudiar idiomas', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:pollo rey', 'Pollo Rey', '20% dcto. en delivery de lunes a jueves.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:porfirio', 'Porfirio', '40% dto. todos los domingos de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:preu filadd', 'Preu Filadd', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:preuniversitario pedro de valdivia', 'Preuniversitario Pedro de Valdivia', '20% dto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:prima bar', 'Prima Bar', '20% dto . todos los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:prowashgo', 'ProwashGo', '20% dto lunes a sábado online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:qb restaurant bar', 'QB Restaurant Bar', '30% dto los sábados y domingo y 20% dto. lunes a viernes.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:quercus', 'Quercus', '20% dto. los martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:quiero mi masaje', 'Quiero Mi Masaje', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:rally kart', 'Rally Kart', 'Hasta 40% dto. en vueltas todos los días presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ramblas', 'Ramblas', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:rappi', 'Rappi', 'Disfrutar un nuevo sabor cada día', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:restaurant urbano 136', 'Restaurant Urbano 136', '20% dto. sábado a lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:restaurante ana maria', 'Restaurante Ana María', '20% dto. miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:restaurante hotel magnolia dolares premio', 'Restaurante Hotel Magnolia Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:restaurante isabella', 'Restaurante Isabella', '20% dto. martes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:revesderecho', 'Revesderecho', '20% dto. miércoles en compras online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:rockford', 'Rockford', '40% dto. miércoles 11 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:rotter y krauss', 'Rotter y Krauss', 'Hasta 35% dto. martes en compra presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ruca bar', 'Ruca Bar', '40% dto. todos los viernes de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:rugendas', 'RUGENDAS', '20% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:sabor x2', 'SABOR X2', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:sabor y aroma', 'SABOR Y AROMA', '20% dto. lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:sabores del aji seco', 'Sabores del Ají Seco', '20% dto. Lunes, martes y sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:sabores del peru', 'Sabores del Perú', '20% dto. lunes, martes y sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:saint patrick s day', 'Saint Patrick´s Day', '15% dto. todos los lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:saki', 'Saki', '20% de dto. martes y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:samsung', 'Samsung', 'Paga hasta en 24 cuotas sin interés en compra online y tiendas.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:sanasalud', 'SANASALUD', 'Hasta 65% dcto. Todos los lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:selvado', 'SELVADO', '20% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:senior suites', 'SENIOR SUITES', 'Hasta 15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:smartdent', 'Smartdent', 'Hasta 60% dto. En prestaciones presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:smellwell', 'SmellWell', '20% dto. en compras online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:snow force', 'SNOW FORCE', '20% dto adicional. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:sociedad o306', 'SOCIEDAD O306', '20% dto. los martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:solar fotovoltaica', 'Solar Fotovoltaica', '4 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:specialized', 'Specialized', 'Paga 4 a 12 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:surista', 'SURISTA', '20% dto. viernes, sábado y domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:sushi thai', 'SUSHI THAI', '20% dto. lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:sushiban', 'Sushiban', '25% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:taco bell', 'Taco Bell', '40% dto los jueves presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tanaka la dehesa dolares premio', 'Tanaka La Dehesa Dólares Premio', 'Consumo por $80.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tanaka vitacura dolares premio', 'Tanaka Vitacura Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:taproom tubinger', 'Taproom Tübinger', '20% dto. los Jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:taringa', 'Taringa', '40% dto. todos los sábados de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:taringuita mall sport', 'Taringuita Mall Sport', '40% dto. todos los martes de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:teatro mori', 'Teatro Mori', '30% dto. en obras', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tendencias gourmet', 'Tendencias Gourmet', '20% dto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:terra force', 'TERRA FORCE', '20% dto adicional. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tessa', 'TESSA', '20% dto. jueves presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:thai express', 'THAI EXPRESS', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tienda friosur', 'Tienda Friosur', '20% dto. todos los lunes, martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tigre bravo', 'Tigre Bravo', 'lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tika', 'Tika', '30% dto. todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tirua bar restoran', 'Tirua Bar Restorán', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:togo', 'ToGo', '25% dto. Todos los días en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:toke', 'Toke', '20% dto. en compras presencial y online todos los lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tommy beans', 'Tommy Beans', 'Miércoles 40% dto. a través de la App de cada marca y 30% dto. en compras presenciales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tortas amelia', 'Tortas Amelia', '20% dto todos los días online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:transvip', 'Transvip', '15% dto en servicios', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:trattoria santtino', 'Trattoria Santtino', '20% dto. martes y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tratur', 'TRATUR', '22% dcto. Todos los días en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:trauko', 'Trauko', '15% dto. todos los días en sitio web', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:trayecto bookstore', 'Trayecto Bookstore', '20% dto. lunes y martes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tropicalia', 'Tropicalia', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:tua', 'TUA', '20% dto. los miércoles en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:uber eats: mcdonald’s', 'Uber Eats: McDonald’s', 'Los martes obtén 40% dto. en McDonalds', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ultimate clothing', 'Ultimate Clothing', '25% dto. adicional los días martes y jueves.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:ultimate fitness', 'ULTIMATE FITNESS', '20% dto. adicional todos los jueves del mes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:under armour', 'Under Armour', '40% dto. viernes 13 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:unu', 'ÜÑÜ', '20% dto. online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:varvacoa', 'Varvacoa', 'Hasta 20% dcto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:velvet bakery', 'Velvet Bakery', '20% dto. de lunes a jueves de 10:00 a 19:00 hrs', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:verde sazon', 'Verde Sazón', '40% dto. todos los miércoles de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:verde sazon#2', 'VERDE SAZÓN', '25% dto de lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:vicenzo', 'Vicenzo', '40% dto. todos los jueves de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:vietnam dicovery', 'Vietnam Dicovery', '20% dto. martes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:vina clos de luz', 'Viña Clos de Luz', '30% dto. Todos los días en compra online y tours degustación', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:vina espaldares del maipo', 'Viña Espaldares del Maipo', '20% dto. En compras presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:violeta restaurant', 'VIOLETA RESTAURANT', '20% dto. martes y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:vistandes', 'VistAndes', '20% dto. lunes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:vtr', 'VTR', 'Paga en 13 a 18 cuotas sin interés todos tus equipos nuevos', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:wendys', 'Wendys', 'Viernes 30% dto. en compras presenciales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:wom', 'WOM', 'Paga en 13 a 24 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:yale', 'YALE', '20% dto. En toda la tienda.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:yma dolares premio', 'YMA Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:yokono sushi', 'Yokono Sushi', '35% dto. lunes a miércoles en retiro y delivery', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:yoyo tea', 'YOYO TEA', '20% dto. Todos los días en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:zaika comida india', 'ZAIKA COMIDA INDIA', '20% dto. los sábados', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:zanzibar dolares premio', 'Zanzíbar Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:zapatos.cl', 'Zapatos.cl', '40% dto. lunes 09 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:zenclinic', 'ZenClinic', 'Paga tu tratamiento odontológico en 4 a 12 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:zenclinic dental', 'Zenclinic dental', '30% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:zona verde', 'Zona Verde', 'Hasta 20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('banco de chile:zoo york', 'ZOO YORK', '30% dto. todos los lunes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:akikb', 'AkiKB', '25% dcto. en arriendo de MINIBODEGAS por 3 meses.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:assist card', 'Assist Card', '10% dcto. adicional sobre la tarifa vigente', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:aventura kids', 'Aventura Kids', '20% Dcto. En aventura Kids', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:bamers', 'Bamers', '20% de dcto. en web y tienda', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:bar el callejon', 'Bar el callejón', '20% Dcto. de domingo a miércoles', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:beauty plus', 'Beauty Plus', '30% dcto. en todas las compras online.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:belsport', 'Belsport', '20% de Dcto. en Belsport', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:blue express copec', 'Blue Express Copec', '20% dcto. En envíos prepagos.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:cabify', 'Cabify', '4 viajes por mes por usuario con 15% dcto. tope $2.000', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:castano', 'Castaño', 'Aprovecha las promociones desde $2.800 todos los días', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:chayanne', 'Chayanne', 'Chayanne - Movistar Arena \n 20, 21 y 23 de agosto 2025', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:chiletur copec', 'Chiletur Copec', '15% dcto. en productos disponibles en chile.tur.com', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:cinemark', 'Cinemark', 'Dctos. especiales en entradas y confitería', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:condor bus', 'Cóndor Bus', '15% dcto. En compras online www.condorbus.cl', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:copec voltex', 'Copec Voltex', '10% dcto. en servicio de cargador', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:corrales del sur', 'Corrales del Sur', '15% dcto. embutidos y línea hogar todos los lunes.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:do sushi', 'Do Sushi', '25% de dcto. de Domingo a Martes.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:doggis', 'Doggis', '30% dcto en todo el menú de lunes a jueves', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:easycancha', 'Easycancha', '3 meses de prueba gratis con suscripción PRIME', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:eclass', 'eClass', '40% dcto. en diplomados eClass Academy', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:ecocitex', 'Ecocitex', '25% en el total de la compra', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:entrelagos', 'Entrelagos', '15% de dcto. en compras realizadas de manera online', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:escuela de surf maintencillo', 'Escuela de Surf Maintencillo', 'Dcto. en clases y arriendo de equipo', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:euro rent a car', 'Euro Rent a Car', '30% dcto en arriendo de cualquier vehículo', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:farmacia ahumada', 'Farmacia Ahumada', 'Descuentos en compras presenciales.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:farmacia fraccion', 'Farmacia Fracción', '10% dcto. Compras online en bioequivalentes.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:flixbus', 'FlixBus', '20% de dcto. en la compra de pasajes', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:franchute', 'Franchute', '20% dcto en la barra los martes y miércoles', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:freemet', 'Freemet', 'Descuentos exclusivos en compras online', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:glam & co', 'Glam & Co', '20% de descuento de lunes a jueves en salones.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:green day', 'Green Day', 'Parque Estadio Nacional \n 30 agosto, 2025', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:green lab', 'Green Lab', '15% dcto de sábado a miércoles en toda la carta', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:hola ola', 'Hola Ola', '20% dcto. en cafetería', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:hozier', 'Hozier', 'Movistar Arena \n 24 de mayo de 2025', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:ibis', 'Ibis', '15% Dcto.en IBIS Concepción', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:juan maestro', 'Juan Maestro', '30% Descuento en todo el menú de lunes a jueves', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:just burger', 'Just Burger', '30% en Just Burger Lunes, Martes, Jueves y Domingo', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:karun', 'Karün', '25% dcto. en anteojos de sol', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:katy perry', 'Katy Perry', 'Estadio Bicentenario de la Florida. \n 6 de septiembre 2025', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:kidzania', 'Kidzania', '20% dcto. en entradas', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:klean kanteen', 'Klean Kanteen', 'Hasta 30% dcto. en limitesur.cl y tiendas físicas', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:kylie minogue', 'Kylie Minogue', 'Kylie Minogue - Movistar Arena \n12 de agosto 2025', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:late', 'Late', 'Dctos. en productos y recargas de botellones', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:linkin park', 'Linkin Park', 'Estadio Nacional \n 2 de noviembre, 2025', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:local burger', 'Local Burger', '25% de dcto. de Domingo a Martes.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:mamut', 'Mamut', '20% OFF en toda la carta de Restaurant Mamut', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:marathon', 'Marathon', '10% dcto. adicional los martes', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:micoca-cola.cl', 'miCoca-Cola.cl', '25% de dcto. en el total de tu boleta, al comprar online', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:mut', 'Mut', 'Disfruta de los descuentos de BICIHUB MUT', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:natura', 'Natura', '30% OFF adicional los viernes', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:oakley', 'Oakley', '20% dcto. en web y tienda.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:opticas schilling', 'Ópticas Schilling', '20% dcto. en lentes ópticos y sol', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:papa johns', 'Papa Johns', '25% de dcto. en el total de tu boleta', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:parque aventura', 'Parque Aventura', '20% dcto. en entradas a Parque Aventura', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:parques outlife', 'Parques Outlife', 'Dctos. en Parques RKF El Durazno y Outlife Chamisero', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:rappi', 'Rappi', '90% dcto en envíos por 3 meses', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:rauw alejandro', 'Rauw Alejandro', 'Movistar Arena \n 14 octubre, 2025', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:restaurante olivia', 'Restaurante Olivia', '15% Dcto.Restaurante Olivia en toda la carta', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:ripley', 'Ripley', 'Hasta 30% en vestuario hombre, mujer, infantil.', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:roda', 'Roda', '15% dcto. en www.roda.cl', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:starbucks', 'Starbucks', '30% dcto. todos los martes y miércoles', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:sundeck - bob moses', 'Sundeck - Bob Moses', 'Espacio Riesco,Gran Salón \n 13 de Junio', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:sundeck - the grid', 'Sundeck - The Grid', 'Espacio Riesco�\n 30 agosto, 2025', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:super zoo', 'Super Zoo', 'Hasta 20% Dcto. en Tienda Online', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:taller f', 'Taller F', '20% dcto. personaliza y renueva tu closet', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:the body shop', 'The Body Shop', '15% Dcto. en productos The Body Shop', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:tommy beans', 'Tommy Beans', '30% Descuento en todo el menú de lunes a jueves', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:turbus', 'Turbus', '15% Dcto. En compras online', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('entel:wild foods', 'Wild Foods', 'Dctos. online en productos seleccionados', 'Club Entel', 'Entel', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:aamaal fit', 'AAMAAL FIT', '​Presta los servicios de comercialización de ropa deportiva de mujer y hombre Compras online y presenciales.• 15% de descuento en todos nuestros productos.www.instagram.com/aamaal.fit', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:achs', 'ACHS', 'Precios preferentes de atención en salud mental (online y presencial), traumatología, kinesiología, rayos y medicina general.ParaSalud MentalParaTraumatología, Kinesiología y RayosParaMedicina GeneralRevisaInstructivo Pago ACHS.pdfpara los pacientes que sean Fonasa en el link de la página webwww.achs.cl/salud-no-laboral/convenios', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:aradeli sabores', 'ARADELI SABORES', 'Presta los servicios de distribución de chocolates artesanales.5% de descuento en todos sus productos.www.instagram.com/aradelisabores/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:artemisa salud mental', 'ARTEMISA SALUD MENTAL', 'En Artemisa somos un equipo comprometido con entregar soluciones a las necesidades de salud mental y aportar a la formación clínica de psicólogos y psicólogas. Buscamos entregar un servicio de excelencia, con altos estándares de calidad.¿Cuándo ir al psicólogo/a?:En la psicoterapia se abordan temas de tu vida que te preocupan, para descubrir soluciones y reforzar los recursos personales. En el caso niños/as y adolescentes, la psicoterapia involucra también trabajar con sus familias. Existen múltiples estudios científicos que respaldan la efectividad de la psicoterapia, considerándose un tratamiento basado en la evidencia.Algunas de las situaciones en que se sugiere consultar son:• Si tienes un problema que no has podido solucionar, a pesar de haberlo intentado de distintas formas.• Si percibes que no tienes control sobre lo que ocurre en tu vida cotidiana.• Si te sientes disconforme con tu vida.• Si presentas dolencias físicas que no tienen explicación médica (somatizaciones).• Si presentas alguno de los siguientes síntomas o situaciones: estrés, ansiedad, depresión, duelo, impulsividad, desregulación emocional, problemas de autoestima, entre otros.Buscar ayuda de un psicólogo/a puede facilitar el manejo de desafíos en la vida cotidiana. No esperes a situaciones críticas; consultar temprano hará el proceso más fácil y mejorará tu bienestar.Para acceder al beneficio: Contáctanos a contacto@artemisasaludmental.cl o escríbenos a nuestroWhatsApp +56 9 32046633, indicando que eres estudiante de la Universidad Mayor. Para ello, deben enviar una foto de tu certificado de alumno/a regular.www.instagram.com/artemisasaludmental/?hl=es', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:bci', 'BCI', 'Plan Universitario costo $0 de Mantención.Cuenta digital BciCuenta MACHAtención preferencial con ejecutivo asignado.Contacta a tu Gestor de Convenios Renata Silva Richardson +569 6597 7848 renata.silva@bci.clPlan Universitarios Enero.pdfwww.conveniosbci.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:beauty june', 'BEAUTY JUNE', '​15% de descuento sobre el total de la compra.No acumulable con otras promociones. Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular, certificado laboral o pantallazo del perfil de Intranet (App Mundo Mayor).Compras en WhatsApp : (+56) 936481992www.instagram.com/beautyjune.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:bhanga climing', 'BHANGA CLIMING', '2x1 en los pases diarios en horario bajo (de 10.00 a 16.00hrs).Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de la App Mundo Mayor de forma presencial.Av. Consistorial 2100, Mall Alto Peñalolénwww.instagram.com/bhangaclimbing', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:bikefix', 'BIKEFIX', '5% en accesorios de repuestos.5% de descuento en compra de bicicletas cualquier medio de pago, no es acumulable con otras promociones.Enviar copia del certificado de alumno regular al correo bikefixchile@gmail.comwww.bikefix.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:cabanas las ananuca', 'CABAÑAS LAS AÑAÑUCA', '11% de descuento sobre el total de la compra.Promoción no acumulable con otros descuentos.Para reservar debes acreditar pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor) enviando un correo ainfo@cabanasananucas.clwww.cabanasananucas.cl', 'Viajes, Hoteles y Trasporte', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:calper', 'CALPER', '15% de descuento para compras en tiendas y web, utilizando el código de descuento "UMAYOR2025". Para estudiantes del área de la salud en uniformes clínicos y calzado. (No válido para calzado Skechers y Birkenstock).Manquehue: Los Militares 6020, Las Condes.Portugal: Av. Portugal 191, Santiago.Providencia: Antonio Varas 303, Providencia.Estoril: Estoril con Paul Harris.Viña: Calle Viana 273, Viña del Mar.www.calper.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:camp fit girls', 'CAMP FIT GIRLS', '15% de descuento para participar en las diferentes clases que ofrecen.Clase de prueba gratis. Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular, certificado laboral o pantallazo del perfil de Intranet (App Mundo Mayor).Bustamante 642, Ñuñoa (Metro Irarrázaval o Sta. Isabel)www.campfitgirls.cl', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:centro de bienestar kohler', 'CENTRO DE BIENESTAR KÖHLER', 'Presta los servicios de sesiones de Psicoterapia.20% de descuento en el valor de las sesiones de Psicoterapia.50% de descuento adicional enl a primera sesión.www.instagram.com/tuversionpositiva/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:centro integral plaza de armas', 'CENTRO INTEGRAL PLAZA DE ARMAS', '15% de descuento sobre el total de la compra del servicio.Dicho descuento se hará efectivo previo acreditación del vínculo con la Universidad Mayor al correo contacto@centroentrointegralplazadearmas.cl con un certificado de alumno regular o perfil de la aplicación Mundo Mayor.Calle San Antonio #486, Oficina 151. Piso 15Precios y detalles convenio Centro de atención integral Plaza de Armas Universidad Mayor.pdfwww.centrointegralplazadearmas.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:ceoi', 'CEOI', 'Campañas con descuentos exclusivos mensuales:Hasta el 30 de abril examen de diagnóstico costo $0. Destartaje supragingival + radiografía panorámica $60.000Republica Arabe de Egipto 250, Of 2, Las Condes.https://ceoi.cl/', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:cetep', 'CETEP', '15% descuento en productos de la farmacia sobre el precio de venta al público, sin considerar promociones o descuentos vigentes. Valores preferenciales en atenciones online.Para hacer efectivo este beneficio se entregará un Código de Descuento que será válido para los beneficiarios de la empresa y será requerido al momento del pago en la web.Balmoral 309, Nivel -2 Local 201, Las Condes.Nueva Los Leones 200, Providencia.Av. Libertador Bernardo O´Higgins 420, Rancagua.Chacabuco 799, Concepción.Cuatro Oriente 108, Viña del Mar.https://cetep.cl/', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:chilescalando', 'CHILESCALANDO', '​25% de descuento en los servicios de:Curso de iniciación en escalada deportiva en monolargo.Experiencia de escalada en roca.Más información con: Víctor Sáez / +569 8598 0467IG@chilescalandoRevisa los cursos aquí:Curso de escalada​Curso Top-rope y desequiparExperiencia de escaladaTécnicas de autorescate', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:cleta sos', 'CLETA SOS', '15% de descuento en todos los servicios de mantención de bicicletas utilizando el código "umayor" al agendarlo por la web.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de la App Mundo Mayor.cleta1.sos@gmail.comwww.cletaSOS.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:clinica dental alba', 'CLINICA DENTAL ALBA', 'Hasta un 60% de descuento en diferentes servicios:- Diagnóstico gratuito.- 60% de descuento Limpieza Dental.- 50% de descuento Blanqueamiento Dental e Interconsulta.- Tratamiento de Ortodoncia. Valor preferencial detallado en Anexo N°1- Otros Tratamientos Dentales, descuento de un 50% al monto total del tratamiento.Arancel Alba anexo 1_2024.pdfHolanda 099, oficina 304, Providenciawww.clinicadentalalba.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:clinica odontologica everest', 'CLÍNICA ODONTOLÓGICA EVEREST', '​Evaluación y Diagnóstico con Radiografía Panorámica sin Costo.62% descuento en prestaciones dentales frecuentes.55% descuento en el resto de las prestaciones dentales.Descuentos sin tope ni deducible.Descuento válido en prestaciones dentales, excluye Laboratorios, Pabellón, Informes Radiológicos e insumos.Los descuentos NO son acumulables con otros convenios y/o promociones vigentes.Acreditando pertenencia a Universidad Mayor debes mostrar un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor).Todas las sucursales.www.instagram.com/clinicaeverest/', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:clinica tomas moro', 'CLÍNICA TOMÁS MORO', '30% de descuento sobre el valor de los servicios de consultas ambulatorias en las siguientes especialidades: • Medicina General • Medicina Interna • Fonoaudiología: Adulto e Infantil • Kinesiología: Adulto e Infantil • Psicología: Adulto e Infantil • Terapia Ocupacional: Adulto e Infantil • Nutrición: Adulto, Infantil y DeportivaDicho descuento se hará efectivo previo acreditación del vínculo con la Universidad Mayor al correo con un certificado de alumno regular o perfil de la aplicación Mundo Mayor.Ubicación: Apoquindo 7331, Oficina 411, Las CondesHorarios: lunes a viernes de 09:00 a 21:00 / sábado de 09:00 a 12:30Correo:recepcion@clinicatomasmoro.clTeléfono: +56997696360https://clinicatomasmoro.cl/(Estos son precios particulares y luego se le aplica el reembolso)', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:club fotografia', 'CLUB FOTOGRAFÍA', '​10% de descuento en cualquiera de nuestros cursos individuales.Pago solo vía transferencia electrónica.Para canjearlo deben hacer la reserva desde la web usando el código de descuentoMICLUBMAYOR. Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil del Mundo Mayor.www.clubdefotografia.cl', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:color astral', 'COLOR ASTRAL', '​20% de descuento en taller experimental de ceramica.10% en taller intensivo o workshop de tazas.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor) al correocolorastral@gmail.comwww.instagram.com/colorastralInfo Talleres.pdf', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:cute stuff spa', 'CUTE STUFF SPA', 'Presta los servicios de venta de artículos de librería y bazar.20% de descuento en todos los productos, excepto en magnetic notes y magnetic pads.10% de descuento en magnetic notes y magnetic pads.www.instagram.com/cute.stuff.temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:diario financiero', 'DIARIO FINANCIERO', '​50% descuento para el plan de suscripción DF digital premium anual utilizando el código de descuento "UMAYORDF"Suscríbete aquí:https://www.df.cl/suscripciones-umayor', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:el colorado', 'EL COLORADO', 'Temporada 2025 aun no comienza.', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:ems providencia', 'EMS PROVIDENCIA', '35% de descuento en electroestimulación.35% en HIIT.15% Nutricionista.20% Quiropractico.Para acreditar pertenencia a Universidad Mayor debes mostrar un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor).Antonio Varas 175, oficina 902, ProvidenciaEMS 2024.pdfwww.emsprovidencia.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:escuela de conductores san luis', 'ESCUELA DE CONDUCTORES SAN LUIS ​', '​10 % sobre el total de la compra en los siguientes cursos:Curso normal auto manualCurso normal auto automáticoCurso a domicilioCurso intensivoAdicional al curso contratado se le otorgará una clase práctica adicional.No acumulables con otras promociones.Sucursal Metro ÑuñoaAv. Pedro de Valdivia # 3474, Local 43-B, Tercer Nivel, Mall Caracol, Metro ÑuñoaSucursal Metro IrarrázavalAvda. Matta 060 local 10www.edcsanluis.cl', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:espacio vuela', 'ESPACIO VUELA', 'Matricula gratuita y 10% de descuento sobre planes de disciplinas (clases de Pole Sport, Aerial yoga, Pilates Zen, Kick Boxing, K-pop, Hip-Hop, Cotemporáneo, Dance Lab, Reggaeton, Girly, Flexibilidad Freestyle).No acumulable con otras promociones. Acreditando pertenencia a Universidad Mayor con un certificado de alumno regular o pantallazo del perfil de Mundo Mayor al correocontacto@espaciovuela.clRevisa los horarios de las clasesAQUÍ', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:estacionamiento zenit', 'ESTACIONAMIENTO ZENIT', 'Ticket diario U. Mayor a $ 4.000 IVA incluido, para la jornada completaAbono Mensual 24/7 a $85.000 IVA incluido, mes completo.Eliodoro Yáñez 1250, Providencia', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:eyoukine', 'EYOUKINE', 'p>Presta los servicios de Rehabilitación kinésica integral y masaje terapéutico• 15% de descuento en masajes relajantes y/o descontracturantes.• 15% de descuento en evaluación y diagnóstico.• 20% de descuento en el mes de tu cumpleaños en masajes relajantes y/o descontracturantes (presentando cedula de identidadwww.instagram.com/eyoukine/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:garmin', 'GARMIN', '​20% de descuento en toda la tienda utilizando el código "GARMINYUMAYOR". No acumulable con otras promociones.www.garminstore.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:georuston', 'GEORUSTON', '10% de descuento en venta online de sus productos, ingresando el código "UMAYOR23" al momento de la compra en la pagina webwww.georuston.cl​Venta online de insumos geológicos. ​​​Más información en IG​@georuston​', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:gimnasio el muro', 'GIMNASIO EL MURO', '15% de descuento en escalada de prueba.15% de descuento en pase libre en horario Eco.15% de descuento en mensualidad Eco.15% de descuento en plan “10 tickets estudiante” todo horario.10% de descuento en clases de escalada en horario Eco.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de de la App Mundo Mayor presencialmente en la recepción.Avda Larrain 6228, La ReinaBHANGA CLIMING', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:gimnasio upgrade', 'GIMNASIO UPGRADE', 'Descuento en sus diferentes planes.Acreditación del vínculo con la Universidad Mayor con un certificado de alumno regular o perfil de la aplicación Mundo Mayor si contrata en mesón. Contratando en web utilizar código del plan que se quiere contratar.Plan Anual: UMAYORANUALPlan Semestral: UMAYORSEMPlan Trimestral: UMAYORTRIMVálido en todas las sucursales del país.https://www.gimnasiopacific.cl/', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:goolfy', 'GOOLFY', 'Tarifa especial a $8.000pesos de lunes a viernes: 12.00 - 22.00hrs y sábados, domingos y festivos : 10.00 - 22.00hrs.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de del Mundo Mayor.Para más información o para reservar su visita contactarse al +56968354052 o por correo electrónico agoolfy@virtualracing.clwww.goolfychile.cl', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:henk-co', 'HENK-CO', 'Red de Atención Psicológica Henk-co.Presta los servicios de:Acompañamiento psicológicoPsicoterapiaPsicoeducaciónUn descuento de $7.000 CLP, desde la modalidad online, y un descuento de $11.000 desde la modalidad presencial.Para acceder a este beneficio sólo debes ingresar a la web, solicitar la hora y poner el código "CONVENIOMAYOR" en el motivo de consulta luego el/la psicólogo/a asignado te pedirá un pantallazo de tu perfil mayor.https://henkco.cl/PDF informativo con valores + misión.docx.pdf', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:inaltum fitness', 'INALTUM FITNESS', 'Descuento fijo sobre el total del plan.Contratación del servicio con el personal presente en recepción.No acumulable con otras promociones.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular, certificado laboral o pantallazo del perfil de Intranet (App Mundo Mayor).Avenida Miguel Claro 109, Providenciawww.inaltum.cl', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:juntos al volante', 'JUNTOS AL VOLANTE', '​10 % sobre el total de la compra en los siguientes cursos:Curso normal auto manualCurso normal auto automáticoCurso a domicilioCurso intensivoAdicional al curso contratado se le otorgará una clase práctica adicional. No acumulables con otras promociones.SUCURSAL VITACURAAvenida san patricio 4298 oficina 11 piso 3SUCURSAL LAS CONDESAvenida apoquindo 4900 local 26 piso 1SUCURSAL HUECHURABAAvenida pedro fontova 7280 oficina 215 piso 2www.juntosalvolante.cl', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:koe', 'KOE', '​ 10% de descuento en planes contado.8% de descuento en planes crédito. No acumulables con otras promocionesPreparación para una prueba internacional (toefl, toeic, ilts o b2 first de cambridge)Talleres presenciales u onlineBeca familiar gratuita por contratoProgramas de enseñanza y aprendizaje del idioma Inglés en horarios programables de libre elección con asistencia de 2 veces a la semana, pudiendo ser virtual de lunes a viernes de 8.00 am a 9.00 pm – sábado y domingo de 9.00 am a 4.00 pm y presencial de Lunes a viernes de 12.00 pm a 9.00 pm – sábado de 10.00 am a 2.00 pm.El usuario tiene acceso a sesiones presenciales, virtuales o mixtas en tiempo real; en caso de las clases presenciales podrá asistir a cualquiera de las sedes de KOE, ubicadas en Huefanos 1117, of 414, Santiago centro - Apoquindo 2930 piso 13, Las Condes - Libertad 798 piso 6 oficina 602, Viña del Mar.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil del Mundo Mayor.Contacto: Myriam Andrea Espejo Quilobrán / Ejecutiva Convenio / +56978078604 / myriam.espejo@gmail.com o myriam.espejo@koe.lawww.koe.cl', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:la holandesa cafe', 'LA HOLANDESA CAFÉ', 'Presta los servicios de Cafetería.Capuccino 2x1 los lunes hasta las 14.00hrs.Café más galletón vegano $4.000.Challa tradicional + jugo/café $8.000Café/Chocolate caliente + Gateau $6.000Babka + helado $4.000www.instagram.com/laholandesacafe/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:la quadrada pizza', 'LA QUADRADA PIZZA', 'Presta los servicios de venta de pizza, sándwiches y empanadas.• 15% de descuento en la compra de cualquier producto sobre los $10.000.• Compras inferiores a los 10.000 tienen un 10% descuento de base.• Lunes y martes pizza pepperoni familiar a $7.990.www.instagram.com/laquadradapizza', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:labysalud', 'LABYSALUD', '$5.000 de descuento en Toma de muestras de Exámenes a Domicilio:Exámenes de laboratorio: más de 300 examenes de sangre, orina y cultivo.Exámenes cardiológicos: electrocardiograma (ECG), Holter de ritmo/arritmia, holter de presión, ecocardiograma.Realizados por enfermeraLaboratorios acreditadosResultados en horas vía mail o WhatsAppEl descuento se hará efectivo previa acreditación del vínculo con la Universidad Mayor presentando certificado de alumno regular y perfil de la aplicación Mundo Mayor.Descuento aplicable a estudiantes U Mayor y sus familias.Cobertura: rm + v regiónHorario de atención: De lunes a viernes, excepto festivos. No acumulable con otras promociones.www.labysalud.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:levimed', 'LEVIMED', 'Porcentaje de descuento sobre el valor total de cada servicio,en relación al precio o referencial de lista para el público consumidor. Dicho descuento no es acumulable con otras promociones.Neveria 4672, Las Condeswww.levimed.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:libreria nacional', 'Librería Nacional', 'Obtiene un 20% de descuento, válido para tiendas físicas y compras a través de la web.Para compras online, utiliza el códigouniversidad_mayorPara descuento en tiendas físicas, debes mostrar tu credencial de la App Mundo Mayor.Promoción válida del 01 de junio hasta el 31 de julio.', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:libreria san borja', 'LIBRERÍA SAN BORJA', '7% de descuento sobre el total de la compra igual o superior a $5.000.Ubicada en: Av. Portugal 38, Torre 5, Local 1, Santiago.Más información al IG:@libreriasanborja', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:libroos', 'LIBROOS', '10% de descuento por compras realizadas a través de la web, ingresando el código "ConvenioUMayor"www.libroos.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:live, love, rock on!', 'LIVE, LOVE, ROCK ON!', '​15% descuentosobre el total de la compra utilizando el código "UMAYOR2020".', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:logo_1211-gotech.jpg', 'logo_1211-Gotech.jpg', '15% de descuento sobre el total de la compra (no acumulable con otras promociones)Aplicable sólo a Suministros Recotoner (Toner, Tintas y Drum)Código: UMAYORhttps://recotoner.cl/discount/UMAYORIGwww.instagram.com/recotoner.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:lovely mantequillas', 'LOVELY MANTEQUILLAS', 'Presta los servicios de comercialización y elaboración de mantequillas de frutos secos, snacks veganos y libres de azúcar.• 10 % de descuento en todos nuestros productos• 20% de descuento en el día de tu cumpleañoswww.instagram.com/lovely.mantequillas', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:m3storage', 'M3STORAGE', '20% descuento los primeros 3 meses en arriendo de bodegas (No acumulables con otras promociones y sujeto a disponibilidad) Esto sobre el precio o valores referenciales de lista para el público consumidor.Utilizando el cupón de descuento “UMAYORM3” a través de la página web. O comunicándose directamente al +56 9 8617 4925 para solicitar el arriendo de bodega acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor).https://m3storage.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:made in marruecos', 'MADE IN MARRUECOS', '15 % descuentosobre el total de la compra utilizando el código "UMAYOR_15DCTO".No acumulables con otras promociones. Excluye viajes.www.madeinmarruecos.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:maithai', 'MAITHAI', 'Presta los servicios gastronómicos de comida tailandesa, con patente de restaurant, contando con mesas interiores y terraza exterior, prestando un servicio de calidad y ofreciendo una experiencia única para nuestros clientes.• Alumnos: 15% de descuento en la carta.• Funcionarios: 10% de descuento en la carta.www.instagram.com/maithai_cl', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:marina temuco', 'MARINA TEMUCO', 'Presta los servicios de elaboración y venta de sal de mar con distintas especias, entregando productos 100% naturales y libre de aditivos.10% de descuento en toda la línea de productos de Marina Temuco, este descuento podrá ser utilizado durante todo el año, aplica para venta online y ventas presenciales en ferias. (Excluye puntos de ventas físicos).15% de descuento para estudiantes y funcionarios en el día de su cumpleaños. El descuento solo aplica para venta online y ventas presenciales en ferias. (Excluye puntos de venta físicos).www.instagram.com/marinatemuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:megafitness', 'MEGAFITNESS', 'Descuento en sus diferentes planes.Acreditación del vínculo con la Universidad Mayor con un certificado de alumno regular o perfil de la aplicación Mundo Mayor contratando directamente en la sucursal (descuentos exclusivos Sucursal Manuel Montt).Matricula $10.000 anual.Plan Anual: $249.990Plan Semestral: $150.000Plan Trimestral: $90.000Plan Trimestral: $28.990Av. Manuel Montt 50, Providencia.www.instagram.com/megafitnessmanuelmontt', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:mundo roms', 'MUNDO ROMS', '10% de descuento en productos seleccionados de las siguientes categorías:- Consolas y Videojuegos Retro- Juguetes Retro- Artículos Cultura Pop- Librería y PapeleríaPara acceder al precio en convenio, enviar certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor) al correo: contacto@mundoroms.comwww.mundoroms.com/convenios', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:naturista', 'NATURISTA', 'Presta los servicios de comida saludable para servir o llevar, taler como: bowl de ensaladas, wrap, platos calientes, etc. Con opciones vegetarianas, veganas, sin gluten, entre otras.10% de descuento en bowl, wrap y jugos naturales todos los miércoles de cada mes.Exclusivo para alumnos: en el día de tu cumpleaños solicita tu jugo natural de regalo por la compra de cualquiera de nuestros productos.www.instagram.com/naturistafood/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:norden', 'NORDEN', '25% de descuento en todas las prestaciones clínicas (excepto laboratorio) Si están afiliados a Caja Los Andes, obtienen un 5% adicional, sumando hasta 30% de descuento total en todas las prestaciones.- Pack de Bienvenida: $69.000, incluye consulta de diagnóstico, pack rayos (panorámica + bitewing lateral), higiene (con destartaje completo y profilaxis).- Campañas con descuentos exclusivos.www.clinicasnorden.cl/', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:optica switch', 'ÓPTICA SWITCH', '20% de descuentoen lentes Monofocales.10% de descuentoen lentes Bifocales y/o MultifocalesExamen visual gratis por la compra de un lente.Av. Walker Martínez 2011, local C, La Florida.Enrique Olivares 1331, La Florida.Av. Consistorial 2069, Peñalolén.', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:otium', 'OTIUM', '20% de descuentoacreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de del Mundo Mayor en las tiendas presenciales o genera un cupón de descuento vía DM en su cuenta de Instagram.⁣⁣www.instagram.com/otium.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:parque farellones', 'PARQUE FARELLONES', 'Temporada 2025 aun no comienza.', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:peregrino coffee', 'PEREGRINO COFFEE', '10% de descuento sobre el total de la compra. No acumulable con otras promociones.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor).Direcciones:- Loreley 114, La Reina.- Av. Apoquindo 7014, Las Condeswww.peregrinocoffee.cl​​', 'Gastronomía', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:pie monte', 'PIE MONTE', 'Hotel Olmué20% descuento Temporada Baja (Marzo a Junio y Agosto a Noviembre)10% descuento Temporada Alta (Julio ; Diciembre a Febrero)Enviando el certificado de alumno regular al correoinfo@piemontehotel.clsolicitando información.CONDICIONES RESERVAS PIE MONTE.pdfwww.instagram.com/piemontehotelolmuewww.piemontehotel.cl', 'Viajes, Hoteles y Trasporte', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:quiero mi examen', 'QUIERO MI EXAMEN', '50% de descuento en la orden médica quedando a un valor de $2.245 cada orden médica.Promoción no acumulable con otros descuento.Utilizando el código de descuento"UMAYOR"en la web.www.quieromiexamen.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:rami', 'RAMI', 'Presta los servicios de venta de productos Coreanos15% de descuento en compras sobre el valor del catálogo.25% de descuento en el día de tu cumpleaños (Acreditando con tu Cédula de Identidad).www.instagram.com/rami.temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:red hotelera', 'RED HOTELERA', 'Operadora de reservas10% de descuento sobre tarifas rack de los diferentes hoteles.WhatsApp : (+56) 973889424 - (+56) 974477872Teléfonos (+56) 44 8909220 - (+56) 225860992Horario De Atención: De Lunes a Viernes desde las 09:00 a 18 hrs.www.instagram.com/redhotelera', 'Viajes, Hoteles y Trasporte', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:restaurante frutal temuco', 'RESTAURANTE FRUTAL TEMUCO', 'Gastronomía GourmetIncluimos en tu almuerzo económico: consomé/crema/sopa (Según disponibilidad del día).15% de descuentoen el valor de la carta (Temuco - Curacautín).20% de descuentoen zona de reuniones y fiestas (Temuco - Curacautín).Gratis zona de recambio de vestuario en temporada de nieve (Curacautín).Regalo de cumpleaños, si agendas tu celebración con nosotros.Solo debes validarte con tus credenciales #umayor. No acumulable con otras promociones.Reservas +56997471269.Dinamarca #691, local 4 y 5, Temuco.www.instagram.com/frutal_temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:saba', 'SABA', '10% descuento sobre el total de la compra.No acumulables con otras promociones. En la página web, ingresando el cupón de descuento "SABAUMAYOR10"En los puntos de venta presenciales (Santiago Centro y San Carlos de Apoquindo), acreditando el vínculo con la Universidad, a través de app Mundo Mayor y CI.San Antonio N°140 LC 54-56, Paseo San Agustín, Santiago.Avenida Plaza 651, LC 23,Segundo piso, San Carlos de Apoquindohttps://saba.cl/categorias-productos/estudiantes/universidad-mayor/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:sala k', 'SALA K', 'Precios preferentes en las diferentes exhibiciones, acreditando el vínculo con la Universidad, a través de app Mundo MayorEstudiantes U. Mayor: $1.000Colaboradores/as y Alumni: $2.000www.salak.cl', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:sala teatro u.mayor', 'SALA TEATRO U.MAYOR', 'Precios preferentes en las diferentes obras, compras en boletería, acreditando el vínculo con la Universidad, a través de app Mundo MayorEstudiantes Teatro U. Mayor: $1.000Estudiantes U. Mayor (otras carreras): $3.000 Colaboradores/as y Alumni: $4.000Santo Domingo 711, Santiagowww.instagram.com/saladeteatroumayor', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:samsumg', 'SAMSUMG', 'Hasta 50% de descuento en campaña Back to School (se destaca el Galaxy S24 128GB con 51%dcto).Para acceder a estos beneficios debes registrar su mail institucional. Luego de validar el registro podrán acceder a una cuenta con la que podrán comprar con atractivos descuentos.https://www.samsung.com/cl/multistore/estudiantes_chile/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:scorpi', 'SCORPI', '15% de descuento sobre el precio de lista o precio normal (no aplica sobre descuentos, ni costo de despacho).Compra utilizando código de descuento "UMAYORSCORPI15%". O directamente en las tiendas físicas, presentando certificado de alumno regular o pantallazo del perfil de la App Mundo Mayor.www.scorpi.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:sello.pink', 'SELLO.PINK', 'Presta los servicios de tratamiento de belleza cosmético para las uñas.• Todos los jueves con un 15% de descuento en esmaltados permanentes y uñas softgel.www.instagram.com/sello.pink', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:serviteca de luca', 'SERVITECA DE LUCA', 'p>Presta los servicios de Alineación, Balanceo, Cambio de aceite, Frenos, Neumáticos, Baterías, Scanner automotriz, Mecánica rápida (pastillas de frenos, rectificado de discos, embalatado, repuestos en general), Lavado full,K Pulido, Lavado de tapiz, Sellado cerámico.• 10 % de descuento en todos nuestros productos• 20% de descuento en el día de tu cumpleañoswww.instagram.com/servitecadeluca/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:sexshop toy hot', 'SEXSHOP TOY HOT', 'Presta los servicios de artículos y juguetes para adultos10% de descuento en compras superiores a $15.000 a todos los de la carrera obstetricia y puericultura.10% de descuento en compras superiores a $20.000Un lubricante básico de 5ml de regalo por cada compra superior a $15.000www.instagram.com/sexshop_toyhot/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:smartfit', 'SMARTFIT', '14% de descuento en Plan Black, utilizando el código en la web.Solicitar el código al correo dae@umayor.cl mandando un pantallazo de la credencial digital (App Mundo Mayor) o certificado alumno regular.Códigos limitados.Todas las sucursales del país.https://www.smartfit.cl/', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:smartfix', 'SMARTFIX', 'Servicio Técnico Smartphone y Venta de Accesorios ​​10 % descuento sobre el total de la compra.No acumulables con otras promociones.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de de la App Mundo Mayor.www.instagram.com/smartfix.empresarial', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:sportlife', 'SPORTLIFE', 'Valores preferenciales en planes por sectores y zonas.Promoción de 7 días de FreePassRevisar documento de valoresVALORES 2024.pdfContacto: Julia Vidal / Cuentas Corporativas / jvidal@sportlife.cl / +56 9 57280769www.sportlife.cl', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:stile isabella', 'STILE ISABELLA', 'Presta los servicios de venta de joyas y accesorios.10% de descuento en toda la tienda.20% de descuento por compras sobre $35.000 (no acumulable)2x1 y envío gratis exclusivo en el día de tu cumpleaños (válidadndo con cédula de identidad).www.instagram.com/stile.isabella/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:sublicraft studio', 'SUBLICRAFT STUDIO', 'Agendas personalizadas, estampados de polerones, poleras, morrales, tazones, etc; cotillón personalizado para distintos eventos, papelería (como tarjetas de presentación, stickers, tags, impresión de libros).• 15% en agendas• 10% en estampados• 10% en productos de papelería como stickers, cotillón, tarjetas, etcwww.instagram.com/sublicraft_studio/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:teatro azares', 'TEATRO AZARES', '$5.298 para obras y $2.700 para obras de títeresCompra de las entradas online utilizando el código "BENUMAYOR" .También compras directamente en boleterías acreditando el vínculo con la Universidad, a través de app Mundo Mayor.Teatro Azares - Cartelera marzo 2025.pdfwww.teatroazares.cl', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:teatro municipal', 'TEATRO MUNICIPAL', 'Descuento en la compra de entradas para espectáculos presenciales en Teatro Municipal de Santiago.Puedes comprar vía online utilizando el código de descuento "UMAYOR"Para venta presencial en boleterías del Teatro debes presentar un certificado que acredite la condición de alumno o bien exhibir la App Mundo Mayor, junto a su cédula de identidad.El beneficio es aplicable máximo 2 entradas por título.No es acumulable con otras promociones Calendario_Teatro Municipal.pdfFunciones con convenio.docxwww.municipal.cl', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:terrapadel y crossfit', 'TERRAPADEL Y CROSSFIT', 'Presta los servicios de arriendo de canchas de Pádel y CrossfitLunes a viernes: 08.00 a 18.00hrs $8.000 / 18.00 a 00.00hrs $15.000.Fines de semana: todo el día $8.000Préstamos de palas y pelotas Sin costo.Box CrossFit:www.instagram.com/terrapadelaraucania/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:turbus', 'TURBUS', 'Precios preferenciales que permite a los estudiantes viajar de lunes a domingo, en cualquier horario, desde el 1 de marzo hasta el 15 de diciembre de 2023.A través de la web, ingresandoaquí. El descuento se reflejará automáticamente al momento de ir a pagar, siempre y cuando hayas escogido el tramo asociado a tu inscripción.Debes inscribirteAQUÍpara obtener el beneficio.', 'Viajes, Hoteles y Trasporte', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:un rincon del encuentro', 'UN RINCÓN DEL ENCUENTRO', 'Atención psicológica online con un valor de$18.000 por sesión.Correspondiente a un 28% de descuento del valor original de la sesión ($25.000).Centro de Atención Psicológica comprometido con la salud mental de la población de todas las edades, desde un enfoque de género y enfoque afirmativo. Contamos con profesionales capacitadas/es para el trabajo con neurodivergencias.Somos un grupo conformado por psicologas/psicologues, e intentamos entregar un espacio seguro y de confianza para cualquier proceso.Inscribiéndote allink exclusivo UMwww.instagram.com/unrincondelencuentro', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:up fit temuco', 'UP FIT TEMUCO', 'Presta los servicios de gimnasio para mujeres.10% de descuento en horario de 08.00 a 14.00hrs.Agenda tu clase de prueba Gratis.www.instagram.com/upfit.temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:valentinna', 'VALENTINNA', 'Presta los servicios de venta de joyas y accesorios.15% de descuento en el total de su compra a alumnos.10% de descuento en el total de su compra a docentes y colaboradores.www.instagram.com/valentinna.chile/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:valle nevado', 'VALLE NEVADO', 'Temporada 2025 aun no comienza.', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:vera napoli', 'VERA NAPOLI', 'Presta los servicios de Restaurante y alimentación• Menú ejecutivo, de lunes a viernes, de 12:30-16:00 horas, a $6.990• 10% descuento en productos que no entran en promoción de menú ejecutivo (pasta rellena y pizza tamaño tradicional)www.instagram.com/veranapoli.cl/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:vina casa donoso', 'VIÑA CASA DONOSO', 'Entre 20 y 50% en vinos y productos.10% de descuento en actividades enológicas (Visitas guiadas, tour, etc) en sucursal Talca. 10% de descuento en arriendo de Instalaciones para eventos corporativos.Maria Jose Torres+56 9 5684 5204mariajose.torres.anc@gmail.comwww.instagram.com/vinacasadonoso/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:vina sutil', 'VIÑA SUTIL', '40% de descuento sobre el precio de lista de los productos comercializados por TWG a través de la plataforma utilizando el código de descuento “UMAYOR2025”, cuyo uso es ilimitado y se mantendrá vigente hasta el 1º de marzo de 2026.www.bardecopas.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:volta roasters', 'VOLTA ROASTERS', 'Presta los servicios de Cafetería30% de descuento en Promoción de: Café caliente + selladito - de 08.30 a 10.00hrs.10% de descuento en "Promoción de Almuerzo", bebida + wrap a elección - de 13.00 a 14.30hrs.20% de descuento base si llevas tu vaso para la bebida de tu preferencia.Beneficios exclusivos en el día de tu cumpleaños.Descuentos exclusivos en café de grano en formato de 250grs,www.instagram.com/voltaroasters/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:w1 temuco', 'W1 TEMUCO', 'Presta los servicios venta oficial Winkler Nutrition y Revitta Wellness de Temuco15% de descuento sobre el precio o valor referencial.18% de descuento en cualquier producto de la tienda, en el día de tu cumpleaños.www.instagram.com/w1.temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:yasser azar', 'YASSER AZAR', 'Presta los servicios de:1- Evaluación y diagnóstico quiropráctico2- Tratamiento quiropráctico basada en técnicas de alta velocidad y baja amplitud3- Tratamiento de descomprensión de columna para tratamientos de hernias y discopatías15% de descuento en los tratamientos quiroprácticos20% de descuento en los tratamientos quiroprácticos en el día de tu cumpleaños (con cédula de identidad)www.instagram.com/yasser_azar/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
+INSERT INTO benefits (benefit_key, name, description, category, provider, location, image_url, is_active) VALUES ('universidad mayor:zanaholiva', 'ZANAHOLIVA', 'Presta los servicios de venta de alimentos saludables.10% de descuentoen toda la carta.Regalo de Cumpleaños:podrás pedir jugo, bebida, café o té. Debes validarlo con tu cédula de identidad.www.instagram.com/zanaholiva/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '', 1) ON CONFLICT (benefit_key) DO UPDATE SET name = EXCLUDED.name, description = EXCLUDED.description, category = EXCLUDED.category, provider = EXCLUDED.provider, location = EXCLUDED.location, image_url = EXCLUDED.image_url, is_active = 1;
 
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('KOE', '​ 10% de descuento en planes contado.8% de descuento en planes crédito. No acumulables con otras promocionesPreparación para una prueba internacional (toefl, toeic, ilts o b2 first de cambridge)Talleres presenciales u onlineBeca familiar gratuita por contratoProgramas de enseñanza y aprendizaje del idioma Inglés en horarios programables de libre elección con asistencia de 2 veces a la semana, pudiendo ser virtual de lunes a viernes de 8.00 am a 9.00 pm – sábado y domingo de 9.00 am a 4.00 pm y presencial de Lunes a viernes de 12.00 pm a 9.00 pm – sábado de 10.00 am a 2.00 pm.El usuario tiene acceso a sesiones presenciales, virtuales o mixtas en tiempo real; en caso de las clases presenciales podrá asistir a cualquiera de las sedes de KOE, ubicadas en Huefanos 1117, of 414, Santiago centro - Apoquindo 2930 piso 13, Las Condes - Libertad 798 piso 6 oficina 602, Viña del Mar.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil del Mundo Mayor.Contacto: Myriam Andrea Espejo Quilobrán / Ejecutiva Convenio / +56978078604 / myriam.espejo@gmail.com o myriam.espejo@koe.lawww.koe.cl', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLUB FOTOGRAFÍA', '​10% de descuento en cualquiera de nuestros cursos individuales.Pago solo vía transferencia electrónica.Para canjearlo deben hacer la reserva desde la web usando el código de descuentoMICLUBMAYOR. Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil del Mundo Mayor.www.clubdefotografia.cl', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('JUNTOS AL VOLANTE', '​10 % sobre el total de la compra en los siguientes cursos:Curso normal auto manualCurso normal auto automáticoCurso a domicilioCurso intensivoAdicional al curso contratado se le otorgará una clase práctica adicional. No acumulables con otras promociones.SUCURSAL VITACURAAvenida san patricio 4298 oficina 11 piso 3SUCURSAL LAS CONDESAvenida apoquindo 4900 local 26 piso 1SUCURSAL HUECHURABAAvenida pedro fontova 7280 oficina 215 piso 2www.juntosalvolante.cl', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ESCUELA DE CONDUCTORES SAN LUIS ​', '​10 % sobre el total de la compra en los siguientes cursos:Curso normal auto manualCurso normal auto automáticoCurso a domicilioCurso intensivoAdicional al curso contratado se le otorgará una clase práctica adicional.No acumulables con otras promociones.Sucursal Metro ÑuñoaAv. Pedro de Valdivia # 3474, Local 43-B, Tercer Nivel, Mall Caracol, Metro ÑuñoaSucursal Metro IrarrázavalAvda. Matta 060 local 10www.edcsanluis.cl', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('COLOR ASTRAL', '​20% de descuento en taller experimental de ceramica.10% en taller intensivo o workshop de tazas.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor) al correocolorastral@gmail.comwww.instagram.com/colorastralInfo Talleres.pdf', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CHILESCALANDO', '​25% de descuento en los servicios de:Curso de iniciación en escalada deportiva en monolargo.Experiencia de escalada en roca.Más información con: Víctor Sáez / +569 8598 0467IG@chilescalandoRevisa los cursos aquí:Curso de escalada​Curso Top-rope y desequiparExperiencia de escaladaTécnicas de autorescate', 'Cursos', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Librería Nacional', 'Obtiene un 20% de descuento, válido para tiendas físicas y compras a través de la web.Para compras online, utiliza el códigouniversidad_mayorPara descuento en tiendas físicas, debes mostrar tu credencial de la App Mundo Mayor.Promoción válida del 01 de junio hasta el 31 de julio.', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ESTACIONAMIENTO ZENIT', 'Ticket diario U. Mayor a $ 4.000 IVA incluido, para la jornada completaAbono Mensual 24/7 a $85.000 IVA incluido, mes completo.Eliodoro Yáñez 1250, Providencia', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('M3STORAGE', '20% descuento los primeros 3 meses en arriendo de bodegas (No acumulables con otras promociones y sujeto a disponibilidad) Esto sobre el precio o valores referenciales de lista para el público consumidor.Utilizando el cupón de descuento “UMAYORM3” a través de la página web. O comunicándose directamente al +56 9 8617 4925 para solicitar el arriendo de bodega acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor).https://m3storage.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BIKEFIX', '5% en accesorios de repuestos.5% de descuento en compra de bicicletas cualquier medio de pago, no es acumulable con otras promociones.Enviar copia del certificado de alumno regular al correo bikefixchile@gmail.comwww.bikefix.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLETA SOS', '15% de descuento en todos los servicios de mantención de bicicletas utilizando el código "umayor" al agendarlo por la web.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de la App Mundo Mayor.cleta1.sos@gmail.comwww.cletaSOS.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VIÑA CASA DONOSO', 'Entre 20 y 50% en vinos y productos.10% de descuento en actividades enológicas (Visitas guiadas, tour, etc) en sucursal Talca. 10% de descuento en arriendo de Instalaciones para eventos corporativos.Maria Jose Torres+56 9 5684 5204mariajose.torres.anc@gmail.comwww.instagram.com/vinacasadonoso/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VIÑA SUTIL', '40% de descuento sobre el precio de lista de los productos comercializados por TWG a través de la plataforma utilizando el código de descuento “UMAYOR2025”, cuyo uso es ilimitado y se mantendrá vigente hasta el 1º de marzo de 2026.www.bardecopas.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('OTIUM', '20% de descuentoacreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de del Mundo Mayor en las tiendas presenciales o genera un cupón de descuento vía DM en su cuenta de Instagram.⁣⁣www.instagram.com/otium.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SABA', '10% descuento sobre el total de la compra.No acumulables con otras promociones. En la página web, ingresando el cupón de descuento "SABAUMAYOR10"En los puntos de venta presenciales (Santiago Centro y San Carlos de Apoquindo), acreditando el vínculo con la Universidad, a través de app Mundo Mayor y CI.San Antonio N°140 LC 54-56, Paseo San Agustín, Santiago.Avenida Plaza 651, LC 23,Segundo piso, San Carlos de Apoquindohttps://saba.cl/categorias-productos/estudiantes/universidad-mayor/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CALPER', '15% de descuento para compras en tiendas y web, utilizando el código de descuento "UMAYOR2025". Para estudiantes del área de la salud en uniformes clínicos y calzado. (No válido para calzado Skechers y Birkenstock).Manquehue: Los Militares 6020, Las Condes.Portugal: Av. Portugal 191, Santiago.Providencia: Antonio Varas 303, Providencia.Estoril: Estoril con Paul Harris.Viña: Calle Viana 273, Viña del Mar.www.calper.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SCORPI', '15% de descuento sobre el precio de lista o precio normal (no aplica sobre descuentos, ni costo de despacho).Compra utilizando código de descuento "UMAYORSCORPI15%". O directamente en las tiendas físicas, presentando certificado de alumno regular o pantallazo del perfil de la App Mundo Mayor.www.scorpi.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MADE IN MARRUECOS', '15 % descuentosobre el total de la compra utilizando el código "UMAYOR_15DCTO".No acumulables con otras promociones. Excluye viajes.www.madeinmarruecos.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LIVE, LOVE, ROCK ON!', '​15% descuentosobre el total de la compra utilizando el código "UMAYOR2020".', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ÓPTICA SWITCH', '20% de descuentoen lentes Monofocales.10% de descuentoen lentes Bifocales y/o MultifocalesExamen visual gratis por la compra de un lente.Av. Walker Martínez 2011, local C, La Florida.Enrique Olivares 1331, La Florida.Av. Consistorial 2069, Peñalolén.', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BCI', 'Plan Universitario costo $0 de Mantención.Cuenta digital BciCuenta MACHAtención preferencial con ejecutivo asignado.Contacta a tu Gestor de Convenios Renata Silva Richardson +569 6597 7848 renata.silva@bci.clPlan Universitarios Enero.pdfwww.conveniosbci.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SAMSUMG', 'Hasta 50% de descuento en campaña Back to School (se destaca el Galaxy S24 128GB con 51%dcto).Para acceder a estos beneficios debes registrar su mail institucional. Luego de validar el registro podrán acceder a una cuenta con la que podrán comprar con atractivos descuentos.https://www.samsung.com/cl/multistore/estudiantes_chile/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MUNDO ROMS', '10% de descuento en productos seleccionados de las siguientes categorías:- Consolas y Videojuegos Retro- Juguetes Retro- Artículos Cultura Pop- Librería y PapeleríaPara acceder al precio en convenio, enviar certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor) al correo: contacto@mundoroms.comwww.mundoroms.com/convenios', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SMARTFIX', 'Servicio Técnico Smartphone y Venta de Accesorios ​​10 % descuento sobre el total de la compra.No acumulables con otras promociones.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de de la App Mundo Mayor.www.instagram.com/smartfix.empresarial', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('logo_1211-Gotech.jpg', '15% de descuento sobre el total de la compra (no acumulable con otras promociones)Aplicable sólo a Suministros Recotoner (Toner, Tintas y Drum)Código: UMAYORhttps://recotoner.cl/discount/UMAYORIGwww.instagram.com/recotoner.cl/', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('GEORUSTON', '10% de descuento en venta online de sus productos, ingresando el código "UMAYOR23" al momento de la compra en la pagina webwww.georuston.cl​Venta online de insumos geológicos. ​​​Más información en IG​@georuston​', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LIBRERÍA SAN BORJA', '7% de descuento sobre el total de la compra igual o superior a $5.000.Ubicada en: Av. Portugal 38, Torre 5, Local 1, Santiago.Más información al IG:@libreriasanborja', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LIBROOS', '10% de descuento por compras realizadas a través de la web, ingresando el código "ConvenioUMayor"www.libroos.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('DIARIO FINANCIERO', '​50% descuento para el plan de suscripción DF digital premium anual utilizando el código de descuento "UMAYORDF"Suscríbete aquí:https://www.df.cl/suscripciones-umayor', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('GARMIN', '​20% de descuento en toda la tienda utilizando el código "GARMINYUMAYOR". No acumulable con otras promociones.www.garminstore.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BEAUTY JUNE', '​15% de descuento sobre el total de la compra.No acumulable con otras promociones. Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular, certificado laboral o pantallazo del perfil de Intranet (App Mundo Mayor).Compras en WhatsApp : (+56) 936481992www.instagram.com/beautyjune.cl', 'Tiendas y Servicios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('TEATRO MUNICIPAL', 'Descuento en la compra de entradas para espectáculos presenciales en Teatro Municipal de Santiago.Puedes comprar vía online utilizando el código de descuento "UMAYOR"Para venta presencial en boleterías del Teatro debes presentar un certificado que acredite la condición de alumno o bien exhibir la App Mundo Mayor, junto a su cédula de identidad.El beneficio es aplicable máximo 2 entradas por título.No es acumulable con otras promociones Calendario_Teatro Municipal.pdfFunciones con convenio.docxwww.municipal.cl', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('GOOLFY', 'Tarifa especial a $8.000pesos de lunes a viernes: 12.00 - 22.00hrs y sábados, domingos y festivos : 10.00 - 22.00hrs.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de del Mundo Mayor.Para más información o para reservar su visita contactarse al +56968354052 o por correo electrónico agoolfy@virtualracing.clwww.goolfychile.cl', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SALA K', 'Precios preferentes en las diferentes exhibiciones, acreditando el vínculo con la Universidad, a través de app Mundo MayorEstudiantes U. Mayor: $1.000Colaboradores/as y Alumni: $2.000www.salak.cl', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SALA TEATRO U.MAYOR', 'Precios preferentes en las diferentes obras, compras en boletería, acreditando el vínculo con la Universidad, a través de app Mundo MayorEstudiantes Teatro U. Mayor: $1.000Estudiantes U. Mayor (otras carreras): $3.000 Colaboradores/as y Alumni: $4.000Santo Domingo 711, Santiagowww.instagram.com/saladeteatroumayor', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BHANGA CLIMING', '2x1 en los pases diarios en horario bajo (de 10.00 a 16.00hrs).Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de la App Mundo Mayor de forma presencial.Av. Consistorial 2100, Mall Alto Peñalolénwww.instagram.com/bhangaclimbing', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('GIMNASIO EL MURO', '15% de descuento en escalada de prueba.15% de descuento en pase libre en horario Eco.15% de descuento en mensualidad Eco.15% de descuento en plan “10 tickets estudiante” todo horario.10% de descuento en clases de escalada en horario Eco.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de de la App Mundo Mayor presencialmente en la recepción.Avda Larrain 6228, La ReinaBHANGA CLIMING', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('TEATRO AZARES', '$5.298 para obras y $2.700 para obras de títeresCompra de las entradas online utilizando el código "BENUMAYOR" .También compras directamente en boleterías acreditando el vínculo con la Universidad, a través de app Mundo Mayor.Teatro Azares - Cartelera marzo 2025.pdfwww.teatroazares.cl', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VALLE NEVADO', 'Temporada 2025 aun no comienza.', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PARQUE FARELLONES', 'Temporada 2025 aun no comienza.', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('EL COLORADO', 'Temporada 2025 aun no comienza.', 'Recreación y Entretención', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SMARTFIT', '14% de descuento en Plan Black, utilizando el código en la web.Solicitar el código al correo dae@umayor.cl mandando un pantallazo de la credencial digital (App Mundo Mayor) o certificado alumno regular.Códigos limitados.Todas las sucursales del país.https://www.smartfit.cl/', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MEGAFITNESS', 'Descuento en sus diferentes planes.Acreditación del vínculo con la Universidad Mayor con un certificado de alumno regular o perfil de la aplicación Mundo Mayor contratando directamente en la sucursal (descuentos exclusivos Sucursal Manuel Montt).Matricula $10.000 anual.Plan Anual: $249.990Plan Semestral: $150.000Plan Trimestral: $90.000Plan Trimestral: $28.990Av. Manuel Montt 50, Providencia.www.instagram.com/megafitnessmanuelmontt', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ESPACIO VUELA', 'Matricula gratuita y 10% de descuento sobre planes de disciplinas (clases de Pole Sport, Aerial yoga, Pilates Zen, Kick Boxing, K-pop, Hip-Hop, Cotemporáneo, Dance Lab, Reggaeton, Girly, Flexibilidad Freestyle).No acumulable con otras promociones. Acreditando pertenencia a Universidad Mayor con un certificado de alumno regular o pantallazo del perfil de Mundo Mayor al correocontacto@espaciovuela.clRevisa los horarios de las clasesAQUÍ', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('INALTUM FITNESS', 'Descuento fijo sobre el total del plan.Contratación del servicio con el personal presente en recepción.No acumulable con otras promociones.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular, certificado laboral o pantallazo del perfil de Intranet (App Mundo Mayor).Avenida Miguel Claro 109, Providenciawww.inaltum.cl', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SPORTLIFE', 'Valores preferenciales en planes por sectores y zonas.Promoción de 7 días de FreePassRevisar documento de valoresVALORES 2024.pdfContacto: Julia Vidal / Cuentas Corporativas / jvidal@sportlife.cl / +56 9 57280769www.sportlife.cl', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CAMP FIT GIRLS', '15% de descuento para participar en las diferentes clases que ofrecen.Clase de prueba gratis. Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular, certificado laboral o pantallazo del perfil de Intranet (App Mundo Mayor).Bustamante 642, Ñuñoa (Metro Irarrázaval o Sta. Isabel)www.campfitgirls.cl', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('GIMNASIO UPGRADE', 'Descuento en sus diferentes planes.Acreditación del vínculo con la Universidad Mayor con un certificado de alumno regular o perfil de la aplicación Mundo Mayor si contrata en mesón. Contratando en web utilizar código del plan que se quiere contratar.Plan Anual: UMAYORANUALPlan Semestral: UMAYORSEMPlan Trimestral: UMAYORTRIMVálido en todas las sucursales del país.https://www.gimnasiopacific.cl/', 'Gimnasios', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLÍNICA ODONTOLÓGICA EVEREST', '​Evaluación y Diagnóstico con Radiografía Panorámica sin Costo.62% descuento en prestaciones dentales frecuentes.55% descuento en el resto de las prestaciones dentales.Descuentos sin tope ni deducible.Descuento válido en prestaciones dentales, excluye Laboratorios, Pabellón, Informes Radiológicos e insumos.Los descuentos NO son acumulables con otros convenios y/o promociones vigentes.Acreditando pertenencia a Universidad Mayor debes mostrar un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor).Todas las sucursales.www.instagram.com/clinicaeverest/', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('EMS PROVIDENCIA', '35% de descuento en electroestimulación.35% en HIIT.15% Nutricionista.20% Quiropractico.Para acreditar pertenencia a Universidad Mayor debes mostrar un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor).Antonio Varas 175, oficina 902, ProvidenciaEMS 2024.pdfwww.emsprovidencia.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CEOI', 'Campañas con descuentos exclusivos mensuales:Hasta el 30 de abril examen de diagnóstico costo $0. Destartaje supragingival + radiografía panorámica $60.000Republica Arabe de Egipto 250, Of 2, Las Condes.https://ceoi.cl/', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LABYSALUD', '$5.000 de descuento en Toma de muestras de Exámenes a Domicilio:Exámenes de laboratorio: más de 300 examenes de sangre, orina y cultivo.Exámenes cardiológicos: electrocardiograma (ECG), Holter de ritmo/arritmia, holter de presión, ecocardiograma.Realizados por enfermeraLaboratorios acreditadosResultados en horas vía mail o WhatsAppEl descuento se hará efectivo previa acreditación del vínculo con la Universidad Mayor presentando certificado de alumno regular y perfil de la aplicación Mundo Mayor.Descuento aplicable a estudiantes U Mayor y sus familias.Cobertura: rm + v regiónHorario de atención: De lunes a viernes, excepto festivos. No acumulable con otras promociones.www.labysalud.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLINICA DENTAL ALBA', 'Hasta un 60% de descuento en diferentes servicios:- Diagnóstico gratuito.- 60% de descuento Limpieza Dental.- 50% de descuento Blanqueamiento Dental e Interconsulta.- Tratamiento de Ortodoncia. Valor preferencial detallado en Anexo N°1- Otros Tratamientos Dentales, descuento de un 50% al monto total del tratamiento.Arancel Alba anexo 1_2024.pdfHolanda 099, oficina 304, Providenciawww.clinicadentalalba.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('NORDEN', '25% de descuento en todas las prestaciones clínicas (excepto laboratorio) Si están afiliados a Caja Los Andes, obtienen un 5% adicional, sumando hasta 30% de descuento total en todas las prestaciones.- Pack de Bienvenida: $69.000, incluye consulta de diagnóstico, pack rayos (panorámica + bitewing lateral), higiene (con destartaje completo y profilaxis).- Campañas con descuentos exclusivos.www.clinicasnorden.cl/', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('QUIERO MI EXAMEN', '50% de descuento en la orden médica quedando a un valor de $2.245 cada orden médica.Promoción no acumulable con otros descuento.Utilizando el código de descuento"UMAYOR"en la web.www.quieromiexamen.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CETEP', '15% descuento en productos de la farmacia sobre el precio de venta al público, sin considerar promociones o descuentos vigentes. Valores preferenciales en atenciones online.Para hacer efectivo este beneficio se entregará un Código de Descuento que será válido para los beneficiarios de la empresa y será requerido al momento del pago en la web.Balmoral 309, Nivel -2 Local 201, Las Condes.Nueva Los Leones 200, Providencia.Av. Libertador Bernardo O´Higgins 420, Rancagua.Chacabuco 799, Concepción.Cuatro Oriente 108, Viña del Mar.https://cetep.cl/', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ACHS', 'Precios preferentes de atención en salud mental (online y presencial), traumatología, kinesiología, rayos y medicina general.ParaSalud MentalParaTraumatología, Kinesiología y RayosParaMedicina GeneralRevisaInstructivo Pago ACHS.pdfpara los pacientes que sean Fonasa en el link de la página webwww.achs.cl/salud-no-laboral/convenios', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ARTEMISA SALUD MENTAL', 'En Artemisa somos un equipo comprometido con entregar soluciones a las necesidades de salud mental y aportar a la formación clínica de psicólogos y psicólogas. Buscamos entregar un servicio de excelencia, con altos estándares de calidad.¿Cuándo ir al psicólogo/a?:En la psicoterapia se abordan temas de tu vida que te preocupan, para descubrir soluciones y reforzar los recursos personales. En el caso niños/as y adolescentes, la psicoterapia involucra también trabajar con sus familias. Existen múltiples estudios científicos que respaldan la efectividad de la psicoterapia, considerándose un tratamiento basado en la evidencia.Algunas de las situaciones en que se sugiere consultar son:• Si tienes un problema que no has podido solucionar, a pesar de haberlo intentado de distintas formas.• Si percibes que no tienes control sobre lo que ocurre en tu vida cotidiana.• Si te sientes disconforme con tu vida.• Si presentas dolencias físicas que no tienen explicación médica (somatizaciones).• Si presentas alguno de los siguientes síntomas o situaciones: estrés, ansiedad, depresión, duelo, impulsividad, desregulación emocional, problemas de autoestima, entre otros.Buscar ayuda de un psicólogo/a puede facilitar el manejo de desafíos en la vida cotidiana. No esperes a situaciones críticas; consultar temprano hará el proceso más fácil y mejorará tu bienestar.Para acceder al beneficio: Contáctanos a contacto@artemisasaludmental.cl o escríbenos a nuestroWhatsApp +56 9 32046633, indicando que eres estudiante de la Universidad Mayor. Para ello, deben enviar una foto de tu certificado de alumno/a regular.www.instagram.com/artemisasaludmental/?hl=es', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('UN RINCÓN DEL ENCUENTRO', 'Atención psicológica online con un valor de$18.000 por sesión.Correspondiente a un 28% de descuento del valor original de la sesión ($25.000).Centro de Atención Psicológica comprometido con la salud mental de la población de todas las edades, desde un enfoque de género y enfoque afirmativo. Contamos con profesionales capacitadas/es para el trabajo con neurodivergencias.Somos un grupo conformado por psicologas/psicologues, e intentamos entregar un espacio seguro y de confianza para cualquier proceso.Inscribiéndote allink exclusivo UMwww.instagram.com/unrincondelencuentro', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('HENK-CO', 'Red de Atención Psicológica Henk-co.Presta los servicios de:Acompañamiento psicológicoPsicoterapiaPsicoeducaciónUn descuento de $7.000 CLP, desde la modalidad online, y un descuento de $11.000 desde la modalidad presencial.Para acceder a este beneficio sólo debes ingresar a la web, solicitar la hora y poner el código "CONVENIOMAYOR" en el motivo de consulta luego el/la psicólogo/a asignado te pedirá un pantallazo de tu perfil mayor.https://henkco.cl/PDF informativo con valores + misión.docx.pdf', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLÍNICA TOMÁS MORO', '30% de descuento sobre el valor de los servicios de consultas ambulatorias en las siguientes especialidades: • Medicina General • Medicina Interna • Fonoaudiología: Adulto e Infantil • Kinesiología: Adulto e Infantil • Psicología: Adulto e Infantil • Terapia Ocupacional: Adulto e Infantil • Nutrición: Adulto, Infantil y DeportivaDicho descuento se hará efectivo previo acreditación del vínculo con la Universidad Mayor al correo con un certificado de alumno regular o perfil de la aplicación Mundo Mayor.Ubicación: Apoquindo 7331, Oficina 411, Las CondesHorarios: lunes a viernes de 09:00 a 21:00 / sábado de 09:00 a 12:30Correo:recepcion@clinicatomasmoro.clTeléfono: +56997696360https://clinicatomasmoro.cl/(Estos son precios particulares y luego se le aplica el reembolso)', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CENTRO INTEGRAL PLAZA DE ARMAS', '15% de descuento sobre el total de la compra del servicio.Dicho descuento se hará efectivo previo acreditación del vínculo con la Universidad Mayor al correo contacto@centroentrointegralplazadearmas.cl con un certificado de alumno regular o perfil de la aplicación Mundo Mayor.Calle San Antonio #486, Oficina 151. Piso 15Precios y detalles convenio Centro de atención integral Plaza de Armas Universidad Mayor.pdfwww.centrointegralplazadearmas.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LEVIMED', 'Porcentaje de descuento sobre el valor total de cada servicio,en relación al precio o referencial de lista para el público consumidor. Dicho descuento no es acumulable con otras promociones.Neveria 4672, Las Condeswww.levimed.cl', 'Salud y Estética', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PEREGRINO COFFEE', '10% de descuento sobre el total de la compra. No acumulable con otras promociones.Acreditando pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor).Direcciones:- Loreley 114, La Reina.- Av. Apoquindo 7014, Las Condeswww.peregrinocoffee.cl​​', 'Gastronomía', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('TURBUS', 'Precios preferenciales que permite a los estudiantes viajar de lunes a domingo, en cualquier horario, desde el 1 de marzo hasta el 15 de diciembre de 2023.A través de la web, ingresandoaquí. El descuento se reflejará automáticamente al momento de ir a pagar, siempre y cuando hayas escogido el tramo asociado a tu inscripción.Debes inscribirteAQUÍpara obtener el beneficio.', 'Viajes, Hoteles y Trasporte', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PIE MONTE', 'Hotel Olmué20% descuento Temporada Baja (Marzo a Junio y Agosto a Noviembre)10% descuento Temporada Alta (Julio ; Diciembre a Febrero)Enviando el certificado de alumno regular al correoinfo@piemontehotel.clsolicitando información.CONDICIONES RESERVAS PIE MONTE.pdfwww.instagram.com/piemontehotelolmuewww.piemontehotel.cl', 'Viajes, Hoteles y Trasporte', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('RED HOTELERA', 'Operadora de reservas10% de descuento sobre tarifas rack de los diferentes hoteles.WhatsApp : (+56) 973889424 - (+56) 974477872Teléfonos (+56) 44 8909220 - (+56) 225860992Horario De Atención: De Lunes a Viernes desde las 09:00 a 18 hrs.www.instagram.com/redhotelera', 'Viajes, Hoteles y Trasporte', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CABAÑAS LAS AÑAÑUCA', '11% de descuento sobre el total de la compra.Promoción no acumulable con otros descuentos.Para reservar debes acreditar pertenencia a Universidad Mayor, con un certificado de alumno regular o pantallazo del perfil de Intranet (App Mundo Mayor) enviando un correo ainfo@cabanasananucas.clwww.cabanasananucas.cl', 'Viajes, Hoteles y Trasporte', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MARINA TEMUCO', 'Presta los servicios de elaboración y venta de sal de mar con distintas especias, entregando productos 100% naturales y libre de aditivos.10% de descuento en toda la línea de productos de Marina Temuco, este descuento podrá ser utilizado durante todo el año, aplica para venta online y ventas presenciales en ferias. (Excluye puntos de ventas físicos).15% de descuento para estudiantes y funcionarios en el día de su cumpleaños. El descuento solo aplica para venta online y ventas presenciales en ferias. (Excluye puntos de venta físicos).www.instagram.com/marinatemuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('RESTAURANTE FRUTAL TEMUCO', 'Gastronomía GourmetIncluimos en tu almuerzo económico: consomé/crema/sopa (Según disponibilidad del día).15% de descuentoen el valor de la carta (Temuco - Curacautín).20% de descuentoen zona de reuniones y fiestas (Temuco - Curacautín).Gratis zona de recambio de vestuario en temporada de nieve (Curacautín).Regalo de cumpleaños, si agendas tu celebración con nosotros.Solo debes validarte con tus credenciales #umayor. No acumulable con otras promociones.Reservas +56997471269.Dinamarca #691, local 4 y 5, Temuco.www.instagram.com/frutal_temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LA HOLANDESA CAFÉ', 'Presta los servicios de Cafetería.Capuccino 2x1 los lunes hasta las 14.00hrs.Café más galletón vegano $4.000.Challa tradicional + jugo/café $8.000Café/Chocolate caliente + Gateau $6.000Babka + helado $4.000www.instagram.com/laholandesacafe/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('RAMI', 'Presta los servicios de venta de productos Coreanos15% de descuento en compras sobre el valor del catálogo.25% de descuento en el día de tu cumpleaños (Acreditando con tu Cédula de Identidad).www.instagram.com/rami.temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('STILE ISABELLA', 'Presta los servicios de venta de joyas y accesorios.10% de descuento en toda la tienda.20% de descuento por compras sobre $35.000 (no acumulable)2x1 y envío gratis exclusivo en el día de tu cumpleaños (válidadndo con cédula de identidad).www.instagram.com/stile.isabella/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('TERRAPADEL Y CROSSFIT', 'Presta los servicios de arriendo de canchas de Pádel y CrossfitLunes a viernes: 08.00 a 18.00hrs $8.000 / 18.00 a 00.00hrs $15.000.Fines de semana: todo el día $8.000Préstamos de palas y pelotas Sin costo.Box CrossFit:www.instagram.com/terrapadelaraucania/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ZANAHOLIVA', 'Presta los servicios de venta de alimentos saludables.10% de descuentoen toda la carta.Regalo de Cumpleaños:podrás pedir jugo, bebida, café o té. Debes validarlo con tu cédula de identidad.www.instagram.com/zanaholiva/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('W1 TEMUCO', 'Presta los servicios venta oficial Winkler Nutrition y Revitta Wellness de Temuco15% de descuento sobre el precio o valor referencial.18% de descuento en cualquier producto de la tienda, en el día de tu cumpleaños.www.instagram.com/w1.temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('UP FIT TEMUCO', 'Presta los servicios de gimnasio para mujeres.10% de descuento en horario de 08.00 a 14.00hrs.Agenda tu clase de prueba Gratis.www.instagram.com/upfit.temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VOLTA ROASTERS', 'Presta los servicios de Cafetería30% de descuento en Promoción de: Café caliente + selladito - de 08.30 a 10.00hrs.10% de descuento en "Promoción de Almuerzo", bebida + wrap a elección - de 13.00 a 14.30hrs.20% de descuento base si llevas tu vaso para la bebida de tu preferencia.Beneficios exclusivos en el día de tu cumpleaños.Descuentos exclusivos en café de grano en formato de 250grs,www.instagram.com/voltaroasters/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CENTRO DE BIENESTAR KÖHLER', 'Presta los servicios de sesiones de Psicoterapia.20% de descuento en el valor de las sesiones de Psicoterapia.50% de descuento adicional enl a primera sesión.www.instagram.com/tuversionpositiva/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SEXSHOP TOY HOT', 'Presta los servicios de artículos y juguetes para adultos10% de descuento en compras superiores a $15.000 a todos los de la carrera obstetricia y puericultura.10% de descuento en compras superiores a $20.000Un lubricante básico de 5ml de regalo por cada compra superior a $15.000www.instagram.com/sexshop_toyhot/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ARADELI SABORES', 'Presta los servicios de distribución de chocolates artesanales.5% de descuento en todos sus productos.www.instagram.com/aradelisabores/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VALENTINNA', 'Presta los servicios de venta de joyas y accesorios.15% de descuento en el total de su compra a alumnos.10% de descuento en el total de su compra a docentes y colaboradores.www.instagram.com/valentinna.chile/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CUTE STUFF SPA', 'Presta los servicios de venta de artículos de librería y bazar.20% de descuento en todos los productos, excepto en magnetic notes y magnetic pads.10% de descuento en magnetic notes y magnetic pads.www.instagram.com/cute.stuff.temuco/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('NATURISTA', 'Presta los servicios de comida saludable para servir o llevar, taler como: bowl de ensaladas, wrap, platos calientes, etc. Con opciones vegetarianas, veganas, sin gluten, entre otras.10% de descuento en bowl, wrap y jugos naturales todos los miércoles de cada mes.Exclusivo para alumnos: en el día de tu cumpleaños solicita tu jugo natural de regalo por la compra de cualquiera de nuestros productos.www.instagram.com/naturistafood/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('YASSER AZAR', 'Presta los servicios de:1- Evaluación y diagnóstico quiropráctico2- Tratamiento quiropráctico basada en técnicas de alta velocidad y baja amplitud3- Tratamiento de descomprensión de columna para tratamientos de hernias y discopatías15% de descuento en los tratamientos quiroprácticos20% de descuento en los tratamientos quiroprácticos en el día de tu cumpleaños (con cédula de identidad)www.instagram.com/yasser_azar/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('EYOUKINE', 'p>Presta los servicios de Rehabilitación kinésica integral y masaje terapéutico• 15% de descuento en masajes relajantes y/o descontracturantes.• 15% de descuento en evaluación y diagnóstico.• 20% de descuento en el mes de tu cumpleaños en masajes relajantes y/o descontracturantes (presentando cedula de identidadwww.instagram.com/eyoukine/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VERA NAPOLI', 'Presta los servicios de Restaurante y alimentación• Menú ejecutivo, de lunes a viernes, de 12:30-16:00 horas, a $6.990• 10% descuento en productos que no entran en promoción de menú ejecutivo (pasta rellena y pizza tamaño tradicional)www.instagram.com/veranapoli.cl/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SUBLICRAFT STUDIO', 'Agendas personalizadas, estampados de polerones, poleras, morrales, tazones, etc; cotillón personalizado para distintos eventos, papelería (como tarjetas de presentación, stickers, tags, impresión de libros).• 15% en agendas• 10% en estampados• 10% en productos de papelería como stickers, cotillón, tarjetas, etcwww.instagram.com/sublicraft_studio/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SERVITECA DE LUCA', 'p>Presta los servicios de Alineación, Balanceo, Cambio de aceite, Frenos, Neumáticos, Baterías, Scanner automotriz, Mecánica rápida (pastillas de frenos, rectificado de discos, embalatado, repuestos en general), Lavado full,K Pulido, Lavado de tapiz, Sellado cerámico.• 10 % de descuento en todos nuestros productos• 20% de descuento en el día de tu cumpleañoswww.instagram.com/servitecadeluca/', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SELLO.PINK', 'Presta los servicios de tratamiento de belleza cosmético para las uñas.• Todos los jueves con un 15% de descuento en esmaltados permanentes y uñas softgel.www.instagram.com/sello.pink', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MAITHAI', 'Presta los servicios gastronómicos de comida tailandesa, con patente de restaurant, contando con mesas interiores y terraza exterior, prestando un servicio de calidad y ofreciendo una experiencia única para nuestros clientes.• Alumnos: 15% de descuento en la carta.• Funcionarios: 10% de descuento en la carta.www.instagram.com/maithai_cl', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LOVELY MANTEQUILLAS', 'Presta los servicios de comercialización y elaboración de mantequillas de frutos secos, snacks veganos y libres de azúcar.• 10 % de descuento en todos nuestros productos• 20% de descuento en el día de tu cumpleañoswww.instagram.com/lovely.mantequillas', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LA QUADRADA PIZZA', 'Presta los servicios de venta de pizza, sándwiches y empanadas.• 15% de descuento en la compra de cualquier producto sobre los $10.000.• Compras inferiores a los 10.000 tienen un 10% descuento de base.• Lunes y martes pizza pepperoni familiar a $7.990.www.instagram.com/laquadradapizza', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AAMAAL FIT', '​Presta los servicios de comercialización de ropa deportiva de mujer y hombre Compras online y presenciales.• 15% de descuento en todos nuestros productos.www.instagram.com/aamaal.fit', 'Temuco', 'Universidad Mayor', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Lounge', '20% dto. adicional sobre el precio vigente, todos los domingos.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Taringa', '40% dto. todos los sábados de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Imared', '20% dto. todos los días en pagos presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Poliglota', 'Hasta 76% dto. para estudiar idiomas', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Solar Fotovoltaica', '4 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Kaya Unite', '40% dto. presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Rally Kart', 'Hasta 40% dto. en vueltas todos los días presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Bodeguita Miguel Torres', '50% dto. los viernes de junio con tu Tarjeta Visa Infinite', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Wendys', 'Viernes 30% dto. en compras presenciales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Espacio Caju – Stay and play café', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Exclusivo Clientes Plan Océano', '40% dto. en grandes marcas de vestuario y calzado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Exclusivo Clientes Plan Cordillera', '30% dto. en grandes marcas de vestuario y calzado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ULTIMATE FITNESS', '20% dto. adicional todos los jueves del mes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Brando', '25% dto. lunes presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MacOnline Apple', 'Lo mejor de Apple en 4 a 24 cuotas sin interés con tus Tarjetas de Crédito del Chile', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Danubio Azul', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('DO SUSHI', '20% dto. jueves y viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Trattoria Santtino', '20% dto. martes y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Prima Bar', '20% dto . todos los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('El Nuevo Arriero', '20% dto. lunes a viernes horario almuerzo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Divina Comida', '20% dto. miércoles a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Under Armour', '40% dto. viernes 13 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Hush Puppies', '40% dto. viernes 13 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CAT', '40% dto. jueves 12 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Columbia', '40% dto. jueves 12 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Rockford', '40% dto. miércoles 11 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Crocs', '40% dto. martes 10 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Merrell', '40% dto. martes 10 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Zapatos.cl', '40% dto. lunes 09 de junio en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cassis', '20% dto. los lunes en "Cafetería" de la carta "Para Tomar"', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Nikola', 'Paga en 4 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Teatro Mori', '30% dto. en obras', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Majestic', '30% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Lineatre', '20% dto. los lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Yokono Sushi', '35% dto. lunes a miércoles en retiro y delivery', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Glam & Co', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('iO', '20% dto. todos los días en compra presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ZOO YORK', '30% dto. todos los lunes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BondUP', '6 meses gratis de psicología, telemedicina y entretenimiento.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Hands & Company', '30% dto. en servicios presenciales los días lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('FLIXBUS', '25% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Toke', '20% dto. en compras presencial y online todos los lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bodega Parma', '40% dto. todos los lunes de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Kiara', '50% dto. todos los lunes de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Rappi', 'Disfrutar un nuevo sabor cada día', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('TERRA FORCE', '20% dto adicional. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SNOW FORCE', '20% dto adicional. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AQUA FORCE', '20% dto adicional. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('DELTAMOTORS', '20% dto. todos los días presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('De Flores y Floreros', '10% dto. miércoles presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BO Concept', '15% dto. en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('7Veinte', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Flux Solar', 'Compra tu planta solar de 6 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('EnelX', 'Paga en 13 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLUB DE PADEL DE LA FLORIDA', 'Hasta 25% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MOTA', '25% dto. en compras online todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CAFFARENA', '30% dto. en compras online todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('GRAVAT', '30% dto. todos los días online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('DBS', '20% dto. todos los miércoles en compra online con tus Tarjetas del Chile.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Marathon', '20% dto. adicional presencial y online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('El Naturalista', 'Hasta 20% dto. en compra presencial lunes y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PLANT ME', '20% dto. presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Zona Verde', 'Hasta 20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Green Glass', '15% dto. en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ÜÑÜ', '20% dto. online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Biobrush', '25% dto online todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Maríabooth', '15% dto. todos los días en compra online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Movistar', 'Paga en 13 hasta 24 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Specialized', 'Paga 4 a 12 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Entel', 'Paga en 13 a 18 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AUFBAU', 'Paga en 13 a 24 cuotas sin interés con tus Tarjetas de Crédito del Chile', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Samsung', 'Paga hasta en 24 cuotas sin interés en compra online y tiendas.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Calcetines Bacanes', '20% dto. en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Trauko', '15% dto. todos los días en sitio web', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MARLEY COFFEE', '35% dto los miércoles online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ChileLentes', 'Hasta un 25% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Rotter y Krauss', 'Hasta 35% dto. martes en compra presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bouden', '20% dto. martes online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Fête Chocolat', '20% dto. los lunes presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MDF', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Doite', '20% dto. en compras presenciales y online todos los martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tommy Beans', 'Miércoles 40% dto. a través de la App de cada marca y 30% dto. en compras presenciales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('TESSA', '20% dto. jueves presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AV ODONTOLOGÍA', 'Hasta un 60% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Restaurante Ana María', '20% dto. miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bar Imperial', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BANGKOK THAI', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ari Nikkei', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ramblas', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Don Teo Santiago', '20% dto. viernes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Japón Ya', '20% dto. miércoles y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Barrica 94', '50% dto. todos los jueves de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Capogrossi', '50% dto. los martes de junio con tu Tarjeta Visa Infinite', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Transvip', '15% dto en servicios', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Green Lab', '20% dto. jueves a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Vietnam Dicovery', '20% dto. martes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Cocina de Javier', '30% dto. los martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Novu', '20% dto. los días lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PECES DE CIUDAD', '20% dto. miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Casona Del Virrey', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Fabrics', 'Hasta 40% dto. en ropa de cama y baño', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bao Bar', '40% dto. todos los sábados de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Expendio', 'Hasta 30% dto. sábados y domingos', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Restaurante Isabella', '20% dto. martes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BAR PLAZA', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Gorilas', '20% dto. jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Uber Eats: McDonald’s', 'Los martes obtén 40% dto. en McDonalds', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('China Wok', 'Viernes 30% dto. en compras presenciales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('KFC', 'Jueves 30% dto. en compras presenciales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Doggis', '40% dto pidiendo por la App y 30% dto presencial los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Juan Maestro', '40% dto pidiendo por la App y 30% dto presencial los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Dunkin’', '30% dto. lunes y miércoles en compra presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Taringuita Mall Sport', '40% dto. todos los martes de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PAD THAI', '40% dto. todos los miércoles de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Verde Sazón', '40% dto. todos los miércoles de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Vicenzo', '40% dto. todos los jueves de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Casa Morera', '40% dto. todos los jueves de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ruca Bar', '40% dto. todos los viernes de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Porfirio', '40% dto. todos los domingos de junio', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Car Broker Chile', 'Hasta 25% dto. en servicios presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('DR SMILE', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLICKEPP', '20% dto. todos los días online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Barra', 'Beneficios exclusivos todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Burano', '15% dto adicional. todos los días online y presencial.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BENETTON', '20% dto. lunes a jueves en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ultimate Clothing', '25% dto. adicional los días martes y jueves.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Copas y Cervezas', '25% dto. en planes semestrales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ASH', '20% dto. todos los días presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('L´Occitane', '20% dto. los miércoles, jueves y viernes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bazhars Alfombras', '10% dto. adicional en compra online y presencial todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Revesderecho', '20% dto. miércoles en compras online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Nevada Novias', '15% dto. todos los días presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clinica Everest', 'Paga en 7 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tika', '30% dto. todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Al Pesto', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Asia Skincare', '20% dto. los miércoles presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bellapiel', '20% dto. lunes a jueves en servicios', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Centro Odontológico Dr. Alvaro Peña Páez', 'Hasta 35% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Aesthetic Place Dr. Roy Sothers', '15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ONEDENT', 'sobre el arancel de ONEDENT', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CARBEL COFFEE & PASTRY', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ma Griffe', '20% dto. todos los días en compras online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LA PIZZARRA', 'lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Farmex', 'Hasta 20% dto. en compra online todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Local Burger', '20% de dto. viernes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLARO', 'Paga en 13 a 18 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Nuna Restaurante', '15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PET FAMILY', 'Hasta 15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Trayecto Bookstore', '20% dto. lunes y martes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Sushiban', '25% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ISTANWOOL', '10% dto. adicional en compra presencial todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Maria La Biyux', '20% dto online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Dominga Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cafetería Le Grand de La Fete Dólares Premio', 'Consumo por $30.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Casa Morera Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CONEY JUMP + YUKIDS', '35% dto. En los 40 minutos de juego todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tirua Bar Restorán', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CEVICHAZO 102', '20% dto. lunes, viernes y sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Peluquería Francesa', '20% dto. lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SABOR Y AROMA', '20% dto. lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Infiltrados', '20% dto. martes, miércoles y sábados', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Biferia', '20% dto. lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clínica Versalles', 'Hasta 50% dto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SUSHI THAI', '20% dto. lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('511 The Hemingway Room', '20% dto. lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tropicalia', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CONFITERIA LARBOS', '20% dto. lunes, martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clínica Bast', '20% dto. martes y miércoles presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Carolina Varela', 'Paga en 4 a 12 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Caleta la Reina', '25% dto. miércoles y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('NOLIA', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BAR ENIGMA', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Make Make', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CHIAROSCURO PANORAMICO', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ZAIKA COMIDA INDIA', '20% dto. los sábados', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CASAGIARDINO', '20% dto. martes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PAWER', 'Hasta 18% dto. en contratación de planes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('El Ají Seco Maipú', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Kechua', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VERDE SAZÓN', '25% dto de lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SOCIEDAD O306', '20% dto. los martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tigre Bravo', 'lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VistAndes', '20% dto. lunes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AquaChile', '20% dto los jueves online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Azaleia', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ESTACIONAMIENTO AUTOPARK', '20% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Deysa Care', '20% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tortas Amelia', '20% dto todos los días online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Minata Clean Beauty', '20% dto los martes online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Taco Bell', '40% dto los jueves presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Nosu', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('TUA', '20% dto. los miércoles en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('María Pompón', '15% dto. adicional lunes y miércoles presencial y online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Dily', 'Hasta 30% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AutoExpertos', '25% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ProwashGo', '20% dto lunes a sábado online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('icarcheck', '20% dto todos los días online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('GOOTA', '20% dto. en alimentos probióticos', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('FCO Motor Services', '25% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Mercado Carozzi', 'Desde 20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Zenclinic dental', '30% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('EVERLAST', '30% dto. todos los lunes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Petrizzio', '30% dto. jueves y viernes en petrizzio.cl', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ancares Café', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('3INA', '20% dto. martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cine Star', 'Canjea hasta el 100% con tus Dólares-Premio.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Eshopex', '20% dto. en flete internacional.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tanaka Vitacura Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('All Play Kids Zone', '20% dto. lunes a viernes de manera presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Laqu', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CONSERBAR', '20% dto. miércoles y sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Carl’s Jr.', '20% dto. todos los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Fashion''s Park', 'Hasta 25% dto. adicional en compra online y presencial.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Quiero Mi Masaje', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Gaes', 'Paga en 13 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('HIFI', '4 a 24 cuotas sin interes.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('WOM', 'Paga en 13 a 24 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VTR', 'Paga en 13 a 18 cuotas sin interés todos tus equipos nuevos', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Horwin', 'Paga en 13 a 24 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CNO', 'Paga en 7 a 12 cuotas sin interés tus tratamientos odontológicos en clínicas pertenecientes a CNO', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Be electric', 'Paga en 6 a 24 cuotas sin interés todos los días en productos.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Abastible', 'Paga en 13 a 24 cuotas sin interés', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('LA MURTA', '20% dto. viernes a domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Burger vs Pizza', '20% dto. viernes, sábado y domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('EMPIRICO', '20% dto. los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SABOR X2', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Saki', '20% de dto. martes y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Bonaerense', '20% dcto. de lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('HELADERIA LARRS', '30% dto. los días lunes pagando con tus Tarjetas del Chile', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Buffet Express', '20% dto. Lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SmellWell', '20% dto. en compras online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Keds', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Hush Puppies Kids', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Mountain Hardwear', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bsoul', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Billabong', '20% dto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BURTON', '20% dto. miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Orquídea', '25% dto. los días lunes en compras presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ToGo', '25% dto. Todos los días en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bigos', 'Todos los viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BUG ME', 'Todos los días en compra online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clínica Dental Santorini', '50% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Maison Niche', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Jansport', '20% dcto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Calpany', '20% dcto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Element', '20% dcto. los miércoles, jueves y viernes en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AKALI', 'Hasta 40% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Koychi Korean Street Food', '25% dto. todos los miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Pizzeria Capri Dólares Premio', 'Consumo por $30.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Capogrossi Dólares Premio', 'Consumo por $80.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Restaurante Hotel Magnolia Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Áurea Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Majestic Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tanaka La Dehesa Dólares Premio', 'Consumo por $80.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Cocina de Javier Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('YMA Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cocoa Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Zanzíbar Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clínica Abedules', 'Paga en 4 a 12 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Pitísimas', '20% dto. todos los días en pitisimas.cl', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLÍNICA ESTÉTICA BIEN ÊTRE', 'Hasta 20% dto en limpiezas faciales, masajes y tratamientos corporales.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Amandine Bistró Dólares Premio', 'Consumo por $80.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cafetería Espresso Dólares Premio', 'Consumo por $10.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ciudadano Dólares Premio', 'Consumo por $50.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Tabla Dólares Premio', 'Consumo por $40.000', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BSoul', '20% dcto. miércoles, jueves y viernes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SURISTA', '20% dto. viernes, sábado y domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Sabores del Perú', '20% dto. lunes, martes y sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Favara', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SELVADO', '20% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('GALPÓN ALONSO', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('YOYO TEA', '20% dto. Todos los días en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tienda Friosur', '20% dto. todos los lunes, martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Geomar', '20% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Viña Clos de Luz', '30% dto. Todos los días en compra online y tours degustación', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Europa Secreta', '20% dto. Todos los días en compra online y presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BIGU', '20% dto. Todos los días en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Canasta Raíces Sanas', '20% dto. en compras online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Alma Salud', 'Hasta 30% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tendencias Gourmet', '20% dto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Lola Lash', 'Hasta 25% dto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('VIOLETA RESTAURANT', '20% dto. martes y jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('THAI EXPRESS', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MALEVOLO PIZZA', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Hacienda el Llano', '20% dto. Martes y Miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('California Cantina', '20% dto. Lunes, martes y domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('RUGENDAS', '20% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MALDITO ARROZ', '20% dto. lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('B BAR', '20% dto. Viernes y sábado.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Castillo Hamburgo', '20% dto. Martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Quercus', '20% dto. los martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Paladar Restobar', '20% dto. martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Emporio San Marco', '20% dto. los lunes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Olivia Trattoria', '20% dto. lunes y viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Lomo de la Fuente', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Sabores del Ají Seco', '20% dto. Lunes, martes y sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Green Poke', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cinque Pizza Restaurant', '25% dto. martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SENIOR SUITES', 'Hasta 15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Fondo de Cultura Económica', '25% dto en compra presencial y online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('KEYPA', '40% dcto. Todos los días en compra online.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CIRCUS BARBER SHOP', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('TRATUR', '22% dcto. Todos los días en compra online', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AC Odontología', '50% de descuento.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ciudad Vieja', '20% dto. martes y miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ZenClinic', 'Paga tu tratamiento odontológico en 4 a 12 cuotas sin interés.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Citadelle', '20% dto. martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('First Security', '60% dcto. todos los dias', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('YALE', '20% dto. En toda la tienda.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Mattarello', '20% dto. lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clínica Agua', 'Hasta 40% dto. En tratamientos presenciales todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ALMAPIEL', '20% dto. adicional todos los días en compra online y presencial.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clínica Ortodoncia Antonella Sivori', 'Hasta 35% dto. En prestaciones seleccionadas', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLINICA NACE', '15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Saint Patrick´s Day', '15% dto. todos los lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Pollo Rey', '20% dcto. en delivery de lunes a jueves.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('BurgerBeef', '20% dcto. en delivery de lunes a jueves.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Néctar Deco', '20% dcto. Todos los días en compras presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ocarrol Rent a Car', '30% dto. En arriendos de vehículos', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MUEBLES EL CIPRÉS', 'Hasta 20% dcto Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Velvet Bakery', '20% dto. de lunes a jueves de 10:00 a 19:00 hrs', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Smartdent', 'Hasta 60% dto. En prestaciones presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CELIV', '20% dcto los días martes.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ENGINTEL', '20% dto en programas Let´s learn together', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Viña Espaldares del Maipo', '20% dto. En compras presenciales', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Boga', '20% dto. Lunes a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Preu Filadd', '20% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Pesca De Los Mekis', '30% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MY FAMILY PETS', 'Hasta 15% dto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Preuniversitario Pedro de Valdivia', '20% dto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('SANASALUD', 'Hasta 65% dcto. Todos los lunes y martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Padel Mundo Sport', '20% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clínica CRL', 'Hasta 50% dcto.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Mantraa Unisex Salon & Spa', '20% dcto. Lunes y Martes en todos los servicios', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Varvacoa', 'Hasta 20% dcto. todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('CLINICA ESTÉTICA MI MANTRA', '20% dto todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bar Medanoso', '20% dto. Lunes a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Restaurant Urbano 136', '20% dto. sábado a lunes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('DHouse', '20% dcto. miércoles, jueves y viernes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Caprese', '20% dto. Lunes a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ambar Deco', '20% dto. En compras presenciales de lunes a sábado', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Mandala Food & Bar', '20% dto. lunes a sábado de 17:00 a 22:00 Hrs', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('MARDELI', '20% dto martes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('La Casona del Ají', '20% dto. lunes a jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Brookman', '20% dto. de lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ceiba', '20% dto. todos los jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Club de San Miguel', '20% dto. lunes a miércoles', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Funsport', '20% dcto. miércoles, jueves y viernes en compra presencial', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('ICA RESTAURANTE', '20% dto. sábado y domingo', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Taproom Tübinger', '20% dto. los Jueves', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('QB Restaurant Bar', '30% dto los sábados y domingo y 20% dto. lunes a viernes.', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('PF CHANGS', '20% dto. de lunes a viernes', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Pisco Bou Legado', 'Hasta 15% dto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Clínicas Odontologicas Everest', 'Hasta 64% dcto. Todos los días', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Oasi di Bellezza', '40% de descuento en depilación Láser Soprano Ice', 'Beneficios Bancarios', 'Banco de Chile', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Starbucks', '30% dcto. todos los martes y miércoles', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Castaño', 'Aprovecha las promociones desde $2.800 todos los días', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Wild Foods', 'Dctos. online en productos seleccionados', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Papa Johns', '25% de dcto. en el total de tu boleta', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Farmacia Fracción', '10% dcto. Compras online en bioequivalentes.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Natura', '30% OFF adicional los viernes', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Farmacia Ahumada', 'Descuentos en compras presenciales.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Beauty Plus', '30% dcto. en todas las compras online.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Late', 'Dctos. en productos y recargas de botellones', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('miCoca-Cola.cl', '25% de dcto. en el total de tu boleta, al comprar online', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Klean Kanteen', 'Hasta 30% dcto. en limitesur.cl y tiendas físicas', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Belsport', '20% de Dcto. en Belsport', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Kylie Minogue', 'Kylie Minogue - Movistar Arena \n12 de agosto 2025', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Chayanne', 'Chayanne - Movistar Arena \n 20, 21 y 23 de agosto 2025', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Katy Perry', 'Estadio Bicentenario de la Florida. \n 6 de septiembre 2025', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Hozier', 'Movistar Arena \n 24 de mayo de 2025', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Entrelagos', '15% de dcto. en compras realizadas de manera online', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Corrales del Sur', '15% dcto. embutidos y línea hogar todos los lunes.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Mamut', '20% OFF en toda la carta de Restaurant Mamut', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Green Lab', '15% dcto de sábado a miércoles en toda la carta', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Local Burger', '25% de dcto. de Domingo a Martes.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Do Sushi', '25% de dcto. de Domingo a Martes.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Tommy Beans', '30% Descuento en todo el menú de lunes a jueves', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Juan Maestro', '30% Descuento en todo el menú de lunes a jueves', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Rappi', '90% dcto en envíos por 3 meses', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Franchute', '20% dcto en la barra los martes y miércoles', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Restaurante Olivia', '15% Dcto.Restaurante Olivia en toda la carta', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bar el callejón', '20% Dcto. de domingo a miércoles', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Just Burger', '30% en Just Burger Lunes, Martes, Jueves y Domingo', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Hola Ola', '20% dcto. en cafetería', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Doggis', '30% dcto en todo el menú de lunes a jueves', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Escuela de Surf Maintencillo', 'Dcto. en clases y arriendo de equipo', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Easycancha', '3 meses de prueba gratis con suscripción PRIME', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Parques Outlife', 'Dctos. en Parques RKF El Durazno y Outlife Chamisero', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('The Body Shop', '15% Dcto. en productos The Body Shop', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Glam & Co', '20% de descuento de lunes a jueves en salones.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ibis', '15% Dcto.en IBIS Concepción', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ópticas Schilling', '20% dcto. en lentes ópticos y sol', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Assist Card', '10% dcto. adicional sobre la tarifa vigente', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Taller F', '20% dcto. personaliza y renueva tu closet', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Bamers', '20% de dcto. en web y tienda', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Oakley', '20% dcto. en web y tienda.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Super Zoo', 'Hasta 20% Dcto. en Tienda Online', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ripley', 'Hasta 30% en vestuario hombre, mujer, infantil.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Marathon', '10% dcto. adicional los martes', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Parque Aventura', '20% dcto. en entradas a Parque Aventura', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Aventura Kids', '20% Dcto. En aventura Kids', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Kidzania', '20% dcto. en entradas', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cinemark', 'Dctos. especiales en entradas y confitería', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Roda', '15% dcto. en www.roda.cl', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Mut', 'Disfruta de los descuentos de BICIHUB MUT', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('eClass', '40% dcto. en diplomados eClass Academy', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Karün', '25% dcto. en anteojos de sol', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Freemet', 'Descuentos exclusivos en compras online', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Copec Voltex', '10% dcto. en servicio de cargador', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Ecocitex', '25% en el total de la compra', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Chiletur Copec', '15% dcto. en productos disponibles en chile.tur.com', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('FlixBus', '20% de dcto. en la compra de pasajes', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Turbus', '15% Dcto. En compras online', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cabify', '4 viajes por mes por usuario con 15% dcto. tope $2.000', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Euro Rent a Car', '30% dcto en arriendo de cualquier vehículo', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Cóndor Bus', '15% dcto. En compras online www.condorbus.cl', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Linkin Park', 'Estadio Nacional \n 2 de noviembre, 2025', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Rauw Alejandro', 'Movistar Arena \n 14 octubre, 2025', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Sundeck - Bob Moses', 'Espacio Riesco,Gran Salón \n 13 de Junio', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Green Day', 'Parque Estadio Nacional \n 30 agosto, 2025', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Sundeck - The Grid', 'Espacio Riesco�\n 30 agosto, 2025', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('AkiKB', '25% dcto. en arriendo de MINIBODEGAS por 3 meses.', 'Club Entel', 'Entel', 'Sin ubicación', '');
-INSERT INTO benefits (name, description, category, provider, location, image_url) VALUES ('Blue Express Copec', '20% dcto. En envíos prepagos.', 'Club Entel', 'Entel', 'Sin ubicación', '');
+COMMIT;
@@ -0,0 +1,279 @@
+"""
+Resolución de comercios entre proveedores
+
+Agrupa los beneficios del catálogo consolidado (y de los CSV de proveedores
+que se agreguen con --csv) en comercios: "Starbucks" de Entel y de Banco de
+Chile, "Farmacia Ahumada" y "Ahumada", etc. Para no comparar todos contra
+todos, cada beneficio se asigna a bloques por:
+
+- nombre normalizado completo
+- cada token significativo del nombre (sin palabras genéricas como club,
+  tienda o restaurant, ni tokens que se repiten en muchos beneficios)
+- dominios web del comercio que aparecen en la descripción (www.koe.cl → koe)
+  y el último segmento de la URL del beneficio cuando nombra al comercio
+  (entel.cl/beneficios/descuentos/comida/starbucks)
+
+Solo se comparan pares dentro de un mismo bloque, y los bloques de más de
+MAX_BLOCK beneficios (tokens demasiado comunes) se descartan. Los pares que
+coinciden se unen con union-find y el resultado se guarda en
+migrations/merchants.json como comercio → beneficios y beneficio → comercio.
+
+    python migrations/merchants.py construir --csv entel/data/benefits_entel.csv
+    python migrations/merchants.py comercio "starbucks"
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from itertools import combinations
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import metrics
+from common.delta import normalize_title
+from common.text import tokenize
+
+DIR_SCRIPT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INDEX = os.path.join(DIR_SCRIPT, 'merchants.json')
+
+MAX_BLOCK = 200
+
+# Fracción mínima de tokens compartidos; con 0.5 "Exclusivo Clientes Plan Océano" y
+# "... Plan Cordillera" (3 de 5) quedaban como un mismo comercio
+MIN_JACCARD = 2 / 3
+
+# Un token presente en más de esta fracción de los beneficios (mínimo 5) es
+# parte de un programa o categoría ("Dólares Premio") y no identifica comercio
+COMMON_TOKEN_FRACTION = 0.01
+
+# Palabras que aparecen en nombres de comercios distintos (ya normalizadas por tokenize)
+GENERIC_TOKENS = {
+    'club', 'tienda', 'restaurant', 'restaurante', 'cafe', 'bar', 'hotel', 'centro', 'spa',
+    'farmacia', 'ltda', 'chile', 'store', 'shop', 'online', 'presencial', 'descuento', 'dcto', 'dto',
+    'the', 'and', 'beneficio', 'sucursal', 'express', 'grupo', 'mall', 'plaza',
+}
+# Dominios que son del proveedor o de servicios genéricos, no del comercio
+IGNORED_DOMAINS = {'bci', 'entel', 'bancochile', 'umayor', 'instagram', 'facebook', 'gmail', 'google', 'wa'}
+DOMAIN = re.compile(r'(?:https?://)?(?:www\.)?([a-z0-9-]+)\.(?:cl|com|net|org|la)\b', re.I)
+# Sufijo aleatorio de las URL de detalle de BCI (…-zbuen2)
+URL_ID_SUFFIX = re.compile(r'-[a-z0-9]*\d[a-z0-9]*$')
+
+
+def merchant_tokens(name):
+    return {token for token in tokenize(name) if token not in GENERIC_TOKENS and not token.isdigit() and len(token) > 1}
+
+
+def url_slug(url):
+    """Último segmento de la URL si parece el nombre de un comercio (una o dos palabras)"""
+    if not url:
+        return ''
+    segment = urlparse(url).path.rstrip('/').rsplit('/', 1)[-1]
+    segment = URL_ID_SUFFIX.sub('', segment)
+    return segment.replace('-', ' ') if 0 < segment.count('-') + 1 <= 2 else ''
+
+
+def description_domains(text):
+    return {match.lower() for match in DOMAIN.findall(text or '') if match.lower() not in IGNORED_DOMAINS}
+
+
+def blocking_keys(record):
+    keys = set()
+    if record['normalized']:
+        keys.add('n:' + record['normalized'])
+    keys.update('t:' + token for token in record['tokens'])
+    keys.update('d:' + domain.replace('-', '') for domain in record['domains'])
+    # El nombre compacto también se indexa como dominio (KOE ↔ www.koe.cl)
+    if record['compact']:
+        keys.add('d:' + record['compact'])
+    return keys
+
+
+def is_match(a, b):
+    """Mismo comercio: mismo dominio, o nombres cuyos tokens coinciden o se contienen
+
+    Un nombre de un solo token contenido en otro solo cuenta si el otro
+    empieza por él (Olivia ↔ Olivia Trattoria, pero no Isabella ↔ Stile
+    Isabella): con union-find un par de más une grupos enteros.
+    """
+    if a['domains'] & b['domains']:
+        return True
+    if a['compact'] and (a['compact'] == b['compact'] or a['compact'] in b['domains']):
+        return True
+    if b['compact'] and b['compact'] in a['domains']:
+        return True
+    ta, tb = a['tokens'], b['tokens']
+    if not ta or not tb:
+        return False
+    smaller, larger = (a, b) if len(ta) <= len(tb) else (b, a)
+    small, large = smaller['tokens'], larger['tokens']
+    if small <= large and sum(len(token) for token in small) >= 5:
+        if small == large or len(small) > 1 or larger.get('first') in small:
+            return True
+    return len(ta & tb) / len(ta | tb) >= MIN_JACCARD
+
+
+class UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def prepare(rows):
+    records = []
+    for row in rows:
+        name = ' '.join((row.get('title') or row.get('name') or '').replace('\u200b', ' ').split())
+        provider = row.get('provider') or row.get('bank') or ''
+        name_tokens = merchant_tokens(name)
+        ordered = [token for token in tokenize(name) if token in name_tokens]
+        compact = re.sub(r'[^a-z0-9]', '', normalize_title(name))
+        records.append({
+            'key': f"{normalize_title(provider)}:{normalize_title(name)}",
+            'name': name,
+            'provider': provider,
+            'category': row.get('category', ''),
+            'url': row.get('url', ''),
+            'normalized': ' '.join(sorted(name_tokens)),
+            'compact': compact if len(compact) >= 3 else '',
+            'tokens': name_tokens | merchant_tokens(url_slug(row.get('url'))),
+            'ordered': ordered,
+            'domains': {domain.replace('-', '') for domain in description_domains(row.get('description'))},
+        })
+    return records
+
+
+def resolve(rows):
+    """Agrupa los beneficios en comercios; retorna (registros, lista de grupos de índices)"""
+    records = prepare(rows)
+    frequency = Counter(token for record in records for token in record['tokens'])
+    limit = max(5, COMMON_TOKEN_FRACTION * len(records))
+    common = {token for token, count in frequency.items() if count > limit}
+    for record in records:
+        record['tokens'] -= common
+        record['first'] = next((token for token in record['ordered'] if token not in common), None)
+
+    blocks = defaultdict(list)
+    for i, record in enumerate(records):
+        for key in blocking_keys(record):
+            blocks[key].append(i)
+
+    uf = UnionFind(len(records))
+    compared = set()
+    skipped = 0
+    for key, members in blocks.items():
+        if len(members) > MAX_BLOCK:
+            skipped += 1
+            continue
+        for a, b in combinations(members, 2):
+            if (a, b) in compared or uf.find(a) == uf.find(b):
+                continue
+            compared.add((a, b))
+            if is_match(records[a], records[b]):
+                uf.union(a, b)
+    metrics.incr('pairs_compared', len(compared))
+    metrics.incr('blocks_skipped', skipped)
+
+    groups = defaultdict(list)
+    for i in range(len(records)):
+        groups[uf.find(i)].append(i)
+    return records, list(groups.values())
+
+
+def merchant_slug(name):
+    return re.sub(r'[^a-z0-9]+', '-', normalize_title(name)).strip('-')
+
+
+def build_index(rows):
+    records, groups = resolve(rows)
+    merchants = {}
+    by_benefit = {}
+    for group in groups:
+        # El nombre del comercio es el más frecuente del grupo, y entre empates el más corto
+        names = Counter(records[i]['name'] for i in group)
+        name = min(names, key=lambda n: (-names[n], len(n), n))
+        slug = base_slug = merchant_slug(name) or 'sin-nombre'
+        n = 2
+        while slug in merchants:
+            slug, n = f'{base_slug}-{n}', n + 1
+        merchants[slug] = {
+            'name': name,
+            'providers': sorted({records[i]['provider'] for i in group}),
+            'benefits': [{field: records[i][field] for field in ('key', 'name', 'provider', 'category', 'url')}
+                         for i in group],
+        }
+        for i in group:
+            by_benefit[records[i]['key']] = slug
+    return {'merchants': merchants, 'by_benefit': by_benefit}
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolución de comercios entre proveedores")
+    parser.add_argument('--indice', default=DEFAULT_INDEX)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('construir', help="Agrupa los beneficios en comercios")
+    build_parser.add_argument('--csv', action='append',
+                              help="CSV de entrada (se puede repetir; por defecto migrations/benefits.csv)")
+
+    lookup_parser = subparsers.add_parser('comercio', help="Beneficios de un comercio")
+    lookup_parser.add_argument('nombre')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'construir':
+        metrics.start_run('merchants')
+        rows = []
+        for path in args.csv or [os.path.join(DIR_SCRIPT, 'benefits.csv')]:
+            rows.extend(_read_csv(path))
+        with metrics.span('resolve'):
+            index = build_index(rows)
+        tmp_path = args.indice + '.tmp'
+        with metrics.span('json_write'), open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, args.indice)
+        metrics.record_file_written(args.indice)
+        shared = sum(1 for merchant in index['merchants'].values() if len(merchant['providers']) > 1)
+        print(f"✓ {len(rows)} beneficios agrupados en {len(index['merchants'])} comercios "
+              f"({shared} con más de un proveedor) en {args.indice}")
+        metrics.finish_run()
+        return 0
+
+    if not os.path.exists(args.indice):
+        print(f"✗ No existe el índice {args.indice}; ejecuta primero: python migrations/merchants.py construir")
+        return 1
+    with open(args.indice, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    slug = merchant_slug(args.nombre)
+    merchant = index['merchants'].get(slug)
+    if merchant is None:
+        matches = [s for s in index['merchants'] if s.startswith(slug)]
+        merchant = index['merchants'][matches[0]] if matches else None
+    if merchant is None:
+        print(f"✗ No se encontró el comercio {args.nombre}")
+        return 1
+    print(f"{merchant['name']} ({', '.join(merchant['providers'])})")
+    for benefit in merchant['benefits']:
+        print(f"  [{benefit['provider']}] {benefit['name']} ({benefit['category']})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Índice de búsqueda de texto completo sobre el catálogo consolidado
+
+Construye un índice SQLite FTS5 a partir de migrations/benefits.csv para no
+tener que buscar con LIKE '%...%' sobre descripciones largas. El texto se
+normaliza antes de indexar y con las mismas reglas al consultar (ver
+common/text.py): minúsculas, sin tildes, separando palabras pegadas por el
+scraping, sin palabras vacías y con plurales simples reducidos.
+
+Cada término de la consulta se busca como prefijo, así que "fotog" encuentra
+"fotografía". Uso:
+
+    python migrations/search_index.py construir
+    python migrations/search_index.py buscar "descuento cursos" --proveedor "Universidad Mayor"
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import metrics
+from common.text import normalize, tokenize
+
+DIR_SCRIPT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INDEX = os.path.join(DIR_SCRIPT, 'search.sqlite')
+
+COLUMNS = ['name', 'description', 'category', 'provider', 'location', 'image_url']
+
+# Peso de cada columna indexada en el ranking bm25 (name, description, category)
+WEIGHTS = (5.0, 1.0, 2.0)
+
+
+def build_index(csv_filename='benefits.csv', index_filename=DEFAULT_INDEX):
+    """Construye el índice en un archivo temporal y lo reemplaza al terminar
+
+    Así las consultas en curso siguen leyendo el índice anterior hasta el final.
+    """
+    ruta_csv = os.path.join(DIR_SCRIPT, csv_filename)
+    tmp_path = index_filename + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    conn.execute('PRAGMA journal_mode = OFF')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute(f"CREATE TABLE benefits (id INTEGER PRIMARY KEY, {', '.join(c + ' TEXT' for c in COLUMNS)})")
+    # Contentless: el texto original queda en benefits y el índice solo guarda los términos
+    conn.execute("""
+        CREATE VIRTUAL TABLE benefits_fts USING fts5(
+            name, description, category,
+            content='', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+    """)
+
+    count = 0
+    with metrics.span('index_build'), open(ruta_csv, newline='', encoding='utf-8') as csvfile:
+        batch = []
+        for row in csv.DictReader(csvfile):
+            count += 1
+            batch.append((count, row))
+            if len(batch) == 1000:
+                _insert_batch(conn, batch)
+                batch = []
+        _insert_batch(conn, batch)
+        conn.execute("INSERT INTO benefits_fts (benefits_fts) VALUES ('optimize')")
+        conn.commit()
+    conn.close()
+    os.replace(tmp_path, index_filename)
+
+    metrics.incr('rows', count)
+    metrics.record_file_written(index_filename)
+    print(f"✓ Índice creado en {index_filename} ({count} beneficios)")
+    return count
+
+
+def _insert_batch(conn, batch):
+    conn.executemany(f"INSERT INTO benefits (id, {', '.join(COLUMNS)}) VALUES (?{', ?' * len(COLUMNS)})",
+                     [(i, *(row.get(c, '') for c in COLUMNS)) for i, row in batch])
+    conn.executemany('INSERT INTO benefits_fts (rowid, name, description, category) VALUES (?, ?, ?, ?)',
+                     [(i, normalize(row.get('name')), normalize(row.get('description')), normalize(row.get('category')))
+                      for i, row in batch])
+
+
+def build_query(query):
+    """Convierte el texto del usuario en una consulta FTS5 (todos los términos, como prefijo)"""
+    return ' '.join(f'"{term}"*' for term in tokenize(query))
+
+
+def search(query, limit=20, provider=None, category=None, index_filename=DEFAULT_INDEX, conn=None):
+    """Busca beneficios; retorna dicts con las columnas del CSV y score (menor es mejor)"""
+    match = build_query(query)
+    if not match:
+        return []
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(f'file:{index_filename}?mode=ro', uri=True)
+    try:
+        sql = f"""
+            SELECT {', '.join('b.' + c for c in COLUMNS)}, bm25(benefits_fts, {', '.join(map(str, WEIGHTS))}) AS score
+            FROM benefits_fts JOIN benefits b ON b.id = benefits_fts.rowid
+            WHERE benefits_fts MATCH ?
+        """
+        params = [match]
+        if provider:
+            sql += ' AND b.provider = ?'
+            params.append(provider)
+        if category:
+            sql += ' AND b.category = ?'
+            params.append(category)
+        sql += ' ORDER BY score LIMIT ?'
+        params.append(limit)
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        if own_conn:
+            conn.close()
+    return [dict(zip(COLUMNS + ['score'], row)) for row in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Índice de búsqueda de beneficios (SQLite FTS5)")
+    parser.add_argument('--indice', default=DEFAULT_INDEX, help="Archivo del índice")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('construir', help="Construye el índice desde el CSV")
+    build_parser.add_argument('--csv', default='benefits.csv')
+
+    search_parser = subparsers.add_parser('buscar', help="Busca en el índice")
+    search_parser.add_argument('consulta')
+    search_parser.add_argument('--proveedor')
+    search_parser.add_argument('--categoria')
+    search_parser.add_argument('--limite', type=int, default=10)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'construir':
+        metrics.start_run('search_index')
+        build_index(args.csv, args.indice)
+        metrics.finish_run()
+        return 0
+
+    if not os.path.exists(args.indice):
+        print(f"✗ No existe el índice {args.indice}; ejecuta primero: python migrations/search_index.py construir")
+        return 1
+    start = time.perf_counter()
+    results = search(args.consulta, args.limite, args.proveedor, args.categoria, args.indice)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for result in results:
+        description = ' '.join(result['description'].replace('\u200b', ' ').split())
+        print(f"{result['score']:8.2f}  [{result['provider']}] {result['name']} ({result['category']})")
+        print(f"          {description[:110]}")
+    print(f"\n{len(results)} resultados en {elapsed_ms:.2f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
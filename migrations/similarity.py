@@ -0,0 +1,402 @@
+"""
+Beneficios similares ("beneficios como este") con TF-IDF disperso
+
+construir vectoriza título + descripción del catálogo consolidado
+(migrations/benefits.csv) con TF-IDF sobre los tokens de common/text.py y
+precalcula los k vecinos más cercanos (coseno) de cada beneficio. Las
+similitudes se calculan por bloques de filas (producto de matrices dispersas
+por bloque + argpartition sobre los puntajes distintos de cero), así que la
+memoria queda acotada por el tamaño del bloque y no por N². Los términos que
+aparecen en más del 20% de los beneficios no cuentan para la similitud.
+
+actualizar aplica un CSV de cambios (el *_delta.csv de --delta, o cualquier
+CSV con los beneficios nuevos o modificados) sin reconstruir todo: las filas
+modificadas o borradas quedan como lápidas, las nuevas se agregan al final y
+solo se recalculan los vecinos de las filas afectadas; el resto solo compara
+su lista con las filas nuevas. Los pesos IDF se recalculan en cada
+actualización, pero las listas no afectadas conservan sus puntajes
+anteriores hasta la siguiente reconstrucción completa.
+
+    python migrations/similarity.py construir --k 10
+    python migrations/similarity.py similares "Starbucks"
+    python migrations/similarity.py buscar "descuento en cursos de idiomas"
+    python migrations/similarity.py actualizar nuevos.csv
+
+Las llaves tienen que ser las mismas al construir y al actualizar. El índice
+del catálogo usa proveedor + nombre (como builder.benefit_key), y acepta CSV
+con las columnas del catálogo. Un beneficio cuya llave se repite en el índice
+(llave#2, ...) no se puede actualizar por partes, porque el sufijo depende del
+orden del CSV completo: actualizar lo rechaza y hay que reconstruir. Los *_delta.csv de un scraper usan las llaves
+de common/delta.py (URL o título), así que van contra un índice construido
+con el mismo --proveedor:
+
+    python migrations/similarity.py --indice migrations/similarity_bci construir --csv data/benefits_bci.csv --proveedor bci
+    python migrations/similarity.py --indice migrations/similarity_bci actualizar data/benefits_bci_delta.csv --proveedor bci
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import delta, metrics
+from common.text import tokenize
+
+DIR_SCRIPT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INDEX_DIR = os.path.join(DIR_SCRIPT, 'similarity_index')
+
+# Filas por bloque en los productos de matrices
+CHUNK_SIZE = 256
+
+# Términos presentes en más de esta fracción de los beneficios (dto, 20, todos
+# los días...) no ayudan a distinguir y vuelven casi densos los productos
+MAX_DF = 0.2
+
+
+def benefit_text(row):
+    return f"{row.get('title') or row.get('name', '')} {row.get('description', '')}"
+
+
+def _summary(row, provider=None):
+    return {
+        'name': row.get('title') or row.get('name', ''),
+        'provider': provider or row.get('provider', ''),
+        'category': row.get('category', ''),
+    }
+
+
+class SimilarityIndex:
+    def __init__(self, k=10):
+        self.k = k
+        self.provider = None    # proveedor de las llaves de common/delta.py; None = llaves del catálogo
+        self.keys = []          # llave por fila; None en las filas borradas (lápidas)
+        self.records = []       # nombre, proveedor y categoría por fila
+        self.vocab = {}
+        self.tf = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.knn_idx = np.empty((0, k), dtype=np.int32)
+        self.knn_score = np.empty((0, k), dtype=np.float32)
+        self._matrix = None
+
+    @property
+    def positions(self):
+        return {key: i for i, key in enumerate(self.keys) if key is not None}
+
+    def _term_rows(self, texts, grow=True):
+        """Matriz de frecuencias (1 + log tf) de los textos; agrega términos nuevos al vocabulario si grow"""
+        indptr, indices, data = [0], [], []
+        for text in texts:
+            for term, count in Counter(tokenize(text)).items():
+                column = self.vocab.get(term)
+                if column is None:
+                    if not grow:
+                        continue
+                    column = self.vocab[term] = len(self.vocab)
+                indices.append(column)
+                data.append(1.0 + np.log(count))
+            indptr.append(len(indices))
+        return sparse.csr_matrix((np.array(data, dtype=np.float32), indices, indptr),
+                                 shape=(len(texts), len(self.vocab)))
+
+    def _idf(self):
+        active = sum(1 for key in self.keys if key is not None)
+        df = np.bincount(self.tf.indices, minlength=len(self.vocab))
+        idf = (np.log((1 + active) / (1 + df)) + 1).astype(np.float32)
+        idf[df > MAX_DF * active] = 0
+        return idf
+
+    def _weighted(self, rows):
+        """Aplica IDF y normaliza cada fila a largo 1 (el producto punto queda como coseno)"""
+        weighted = sparse.csr_matrix(rows.multiply(self._idf()), dtype=np.float32)
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms) @ weighted
+
+    def matrix(self):
+        if self._matrix is None:
+            self._matrix = self._weighted(self.tf).tocsr()
+        return self._matrix
+
+    def _top_k(self, scores, k, exclude=None):
+        """Top k por fila de un bloque disperso de puntajes; -1 donde no hay vecino
+
+        Solo se ordenan los puntajes distintos de cero de cada fila.
+        """
+        scores = scores.tocsr()
+        top = np.full((scores.shape[0], k), -1, dtype=np.int32)
+        top_scores = np.zeros((scores.shape[0], k), dtype=np.float32)
+        for r in range(scores.shape[0]):
+            start, end = scores.indptr[r], scores.indptr[r + 1]
+            values, columns = scores.data[start:end], scores.indices[start:end]
+            if exclude is not None:
+                keep = columns != exclude[r]
+                values, columns = values[keep], columns[keep]
+            if len(values) > k:
+                best = np.argpartition(-values, k - 1)[:k]
+                values, columns = values[best], columns[best]
+            order = np.argsort(-values)
+            top[r, :len(order)] = columns[order]
+            top_scores[r, :len(order)] = values[order]
+        return top, top_scores
+
+    def _neighbors_of(self, rows):
+        """Recalcula la lista de vecinos de las filas dadas, por bloques"""
+        X = self.matrix()
+        XT = X.T.tocsc()
+        for start in range(0, len(rows), CHUNK_SIZE):
+            chunk = np.asarray(rows[start:start + CHUNK_SIZE])
+            self.knn_idx[chunk], self.knn_score[chunk] = self._top_k(X[chunk] @ XT, self.k, exclude=chunk)
+
+    def build(self, rows, provider=None):
+        self.provider = provider
+        keyed = list(delta.unique_keys(provider, rows) if provider else _catalogue_keys(rows))
+        self.keys = [key for key, _ in keyed]
+        self.records = [_summary(row, provider) for _, row in keyed]
+        self.vocab = {}
+        self.tf = self._term_rows([benefit_text(row) for _, row in keyed])
+        self._matrix = None
+        self.knn_idx = np.full((len(self.keys), self.k), -1, dtype=np.int32)
+        self.knn_score = np.zeros((len(self.keys), self.k), dtype=np.float32)
+        with metrics.span('knn'):
+            self._neighbors_of(np.arange(len(self.keys)))
+        return len(self.keys)
+
+    def update(self, upserts, removed_keys=()):
+        """Aplica beneficios nuevos o modificados (lista de (llave, fila)) y borrados"""
+        positions = self.positions
+        stale = [positions[key] for key, _ in upserts if key in positions]
+        stale += [positions[key] for key in removed_keys if key in positions]
+        stale = np.array(sorted(set(stale)), dtype=np.int32)
+
+        # Lápidas: la fila queda en cero y sin llave
+        if len(stale):
+            mask = np.ones(len(self.keys), dtype=np.float32)
+            mask[stale] = 0
+            self.tf = (sparse.diags(mask) @ self.tf).tocsr()
+            self.tf.eliminate_zeros()
+            for i in stale:
+                self.keys[i] = None
+            self.knn_idx[stale] = -1
+            self.knn_score[stale] = 0
+
+        start = len(self.keys)
+        new_rows = self._term_rows([benefit_text(row) for _, row in upserts])
+        self.tf.resize((self.tf.shape[0], len(self.vocab)))
+        self.tf = sparse.vstack([self.tf, new_rows]).tocsr()
+        self.keys += [key for key, _ in upserts]
+        self.records += [_summary(row) for _, row in upserts]
+        new = np.arange(start, len(self.keys), dtype=np.int32)
+        self.knn_idx = np.vstack([self.knn_idx, np.full((len(new), self.k), -1, dtype=np.int32)])
+        self.knn_score = np.vstack([self.knn_score, np.zeros((len(new), self.k), dtype=np.float32)])
+        self._matrix = None
+
+        # Filas que apuntaban a una lápida: su lista se recalcula completa
+        affected = np.zeros(len(self.keys), dtype=bool)
+        affected[new] = True
+        if len(stale):
+            affected |= np.isin(self.knn_idx, stale).any(axis=1)
+        affected_rows = np.flatnonzero(affected)
+        with metrics.span('knn'):
+            self._neighbors_of(affected_rows)
+            self._merge_new_neighbors(new, ~affected)
+        return len(new), len(stale)
+
+    def _merge_new_neighbors(self, new, rows_mask):
+        """Mezcla las filas nuevas en las listas de vecinos que no se recalcularon"""
+        if not len(new):
+            return
+        X = self.matrix()
+        new_T = X[new].T.tocsc()
+        rows = np.flatnonzero(rows_mask & np.array([key is not None for key in self.keys]))
+        for start in range(0, len(rows), CHUNK_SIZE):
+            chunk = rows[start:start + CHUNK_SIZE]
+            scores = (X[chunk] @ new_T).toarray()
+            candidates = np.hstack([self.knn_idx[chunk], np.broadcast_to(new, (len(chunk), len(new)))])
+            candidate_scores = np.hstack([np.where(self.knn_idx[chunk] >= 0, self.knn_score[chunk], -np.inf), scores])
+            k = min(self.k, candidates.shape[1])
+            top = np.argpartition(-candidate_scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(candidate_scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            idx = np.take_along_axis(candidates, top, axis=1).astype(np.int32)
+            idx[top_scores <= 0] = -1
+            self.knn_idx[chunk] = idx
+            self.knn_score[chunk] = np.where(top_scores > 0, top_scores, 0)
+
+    def neighbors(self, key):
+        position = self.positions.get(key)
+        if position is None:
+            return []
+        return [dict(self.records[i], key=self.keys[i], score=round(float(score), 4))
+                for i, score in zip(self.knn_idx[position], self.knn_score[position]) if i >= 0]
+
+    def query(self, text, k=10):
+        """Top k beneficios más parecidos a un texto libre"""
+        vector = self._weighted(self._term_rows([text], grow=False)).tocsr()
+        if not vector.nnz:
+            return []
+        top, top_scores = self._top_k(vector @ self.matrix().T, k)
+        return [dict(self.records[i], key=self.keys[i], score=round(float(score), 4))
+                for i, score in zip(top[0], top_scores[0]) if i >= 0]
+
+    def find_key(self, text):
+        """Llave exacta, o la primera cuyo nombre normalizado coincide"""
+        if text in self.positions:
+            return text
+        wanted = delta.normalize_title(text)
+        for key, record in zip(self.keys, self.records):
+            if key is not None and delta.normalize_title(record['name']) == wanted:
+                return key
+        return None
+
+    def save(self, directory=DEFAULT_INDEX_DIR):
+        os.makedirs(directory, exist_ok=True)
+        sparse.save_npz(os.path.join(directory, 'tf.npz'), self.tf)
+        np.save(os.path.join(directory, 'knn_idx.npy'), self.knn_idx)
+        np.save(os.path.join(directory, 'knn_score.npy'), self.knn_score)
+        with open(os.path.join(directory, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'k': self.k, 'provider': self.provider, 'keys': self.keys, 'records': self.records,
+                       'vocab': self.vocab}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory=DEFAULT_INDEX_DIR):
+        with open(os.path.join(directory, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        index = cls(meta['k'])
+        index.keys, index.records, index.vocab = meta['keys'], meta['records'], meta['vocab']
+        index.provider = meta.get('provider')
+        index.tf = sparse.load_npz(os.path.join(directory, 'tf.npz')).tocsr()
+        index.knn_idx = np.load(os.path.join(directory, 'knn_idx.npy'))
+        index.knn_score = np.load(os.path.join(directory, 'knn_score.npy'))
+        return index
+
+
+def _catalogue_key(row):
+    """Llave del catálogo consolidado: proveedor + nombre normalizado, como builder.benefit_key"""
+    return f"{delta.normalize_title(row.get('provider', ''))}:{delta.normalize_title(row.get('name', ''))}"
+
+
+def _catalogue_keys(rows):
+    """_catalogue_key de cada fila, con #n para las repetidas (como builder.unique_benefit_keys)"""
+    seen = set()
+    for row in rows:
+        key = base_key = _catalogue_key(row)
+        n = 2
+        while key in seen:
+            key, n = f'{base_key}#{n}', n + 1
+        seen.add(key)
+        yield key, row
+
+
+def ambiguous_keys(index_keys, rows, provider=None):
+    """Llaves base de rows que no identifican una sola fila del índice
+
+    El #n de una llave repetida depende del orden de todas las filas con esa
+    llave en el CSV completo; un CSV de cambios con solo una de ellas la
+    llamaría #1 y reemplazaría el vector de otra. Son ambiguas las llaves
+    base con más de una fila activa en el índice o más de una fila en rows.
+    """
+    in_index = Counter(re.sub(r'#\d+$', '', key) for key in index_keys if key is not None)
+    bases = [delta.benefit_key(provider, row) if provider else _catalogue_key(row) for row in rows]
+    in_rows = Counter(bases)
+    return sorted({base for base in bases if in_index[base] > 1 or in_rows[base] > 1})
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def _print_results(results):
+    for result in results:
+        print(f"{result['score']:.3f}  [{result['provider']}] {result['name']} ({result['category']})")
+    if not results:
+        print("Sin resultados")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Beneficios similares con TF-IDF")
+    parser.add_argument('--indice', default=DEFAULT_INDEX_DIR, help="Directorio del índice")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('construir', help="Construye el índice y los vecinos de cada beneficio")
+    build_parser.add_argument('--csv', default=os.path.join(DIR_SCRIPT, 'benefits.csv'))
+    build_parser.add_argument('--proveedor', help="Llaves como en common/delta.py para un CSV de un proveedor")
+    build_parser.add_argument('--k', type=int, default=10)
+
+    update_parser = subparsers.add_parser('actualizar', help="Aplica un CSV de cambios sin reconstruir")
+    update_parser.add_argument('csv')
+    update_parser.add_argument('--proveedor', help="Proveedor de las filas (los *_delta.csv no lo traen)")
+
+    similar_parser = subparsers.add_parser('similares', help="Vecinos precalculados de un beneficio")
+    similar_parser.add_argument('beneficio', help="Llave o nombre del beneficio")
+
+    query_parser = subparsers.add_parser('buscar', help="Beneficios parecidos a un texto")
+    query_parser.add_argument('texto')
+    query_parser.add_argument('--k', type=int, default=10)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'construir':
+        metrics.start_run('similarity')
+        index = SimilarityIndex(args.k)
+        count = index.build(_read_csv(args.csv), args.proveedor)
+        index.save(args.indice)
+        print(f"✓ Índice de similitud creado en {args.indice} ({count} beneficios, k={args.k})")
+        metrics.finish_run()
+        return 0
+
+    if not os.path.exists(os.path.join(args.indice, 'meta.json')):
+        print(f"✗ No existe el índice {args.indice}; ejecuta primero: python migrations/similarity.py construir")
+        return 1
+    index = SimilarityIndex.load(args.indice)
+
+    if args.command == 'actualizar':
+        if args.proveedor != index.provider:
+            # Con otro esquema de llaves ninguna fila modificada reemplazaría a la anterior: quedarían duplicadas
+            built_with = f"--proveedor {index.provider}" if index.provider else "llaves del catálogo (proveedor:nombre)"
+            print(f"✗ El índice {args.indice} se construyó con {built_with}; "
+                  f"actualízalo con el mismo esquema de llaves o reconstrúyelo")
+            return 1
+        rows = _read_csv(args.csv)
+        if args.proveedor:
+            for row in rows:
+                row.setdefault('provider', args.proveedor)
+        ambiguous = ambiguous_keys(index.keys, rows, args.proveedor)
+        if ambiguous:
+            print(f"✗ {len(ambiguous)} llaves del CSV corresponden a varias filas del índice y no se sabe cuál "
+                  f"reemplazar ({', '.join(ambiguous[:5])}{', ...' if len(ambiguous) > 5 else ''}); "
+                  f"reconstruye el índice con construir")
+            return 1
+        removed = [row for row in rows if row.get('change') == 'delete']
+        upserts = [row for row in rows if row.get('change') != 'delete']
+        if args.proveedor:
+            upserts = list(delta.unique_keys(args.proveedor, upserts))
+            removed_keys = [key for key, _ in delta.unique_keys(args.proveedor, removed)]
+        else:
+            upserts = list(_catalogue_keys(upserts))
+            removed_keys = [key for key, _ in _catalogue_keys(removed)]
+        added, dropped = index.update(upserts, removed_keys)
+        index.save(args.indice)
+        print(f"✓ Índice actualizado: {added} filas nuevas o modificadas, {dropped} reemplazadas o borradas")
+    elif args.command == 'similares':
+        key = index.find_key(args.beneficio)
+        if key is None:
+            print(f"✗ No se encontró el beneficio {args.beneficio}")
+            return 1
+        print(f"Similares a {key}:")
+        _print_results(index.neighbors(key))
+    else:
+        _print_results(index.query(args.texto, args.k))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import csv
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from migrations import benefits_index
+
+
+def write_csv(path, descriptions):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['title', 'description', 'provider', 'category', 'is_active'])
+        writer.writeheader()
+        for n, description in enumerate(descriptions):
+            writer.writerow({'title': f'Beneficio {n}', 'description': description,
+                             'provider': 'Entel', 'category': 'Cursos', 'is_active': '1'})
+
+
+def test_dates_outside_the_stored_range_do_not_abort_the_build(tmp_path):
+    csv_path = tmp_path / 'benefits.csv'
+    index_path = tmp_path / 'benefits.idx'
+    write_csv(csv_path, ['Desde el 1 de enero de 1999', 'Hasta el 31 de diciembre de 2199',
+                         'Del 1 al 30 de junio de 2025'])
+
+    benefits_index.build_index(str(csv_path), str(index_path), today=date(2025, 6, 8))
+
+    index = benefits_index.BenefitIndex(str(index_path))
+    try:
+        assert index.count == 3
+        valid = [index.record(n)['title'] for n in index.valid_on(date(2025, 6, 12))]
+        assert valid == ['Beneficio 0', 'Beneficio 1', 'Beneficio 2']
+        assert [index.record(n)['title'] for n in index.valid_on(date(2025, 7, 1))] == ['Beneficio 0', 'Beneficio 1']
+    finally:
+        index.close()
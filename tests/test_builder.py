@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from migrations import builder
+
+
+def row(name, description='20% dto.', provider='Entel'):
+    return {'name': name, 'description': description, 'category': 'Cursos',
+            'provider': provider, 'location': '', 'image_url': ''}
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=builder.COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def test_same_base_key_rows_are_kept_with_suffixes():
+    keys = [key for key, _ in builder.unique_benefit_keys(
+        [row('Verde Sazón', '10%'), row('VERDE SAZÓN', '20%'), row('Verde sazon', '30%')])]
+    assert keys == ['entel:verde sazon', 'entel:verde sazon#2', 'entel:verde sazon#3']
+
+
+def test_diff_emits_inserts_updates_and_deletes(tmp_path):
+    previous = builder.load_snapshot(write_csv(tmp_path / 'previous.csv', [
+        row('Cine'), row('Café', '10%'), row('Gimnasio')]))
+    current = builder.load_snapshot(write_csv(tmp_path / 'current.csv', [
+        row('Café', '15%'), row('Gimnasio'), row('Librería')]))
+
+    changes = [(change, key) for change, key, _ in builder.diff_snapshots(previous, current)]
+
+    assert changes == [('update', 'entel:cafe'), ('delete', 'entel:cine'), ('insert', 'entel:libreria')]
+
+
+def test_unchanged_snapshot_produces_no_changes(tmp_path):
+    snapshot = builder.load_snapshot(write_csv(tmp_path / 'benefits.csv', [row('Cine'), row('CINE', 'otro')]))
+    assert list(builder.diff_snapshots(snapshot, snapshot)) == []
+
+
+def test_incremental_migration_deactivates_only_removed_keys(tmp_path):
+    previous = write_csv(tmp_path / 'previous.csv', [row('Cine'), row('Café')])
+    current = write_csv(tmp_path / 'current.csv', [row('Café')])
+    sql_path = tmp_path / 'out.sql'
+
+    counts = builder.generar_sql_desde_csv(current, str(sql_path), previous)
+
+    sql = sql_path.read_text(encoding='utf-8')
+    assert counts == {'insert': 0, 'update': 0, 'delete': 1}
+    assert "UPDATE benefits SET is_active = 0 WHERE benefit_key = 'entel:cine';" in sql
+    assert 'NOT IN' not in sql
+
+
+def test_full_load_deactivates_every_key_missing_from_the_snapshot(tmp_path):
+    current = write_csv(tmp_path / 'current.csv', [row('Café'), row("L'Atelier")])
+    sql_path = tmp_path / 'out.sql'
+
+    counts = builder.generar_sql_desde_csv(current, str(sql_path))
+
+    sql = sql_path.read_text(encoding='utf-8')
+    assert counts['insert'] == 2
+    assert ("UPDATE benefits SET is_active = 0 WHERE benefit_key IS NULL OR benefit_key NOT IN (\n"
+            "    'entel:cafe',\n    'entel:l''atelier'\n);") in sql
+    assert sql.index('NOT IN') < sql.index('INSERT INTO')
+
+
+def test_full_load_of_an_empty_snapshot_deactivates_everything(tmp_path):
+    sql_path = tmp_path / 'out.sql'
+    builder.generar_sql_desde_csv(write_csv(tmp_path / 'empty.csv', []), str(sql_path))
+    assert 'UPDATE benefits SET is_active = 0;\n' in sql_path.read_text(encoding='utf-8')
+
+
+def test_snapshot_is_promoted_only_when_the_migration_is_confirmed(tmp_path, monkeypatch):
+    base = str(tmp_path / 'snapshots' / 'benefits.csv')
+    monkeypatch.setattr(builder, 'SNAPSHOT_FILE', base)
+    applied = write_csv(tmp_path / 'applied.csv', [row('Cine')])
+    builder.guardar_snapshot(applied, base)
+    current = write_csv(tmp_path / 'current.csv', [row('Café')])
+
+    builder.guardar_snapshot(current, builder.snapshot_pendiente('out.sql'))
+
+    # Sin confirmar, la siguiente migración se sigue calculando desde lo aplicado
+    assert [key for key, _ in builder.load_snapshot(base)] == ['entel:cine']
+    assert builder.confirmar_snapshot('out.sql', base)
+    assert [key for key, _ in builder.load_snapshot(base)] == ['entel:cafe']
+    assert not builder.confirmar_snapshot('out.sql', base)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import benefit_store, delta
+
+
+def benefit(title, description='20% dto.'):
+    return {'title': title, 'description': description, 'category': 'Cursos'}
+
+
+def changes_by_kind(changes):
+    return sorted((change['change'], change['title']) for change in changes)
+
+
+def test_full_run_emits_inserts_updates_and_deletes(tmp_path):
+    state = delta.DeltaState('bci', state_dir=str(tmp_path))
+    state.apply([benefit('Cine'), benefit('Café'), benefit('Gimnasio')])
+    state.save()
+
+    state = delta.DeltaState('bci', state_dir=str(tmp_path))
+    changes = state.apply([benefit('Café', '30% dto.'), benefit('Gimnasio'), benefit('Librería')])
+
+    assert changes_by_kind(changes) == [('delete', 'Cine'), ('insert', 'Librería'), ('update', 'Café')]
+    assert not state.entries['bci:cine']['active']
+
+
+def test_partial_run_emits_no_deletes_and_keeps_missing_benefits_active(tmp_path):
+    state = delta.DeltaState('bci', state_dir=str(tmp_path))
+    state.apply([benefit('Cine'), benefit('Café')])
+
+    changes = state.apply([benefit('Café', '30% dto.')], partial=True)
+
+    assert changes_by_kind(changes) == [('update', 'Café')]
+    assert state.entries['bci:cine']['active']
+    # La siguiente ejecución completa sí lo da de baja
+    assert changes_by_kind(state.apply([benefit('Café', '30% dto.')])) == [('delete', 'Cine')]
+
+
+def test_ids_and_created_at_are_stable_across_runs(tmp_path):
+    state = delta.DeltaState('bci', state_dir=str(tmp_path))
+    first = [benefit('Cine')]
+    state.apply(first)
+    again = [benefit('Cine', 'otro texto')]
+    state.apply(again)
+    assert again[0]['id'] == first[0]['id']
+    assert again[0]['created_at'] == first[0]['created_at']
+
+
+def test_store_partial_run_keeps_missing_versions_open(tmp_path):
+    path = str(tmp_path / 'benefits.sqlite')
+    benefit_store.append_run('bci', [benefit('Cine'), benefit('Café')], '2025-03-01', path)
+
+    benefit_store.append_run('bci', [benefit('Café')], '2025-03-02', path, partial=True)
+    assert [b['title'] for b in benefit_store.as_of('bci', '2025-03-02', path)] == ['Café', 'Cine']
+
+    benefit_store.append_run('bci', [benefit('Café')], '2025-03-03', path)
+    assert [b['title'] for b in benefit_store.as_of('bci', '2025-03-03', path)] == ['Café']
+    assert benefit_store.versions_of('bci', 'Cine', path)[0]['valid_to'] == '2025-03-03'
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import history
+
+
+def entry(commit, value):
+    return {'kind': 'benchmark', 'name': 'bci', 'commit': commit, 'metrics': {'records_per_second': value}}
+
+
+def test_single_sample_baseline_is_never_significant():
+    results = history.compare([entry('a', 100.0), entry('b', 50.0)], commit='b')
+    assert len(results) == 1
+    assert results[0]['baseline_samples'] == 1
+    assert not results[0]['significant'] and not results[0]['regression']
+
+
+def test_drop_far_outside_the_baseline_is_a_regression():
+    entries = [entry('a', 100.0), entry('b', 102.0), entry('c', 98.0), entry('d', 101.0), entry('e', 60.0)]
+    result = history.compare(entries, commit='e')[0]
+    assert result['significant'] and result['regression']
+    assert result['change'] < -0.35
+
+
+def test_improvement_or_noise_is_not_a_regression():
+    entries = [entry('a', 100.0), entry('b', 102.0), entry('c', 98.0), entry('d', 101.0)]
+    assert not history.compare(entries + [entry('e', 140.0)], commit='e')[0]['regression']
+    assert not history.compare(entries + [entry('e', 99.0)], commit='e')[0]['significant']
+
+
+def test_flat_baseline_has_no_z_score():
+    entries = [entry('a', 100.0), entry('b', 100.0), entry('c', 100.0), entry('d', 50.0)]
+    result = history.compare(entries, commit='d')[0]
+    assert result['z_score'] is None and not result['regression']
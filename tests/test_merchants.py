@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from migrations import merchants
+
+
+def groups_of(names):
+    rows = [{'name': name, 'provider': 'Banco de Chile' if n % 2 else 'Entel', 'description': ''}
+            for n, name in enumerate(names)]
+    records, groups = merchants.resolve(rows)
+    return sorted(sorted(records[i]['name'] for i in group) for group in groups if len(group) > 1)
+
+
+def test_same_name_and_brand_prefix_are_merged():
+    assert groups_of(['Juan Maestro', 'JUAN MAESTRO', 'Olivia Trattoria', 'Restaurante Olivia',
+                      'Hush Puppies', 'Hush Puppies Kids', 'Farmacia Ahumada', 'Ahumada']) == [
+        ['Ahumada', 'Farmacia Ahumada'], ['Hush Puppies', 'Hush Puppies Kids'],
+        ['JUAN MAESTRO', 'Juan Maestro'], ['Olivia Trattoria', 'Restaurante Olivia']]
+
+
+def test_single_token_inside_another_brand_is_not_merged():
+    assert groups_of(['STILE ISABELLA', 'Restaurante Isabella']) == []
+
+
+def test_shared_program_words_do_not_merge_distinct_benefits():
+    assert groups_of(['Exclusivo Clientes Plan Océano', 'Exclusivo Clientes Plan Cordillera']) == []
+
+
+def test_shared_domain_merges_different_names():
+    rows = [{'name': 'KOE', 'provider': 'Entel', 'description': ''},
+            {'name': 'Sushi bar', 'provider': 'BCI', 'description': 'Pide en www.koe.cl'}]
+    records, groups = merchants.resolve(rows)
+    assert [len(group) for group in groups] == [2]
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import reparse
+
+
+def crashing_parser(content):
+    """Parser de prueba: mata el proceso del pool con los snapshots que dicen 'crash'"""
+    if content == 'crash':
+        os._exit(1)
+    return [{'title': content}]
+
+
+class ListSink:
+    def __init__(self):
+        self.results = []
+
+    def write(self, result):
+        self.results.append(result)
+
+
+def test_killed_worker_only_fails_its_snapshot(tmp_path, monkeypatch):
+    for day in range(1, 13):
+        (tmp_path / f'umayor_2025-03-{day:02d}.txt').write_text('crash' if day == 5 else f'dia {day}')
+    # Los procesos del pool se crean con fork y heredan el parser ya cargado
+    monkeypatch.setitem(reparse._parsers, 'umayor', crashing_parser)
+
+    sink = ListSink()
+    failures = reparse.run_batch(reparse.iter_snapshots(str(tmp_path)), [sink], workers=2, chunk_size=1)
+
+    assert [failure['name'] for failure in failures] == ['umayor_2025-03-05.txt']
+    assert 'BrokenProcessPool' in failures[0]['error']
+    assert sorted(result['seq'] for result in sink.results) == list(range(12))
+    parsed = {result['name']: result['benefits'] for result in sink.results if result['benefits'] is not None}
+    assert len(parsed) == 11
+    assert parsed['umayor_2025-03-12.txt'] == [{'title': 'dia 12'}]
+
+
+def test_store_sink_appends_in_order_across_failures(tmp_path, monkeypatch):
+    for day in range(1, 7):
+        (tmp_path / f'umayor_2025-03-{day:02d}.txt').write_text('crash' if day == 2 else f'dia {day}')
+    monkeypatch.setitem(reparse._parsers, 'umayor', crashing_parser)
+    appended = []
+    monkeypatch.setattr(reparse.benefit_store, 'append_run',
+                        lambda provider, benefits, run_at, path: appended.append(run_at))
+
+    sink = reparse.StoreSink(str(tmp_path / 'store.sqlite'))
+    reparse.run_batch(reparse.iter_snapshots(str(tmp_path)), [sink], workers=2, chunk_size=2)
+
+    assert appended == ['2025-03-01', '2025-03-03', '2025-03-04', '2025-03-05', '2025-03-06']
+    assert not sink.pending
+
+
+BCI_CARD = """
+<div class="carrousel__item"><a href="/beneficios/cafe"><article>
+  <p class="card__title">Café del Centro</p>
+  <p class="card__bajada">20% de descuento</p>
+  <p class="card__bajada">Hasta el 30 de abril</p>
+</article></a></div>
+"""
+
+
+def test_bci_snapshot_dates_resolve_against_the_snapshot_date(tmp_path):
+    (tmp_path / 'bci_2024-03-01.html').write_text(BCI_CARD)
+    snapshot = next(reparse.iter_snapshots(str(tmp_path)))
+
+    result = reparse.parse_snapshot(snapshot)
+
+    assert result['error'] is None
+    assert result['benefits'][0]['valid_until'] == '2024-04-30'
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from migrations import similarity
+
+FIELDS = ['name', 'description', 'category', 'provider']
+
+
+def write_csv(path, rows, fields=FIELDS):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def catalogue():
+    return [
+        {'name': 'Verde Sazón', 'description': 'descuento en almuerzo vegano', 'category': 'Restaurantes', 'provider': 'BCI'},
+        {'name': 'VERDE SAZÓN', 'description': 'cuotas sin interés en catering', 'category': 'Restaurantes', 'provider': 'BCI'},
+        {'name': 'Cine Hoyts', 'description': 'entradas dos por uno', 'category': 'Entretención', 'provider': 'BCI'},
+        {'name': 'Librería Nacional', 'description': 'descuento en libros escolares', 'category': 'Compras', 'provider': 'BCI'},
+    ]
+
+
+def test_update_of_an_ambiguous_key_is_rejected(tmp_path, capsys):
+    index_dir = str(tmp_path / 'index')
+    assert similarity.main(['--indice', index_dir, 'construir', '--csv', write_csv(tmp_path / 'all.csv', catalogue())]) == 0
+    before = similarity.SimilarityIndex.load(index_dir)
+
+    changed = [dict(catalogue()[1], description='cuotas sin interés en eventos')]
+    result = similarity.main(['--indice', index_dir, 'actualizar', write_csv(tmp_path / 'delta.csv', changed)])
+
+    assert result == 1
+    assert 'bci:verde sazon' in capsys.readouterr().out
+    after = similarity.SimilarityIndex.load(index_dir)
+    assert after.keys == before.keys and after.records == before.records
+
+
+def test_update_of_a_unique_key_replaces_its_row(tmp_path):
+    index_dir = str(tmp_path / 'index')
+    similarity.main(['--indice', index_dir, 'construir', '--csv', write_csv(tmp_path / 'all.csv', catalogue())])
+
+    changed = [dict(catalogue()[2], category='Panoramas')]
+    assert similarity.main(['--indice', index_dir, 'actualizar', write_csv(tmp_path / 'delta.csv', changed)]) == 0
+
+    index = similarity.SimilarityIndex.load(index_dir)
+    assert [key for key in index.keys if key == 'bci:cine hoyts'] == ['bci:cine hoyts']
+    assert index.records[index.positions['bci:cine hoyts']]['category'] == 'Panoramas'
+
+
+def test_ambiguous_keys_counts_repeats_in_the_index_and_in_the_delta():
+    index_keys = ['bci:a', 'bci:a#2', 'bci:b', None, 'bci:c']
+    rows = [{'name': 'A', 'provider': 'BCI'}, {'name': 'B', 'provider': 'BCI'},
+            {'name': 'C', 'provider': 'BCI'}, {'name': 'c', 'provider': 'BCI'}]
+    assert similarity.ambiguous_keys(index_keys, rows) == ['bci:a', 'bci:c']
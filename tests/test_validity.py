@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import validity
+
+JUNE_8 = date(2025, 6, 8)
+
+
+def dates(text, reference=JUNE_8):
+    parsed = validity.parse_validity(text, reference)
+    return parsed['valid_from'], parsed['valid_until']
+
+
+@pytest.mark.parametrize('text', ['Del 1 al 31 de mayo', 'Descuento en mayo', 'Todos los viernes de mayo'])
+def test_past_month_without_year_rolls_over_the_same_way_in_every_form(text):
+    assert dates(text) == (date(2026, 5, 1), date(2026, 5, 31))
+
+
+def test_current_month_stays_in_the_reference_year():
+    assert dates('Durante junio') == (date(2025, 6, 1), date(2025, 6, 30))
+    assert dates('Del 1 al 30 de junio') == (date(2025, 6, 1), date(2025, 6, 30))
+
+
+def test_until_takes_next_occurrence_from_reference():
+    assert dates('Hasta el 30 de abril') == (None, date(2026, 4, 30))
+    assert dates('Hasta el 8 de junio') == (None, date(2025, 6, 8))
+    assert dates('Hasta el 29 de febrero', date(2025, 3, 1)) == (None, date(2028, 2, 29))
+
+
+def test_range_across_new_year_starts_in_the_previous_year():
+    assert dates('Del 15 de diciembre al 15 de enero', date(2025, 12, 20)) == (date(2025, 12, 15), date(2026, 1, 15))
+    assert dates('Desde el 15 de diciembre. Válido hasta el 15 de enero', date(2026, 1, 2)) == (
+        date(2025, 12, 15), date(2026, 1, 15))
+
+
+def test_since_alone_takes_the_nearest_year():
+    assert dates('A partir del 1 de junio') == (date(2025, 6, 1), None)
+    assert dates('Desde el 20 de diciembre', date(2026, 1, 5)) == (date(2025, 12, 20), None)
+
+
+def test_explicit_years_and_inverted_intervals():
+    assert dates('Del 10 al 17 de junio de 2024') == (date(2024, 6, 10), date(2024, 6, 17))
+    assert dates('Hasta el 1º de marzo de 2026') == (None, date(2026, 3, 1))
+    assert dates('Del 10 de mayo de 2025 al 1 de mayo de 2025') == (None, None)
+
+
+def test_dates_without_year_are_ignored_without_reference():
+    assert dates('Del 1 al 31 de mayo', None) == (None, None)
+    assert dates('Descuento en mayo', None) == (None, None)
+    assert dates('Del 1 al 31 de mayo de 2025', None) == (date(2025, 5, 1), date(2025, 5, 31))
+
+
+def test_month_abbreviation_needs_a_day():
+    assert dates('Sal de mar y pescados') == (None, None)
+    assert dates('Del 3 al 9 de mar') == (date(2026, 3, 3), date(2026, 3, 9))
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import webdriver_stats
+
+
+def test_nested_scopes_with_equal_counters_close_the_inner_one():
+    recorder = webdriver_stats.CommandRecorder()
+    with recorder.scope('page') as page:
+        with recorder.scope('benefit') as benefit:
+            pass
+        # Ambos ámbitos estaban en cero al cerrar el interno: debe quedar abierto el externo
+        assert recorder._open_scopes() == [page]
+        assert recorder._open_scopes()[0] is page
+        recorder.record('findElement', 'a.card', 0.5)
+
+    assert benefit['commands'] == 0
+    assert page['commands'] == 1
+    assert recorder._open_scopes() == []
+    summary = recorder.summary()
+    assert summary['scopes']['page']['commands'] == 1
+    assert summary['scopes']['benefit']['commands'] == 0
+
+
+def test_commands_count_in_every_open_scope():
+    recorder = webdriver_stats.CommandRecorder()
+    with recorder.scope('page') as page:
+        recorder.record('findElement', 'a.card', 0.1)
+        with recorder.scope('benefit') as benefit:
+            recorder.record('findElement', 'p.title', 0.2, not_found=True)
+
+    assert page['commands'] == 2 and benefit['commands'] == 1
+    assert benefit['not_found'] == 1
+    assert recorder.summary()['total_commands'] == 2
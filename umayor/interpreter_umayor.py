@@ -3,14 +3,65 @@ from bs4 import BeautifulSoup
 import json
 import csv
 import os
+import sys
 
-def clean_html_file():
-    # Read the input file
-    with open('umayor.txt', 'r', encoding='utf-8') as file:
-        content = file.read()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import benefit_store, delta, metrics, validity
+
+def extract_benefit(card, soup):
+    benefit = {}
+    
+    # Get the modal target ID
+    modal_id = card.get('data-target', '').replace('#', '')
+    benefit['id'] = modal_id
+    
+    # Get title from card
+    title_elem = card.find('h4')
+    if title_elem:
+        benefit['title'] = title_elem.get_text(strip=True)
     
+    # Get date from card
+    date_elem = card.find('small')
+    if date_elem:
+        benefit['date'] = date_elem.get_text(strip=True)
+    
+    # Try to find the modal content
+    modal = soup.find('div', id=modal_id)
+    if modal:
+        # Get category
+        cat_elem = modal.find('p', class_='catBeneficios')
+        if cat_elem:
+            benefit['category'] = cat_elem.get_text(strip=True)
+        
+        # Get details
+        details_elem = modal.find('p', class_='boxCuerpo')
+        if details_elem:
+            benefit['details'] = details_elem.get_text(strip=True)
+        
+        # Get image URL
+        img_elem = modal.find('img')
+        if img_elem and img_elem.get('src'):
+            benefit['image_url'] = img_elem['src']
+    
+    benefit.update(extract_validity(benefit))
+    return benefit
+
+def extract_validity(benefit):
+    # The card date is the publication date, used as start and as the year for
+    # dates without one. Weekdays in the details are opening hours, not validity.
+    try:
+        published = validity.parse_date(benefit.get('date', ''))
+    except ValueError:
+        published = None
+    parsed = validity.parse_validity(benefit.get('details', ''), reference=published, weekdays=False)
+    if not parsed['valid_from'] and not (parsed['valid_until'] and published and parsed['valid_until'] < published):
+        parsed['valid_from'] = published
+    return validity.to_fields(parsed)
+
+def parse_benefits(content):
     # Parse HTML
-    soup = BeautifulSoup(content, 'html.parser')
+    with metrics.span('html_parse'):
+        soup = BeautifulSoup(content, 'html.parser')
     
     # Find all benefit cards
     benefits = []
@@ -19,57 +70,49 @@ def clean_html_file():
     benefit_cards = soup.find_all('a', class_='card', attrs={'data-target': re.compile(r'modalBeneficios\d+')})
     
     for card in benefit_cards:
-        benefit = {}
-        
-        # Get the modal target ID
-        modal_id = card.get('data-target', '').replace('#', '')
-        benefit['id'] = modal_id
-        
-        # Get title from card
-        title_elem = card.find('h4')
-        if title_elem:
-            benefit['title'] = title_elem.get_text(strip=True)
-        
-        # Get date from card
-        date_elem = card.find('small')
-        if date_elem:
-            benefit['date'] = date_elem.get_text(strip=True)
-        
-        # Try to find the modal content
-        modal = soup.find('div', id=modal_id)
-        if modal:
-            # Get category
-            cat_elem = modal.find('p', class_='catBeneficios')
-            if cat_elem:
-                benefit['category'] = cat_elem.get_text(strip=True)
-            
-            # Get details
-            details_elem = modal.find('p', class_='boxCuerpo')
-            if details_elem:
-                benefit['details'] = details_elem.get_text(strip=True)
-            
-            # Get image URL
-            img_elem = modal.find('img')
-            if img_elem and img_elem.get('src'):
-                benefit['image_url'] = img_elem['src']
+        with metrics.span('card_extraction'):
+            benefit = extract_benefit(card, soup)
         
         if benefit:  # Only add if we found some data
             benefits.append(benefit)
+            metrics.incr('cards')
+    
+    return benefits
+
+def clean_html_file():
+    metrics.start_run('umayor')
+    
+    # Read the input file
+    with metrics.span('read_source'), open('umayor.txt', 'r', encoding='utf-8') as file:
+        content = file.read()
+    metrics.incr('bytes_read', len(content.encode('utf-8')))
+    
+    benefits = parse_benefits(content)
     
     # Save cleaned data to JSON file
-    with open('benefits_clean.json', 'w', encoding='utf-8') as f:
+    with metrics.span('json_write'), open('benefits_clean.json', 'w', encoding='utf-8') as f:
         json.dump(benefits, f, ensure_ascii=False, indent=2)
+    metrics.record_file_written('benefits_clean.json')
     
     # Save cleaned data to CSV file
     if benefits:
-        keys = ['id', 'title', 'date', 'category', 'details', 'image_url']
+        keys = ['id', 'title', 'date', 'category', 'details', 'image_url', 'valid_from', 'valid_until', 'weekdays']
         csv_path = os.path.join('data', 'benefits_umayor.csv')
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        with metrics.span('csv_write'), open(csv_path, 'w', encoding='utf-8', newline='') as f:
             writer = csv.DictWriter(f, fieldnames=keys)
             writer.writeheader()
             writer.writerows(benefits)
+        metrics.record_file_written(csv_path)
+        
+        # Only the inserts/updates/removals since the previous run, keyed by modalBeneficiosN
+        state = delta.DeltaState('umayor', id_field='id')
+        changes = state.apply([dict(benefit) for benefit in benefits])
+        delta.save_changes_csv(changes, os.path.join('data', 'benefits_umayor_delta.csv'), keys)
+        state.save()
+        benefit_store.append_run('umayor', benefits)
     
     print(f"Found {len(benefits)} benefits. Data saved to benefits_clean.json and {csv_path}")
+    metrics.finish_run()
 
 if __name__ == "__main__":
-    clean_html_file() 
\ No newline at end of file
+    clean_html_file()
\ No newline at end of file